@@ -33,9 +33,11 @@ import os
 import random
 import statistics
 import time
+from collections import deque
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Any, Dict, List, MutableMapping, Sequence
+from itertools import islice
+from typing import Any, Deque, Dict, List, Mapping, MutableMapping, Sequence
 
 # ──────────────────── soft-optional third-party ─────────────────
 try:
@@ -116,6 +118,7 @@ from backend.agent_base import AgentBase  # type: ignore
 from backend.agents import register  # type: ignore
 from backend.orchestrator import _publish  # type: ignore
 from .. import risk
+from ..indicators import RingBuffer, RollingStats
 from ..model_provider import ModelProvider
 from ..memory import Memory
 from ..governance import Governance
@@ -252,25 +255,69 @@ def _maxdd(returns: List[float]) -> float:
     return abs(worst)
 
 
+class _FactorState:
+    """Streaming factor inputs for one symbol (constant work per tick)."""
+
+    def __init__(self, history: int):
+        self.prices = RingBuffer(31)
+        self.vol = RollingStats(max(1, history - 1))  # returns within history
+        self.rev = RollingStats(10)  # 10-day reversal
+        self.count = 0
+
+    def push(self, price: float) -> None:
+        if self.count:
+            ret = _pct(self.prices[-1], price)
+            self.vol.push(ret)
+            self.rev.push(ret)
+        self.prices.append(price)
+        self.count += 1
+
+    def backfill(self, hist: Sequence[float]) -> None:
+        tail = list(hist[-(self.vol.window + 1) :])
+        rets = [_pct(a, b) for a, b in zip(tail, tail[1:])]
+        self.vol.extend(rets)
+        self.rev.extend(rets)
+        for p in tail[-self.prices.size :]:
+            self.prices.append(p)
+        self.count = len(hist)
+
+    def score(self) -> float:
+        if self.count < 30:
+            return 0.0
+        mom = _pct(self.prices[-30], self.prices[-1])
+        vol = self.vol.std() or 1e-6
+        carry = _pct(self.prices[-31], self.prices[-1]) if self.count >= 31 else 0.0
+        rev = -self.rev.mean
+        return (mom + carry + rev) / vol
+
+
 class _FactorEngine:
     """Hybrid (momentum + risk-parity) factor scores."""
 
-    def __init__(self):
+    def __init__(self, history: int = 1000):
+        self.history = history
         self.scores: Dict[str, float] = {}
+        self._state: Dict[str, _FactorState] = {}
 
     # ------------------------------
-    def update(self, series: Dict[str, List[float]]):
+    def update(self, series: Mapping[str, Sequence[float]]):
+        """Rebuild scores from full price histories (backfill)."""
         self.scores.clear()
+        self._state.clear()
         for sym, hist in series.items():
-            if len(hist) < 30:
-                self.scores[sym] = 0.0
-                continue
-            mom = _pct(hist[-30], hist[-1])
-            vol = statistics.pstdev([_pct(a, b) for a, b in zip(hist, hist[1:])]) or 1e-6
-            carry = _pct(hist[-31], hist[-1]) if len(hist) >= 31 else 0.0
-            rev = -statistics.mean([_pct(a, b) for a, b in zip(hist[-11:-1], hist[-10:])])  # 10-day reversal
-            score = (mom + carry + rev) / vol
-            self.scores[sym] = score
+            state = _FactorState(self.history)
+            state.backfill(hist)
+            self._state[sym] = state
+            self.scores[sym] = state.score()
+
+    def update_tick(self, prices: Mapping[str, float]):
+        """Fold one new price per symbol into the running factor state."""
+        for sym, px in prices.items():
+            state = self._state.get(sym)
+            if state is None:
+                state = self._state[sym] = _FactorState(self.history)
+            state.push(px)
+            self.scores[sym] = state.score()
 
 
 # ═══════════════════ portfolio (in-mem fallback) ════════════════
@@ -361,7 +408,7 @@ class FinanceAgent(AgentBase):
         # ── state ──
         self.portfolio = _Portfolio()
         self.factor = _FactorEngine()
-        self.history: Dict[str, List[float]] = {s: [] for s in self.cfg.universe}
+        self.history: Dict[str, Deque[float]] = {s: deque(maxlen=self.factor.history) for s in self.cfg.universe}
         self.planner = _Planner(self.cfg.planner_depth)
 
         # ── broker selection ──
@@ -421,14 +468,13 @@ class FinanceAgent(AgentBase):
         # 1 · sample prices & extend history
         prices = {s: self._safe_price(s) for s in self.cfg.universe}
         for s, p in prices.items():
-            h = self.history[s]
-            h.append(p)
-            if len(h) > 1000:
-                h.pop(0)
+            self.history[s].append(p)
 
         # 2 · update factors & portfolio risk
-        self.factor.update(self.history)
-        flat_ret = [_pct(a, b) for s in self.cfg.universe for a, b in zip(self.history[s][:-1], self.history[s][1:])]
+        self.factor.update_tick(prices)
+        flat_ret = [
+            _pct(a, b) for s in self.cfg.universe for a, b in zip(self.history[s], islice(self.history[s], 1, None))
+        ]
         risk = {
             "var": _cf_var(flat_ret) * self.portfolio.value(prices),
             "cvar": _cvar(flat_ret) * self.portfolio.value(prices),
@@ -6,12 +6,18 @@ Tiny **price‑action** helpers used by the FinanceAgent.
 All routines depend solely on ``numpy`` (already shipped with PyTorch) and
 gracefully handle short input series. The module is deliberately self‑contained
 so it can run on constrained edge devices without optional extras.
+
+These functions evaluate a whole series per call. Live feeds should keep an
+:class:`~.indicators.IndicatorSet` per symbol instead, which updates the same
+readings in constant time per tick.
 """
 
 from __future__ import annotations
 
 from typing import Sequence
 
+from .indicators import IndicatorSet, ema_series, rsi_series
+
 try:
     import numpy as np  # type: ignore
 except ModuleNotFoundError:  # pragma: no cover - lightweight fallback
@@ -23,6 +29,7 @@ __all__ = [
     "ema",
     "rsi",
     "bollinger_bands",
+    "IndicatorSet",
 ]
 
 
@@ -91,6 +98,9 @@ def ema(prices: Sequence[float], span: int = 20) -> float:
     if not prices:
         return 0.0
 
+    if np is not None:
+        return float(ema_series(prices, span)[-1])
+
     alpha = 2 / (span + 1)
     ema_val = float(prices[0])
     for p in prices[1:]:
@@ -107,27 +117,18 @@ def rsi(prices: Sequence[float], period: int = 14) -> float:
         return 0.0
 
     if np is not None:
-        deltas = np.diff(np.asarray(prices, dtype=float))
-        gains = np.clip(deltas, 0, None)
-        losses = np.clip(-deltas, 0, None)
-
-        avg_gain = float(np.mean(gains[:period]))
-        avg_loss = float(np.mean(losses[:period]))
+        return float(rsi_series(prices, period)[-1])
 
-        for g, loss_val in zip(gains[period:], losses[period:]):
-            avg_gain = (avg_gain * (period - 1) + float(g)) / period
-            avg_loss = (avg_loss * (period - 1) + float(loss_val)) / period
-    else:
-        deltas = [prices[i + 1] - prices[i] for i in range(len(prices) - 1)]
-        gains = [max(d, 0.0) for d in deltas]
-        losses = [max(-d, 0.0) for d in deltas]
+    deltas = [prices[i + 1] - prices[i] for i in range(len(prices) - 1)]
+    gains = [max(d, 0.0) for d in deltas]
+    losses = [max(-d, 0.0) for d in deltas]
 
-        avg_gain = sum(gains[:period]) / period
-        avg_loss = sum(losses[:period]) / period
+    avg_gain = sum(gains[:period]) / period
+    avg_loss = sum(losses[:period]) / period
 
-        for g, loss_val in zip(gains[period:], losses[period:]):
-            avg_gain = (avg_gain * (period - 1) + g) / period
-            avg_loss = (avg_loss * (period - 1) + loss_val) / period
+    for g, loss_val in zip(gains[period:], losses[period:]):
+        avg_gain = (avg_gain * (period - 1) + g) / period
+        avg_loss = (avg_loss * (period - 1) + loss_val) / period
 
     if avg_loss == 0:
         return 100.0
@@ -0,0 +1,485 @@
+# SPDX-License-Identifier: Apache-2.0
+"""backend.indicators
+=====================
+
+Incremental technical indicators for streaming price feeds.
+
+Every indicator keeps constant-size state and costs ``O(1)`` per tick: ring
+buffers back the windowed lookbacks, a windowed Welford accumulator tracks
+mean and variance, and EMA/RSI carry their recursive averages forward. Running
+sums are re-derived from the buffer each time it wraps so floating point drift
+stays bounded on long-lived feeds.
+
+The ``*_series`` helpers compute the same quantities for every tick of an
+array at once with ``numpy`` and back the ``backfill`` methods used to seed
+streaming state from history. Without ``numpy`` they replay the streaming
+indicators instead.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import Dict, Iterator, List, Optional, Sequence
+
+try:
+    import numpy as np  # type: ignore
+except ModuleNotFoundError:  # pragma: no cover - lightweight fallback
+    np = None  # type: ignore
+
+__all__ = [
+    "RingBuffer",
+    "RollingStats",
+    "Momentum",
+    "SMACrossover",
+    "EMA",
+    "RSI",
+    "BollingerBands",
+    "IndicatorSet",
+    "ema_series",
+    "rsi_series",
+    "rolling_mean",
+    "rolling_std",
+]
+
+# ``beta ** -block`` stays below ``e ** _EWM_RANGE`` in the blocked EMA scan.
+_EWM_RANGE = 10.0
+
+
+class RingBuffer:
+    """Fixed-capacity FIFO of floats with ``O(1)`` append and indexing."""
+
+    __slots__ = ("size", "_data", "_start", "_len")
+
+    def __init__(self, size: int) -> None:
+        if size <= 0:
+            raise ValueError("size must be positive")
+        self.size = size
+        self._data: List[float] = [0.0] * size
+        self._start = 0
+        self._len = 0
+
+    def append(self, value: float) -> Optional[float]:
+        """Append ``value`` and return the evicted element, if any."""
+
+        if self._len < self.size:
+            self._data[(self._start + self._len) % self.size] = value
+            self._len += 1
+            return None
+        old = self._data[self._start]
+        self._data[self._start] = value
+        self._start = (self._start + 1) % self.size
+        return old
+
+    def clear(self) -> None:
+        self._start = self._len = 0
+
+    @property
+    def full(self) -> bool:
+        return self._len == self.size
+
+    @property
+    def wrapped(self) -> bool:
+        """``True`` right after the oldest slot returned to index zero."""
+
+        return self.full and self._start == 0
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __getitem__(self, idx: int) -> float:
+        if idx < 0:
+            idx += self._len
+        if not 0 <= idx < self._len:
+            raise IndexError("ring buffer index out of range")
+        return self._data[(self._start + idx) % self.size]
+
+    def __iter__(self) -> Iterator[float]:
+        for i in range(self._len):
+            yield self._data[(self._start + i) % self.size]
+
+
+class RollingStats:
+    """Windowed mean and variance using Welford's update with removal."""
+
+    __slots__ = ("window", "_buf", "_mean", "_m2")
+
+    def __init__(self, window: int) -> None:
+        self.window = window
+        self._buf = RingBuffer(window)
+        self._mean = 0.0
+        self._m2 = 0.0
+
+    def push(self, x: float) -> None:
+        x = float(x)
+        old = self._buf.append(x)
+        if old is None:
+            n = len(self._buf)
+            delta = x - self._mean
+            self._mean += delta / n
+            self._m2 += delta * (x - self._mean)
+        elif self._buf.wrapped:
+            self._resync()
+        else:
+            prev = self._mean
+            self._mean += (x - old) / self.window
+            self._m2 += (x - old) * (x - self._mean + old - prev)
+        if self._m2 < 0.0:
+            self._m2 = 0.0
+
+    def extend(self, values: Sequence[float]) -> None:
+        """Load the trailing window of ``values`` in one pass."""
+
+        for x in values[-self.window :]:
+            self._buf.append(float(x))
+        self._resync()
+
+    def _resync(self) -> None:
+        vals = list(self._buf)
+        if not vals:
+            self._mean = self._m2 = 0.0
+            return
+        self._mean = math.fsum(vals) / len(vals)
+        self._m2 = math.fsum((v - self._mean) ** 2 for v in vals)
+
+    @property
+    def count(self) -> int:
+        return len(self._buf)
+
+    @property
+    def mean(self) -> float:
+        return self._mean if self._buf else 0.0
+
+    def variance(self, ddof: int = 0) -> float:
+        n = len(self._buf)
+        if n <= ddof:
+            return 0.0
+        return self._m2 / (n - ddof)
+
+    def std(self, ddof: int = 0) -> float:
+        return math.sqrt(self.variance(ddof))
+
+
+class Momentum:
+    """Percentage change over ``lookback`` ticks."""
+
+    def __init__(self, lookback: int = 20) -> None:
+        if lookback <= 0:
+            raise ValueError("lookback must be positive")
+        self.lookback = lookback
+        self._buf = RingBuffer(lookback + 1)
+
+    def update(self, price: float) -> float:
+        self._buf.append(float(price))
+        return self.value
+
+    def backfill(self, prices: Sequence[float]) -> float:
+        self._buf.clear()
+        for p in prices[-self._buf.size :]:
+            self._buf.append(float(p))
+        return self.value
+
+    @property
+    def value(self) -> float:
+        if not self._buf.full or not self._buf[0]:
+            return 0.0
+        return (self._buf[-1] - self._buf[0]) / self._buf[0]
+
+
+class SMACrossover:
+    """Fast/slow simple moving average cross signal (``+1``, ``-1`` or ``0``)."""
+
+    def __init__(self, fast: int = 20, slow: int = 50) -> None:
+        if fast <= 0 or slow <= 0:
+            raise ValueError("periods must be positive")
+        if fast >= slow:
+            raise ValueError("fast period must be shorter than slow period")
+        self.fast = fast
+        self.slow = slow
+        self._buf = RingBuffer(slow + 1)
+        self._fast_sum = 0.0
+        self._slow_sum = 0.0
+
+    def update(self, price: float) -> int:
+        p = float(price)
+        self._buf.append(p)
+        n = len(self._buf)
+        if self._buf.wrapped:
+            self._resync()
+        else:
+            self._fast_sum += p - (self._buf[-self.fast - 1] if n > self.fast else 0.0)
+            self._slow_sum += p - (self._buf[-self.slow - 1] if n > self.slow else 0.0)
+        return self.value
+
+    def backfill(self, prices: Sequence[float]) -> int:
+        self._buf.clear()
+        for p in prices[-self._buf.size :]:
+            self._buf.append(float(p))
+        self._resync()
+        return self.value
+
+    def _resync(self) -> None:
+        vals = list(self._buf)
+        self._fast_sum = math.fsum(vals[-self.fast :])
+        self._slow_sum = math.fsum(vals[-self.slow :])
+
+    @property
+    def value(self) -> int:
+        if not self._buf.full:
+            return 0
+        last = self._buf[-1]
+        fast_now = self._fast_sum / self.fast
+        slow_now = self._slow_sum / self.slow
+        fast_prev = (self._fast_sum - last + self._buf[-self.fast - 1]) / self.fast
+        slow_prev = (self._slow_sum - last + self._buf[0]) / self.slow
+        if fast_prev <= slow_prev and fast_now > slow_now:
+            return +1
+        if fast_prev >= slow_prev and fast_now < slow_now:
+            return -1
+        return 0
+
+
+class EMA:
+    """Exponential moving average seeded with the first observation."""
+
+    def __init__(self, span: int = 20) -> None:
+        if span <= 0:
+            raise ValueError("span must be positive")
+        self.span = span
+        self.alpha = 2 / (span + 1)
+        self._value: Optional[float] = None
+
+    def update(self, price: float) -> float:
+        p = float(price)
+        self._value = p if self._value is None else (p - self._value) * self.alpha + self._value
+        return self._value
+
+    def backfill(self, prices: Sequence[float]) -> float:
+        self._value = None
+        if len(prices):
+            self._value = float(ema_series(prices, self.span)[-1])
+        return self.value
+
+    @property
+    def value(self) -> float:
+        return 0.0 if self._value is None else self._value
+
+
+class RSI:
+    """Wilder's relative strength index (0‒100)."""
+
+    def __init__(self, period: int = 14) -> None:
+        if period <= 0:
+            raise ValueError("period must be positive")
+        self.period = period
+        self._reset()
+
+    def _reset(self) -> None:
+        self._prev: Optional[float] = None
+        self._n = 0  # deltas seen
+        self._gain = 0.0
+        self._loss = 0.0
+
+    def update(self, price: float) -> float:
+        p = float(price)
+        if self._prev is not None:
+            d = p - self._prev
+            g, loss = max(d, 0.0), max(-d, 0.0)
+            self._n += 1
+            if self._n <= self.period:
+                self._gain += g / self.period
+                self._loss += loss / self.period
+            else:
+                self._gain = (self._gain * (self.period - 1) + g) / self.period
+                self._loss = (self._loss * (self.period - 1) + loss) / self.period
+        self._prev = p
+        return self.value
+
+    def backfill(self, prices: Sequence[float]) -> float:
+        self._reset()
+        if np is None or len(prices) <= self.period + 1:
+            for p in prices:
+                self.update(p)
+            return self.value
+        arr = np.asarray(prices, dtype=float)
+        deltas = np.diff(arr)
+        gains = np.clip(deltas, 0, None)
+        losses = np.clip(-deltas, 0, None)
+        alpha = 1.0 / self.period
+        self._gain = float(_ewm(gains[self.period :], alpha, float(gains[: self.period].mean()))[-1])
+        self._loss = float(_ewm(losses[self.period :], alpha, float(losses[: self.period].mean()))[-1])
+        self._n = len(deltas)
+        self._prev = float(arr[-1])
+        return self.value
+
+    @property
+    def value(self) -> float:
+        if self._n < self.period:
+            return 0.0
+        if self._loss == 0:
+            return 100.0
+        return 100.0 - (100.0 / (1 + self._gain / self._loss))
+
+
+class BollingerBands:
+    """Lower and upper bands ``num_std`` sample deviations around the SMA."""
+
+    def __init__(self, window: int = 20, num_std: float = 2.0) -> None:
+        if window <= 0:
+            raise ValueError("window must be positive")
+        self.num_std = num_std
+        self._stats = RollingStats(window)
+
+    def update(self, price: float) -> tuple[float, float]:
+        self._stats.push(price)
+        return self.value
+
+    def backfill(self, prices: Sequence[float]) -> tuple[float, float]:
+        self._stats = RollingStats(self._stats.window)
+        self._stats.extend(prices)
+        return self.value
+
+    @property
+    def value(self) -> tuple[float, float]:
+        if self._stats.count < self._stats.window:
+            return (0.0, 0.0)
+        band = self.num_std * self._stats.std(ddof=1)
+        return (self._stats.mean - band, self._stats.mean + band)
+
+
+class IndicatorSet:
+    """Per-symbol bundle of the :mod:`alpha_model` indicators."""
+
+    def __init__(
+        self,
+        *,
+        lookback: int = 20,
+        fast: int = 20,
+        slow: int = 50,
+        span: int = 20,
+        period: int = 14,
+        window: int = 20,
+        num_std: float = 2.0,
+    ) -> None:
+        self.momentum = Momentum(lookback)
+        self.crossover = SMACrossover(fast, slow)
+        self.ema = EMA(span)
+        self.rsi = RSI(period)
+        self.bollinger = BollingerBands(window, num_std)
+
+    def _parts(self) -> Dict[str, object]:
+        return {
+            "momentum": self.momentum,
+            "sma_crossover": self.crossover,
+            "ema": self.ema,
+            "rsi": self.rsi,
+            "bollinger_bands": self.bollinger,
+        }
+
+    def update(self, price: float) -> Dict[str, object]:
+        """Feed one tick and return the refreshed readings."""
+
+        for ind in self._parts().values():
+            ind.update(price)  # type: ignore[attr-defined]
+        return self.snapshot()
+
+    def backfill(self, prices: Sequence[float]) -> Dict[str, object]:
+        """Reset every indicator from ``prices`` (oldest → newest)."""
+
+        for ind in self._parts().values():
+            ind.backfill(prices)  # type: ignore[attr-defined]
+        return self.snapshot()
+
+    def snapshot(self) -> Dict[str, object]:
+        return {name: ind.value for name, ind in self._parts().items()}  # type: ignore[attr-defined]
+
+
+# ───────────────────────── batch helpers ─────────────────────────
+def _ewm(x: "np.ndarray", alpha: float, init: float) -> "np.ndarray":
+    """Return ``y[t] = (1 - alpha) * y[t - 1] + alpha * x[t]`` with ``y[-1] = init``.
+
+    The recursion is unrolled in blocks short enough that the rescaled
+    cumulative sum cannot lose precision.
+    """
+
+    beta = 1.0 - alpha
+    out = np.empty(len(x), dtype=float)
+    if beta <= 0.0:
+        out[:] = x
+        return out
+    block = max(1, int(_EWM_RANGE / -math.log(beta)))
+    prev = init
+    for start in range(0, len(x), block):
+        seg = x[start : start + block]
+        decay = beta ** np.arange(1, len(seg) + 1)
+        out[start : start + len(seg)] = decay * (prev + alpha * np.cumsum(seg / decay))
+        prev = out[start + len(seg) - 1]
+    return out
+
+
+def ema_series(prices: Sequence[float], span: int = 20) -> "np.ndarray | List[float]":
+    """Return the EMA after every tick of ``prices``."""
+
+    if span <= 0:
+        raise ValueError("span must be positive")
+    if np is None:
+        ind = EMA(span)
+        return [ind.update(p) for p in prices]
+    arr = np.asarray(prices, dtype=float)
+    if not len(arr):
+        return arr
+    return _ewm(arr, 2 / (span + 1), float(arr[0]))
+
+
+def rsi_series(prices: Sequence[float], period: int = 14) -> "np.ndarray | List[float]":
+    """Return the RSI after every tick, ``0`` until ``period`` deltas exist."""
+
+    if period <= 0:
+        raise ValueError("period must be positive")
+    if np is None or len(prices) <= period:
+        ind = RSI(period)
+        out = [ind.update(p) for p in prices]
+        return np.asarray(out, dtype=float) if np is not None else out
+    arr = np.asarray(prices, dtype=float)
+    deltas = np.diff(arr)
+    gains = np.clip(deltas, 0, None)
+    losses = np.clip(-deltas, 0, None)
+    alpha = 1.0 / period
+    g0, l0 = float(gains[:period].mean()), float(losses[:period].mean())
+    avg_gain = np.concatenate(([g0], _ewm(gains[period:], alpha, g0)))
+    avg_loss = np.concatenate(([l0], _ewm(losses[period:], alpha, l0)))
+    out = np.zeros(len(arr), dtype=float)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        vals = 100.0 - 100.0 / (1 + avg_gain / avg_loss)
+    out[period:] = np.where(avg_loss == 0, 100.0, vals)
+    return out
+
+
+def rolling_mean(prices: Sequence[float], window: int) -> "np.ndarray | List[float]":
+    """Return the mean of every full ``window`` (``len(prices) - window + 1`` values)."""
+
+    if window <= 0:
+        raise ValueError("window must be positive")
+    if np is None:
+        return [sum(prices[i - window : i]) / window for i in range(window, len(prices) + 1)]
+    arr = np.asarray(prices, dtype=float)
+    if len(arr) < window:
+        return np.empty(0, dtype=float)
+    return np.lib.stride_tricks.sliding_window_view(arr, window).mean(axis=1)
+
+
+def rolling_std(prices: Sequence[float], window: int, ddof: int = 1) -> "np.ndarray | List[float]":
+    """Return the standard deviation of every full ``window``."""
+
+    if window <= 0:
+        raise ValueError("window must be positive")
+    if np is None:
+        out = []
+        for i in range(window, len(prices) + 1):
+            stats = RollingStats(window)
+            stats.extend(prices[i - window : i])
+            out.append(stats.std(ddof))
+        return out
+    arr = np.asarray(prices, dtype=float)
+    if len(arr) < window or window <= ddof:
+        return np.zeros(max(0, len(arr) - window + 1), dtype=float)
+    return np.lib.stride_tricks.sliding_window_view(arr, window).std(axis=1, ddof=ddof)
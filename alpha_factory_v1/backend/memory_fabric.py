@@ -33,6 +33,8 @@ VECTOR_DIM[768]           – embedding dimension for pgvector & FAISS
 MEM_TTL_SECONDS[0]        – 0 = keep forever, else soft-delete after TTL
 MEM_MAX_PER_AGENT[100000] – per-agent quota (oldest evicted on overflow)
 VECTOR_SQLITE_PATH[vector_mem.db] – file path for SQLite fallback
+MEM_FAISS_COMPACT_AT[1024] – evicted FAISS ids kept as tombstones before the
+                             index is compacted in the background
 
 Python extras automatically used when available:
     numpy, sentence_transformers, psycopg2-binary, faiss-cpu, neo4j,
@@ -45,6 +47,7 @@ from __future__ import annotations
 import asyncio
 import contextlib
 import hashlib
+import itertools
 import json
 import logging
 import math
@@ -52,9 +55,10 @@ import os
 import sqlite3
 import threading
 import time
+from collections import defaultdict, deque
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union, Final, ClassVar
+from typing import Any, Callable, Deque, Dict, Iterable, List, Optional, Sequence, Tuple, Union, Final, ClassVar
 from alpha_factory_v1.utils.config_common import SettingsConfigDict
 
 # ─────────────────────── dynamic soft-deps ░──────────────────
@@ -139,6 +143,7 @@ class _Settings(BaseSettings):
     # Memory policies
     MEM_TTL_SECONDS: int = 0  # 0 = infinite
     MEM_MAX_PER_AGENT: PositiveInt = Field(100_000, validation_alias="MEM_MAX_PER_AGENT")
+    MEM_FAISS_COMPACT_AT: int = 1024  # tombstones before FAISS compaction
 
     # Quotas / circuit breaker
     MEM_FAIL_GRACE_SEC: int = 20
@@ -229,6 +234,9 @@ _EMBED = _load_embedder()
 _NOW: Callable[[], datetime] = lambda: datetime.now(timezone.utc)  # noqa: E731
 
 
+_SQLITE_BLOCK: Final = 4096  # rows scored per numpy block in the SQLite tier
+
+
 def _hash_content(s: str) -> str:
     return hashlib.sha1(s.encode()).hexdigest()
 
@@ -304,12 +312,20 @@ class _VectorStore:
                     "vec BLOB, content TEXT)"
                 )
             )
+            self._sql.execute("CREATE INDEX IF NOT EXISTS idx_mem_agent_ts ON memories(agent, ts)")
+            self._sql_counts: Dict[str, int] = {}
             self._mode = "sqlite"
             logger.info("VectorStore: SQLite fallback ready.")
         elif "faiss" in globals():
-            self._faiss = faiss.IndexFlatIP(CFG.VECTOR_DIM)
-            self._vectors: List[np.ndarray] = []
-            self._meta: List[Tuple[str, str, str]] = []  # agent, content, ts
+            # ids are stable across evictions; removed rows are tombstoned and
+            # only dropped from the index in batches by ``_compact``.
+            self._faiss = faiss.IndexIDMap(faiss.IndexFlatIP(CFG.VECTOR_DIM))
+            self._meta: Dict[int, Tuple[str, str, str, str]] = {}  # id → agent, content, ts, hash
+            self._by_hash: Dict[str, int] = {}
+            self._by_agent: Dict[str, Deque[int]] = defaultdict(deque)
+            self._tombstones: set[int] = set()
+            self._next_id = 0
+            self._compacting = False
             self._mode = "faiss"
             logger.info("VectorStore: FAISS in-memory index ready.")
         else:
@@ -328,20 +344,80 @@ class _VectorStore:
                     (agent, CFG.MEM_MAX_PER_AGENT),
                 )
         elif self._mode == "sqlite":
-            cur = self._sql.execute("SELECT hash FROM memories WHERE agent=? ORDER BY ts ASC", (agent,)).fetchall()
-            if len(cur) > CFG.MEM_MAX_PER_AGENT:
-                to_del = cur[: len(cur) - CFG.MEM_MAX_PER_AGENT]
-                self._sql.executemany("DELETE FROM memories WHERE hash=?", to_del)
+            excess = self._sql_count(agent) - CFG.MEM_MAX_PER_AGENT
+            if excess > 0:
+                cur = self._sql.execute(
+                    "DELETE FROM memories WHERE hash IN ("
+                    "SELECT hash FROM memories WHERE agent=? ORDER BY ts ASC LIMIT ?)",
+                    (agent, excess),
+                )
                 self._sql.commit()
+                self._sql_counts[agent] -= cur.rowcount
         elif self._mode == "faiss":
-            # lightweight: we simply pop oldest from meta/vectors
-            while sum(1 for a, *_ in self._meta if a == agent) > CFG.MEM_MAX_PER_AGENT:
-                idx = next(i for i, (a, *_) in enumerate(self._meta) if a == agent)
-                self._meta.pop(idx)
-                self._vectors.pop(idx)
-                self._faiss.reset()
-                if self._vectors:
-                    self._faiss.add(np.vstack(self._vectors))
+            with self._lock:
+                ids = self._by_agent.get(agent)
+                while ids and len(ids) > CFG.MEM_MAX_PER_AGENT:
+                    i = ids.popleft()
+                    self._by_hash.pop(self._meta.pop(i)[3], None)
+                    self._tombstones.add(i)
+                self._maybe_compact()
+
+    def _sql_count(self, agent: str) -> int:
+        if agent not in self._sql_counts:
+            row = self._sql.execute("SELECT COUNT(*) FROM memories WHERE agent=?", (agent,)).fetchone()
+            self._sql_counts[agent] = int(row[0])
+        return self._sql_counts[agent]
+
+    def _maybe_compact(self) -> None:
+        if self._compacting or len(self._tombstones) < CFG.MEM_FAISS_COMPACT_AT:
+            return
+        self._compacting = True
+        threading.Thread(target=self._compact, name="faiss-compact", daemon=True).start()
+
+    def _compact(self) -> None:
+        """Drop tombstoned ids from the FAISS index in one batch."""
+        with self._lock:
+            try:
+                if self._tombstones:
+                    dead = np.fromiter(self._tombstones, dtype="int64", count=len(self._tombstones))
+                    self._faiss.remove_ids(dead)
+                    self._tombstones.clear()
+            except Exception as exc:  # noqa: BLE001
+                logger.warning("VectorStore: FAISS compaction failed → %s", exc)
+            finally:
+                self._compacting = False
+
+    def _sqlite_topk(self, qv: Any, k: int) -> List[Dict[str, Any]]:
+        """Score stored vectors block by block, keeping a running top-k."""
+        qn = float(np.linalg.norm(qv))
+        best_s = np.empty(0, dtype="float32")
+        best_r = np.empty(0, dtype="int64")
+        cur = self._sql.execute("SELECT rowid, vec FROM memories")
+        while rows := cur.fetchmany(_SQLITE_BLOCK):
+            ids = np.fromiter((r[0] for r in rows), dtype="int64", count=len(rows))
+            mat = np.frombuffer(b"".join(r[1] for r in rows), dtype="float32").reshape(len(rows), -1)
+            denom = np.linalg.norm(mat, axis=1) * qn
+            denom[denom == 0] = 1
+            s = np.concatenate((best_s, (mat @ qv) / denom))
+            r = np.concatenate((best_r, ids))
+            if len(s) > k:
+                keep = np.argpartition(-s, k - 1)[:k]
+                s, r = s[keep], r[keep]
+            best_s, best_r = s, r
+        order = np.argsort(-best_s, kind="stable")
+        rowids = [int(best_r[i]) for i in order]
+        marks = ",".join("?" * len(rowids))
+        meta = {
+            rid: (a, c, ts)
+            for rid, a, c, ts in self._sql.execute(
+                f"SELECT rowid, agent, content, ts FROM memories WHERE rowid IN ({marks})", rowids
+            )
+        }
+        out = []
+        for i, rid in zip(order, rowids):
+            a, c, ts = meta[rid]
+            out.append({"agent": a, "content": c, "ts": ts, "score": float(best_s[i])})
+        return out
 
     def _apply_ttl_pg(self) -> None:
         if CFG.MEM_TTL_SECONDS <= 0:
@@ -370,22 +446,9 @@ class _VectorStore:
                 self._evict_if_needed(agent)
                 self._apply_ttl_pg()
             elif self._mode == "faiss":
-                if h in {m[1] for m in self._meta}:
-                    return
-                self._faiss.add(vec.reshape(1, -1))
-                self._vectors.append(vec)
-                self._meta.append((agent, content, now))
-                self._evict_if_needed(agent)
+                self._faiss_add(agent, [(h, vec, content)], now)
             elif self._mode == "sqlite":
-                try:
-                    self._sql.execute(
-                        "INSERT OR IGNORE INTO memories VALUES(?,?,?,?,?)",
-                        (h, agent, now, vec.tobytes(), content),
-                    )
-                    self._sql.commit()
-                except sqlite3.OperationalError:
-                    pass
-                self._evict_if_needed(agent)
+                self._sqlite_add(agent, [(h, vec, content)], now)
             else:  # ram list
                 pass
             if _MET_V_ADD:
@@ -395,9 +458,61 @@ class _VectorStore:
             self._mode = "ram"
             self._fail_until = time.time() + CFG.MEM_FAIL_GRACE_SEC
 
+    def _faiss_add(self, agent: str, rows: List[Tuple[str, Any, str]], now: str) -> None:
+        with self._lock:
+            ids: List[int] = []
+            vecs = []
+            for h, vec, content in rows:
+                if h in self._by_hash:
+                    continue
+                i = self._next_id
+                self._next_id += 1
+                self._by_hash[h] = i
+                self._meta[i] = (agent, content, now, h)
+                self._by_agent[agent].append(i)
+                ids.append(i)
+                vecs.append(vec)
+            if ids:
+                self._faiss.add_with_ids(np.vstack(vecs), np.asarray(ids, dtype="int64"))
+                self._evict_if_needed(agent)
+
+    def _sqlite_add(self, agent: str, rows: List[Tuple[str, Any, str]], now: str) -> None:
+        added = 0
+        try:
+            for h, vec, content in rows:
+                cur = self._sql.execute(
+                    "INSERT OR IGNORE INTO memories VALUES(?,?,?,?,?)",
+                    (h, agent, now, vec.tobytes(), content),
+                )
+                added += cur.rowcount
+            self._sql.commit()
+        except sqlite3.OperationalError:
+            pass
+        if agent in self._sql_counts:
+            self._sql_counts[agent] += added
+        self._evict_if_needed(agent)
+
     def add_many(self, agent: str, contents: Iterable[str]):
-        for c in contents:
-            self.add(agent, c)
+        """Insert several memories, batching FAISS and SQLite writes."""
+        if self._mode not in ("faiss", "sqlite"):
+            for c in contents:
+                self.add(agent, c)
+            return
+        rows = [(_hash_content(c), np.asarray(_EMBED(c), dtype="float32"), c) for c in contents]
+        if not rows:
+            return
+        now = _NOW().isoformat()
+        try:
+            if self._mode == "faiss":
+                self._faiss_add(agent, rows, now)
+            else:
+                self._sqlite_add(agent, rows, now)
+            if _MET_V_ADD:
+                _MET_V_ADD.inc(len(rows))
+        except Exception as e:  # noqa: BLE001
+            logger.error("VectorStore.add_many error → %s  (downgrading)", e)
+            self._mode = "ram"
+            self._fail_until = time.time() + CFG.MEM_FAIL_GRACE_SEC
 
     def recent(self, agent: str, limit: int = 20) -> List[str]:
         if self._mode == "pg":
@@ -414,7 +529,9 @@ class _VectorStore:
             )
             return [r[0] for r in cur.fetchall()]
         if self._mode == "faiss":
-            return [c for a, c, *_ in reversed(self._meta) if a == agent][:limit]
+            with self._lock:
+                ids = self._by_agent.get(agent, ())
+                return [self._meta[i][1] for i in itertools.islice(reversed(ids), limit)]
         return []
 
     # search (single query) ------------------------------------
@@ -430,25 +547,25 @@ class _VectorStore:
                         (list(map(float, qv)), k),
                     )
                     return cur.fetchall()
-            if self._mode == "faiss" and self._vectors:
-                d, idx = self._faiss.search(qv.reshape(1, -1), k)
-                out = []
-                for score, i in zip(d[0], idx[0]):
-                    if i == -1:
-                        continue
-                    a, c, ts = self._meta[i]
-                    out.append({"agent": a, "content": c, "ts": ts, "score": float(score)})
-                return out
+            if k <= 0:
+                return []
+            if self._mode == "faiss" and self._meta:
+                with self._lock:
+                    # over-fetch so tombstoned hits can be skipped
+                    kk = min(k + len(self._tombstones), self._faiss.ntotal)
+                    d, idx = self._faiss.search(qv.reshape(1, -1), kk)
+                    out = []
+                    for score, i in zip(d[0], idx[0]):
+                        meta = self._meta.get(int(i))
+                        if meta is None:
+                            continue
+                        a, c, ts, _ = meta
+                        out.append({"agent": a, "content": c, "ts": ts, "score": float(score)})
+                        if len(out) == k:
+                            break
+                    return out
             if self._mode == "sqlite":
-                cur = self._sql.execute("SELECT agent, vec, content, ts FROM memories")
-                rows = cur.fetchall()
-                scored = []
-                for a, vb, c, ts in rows:
-                    v = np.frombuffer(vb, dtype="float32")
-                    s = float(np.dot(v, qv) / (np.linalg.norm(v) * np.linalg.norm(qv) or 1))
-                    scored.append((s, a, c, ts))
-                scored.sort(reverse=True)
-                return [{"agent": a, "content": c, "ts": ts, "score": s} for s, a, c, ts in scored[:k]]
+                return self._sqlite_topk(qv, k)
             return []
 
     # bulk search ----------------------------------------------
@@ -467,7 +584,8 @@ class _VectorStore:
         elif self._mode == "sqlite":
             rows = self._sql.execute("SELECT agent, content, ts FROM memories").fetchall()
         elif self._mode == "faiss":
-            rows = [(a, c, ts) for a, c, ts in self._meta]
+            with self._lock:
+                rows = [(a, c, ts) for a, c, ts, _ in self._meta.values()]
         if path.suffix == ".jsonl":
             with path.open("w", encoding="utf-8") as f:
                 for a, c, ts in rows:
@@ -17,10 +17,13 @@ Why you’ll ❤️ it
    are built-in; dashboards light up automatically.
 3. **Thread-safe & async-friendly.**  A global re-entrant lock serialises writes
    while allowing concurrent reads – perfect for multi-agent concurrency.
-4. **Developer delight.**  A single, elegant API (`add`, `batch_add`, `query`,
-   `find_path`, `neighbours`, `export_graphml`, `import_graphml`) hides all
-   backend quirks so agent authors stay focused on domain logic.
-5. **No hard crashes – ever.**  All optional libs are soft-imported, connection
+4. **Developer delight.**  A single, elegant API (`add`, `add_many`, `batch_add`,
+   `query`, `find_path`, `neighbours`, `export_graphml`, `import_graphml`) hides
+   all backend quirks so agent authors stay focused on domain logic.
+5. **Batched writes.**  Neo4j writes are buffered and flushed as `UNWIND`
+   statements in one transaction once ``GRAPH_BATCH_SIZE`` relations are
+   pending or ``GRAPH_FLUSH_SECS`` have passed; reads flush first.
+6. **No hard crashes – ever.**  All optional libs are soft-imported, connection
    retries use exponential back-off, and every public call is exception-tamed.
 
 Quick-start
@@ -45,6 +48,7 @@ import random
 import re
 import threading
 import time
+import weakref
 from contextlib import contextmanager
 from typing import Any, Dict, Iterable, List, Optional, Tuple
 
@@ -98,6 +102,10 @@ else:  # pragma: no cover
 _LOCK = threading.RLock()
 _JITTER = random.Random(42)
 _REL_RE = re.compile(r"^[A-Za-z0-9_]+$")
+_BATCH_SIZE = int(os.getenv("GRAPH_BATCH_SIZE", "5000"))
+_FLUSH_SECS = float(os.getenv("GRAPH_FLUSH_SECS", "1.0"))
+
+Relation = Tuple[str, str, str] | Tuple[str, str, str, Dict[str, Any]]
 
 
 # ═════════════════════════ helper utilities ════════════════════════
@@ -126,6 +134,19 @@ def _to_int(val: Any, default: int = 0) -> int:  # noqa: D401
         return default
 
 
+def _flush_loop(ref: "weakref.ref[GraphMemory]", wake: threading.Event, interval: float) -> None:
+    """Time-based flusher; holds only a weak reference so GC can close the graph."""
+    while not wake.wait(interval):
+        graph = ref()
+        if graph is None:
+            return
+        try:
+            graph.flush()
+        except Exception as exc:
+            _log.warning("GraphMemory background flush failed (%s)", exc)
+        del graph
+
+
 def _validate_rel(rel: str) -> str:
     """Validate relationship name."""
     if not _REL_RE.match(rel):
@@ -145,6 +166,10 @@ class GraphMemory:
         is absent, the class silently falls back to an in-memory graph.
     database :
         Neo4j DB name (default ``neo4j``).
+    batch_size / flush_interval :
+        Pending Neo4j relations that trigger a flush, and the longest a
+        buffered write may wait (defaults: ``GRAPH_BATCH_SIZE`` /
+        ``GRAPH_FLUSH_SECS``).
     """
 
     # ─────────────────────────── init ────────────────────────────
@@ -155,6 +180,8 @@ class GraphMemory:
         password: Optional[str] = None,
         *,
         database: str | None = None,
+        batch_size: int | None = None,
+        flush_interval: float | None = None,
     ) -> None:
         uri = uri or os.getenv("NEO4J_URI")
         user = user or os.getenv("NEO4J_USER")
@@ -164,6 +191,15 @@ class GraphMemory:
         self._driver = None
         self._g = None  # in-memory graph (NetworkX or stub)
         self._backend = "stub"
+        self._batch_size = max(1, batch_size or _BATCH_SIZE)
+        self._flush_interval = _FLUSH_SECS if flush_interval is None else flush_interval
+        self._pending_nodes: Dict[str, None] = {}
+        self._pending_rels: Dict[str, List[Dict[str, Any]]] = {}
+        self._pending = 0
+        self._flusher: threading.Thread | None = None
+        self._wake = threading.Event()
+        self._n_nodes = 0
+        self._n_edges = 0
 
         # Try Neo4j first
         if _HAS_NEO and uri and user and password:
@@ -174,6 +210,7 @@ class GraphMemory:
                     max_connection_pool_size=16,
                 )
                 self._ensure_schema()
+                self._refresh_gauges()
                 _log.info("GraphMemory connected to Neo4j @ %s", uri)
                 self._backend = "neo4j"
             except Exception as exc:  # pragma: no cover
@@ -198,6 +235,9 @@ class GraphMemory:
                     def add_edge(self, u, v, key=None, **d):
                         self._edges.append((u, v, key, d))
 
+                    def has_edge(self, u, v, key=None):  # duplicates are kept
+                        return False
+
                     def number_of_nodes(self):
                         return len(self.nodes)
 
@@ -248,25 +288,45 @@ class GraphMemory:
         * ``src`` & ``dst`` nodes are auto-created if absent.
         * ``props`` (dict) may store arbitrary JSON-serialisable metadata
           (e.g. ``{"delta_alpha": 42, "agent": "Finance"}``).
+        * On Neo4j the write is buffered; see :meth:`flush`.
+        """
+        self.add_many([(src, rel, dst, props or {})])
+
+    # ------------------------------------------------------------------
+    def add_many(self, relations: Iterable[Relation]) -> None:
+        """
+        Bulk-insert ``(src, rel, dst)`` or ``(src, rel, dst, props)`` relations.
+
+        Same semantics as repeated :meth:`add` on every backend, at one
+        buffer append (Neo4j) or one graph insert (in-memory) per relation.
         """
-        props = props or {}
-        rel = _validate_rel(rel)
+        rows = [(r[0], _validate_rel(r[1]), r[2], r[3] if len(r) > 3 else {}) for r in relations]  # type: ignore[misc]
+        if not rows:
+            return
         with _LOCK:
-            self._upsert_node(src)
-            self._upsert_node(dst)
-            if self._driver:  # Neo4j path
-                cy = (
-                    "MATCH (a:Entity {name:$src}), (b:Entity {name:$dst}) "
-                    f"MERGE (a)-[r:{rel}]->(b) "
-                    "SET r += $props"
-                )
-                with _neo_session(self._driver, self._db) as s:
-                    s.run(cy, src=src, dst=dst, props=props)
-                self._refresh_gauges()
+            if self._driver:
+                for src, rel, dst, props in rows:
+                    self._pending_nodes[src] = None
+                    self._pending_nodes[dst] = None
+                    self._pending_rels.setdefault(rel, []).append({"src": src, "dst": dst, "props": props})
+                self._pending += len(rows)
+                if self._pending >= self._batch_size:
+                    self.flush()
+                else:
+                    self._start_flusher()
             else:  # NX / stub
-                self._g.add_edge(src, dst, key=rel, **props)  # type: ignore[arg-type]
-                self._refresh_gauges_nx()
-        _MET_REL_ADD.inc()
+                g = self._g
+                for src, rel, dst, props in rows:
+                    g.add_node(src)  # type: ignore[attr-defined]
+                    g.add_node(dst)  # type: ignore[attr-defined]
+                    if not g.has_edge(src, dst, rel):  # type: ignore[attr-defined]
+                        self._n_edges += 1
+                    g.add_edge(src, dst, key=rel, **props)  # type: ignore[attr-defined]
+                self._n_nodes = g.number_of_nodes()  # type: ignore[attr-defined]
+                _MET_NODE_UPS.inc(len({n for src, _, dst, _ in rows for n in (src, dst)}))
+                _MET_NODE_G.set(self._n_nodes)
+                _MET_EDGE_G.set(self._n_edges)
+        _MET_REL_ADD.inc(len(rows))
 
     # ------------------------------------------------------------------
     def batch_add(
@@ -280,31 +340,32 @@ class GraphMemory:
         All triples share ``default_props`` – handy for timestamping events.
         """
         default_props = default_props or {}
-        triples = [(s, _validate_rel(r), d) for s, r, d in list(triples)]  # may be generator
-        if not triples:
-            return
+        self.add_many((s, r, d, default_props) for s, r, d in triples)
+
+    # ------------------------------------------------------------------
+    def flush(self) -> None:
+        """Write buffered Neo4j relations in a single transaction."""
         with _LOCK:
-            if self._driver:
-                # group by rel to avoid dynamic rel-type in UNWIND
-                buckets: Dict[str, List[Tuple[str, str, str]]] = {}
-                for s, r, d in triples:
-                    buckets.setdefault(r, []).append((s, r, d))
-                with _neo_session(self._driver, self._db) as sess:
-                    for rel, rows in buckets.items():
-                        cy = (
-                            "UNWIND $rows AS row "
-                            "MERGE (a:Entity {name:row[0]}) "
-                            "MERGE (b:Entity {name:row[2]}) "
-                            f"MERGE (a)-[r:{rel}]->(b) "
-                            "SET r += $props"
-                        )
-                        sess.run(cy, rows=[list(t) for t in rows], props=default_props)
-                self._refresh_gauges()
-            else:
-                for s, r, d in triples:
-                    self._g.add_edge(s, d, key=r, **default_props)  # type: ignore[arg-type]
-                self._refresh_gauges_nx()
-        _MET_REL_ADD.inc(len(triples))
+            if not self._driver or not self._pending:
+                return
+            nodes = list(self._pending_nodes)
+            rels = self._pending_rels
+            self._pending_nodes, self._pending_rels, self._pending = {}, {}, 0
+            try:
+                created_nodes, created_edges = self._write_batch(nodes, rels)
+            except Exception:
+                # keep the batch for the next attempt
+                for name in nodes:
+                    self._pending_nodes.setdefault(name, None)
+                for rel, rows in rels.items():
+                    self._pending_rels.setdefault(rel, [])[:0] = rows
+                self._pending += sum(len(r) for r in rels.values())
+                raise
+            _MET_NODE_UPS.inc(len(nodes))
+            self._n_nodes += created_nodes
+            self._n_edges += created_edges
+            _MET_NODE_G.set(self._n_nodes)
+            _MET_EDGE_G.set(self._n_edges)
 
     # ------------------------------------------------------------------
     @_MET_QRY_LAT.time()  # type: ignore[arg-type]
@@ -312,6 +373,7 @@ class GraphMemory:
         """Run raw **Cypher** – or fallback heuristic filter if offline."""
         _MET_QRY_CNT.inc()
         if self._driver:
+            self.flush()
             with _neo_session(self._driver, self._db) as s:
                 recs = s.run(cypher, **params)
                 return [tuple(r.values()) for r in recs]
@@ -381,14 +443,17 @@ class GraphMemory:
 
     # ------------------------------------------------------------------
     def __len__(self) -> int:
+        """Number of relationships; on Neo4j counted in the database."""
         if self._driver:
             return _to_int(self.query("MATCH ()-[r]->() RETURN count(r)")[0][0])
-        return self._g.number_of_edges()  # type: ignore[attr-defined]
+        return self._n_edges
 
     # ------------------------------------------------------------------
     def clear(self) -> None:
         """Remove all nodes and relationships from the graph."""
         with _LOCK:
+            self._pending_nodes, self._pending_rels, self._pending = {}, {}, 0
+            self._n_nodes = self._n_edges = 0
             if self._driver:
                 with _neo_session(self._driver, self._db) as s:
                     s.run("MATCH (n) DETACH DELETE n")
@@ -403,8 +468,13 @@ class GraphMemory:
 
     # ------------------------------------------------------------------
     def close(self) -> None:
-        """Close any open database connections."""
+        """Flush pending writes and close any open database connections."""
+        self._wake.set()
         if self._driver:
+            try:
+                self.flush()
+            except Exception as exc:  # pragma: no cover - defensive
+                _log.warning("GraphMemory final flush failed (%s)", exc)
             try:
                 self._driver.close()
             except Exception as exc:  # pragma: no cover - defensive
@@ -420,30 +490,55 @@ class GraphMemory:
         self.close()
 
     def __del__(self) -> None:
-        self.close()
+        if hasattr(self, "_wake"):
+            self.close()
 
     # ═══════════════════ internal helpers (private) ══════════════════
-    def _upsert_node(self, name: str) -> None:
-        _MET_NODE_UPS.inc()
-        if self._driver:
-            with _neo_session(self._driver, self._db) as s:
-                s.run("MERGE (:Entity {name:$n})", n=name)
-        else:
-            self._g.add_node(name)  # type: ignore[attr-defined]
+    def _write_batch(self, nodes: List[str], rels: Dict[str, List[Dict[str, Any]]]) -> Tuple[int, int]:
+        """Run one transaction of ``UNWIND`` merges; return (nodes, edges) created."""
+        with _neo_session(self._driver, self._db) as sess:
+            with sess.begin_transaction() as tx:
+                res = tx.run("UNWIND $names AS name MERGE (:Entity {name:name})", names=nodes)
+                created_nodes = res.consume().counters.nodes_created
+                created_edges = 0
+                for rel, rows in rels.items():  # one statement per type: no dynamic rel-types in Cypher
+                    cy = (
+                        "UNWIND $rows AS row "
+                        "MATCH (a:Entity {name:row.src}), (b:Entity {name:row.dst}) "
+                        f"MERGE (a)-[r:{rel}]->(b) "
+                        "SET r += row.props"
+                    )
+                    created_edges += tx.run(cy, rows=rows).consume().counters.relationships_created
+                tx.commit()
+        return created_nodes, created_edges
+
+    def _start_flusher(self) -> None:
+        if self._flusher is not None or self._flush_interval <= 0:
+            return
+        self._flusher = threading.Thread(
+            target=_flush_loop,
+            args=(weakref.ref(self), self._wake, self._flush_interval),
+            name="graph-flush",
+            daemon=True,
+        )
+        self._flusher.start()
 
     def _ensure_schema(self) -> None:
         with _neo_session(self._driver, self._db) as s:
             s.run("CREATE CONSTRAINT IF NOT EXISTS " "FOR (e:Entity) REQUIRE e.name IS UNIQUE")
 
     def _refresh_gauges(self) -> None:
-        n = _to_int(self.query("MATCH (n) RETURN count(n)")[0][0])
-        e = _to_int(self.query("MATCH ()-[r]->() RETURN count(r)")[0][0])
-        _MET_NODE_G.set(n)
-        _MET_EDGE_G.set(e)
+        """Seed the in-memory counts from the database (connect / clear only)."""
+        self._n_nodes = _to_int(self.query("MATCH (n) RETURN count(n)")[0][0])
+        self._n_edges = _to_int(self.query("MATCH ()-[r]->() RETURN count(r)")[0][0])
+        _MET_NODE_G.set(self._n_nodes)
+        _MET_EDGE_G.set(self._n_edges)
 
     def _refresh_gauges_nx(self) -> None:
-        _MET_NODE_G.set(self._g.number_of_nodes())  # type: ignore[attr-defined]
-        _MET_EDGE_G.set(self._g.number_of_edges())  # type: ignore[attr-defined]
+        self._n_nodes = self._g.number_of_nodes()  # type: ignore[attr-defined]
+        self._n_edges = self._g.number_of_edges()  # type: ignore[attr-defined]
+        _MET_NODE_G.set(self._n_nodes)
+        _MET_EDGE_G.set(self._n_edges)
 
     # crude pattern-based filter for offline mode
     def _fallback_query(self, cypher: str) -> List[Tuple[Any, ...]]:
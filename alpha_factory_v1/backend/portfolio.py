@@ -7,6 +7,10 @@ It now **streams each fill** to the live Trace‑graph WebSocket
 
 File locking relies on :mod:`fcntl` or :mod:`msvcrt`. If neither module is
 present, writes proceed without locking and a warning is emitted.
+
+Every ``SNAPSHOT_EVERY`` fills the position book is checkpointed next to the
+ledger together with the ledger's byte length, so start‑up only replays the
+fills appended after the last snapshot.
 """
 
 from __future__ import annotations
@@ -18,9 +22,11 @@ import os
 import time
 from pathlib import Path
 from dataclasses import asdict, dataclass
-from typing import Dict, Iterable
+from typing import Dict, Iterable, Optional
 import logging
 
+from .timeseries_store import load_snapshot, save_snapshot
+
 logger = logging.getLogger(__name__)
 
 try:  # optional OS specific locking modules
@@ -58,20 +64,35 @@ class Fill:
 
 
 class Portfolio:
+    SNAPSHOT_EVERY = 1000
+
     def __init__(self, db_path: Path = DB_PATH) -> None:
-        """Initialize the portfolio and load any persisted fills."""
+        """Initialize the portfolio from the last snapshot plus newer fills."""
         self._db_path = db_path
+        self._snap_path = db_path.with_name(db_path.name + ".snap")
         self._positions: Dict[str, float] = {}
+        # ledger length covered by ``_positions``; ``None`` once another
+        # writer appended fills this instance has not applied
+        self._offset: Optional[int] = 0
+        self._unsnapped = 0
 
-        # ── load existing fills (if any) ──────────────────────────────────
+        # ── load snapshot + replay newer fills (if any) ───────────────────
         if db_path.exists():
-            for line in db_path.read_text().splitlines():
-                try:
-                    rec = Fill(**json.loads(line))
-                except (json.JSONDecodeError, TypeError, KeyError) as exc:
-                    logger.warning("Skipping corrupt fill record: %s", exc)
-                    continue  # skip corrupt lines
-                self._apply(rec, persist=False)
+            snap = load_snapshot(self._snap_path)
+            if snap and 0 <= snap.get("offset", -1) <= db_path.stat().st_size:
+                self._positions = {k: float(v) for k, v in snap["positions"].items()}
+                self._offset = int(snap["offset"])
+            with db_path.open("rb") as fh:
+                fh.seek(self._offset or 0)
+                for line in fh:
+                    try:
+                        rec = Fill(**json.loads(line))
+                    except (json.JSONDecodeError, UnicodeDecodeError, TypeError, KeyError) as exc:
+                        logger.warning("Skipping corrupt fill record: %s", exc)
+                        continue  # skip corrupt lines
+                    self._apply(rec, persist=False)
+                    self._unsnapped += 1
+                self._offset = fh.tell()
 
     # ── public API ────────────────────────────────────────────────────────
     def record_fill(self, symbol: str, qty: float, price: float, side: str) -> None:
@@ -117,8 +138,10 @@ class Portfolio:
     def clear(self) -> None:
         """Erase all persisted fills and reset positions."""
         self._positions.clear()
+        self._snap_path.unlink(missing_ok=True)
         if self._db_path.exists():
             self._db_path.write_text("")
+        self._offset, self._unsnapped = 0, 0
 
     async def arecord_fill(self, symbol: str, qty: float, price: float, side: str) -> None:
         """Async wrapper around :meth:`record_fill`."""
@@ -142,7 +165,7 @@ class Portfolio:
         If neither :mod:`fcntl` nor :mod:`msvcrt` is available, locking is
         skipped and a warning is emitted.
         """
-        fh = self._db_path.open("a")
+        fh = self._db_path.open("ab")
         try:
             if fcntl:
                 fcntl.flock(fh, fcntl.LOCK_EX)
@@ -150,7 +173,15 @@ class Portfolio:
                 msvcrt.locking(fh.fileno(), msvcrt.LK_LOCK, 1)
             else:
                 logger.warning("File locking unavailable; concurrent writes may corrupt the ledger")
-            fh.write(fill.to_json() + "\n")
+            if fh.seek(0, os.SEEK_END) != self._offset:
+                self._offset = None  # foreign fills: our book no longer matches the ledger
+            fh.write((fill.to_json() + "\n").encode())
+            fh.flush()
+            if self._offset is not None:
+                self._offset = fh.tell()
+                self._unsnapped += 1
+                if self._unsnapped >= self.SNAPSHOT_EVERY:
+                    self._snapshot()
         finally:
             try:
                 if fcntl:
@@ -160,6 +191,14 @@ class Portfolio:
             finally:
                 fh.close()
 
+    def _snapshot(self) -> None:
+        try:
+            save_snapshot(self._snap_path, {"offset": self._offset, "positions": self._positions})
+        except OSError:  # pragma: no cover - best effort persistence
+            logger.debug("Portfolio snapshot write failed", exc_info=True)
+            return
+        self._unsnapped = 0
+
     # ── trace‑graph integration ───────────────────────────────────────────
     def _broadcast(self, fill: Fill) -> None:  # pragma: no cover
         """
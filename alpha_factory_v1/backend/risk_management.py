@@ -8,7 +8,9 @@ Self‑contained risk‑management helper for *α‑Factory* FinanceAgent.
 
 • **Historical/Parametric VaR** (value‑at‑risk) at configurable confidence.
 • **Max draw‑down** tracker on the running equity curve.
-• Stateless API + tiny on‑disk cache to survive crashes / restarts.
+• Stateless API + append‑only on‑disk equity log to survive crashes /
+  restarts; a periodic snapshot keeps the running peak so start‑up only
+  replays points recorded since, and VaR reads a memory‑mapped tail.
 
 The module is deliberately NumPy‑only (no heavy pandas dependency) and
 works even when running on constrained edge devices.
@@ -38,7 +40,9 @@ import json
 import logging
 import os
 from pathlib import Path
-from typing import Any, List, Sequence, cast
+from typing import Any, List, cast
+
+from .timeseries_store import SeriesStore
 
 _np: Any
 try:  # pragma: no cover - optional dependency
@@ -59,7 +63,9 @@ class RiskLimitError(RuntimeError):
 
 _CACHE_DIR = Path(os.getenv("ALPHA_DATA_DIR", "/tmp/alphafactory")) / "risk"
 _CACHE_DIR.mkdir(parents=True, exist_ok=True)
-_EQ_CACHE = _CACHE_DIR / "equity_curve.json"
+_EQ_CACHE = _CACHE_DIR / "equity_curve.json"  # legacy format, imported once
+_EQ_STORE = _CACHE_DIR / "equity_curve.f64"
+_SNAPSHOT_EVERY = 256
 
 _LOG = logging.getLogger("alpha_factory.risk")
 
@@ -74,12 +80,12 @@ def _load_equity_cache() -> List[float]:
     return []
 
 
-def _save_equity_cache(curve: Sequence[float]) -> None:
+def _save_equity_snapshot(store: SeriesStore, peak: float) -> None:
     try:
-        _EQ_CACHE.write_text(json.dumps(curve[-5000:]))  # keep ≤ ~5k pts
+        store.snapshot({"peak": peak})
     except Exception:  # pragma: no cover - best effort persistence
         _LOG.debug(
-            "Equity cache write failed – continuing without persistence",
+            "Equity snapshot write failed – continuing without persistence",
             exc_info=True,
         )
 
@@ -100,6 +106,8 @@ class RiskManager:
         Maximum peak‑to‑trough draw‑down allowed (percentage).
     lookback_days:
         Rolling history for VaR in trading days (default 250 ≈ 1y).
+    store_path:
+        Equity log location (defaults to ``$ALPHA_DATA_DIR/risk``).
     """
 
     def __init__(
@@ -109,6 +117,7 @@ class RiskManager:
         max_var_pct: float = 0.02,
         max_drawdown_pct: float = 0.20,
         lookback_days: int = 250,
+        store_path: Path | None = None,
     ) -> None:
         if not 0.9 <= confidence < 1:
             raise ValueError("confidence should be 0.9 ≤ c < 1")
@@ -117,10 +126,17 @@ class RiskManager:
         self.max_drawdown_pct = max_drawdown_pct
         self.lookback = lookback_days
 
-        self._equity_curve: List[float] = _load_equity_cache()
+        self._store = SeriesStore(store_path or _EQ_STORE)
+        if not len(self._store) and store_path is None:
+            for value in _load_equity_cache():
+                self._store.append(float(value))
 
-        # pre‑warm
-        self._peak_equity = max(self._equity_curve, default=0.0)
+        # pre‑warm: snapshot peak + replay of the points recorded since
+        snap = self._store.load_snapshot()
+        tail = self._store.since(int(snap.get("count", 0)))
+        tail_peak = float(tail.max()) if _np is not None and len(tail) else max(tail, default=0.0)
+        self._peak_equity = max(float(snap.get("peak", 0.0)), tail_peak)
+        self._last_equity = self._store.last()
 
     # ------------------------------------------------------------------ API
 
@@ -128,20 +144,22 @@ class RiskManager:
         """Append new equity point and persist to disk."""
         if equity_value <= 0:
             raise ValueError("Equity must be positive")
-        self._equity_curve.append(float(equity_value))
+        self._store.append(float(equity_value))
+        self._last_equity = float(equity_value)
         if equity_value > self._peak_equity:
             self._peak_equity = equity_value
 
-        _save_equity_cache(self._equity_curve)
+        if len(self._store) % _SNAPSHOT_EVERY == 0:
+            _save_equity_snapshot(self._store, self._peak_equity)
 
     def var_pct(self) -> float:
         """Current 1‑day VaR as % of equity (historical / parametric)."""
-        if _np is None or len(self._equity_curve) < 2:
+        if _np is None or len(self._store) < 2:
             # Fallback: pessimistic constant (5 × daily std dev guess)
             return 0.05
 
         # compute daily log‑returns
-        eq = _np.array(self._equity_curve[-self.lookback :], dtype=float)  # noqa: E203
+        eq = self._store.tail(self.lookback)
         rets = _np.diff(_np.log(eq))
         if len(rets) < 10:  # not enough data
             return 0.05
@@ -155,16 +173,16 @@ class RiskManager:
 
     def drawdown_pct(self) -> float:
         """Latest draw‑down from peak, as %."""
-        if not self._equity_curve:
+        last = self._last_equity
+        if last is None:
             return 0.0
-        last = self._equity_curve[-1]
         return (self._peak_equity - last) / self._peak_equity if self._peak_equity else 0.0
 
     # ------------------------------------------------ enforcement / guard
 
     def enforce_limits(self) -> None:
         """Raise :class:`RiskLimitError` if any limit is breached."""
-        current_equity = self._equity_curve[-1] if self._equity_curve else 0.0
+        current_equity = self._last_equity or 0.0
         if current_equity <= 0:  # pragma: no cover
             raise RiskLimitError("Equity unavailable; risk check failed")
 
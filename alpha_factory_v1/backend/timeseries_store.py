@@ -0,0 +1,122 @@
+# SPDX-License-Identifier: Apache-2.0
+"""
+Append‑only on‑disk time series with periodic snapshots.
+
+Used by the risk manager for its equity curve and by the portfolio ledger to
+checkpoint positions, so neither rewrites nor replays its full history.
+
+• :class:`SeriesStore` – raw little‑endian ``float64`` values, one ``write``
+  per point; :meth:`SeriesStore.tail` returns a read‑only memory map.
+• :func:`save_snapshot` / :func:`load_snapshot` – atomic JSON side files
+  holding whatever running state a caller needs to resume from.
+
+Works without NumPy; :meth:`SeriesStore.tail` then returns an :mod:`array`.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import struct
+from array import array
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+try:  # pragma: no cover - optional dependency
+    import numpy as _np
+except ModuleNotFoundError:
+    _np = None
+
+__all__ = ["SeriesStore", "load_snapshot", "save_snapshot"]
+
+_LOG = logging.getLogger("alpha_factory.timeseries")
+
+_F64 = struct.Struct("<d")
+
+
+def save_snapshot(path: Path, state: Dict[str, Any]) -> None:
+    """Atomically replace ``path`` with ``state`` as JSON."""
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(json.dumps(state, separators=(",", ":")))
+    os.replace(tmp, path)
+
+
+def load_snapshot(path: Path) -> Optional[Dict[str, Any]]:
+    """Return the snapshot stored at ``path`` or ``None`` if missing/corrupt."""
+    try:
+        data = json.loads(path.read_text())
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError):
+        _LOG.warning("Ignoring unreadable snapshot %s", path)
+        return None
+    return data if isinstance(data, dict) else None
+
+
+class SeriesStore:
+    """Append‑only ``float64`` series backed by ``path``.
+
+    A torn trailing record from a crash is truncated on open. The companion
+    snapshot lives at ``<path>.snap``; callers record the series length in it
+    and replay only :meth:`since` that length on restart.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+        self.snapshot_path = self.path.with_name(self.path.name + ".snap")
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT | os.O_APPEND, 0o644)
+        size = os.fstat(self._fd).st_size
+        if size % _F64.size:
+            os.ftruncate(self._fd, size - size % _F64.size)
+        self._len = size // _F64.size
+
+    def __len__(self) -> int:
+        return self._len
+
+    def append(self, value: float) -> None:
+        os.write(self._fd, _F64.pack(value))
+        self._len += 1
+
+    def last(self) -> Optional[float]:
+        if not self._len:
+            return None
+        return _F64.unpack(os.pread(self._fd, _F64.size, (self._len - 1) * _F64.size))[0]
+
+    def tail(self, n: int) -> Any:
+        """Return the last ``n`` values, memory‑mapped when NumPy is available."""
+        return self.since(max(0, self._len - n))
+
+    def since(self, start: int) -> Any:
+        """Return values from index ``start`` to the end."""
+        count = max(0, self._len - start)
+        if _np is not None:
+            if not count:
+                return _np.empty(0)
+            return _np.memmap(self.path, dtype="<f8", mode="r", offset=start * _F64.size, shape=(count,))
+        out = array("d")
+        out.frombytes(os.pread(self._fd, count * _F64.size, start * _F64.size))
+        return out
+
+    def snapshot(self, state: Dict[str, Any]) -> None:
+        """Persist ``state`` together with the current series length."""
+        save_snapshot(self.snapshot_path, {**state, "count": self._len})
+
+    def load_snapshot(self) -> Dict[str, Any]:
+        """Return the last snapshot still consistent with the series (or ``{}``)."""
+        snap = load_snapshot(self.snapshot_path)
+        if not snap or not 0 <= int(snap.get("count", -1)) <= self._len:
+            return {}
+        return snap
+
+    def close(self) -> None:
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+    def __del__(self) -> None:  # pragma: no cover - best effort
+        try:
+            self.close()
+        except Exception:
+            pass
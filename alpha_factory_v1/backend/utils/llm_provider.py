@@ -24,7 +24,8 @@ Design pillars
 --------------
 1. Single **call-site** for every agent → ``llm.chat(...)``.
 2. **Provider-cascade** → automatic fail-over & rate-limit budgeting.
-3. **Disk cache** (SQLite) + in-mem LRU to slash cost/latency.
+3. **Disk cache** (SQLite) + in-mem LRU to slash cost/latency, with an
+   optional embedding-similarity tier for near-duplicate prompts.
 4. Full **observability** – Prometheus counters + latency histograms.
 5. **Extensible** – drop a new provider in `_providers/` and it registers
    automatically (≤10 LOC).
@@ -35,6 +36,7 @@ from __future__ import annotations
 
 # ───────────────────────── stdlib ──────────────────────────
 import asyncio
+import contextlib
 import dataclasses
 import functools
 import hashlib
@@ -97,6 +99,17 @@ if _HAS_PROM:
         "Latency",
         ["provider"],
     )
+    _CNT_SEM = metrics_registry.get_metric(
+        Counter,
+        "af_llm_semantic_cache_total",
+        "Semantic cache lookups",
+        ["result"],
+    )
+    _CNT_SEM_SAVED = metrics_registry.get_metric(
+        Counter,
+        "af_llm_semantic_cache_saved_seconds_total",
+        "Provider latency avoided by semantic cache hits",
+    )
 else:  # no-op stubs
 
     class _N:
@@ -109,7 +122,7 @@ else:  # no-op stubs
         def observe(self, *_, **__):
             ...
 
-    _CNT_REQ = _CNT_TOK = _HIST_LAT = _N()  # type: ignore
+    _CNT_REQ = _CNT_TOK = _HIST_LAT = _CNT_SEM = _CNT_SEM_SAVED = _N()  # type: ignore
 
 
 # ─────────────────── token estimation util ─────────────────
@@ -184,6 +197,75 @@ def _cache_put(h: str, out: str, prov: str) -> None:
             )
 
 
+# ─────────────────── semantic cache tier ───────────────────
+_SEMANTIC = os.getenv("AF_LLM_SEMANTIC_CACHE", "").lower() in {"1", "true", "yes"}
+_SEM_THRESHOLD = float(os.getenv("AF_LLM_SEMANTIC_THRESHOLD", "0.92"))
+_SEM_SIZE = int(os.getenv("AF_LLM_SEMANTIC_SIZE", "4096"))  # entries per namespace
+_SEM_TTL = float(os.getenv("AF_LLM_SEMANTIC_TTL", str(_TTL)))
+_SEM_MODEL = os.getenv("AF_LLM_SEMANTIC_MODEL")
+
+# model knob per provider, so answers are only shared within one model
+_MODEL_ENV = {
+    "openai": ("OPENAI_MODEL", "gpt-4o-mini"),
+    "anthropic": ("ANTHROPIC_MODEL", "claude-3-opus-20240229"),
+    "gemini": ("GOOGLE_MODEL", "gemini-pro"),
+    "mistral": ("MISTRAL_MODEL", "mistral-large-latest"),
+    "together": ("TOGETHER_MODEL", "mistralai/Mixtral-8x22B-Instruct-v0.1"),
+    "tgi": ("TGI_ENDPOINT", ""),
+    "ollama": ("OLLAMA_MODEL", "llama3"),
+    "llama": ("LLAMA_MODEL_PATH", ""),
+}
+
+_sem_cache: Any = None
+
+
+def _namespace(provider: str) -> str:
+    env, default = _MODEL_ENV.get(provider, ("", ""))
+    return f"{provider}:{os.getenv(env, default) if env else ''}"
+
+
+def _semantic() -> Any:
+    """Return the shared :class:`SemanticCache`, building it on first use."""
+
+    global _sem_cache, _SEMANTIC
+    if _sem_cache is None and _SEMANTIC:
+        try:
+            from .semantic_cache import SemanticCache, hashed_ngram_embedder, sbert_embedder
+
+            embed = hashed_ngram_embedder()
+            if _SEM_MODEL:
+                with contextlib.suppress(ModuleNotFoundError):
+                    embed = sbert_embedder(_SEM_MODEL)
+            _sem_cache = SemanticCache(_DB, embed, threshold=_SEM_THRESHOLD, ttl=_SEM_TTL, max_entries=_SEM_SIZE)
+        except Exception as exc:
+            _log.warning("Semantic cache disabled: %s", exc)
+            _SEMANTIC = False
+    return _sem_cache
+
+
+def _prompt_text(messages: Sequence[Dict[str, str]]) -> str:
+    return "\n".join(f"{m['role']}: {m['content']}" for m in messages)
+
+
+def _semantic_get(messages: Sequence[Dict[str, str]]) -> str | None:
+    sem = _semantic()
+    if sem is None:
+        return None
+    hit = sem.lookup([_namespace(n) for n in _PROVIDERS], _prompt_text(messages))
+    if hit is None:
+        _CNT_SEM.labels("miss").inc()
+        return None
+    _CNT_SEM.labels("hit").inc()
+    _CNT_SEM_SAVED.inc(hit[2])
+    return hit[0]
+
+
+def _semantic_put(messages: Sequence[Dict[str, str]], out: str, prov: str, latency: float) -> None:
+    sem = _semantic()
+    if sem is not None:
+        sem.store(_namespace(prov), _prompt_text(messages), out, latency)
+
+
 # ───────────────── rate-limit budgeting ────────────────────
 @dataclasses.dataclass
 class _Budget:
@@ -558,6 +640,13 @@ class LLMProvider:
     * ``AF_RPM_LIMIT`` / ``AF_TPM_LIMIT`` – per-provider budgets.
     * ``AF_LOG_PROMPTS`` – if *truthy*, user prompts are logged verbatim.
     * ``AF_LLM_PROVIDERS`` – comma-separated provider order override.
+    * ``AF_LLM_SEMANTIC_CACHE`` – if *truthy*, near-duplicate prompts reuse a
+      cached answer from the same provider/model.
+    * ``AF_LLM_SEMANTIC_THRESHOLD`` – cosine similarity for a hit (default 0.92).
+    * ``AF_LLM_SEMANTIC_SIZE`` / ``AF_LLM_SEMANTIC_TTL`` – per-model entry
+      budget (default 4096) and expiry (default ``AF_LLM_CACHE_TTL``).
+    * ``AF_LLM_SEMANTIC_MODEL`` – sentence-transformers model for embeddings;
+      hashed n-grams are used when unset or unavailable.
     """
 
     def __init__(self, *, temperature: float = 0.7, max_tokens: int = 512) -> None:
@@ -607,13 +696,19 @@ class LLMProvider:
             if hit := _cache_get(hsh):
                 _CNT_REQ.labels("cache", "hit").inc()
                 return hit
+            if _SEMANTIC and (hit := _semantic_get(msgs)):
+                _CNT_REQ.labels("cache", "semantic_hit").inc()
+                return hit
 
         last_exc: Optional[Exception] = None
         for name, prov in _PROVIDERS.items():
             try:
+                t0 = time.perf_counter()
                 out = prov.chat(msgs, temperature, max_tokens, stream, stop)
                 if not stream and cache:
                     _cache_put(hsh, out, name)  # type: ignore[arg-type]
+                    if _SEMANTIC:
+                        _semantic_put(msgs, out, name, time.perf_counter() - t0)  # type: ignore[arg-type]
                 return out
             except Exception as e:
                 last_exc = e
@@ -0,0 +1,260 @@
+# SPDX-License-Identifier: Apache-2.0
+"""
+alpha_factory_v1.backend.utils.semantic_cache
+=============================================
+
+Embedding-similarity tier for the LLM response cache.
+
+Prompts are embedded and compared by cosine similarity against earlier
+prompts in the same namespace (one per provider/model pair), so slightly
+reworded planner calls reuse a stored answer instead of hitting the model.
+Entries live in a ``semantic_cache`` table next to the exact-match SQLite
+cache and are mirrored in an in-memory matrix per namespace. Expired rows are
+skipped at lookup time and purged together with the oldest rows whenever a
+namespace exceeds its size budget.
+
+The default embedder hashes word and character-trigram features, which needs
+only NumPy and is robust to small rewordings. Set ``AF_LLM_SEMANTIC_MODEL``
+to a sentence-transformers model name for true semantic matching.
+"""
+from __future__ import annotations
+
+import re
+import sqlite3
+import threading
+import time
+import zlib
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+EmbedFn = Callable[[str], np.ndarray]
+
+_WORD = re.compile(r"\w+")
+
+__all__ = ["SemanticCache", "hashed_ngram_embedder", "sbert_embedder"]
+
+
+def hashed_ngram_embedder(dim: int = 512) -> EmbedFn:
+    """Return a dependency-free embedder based on hashed n-gram counts."""
+
+    def _embed(text: str) -> np.ndarray:
+        vec = np.zeros(dim, dtype=np.float32)
+        words = _WORD.findall(text.lower())
+        feats: List[str] = list(words)
+        for w in words:
+            padded = f" {w} "
+            feats.extend(padded[i : i + 3] for i in range(len(padded) - 2))
+        for f in feats:
+            h = zlib.crc32(f.encode())
+            vec[h % dim] += 1.0 if h & 0x80000000 else -1.0
+        norm = float(np.linalg.norm(vec))
+        return vec / norm if norm else vec
+
+    return _embed
+
+
+def sbert_embedder(model_name: str) -> EmbedFn:
+    """Return a sentence-transformers embedder producing unit vectors."""
+
+    from sentence_transformers import SentenceTransformer  # type: ignore
+
+    model = SentenceTransformer(model_name)
+
+    def _embed(text: str) -> np.ndarray:
+        return np.asarray(model.encode(text, normalize_embeddings=True), dtype=np.float32)
+
+    return _embed
+
+
+class _Namespace:
+    """Column buffers for one namespace, grown by doubling.
+
+    ``ids``, ``ts``, ``lat`` and ``vecs`` are views of the first ``n`` rows,
+    so appends are amortised O(dim) instead of copying every column.
+    """
+
+    def __init__(self, ids: np.ndarray, ts: np.ndarray, lat: np.ndarray, vecs: np.ndarray, outs: List[str]) -> None:
+        self.n = len(ids)
+        cap = max(8, self.n)
+        self._ids = np.empty(cap, dtype=np.int64)
+        self._ts = np.empty(cap, dtype=np.float64)
+        self._lat = np.empty(cap, dtype=np.float64)
+        self._vecs = np.empty((cap, vecs.shape[1]), dtype=np.float32)
+        self._ids[: self.n], self._ts[: self.n], self._lat[: self.n], self._vecs[: self.n] = ids, ts, lat, vecs
+        self.outs = outs
+
+    @classmethod
+    def empty(cls, dim: int) -> "_Namespace":
+        return cls(
+            np.empty(0, dtype=np.int64),
+            np.empty(0, dtype=np.float64),
+            np.empty(0, dtype=np.float64),
+            np.empty((0, dim), dtype=np.float32),
+            [],
+        )
+
+    @property
+    def ids(self) -> np.ndarray:
+        return self._ids[: self.n]
+
+    @property
+    def ts(self) -> np.ndarray:
+        return self._ts[: self.n]
+
+    @property
+    def lat(self) -> np.ndarray:
+        return self._lat[: self.n]
+
+    @property
+    def vecs(self) -> np.ndarray:
+        return self._vecs[: self.n]
+
+    def append(self, row_id: int, ts: float, lat: float, vec: np.ndarray, out: str) -> None:
+        if self.n == len(self._ids):
+            cap = 2 * len(self._ids)
+            for name in ("_ids", "_ts", "_lat", "_vecs"):
+                old = getattr(self, name)
+                new = np.empty((cap, *old.shape[1:]), dtype=old.dtype)
+                new[: self.n] = old[: self.n]
+                setattr(self, name, new)
+        i = self.n
+        self._ids[i], self._ts[i], self._lat[i], self._vecs[i] = row_id, ts, lat, vec
+        self.outs.append(out)
+        self.n += 1
+
+    def keep(self, mask: np.ndarray) -> None:
+        n = int(mask.sum())
+        for name in ("_ids", "_ts", "_lat", "_vecs"):
+            col = getattr(self, name)
+            col[:n] = col[: self.n][mask]
+        self.outs = [o for o, k in zip(self.outs, mask.tolist()) if k]
+        self.n = n
+
+
+class SemanticCache:
+    """Cosine-similarity cache of LLM answers, partitioned by namespace.
+
+    Args:
+        conn: SQLite connection used for persistence, or ``None`` for an
+            in-memory cache.
+        embed: Function returning a unit-norm ``float32`` vector for a prompt.
+        threshold: Minimum cosine similarity counted as a hit.
+        ttl: Seconds after which an entry is ignored and later purged.
+        max_entries: Size budget per namespace; the oldest entries go first.
+    """
+
+    def __init__(
+        self,
+        conn: Optional[sqlite3.Connection],
+        embed: EmbedFn,
+        *,
+        threshold: float = 0.92,
+        ttl: float = 86400.0,
+        max_entries: int = 4096,
+    ) -> None:
+        self.conn = conn
+        self.embed = embed
+        self.threshold = threshold
+        self.ttl = ttl
+        self.max_entries = max(1, max_entries)
+        self.hits = 0
+        self.misses = 0
+        self.latency_saved = 0.0
+        self._dim = int(embed("").shape[0])
+        self._spaces: Dict[str, _Namespace] = {}
+        self._lock = threading.Lock()
+        if conn is not None:
+            with conn:
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS semantic_cache("
+                    "id INTEGER PRIMARY KEY AUTOINCREMENT, ns TEXT NOT NULL, ts REAL NOT NULL, "
+                    "lat REAL NOT NULL, vec BLOB NOT NULL, out TEXT NOT NULL)"
+                )
+                conn.execute("CREATE INDEX IF NOT EXISTS idx_semantic_cache_ns ON semantic_cache(ns, id)")
+
+    # ------------------------------------------------------------ storage
+    def _space(self, ns: str) -> _Namespace:
+        space = self._spaces.get(ns)
+        if space is not None:
+            return space
+        space = _Namespace.empty(self._dim)
+        if self.conn is not None:
+            rows = self.conn.execute(
+                "SELECT id, ts, lat, vec, out FROM semantic_cache WHERE ns=? AND ts>? ORDER BY id",
+                (ns, time.time() - self.ttl),
+            ).fetchall()
+            rows = [r for r in rows if len(r[3]) == self._dim * 4][-self.max_entries :]
+            if rows:
+                space = _Namespace(
+                    np.array([r[0] for r in rows], dtype=np.int64),
+                    np.array([r[1] for r in rows], dtype=np.float64),
+                    np.array([r[2] for r in rows], dtype=np.float64),
+                    np.frombuffer(b"".join(r[3] for r in rows), dtype=np.float32).reshape(len(rows), self._dim).copy(),
+                    [r[4] for r in rows],
+                )
+        self._spaces[ns] = space
+        return space
+
+    def _evict(self, ns: str, space: _Namespace) -> None:
+        # trim in batches so eviction stays amortised O(1) per insert
+        if len(space.ids) <= self.max_entries + self.max_entries // 8:
+            return
+        keep = space.ts > time.time() - self.ttl
+        excess = int(keep.sum()) - self.max_entries
+        if excess > 0:
+            keep[np.flatnonzero(keep)[:excess]] = False
+        dropped = space.ids[~keep]
+        space.keep(keep)
+        if self.conn is not None and len(dropped):
+            with self.conn:
+                self.conn.executemany("DELETE FROM semantic_cache WHERE id=?", [(int(i),) for i in dropped])
+
+    # --------------------------------------------------------------- API
+    def lookup(self, namespaces: Sequence[str], text: str) -> Optional[Tuple[str, float, float]]:
+        """Return ``(answer, similarity, latency)`` of the first fresh match.
+
+        Namespaces are searched in order and ``latency`` is the provider time
+        recorded when the answer was stored.
+        """
+
+        q = self.embed(text)
+        now = time.time()
+        with self._lock:
+            for ns in namespaces:
+                space = self._space(ns)
+                if not len(space.ids):
+                    continue
+                sims = space.vecs @ q
+                sims[space.ts <= now - self.ttl] = -np.inf
+                best = int(np.argmax(sims))
+                if sims[best] >= self.threshold:
+                    self.hits += 1
+                    self.latency_saved += float(space.lat[best])
+                    return space.outs[best], float(sims[best]), float(space.lat[best])
+            self.misses += 1
+        return None
+
+    def store(self, ns: str, text: str, out: str, latency: float = 0.0) -> None:
+        """Remember ``out`` as the answer to ``text`` within ``ns``."""
+
+        vec = self.embed(text).astype(np.float32)
+        now = time.time()
+        with self._lock:
+            space = self._space(ns)
+            row_id = int(space.ids[-1]) + 1 if len(space.ids) else 0
+            if self.conn is not None:
+                with self.conn:
+                    cur = self.conn.execute(
+                        "INSERT INTO semantic_cache(ns, ts, lat, vec, out) VALUES(?,?,?,?,?)",
+                        (ns, now, latency, vec.tobytes(), out),
+                    )
+                row_id = int(cur.lastrowid or row_id)
+            space.append(row_id, now, latency, vec, out)
+            self._evict(ns, space)
+
+    def __len__(self) -> int:
+        return sum(len(s.ids) for s in self._spaces.values())
+
+    def stats(self) -> Dict[str, float]:
+        return {"hits": self.hits, "misses": self.misses, "latency_saved": self.latency_saved, "entries": len(self)}
@@ -0,0 +1,228 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Wire codecs for :class:`~alpha_factory_v1.common.utils.messaging.A2ABus` envelopes.
+
+``json`` is the historic format: a UTF-8 JSON object carrying ``sender``,
+``recipient``, ``ts``, ``payload`` and an optional ``token``. Binary codecs
+frame the token as ``!H`` length + bytes followed by the body:
+
+* ``proto`` – the serialised :class:`a2a_pb2.Envelope`; decoding parses the
+  frame in place from a ``memoryview`` without intermediate dicts.
+* ``msgpack`` – a MessagePack map, registered when ``msgpack`` is installed.
+  It decodes into :class:`a2a_pb2.Envelope` too, so it needs the proto module.
+
+Every base codec also has ``+zlib`` and, with ``zstandard`` installed, ``+zstd``
+variants that compress frames above :data:`COMPRESS_MIN` bytes. Peers agree on
+a codec with :func:`negotiate`; additional codecs can be added with
+:func:`register`.
+"""
+
+from __future__ import annotations
+
+import abc
+import json
+import struct
+import zlib
+from typing import Any, Callable, Dict, List, Sequence, Tuple
+
+from google.protobuf import json_format
+
+try:
+    from alpha_factory_v1.core.utils import a2a_pb2 as pb
+except Exception:  # pragma: no cover - optional proto
+    pb = None
+
+try:
+    import msgpack
+except ModuleNotFoundError:  # pragma: no cover - optional
+    msgpack = None
+
+try:
+    import zstandard
+except ModuleNotFoundError:  # pragma: no cover - optional
+    zstandard = None
+
+__all__ = ["COMPRESS_MIN", "Codec", "available", "get", "negotiate", "register"]
+
+#: Frames smaller than this are sent uncompressed by the ``+zlib``/``+zstd`` codecs.
+COMPRESS_MIN = 1024
+
+_TOKEN = struct.Struct("!H")
+
+Decoded = Tuple[Any, "str | None"]
+
+
+def _fields(env: Any) -> Dict[str, Any]:
+    if pb is not None and isinstance(env, pb.Envelope):
+        return json_format.MessageToDict(env, preserving_proto_field_name=True)
+    return dict(env.__dict__)
+
+
+def _envelope(data: Dict[str, Any]) -> Any:
+    env = pb.Envelope(
+        sender=data.get("sender", ""),
+        recipient=data.get("recipient", ""),
+        ts=float(data.get("ts", 0.0)),
+    )
+    if isinstance(data.get("payload"), dict):
+        env.payload.update(data["payload"])
+    return env
+
+
+def _frame(token: str | None, body: bytes) -> bytes:
+    tok = (token or "").encode()
+    return _TOKEN.pack(len(tok)) + tok + body
+
+
+def _unframe(data: bytes | memoryview) -> Tuple[str | None, memoryview]:
+    view = memoryview(data)
+    (n,) = _TOKEN.unpack_from(view)
+    end = _TOKEN.size + n
+    token = bytes(view[_TOKEN.size : end]).decode() if n else None
+    return token, view[end:]
+
+
+class Codec(abc.ABC):
+    """Encode envelopes to bytes and back.
+
+    ``encode`` accepts an :class:`a2a_pb2.Envelope` or any object exposing
+    ``sender``, ``recipient``, ``ts`` and ``payload`` attributes; ``decode``
+    returns the envelope and the bus token it carried.
+    """
+
+    name = ""
+
+    @abc.abstractmethod
+    def encode(self, env: Any, token: str | None = None) -> bytes:
+        """Return the wire frame for ``env`` carrying ``token``."""
+
+    @abc.abstractmethod
+    def decode(self, data: bytes | memoryview) -> Decoded:
+        """Return ``(envelope, token)`` parsed from ``data``."""
+
+
+class JsonCodec(Codec):
+    name = "json"
+
+    def encode(self, env: Any, token: str | None = None) -> bytes:
+        data = _fields(env)
+        if token:
+            data["token"] = token
+        return json.dumps(data).encode()
+
+    def decode(self, data: bytes | memoryview) -> Decoded:
+        obj = json.loads(bytes(data))
+        token = obj.pop("token", None)
+        return _envelope(obj), token
+
+
+class ProtoCodec(Codec):
+    name = "proto"
+
+    def encode(self, env: Any, token: str | None = None) -> bytes:
+        if not isinstance(env, pb.Envelope):
+            env = _envelope(_fields(env))
+        return _frame(token, env.SerializeToString())
+
+    def decode(self, data: bytes | memoryview) -> Decoded:
+        token, body = _unframe(data)
+        return pb.Envelope.FromString(body), token
+
+
+class MsgpackCodec(Codec):
+    name = "msgpack"
+
+    def encode(self, env: Any, token: str | None = None) -> bytes:
+        return _frame(token, msgpack.packb(_fields(env)))
+
+    def decode(self, data: bytes | memoryview) -> Decoded:
+        token, body = _unframe(data)
+        return _envelope(msgpack.unpackb(body)), token
+
+
+class CompressedCodec(Codec):
+    """Wrap ``inner`` and compress frames of at least ``min_size`` bytes.
+
+    Each frame starts with a flag byte: ``0`` for raw, ``1`` for compressed.
+    """
+
+    def __init__(
+        self,
+        inner: Codec,
+        suffix: str,
+        compress: Callable[[bytes], bytes],
+        decompress: Callable[[bytes | memoryview], bytes],
+        *,
+        min_size: int = COMPRESS_MIN,
+    ) -> None:
+        self.inner = inner
+        self.name = f"{inner.name}+{suffix}"
+        self._compress = compress
+        self._decompress = decompress
+        self.min_size = min_size
+
+    def encode(self, env: Any, token: str | None = None) -> bytes:
+        raw = self.inner.encode(env, token)
+        if len(raw) < self.min_size:
+            return b"\x00" + raw
+        return b"\x01" + self._compress(raw)
+
+    def decode(self, data: bytes | memoryview) -> Decoded:
+        view = memoryview(data)
+        body = view[1:]
+        if view[0]:
+            body = memoryview(self._decompress(body))
+        return self.inner.decode(body)
+
+
+_CODECS: Dict[str, Codec] = {}
+
+
+def register(codec: Codec) -> None:
+    """Make ``codec`` available for negotiation under ``codec.name``."""
+    _CODECS[codec.name] = codec
+
+
+def get(name: str) -> Codec:
+    """Return the codec registered as ``name``."""
+    try:
+        return _CODECS[name]
+    except KeyError:
+        raise ValueError(f"unknown envelope codec {name!r}") from None
+
+
+def available() -> List[str]:
+    """Return the registered codec names."""
+    return list(_CODECS)
+
+
+def negotiate(offered: Sequence[str], allowed: Sequence[str] | None = None) -> Codec:
+    """Return the first ``offered`` codec this side supports.
+
+    ``allowed`` restricts the choice to a subset of the registered codecs.
+    Falls back to ``json``, which every peer understands.
+    """
+    for name in offered:
+        if name in _CODECS and (allowed is None or name in allowed):
+            return _CODECS[name]
+    return _CODECS["json"]
+
+
+def _zstd_compress(data: bytes) -> bytes:
+    return zstandard.ZstdCompressor(level=3).compress(data)
+
+
+def _zstd_decompress(data: bytes | memoryview) -> bytes:
+    return zstandard.ZstdDecompressor().decompress(data)
+
+
+_bases: List[Codec] = [JsonCodec()]
+if pb is not None:
+    _bases.append(ProtoCodec())
+    if msgpack is not None:
+        _bases.append(MsgpackCodec())
+for _base in _bases:
+    register(_base)
+    register(CompressedCodec(_base, "zlib", lambda b: zlib.compress(b, 1), zlib.decompress))
+    if zstandard is not None:
+        register(CompressedCodec(_base, "zstd", _zstd_compress, _zstd_decompress))
+del _base
@@ -2,7 +2,9 @@
 """Structured logging and Merkle root broadcasting.
 
 The :class:`Ledger` class appends envelopes to a local database (SQLite by
-default) and can periodically broadcast the Merkle root to Solana.
+default) and can periodically broadcast the Merkle root to Solana. With
+``group_commit`` enabled, envelopes are queued and written by a background
+thread in one transaction per batch.
 ``setup`` configures console logging, optionally emitting JSON lines.
 """
 
@@ -14,12 +16,15 @@ import asyncio
 import contextlib
 import json
 import logging
+import queue
 import sqlite3
 import os
+import threading
+import time
 from datetime import datetime
 import dataclasses
 from pathlib import Path
-from typing import Iterable, List, cast
+from typing import Any, Iterable, Iterator, List, cast
 
 try:  # optional dependency for colorized output
     import coloredlogs
@@ -27,6 +32,7 @@ except Exception:  # pragma: no cover - optional
     coloredlogs = None
 
 from . import messaging
+from .merkle import MerkleAccumulator
 from google.protobuf import json_format
 from typing import TYPE_CHECKING
 
@@ -100,8 +106,40 @@ def _merkle_root(hashes: Iterable[str]) -> str:
     return nodes[0].hex()
 
 
+# sqlite ``PRAGMA synchronous`` level for each durability setting
+_DURABILITY = {"full": "FULL", "normal": "NORMAL", "off": "OFF"}
+# queue marker asking the writer to commit its pending batch now
+_FLUSH = object()
+
+
+def _digest(data: bytes) -> bytes:
+    return cast(bytes, blake3(data).digest())
+
+
 class Ledger:
-    """Append-only ledger with optional Merkle root broadcasting."""
+    """Append-only ledger with optional Merkle root broadcasting.
+
+    The Merkle root is maintained incrementally by a
+    :class:`~alpha_factory_v1.common.utils.merkle.MerkleAccumulator` stored in
+    the same database, so logging and root lookups do not rescan the table.
+
+    Args:
+        path: Database file for the SQLite and DuckDB backends.
+        rpc_url: Solana RPC endpoint used when broadcasting roots.
+        wallet: Hex encoded signing key for broadcasts.
+        broadcast: Send Merkle roots to Solana when ``True``.
+        db: ``"sqlite"``, ``"duckdb"`` or ``"postgres"``; defaults to
+            ``AGI_INSIGHT_DB``.
+        group_commit: Queue envelopes and write them from a background thread
+            in batches. Defaults to ``AGI_INSIGHT_LEDGER_GROUP_COMMIT``.
+        batch_size: Maximum envelopes written per transaction.
+        flush_interval: Seconds a batch may wait for more envelopes.
+        queue_size: Bound on queued envelopes; :meth:`log` blocks when full.
+        durability: ``"full"`` waits for the commit before :meth:`log`
+            returns, ``"normal"`` returns once queued and ``"off"`` also
+            relaxes fsync on the database. Defaults to
+            ``AGI_INSIGHT_LEDGER_DURABILITY`` or ``"full"``.
+    """
 
     def __init__(
         self,
@@ -110,17 +148,31 @@ class Ledger:
         wallet: str | None = None,
         broadcast: bool = True,
         db: str | None = None,
+        *,
+        group_commit: bool | None = None,
+        batch_size: int = 512,
+        flush_interval: float = 0.05,
+        queue_size: int = 10_000,
+        durability: str | None = None,
     ) -> None:
+        durability = durability or os.getenv("AGI_INSIGHT_LEDGER_DURABILITY", "full")
+        if durability not in _DURABILITY:
+            raise ValueError(f"durability must be one of {sorted(_DURABILITY)}")
+        if group_commit is None:
+            group_commit = os.getenv("AGI_INSIGHT_LEDGER_GROUP_COMMIT", "").lower() in {"1", "true", "yes"}
+        self.durability = durability
+        self.group_commit = group_commit
         self.path = Path(path)
         self.path.parent.mkdir(parents=True, exist_ok=True)
         db_type = db or os.getenv("AGI_INSIGHT_DB", "sqlite")
         self.db_type = db_type
         if db_type == "duckdb" and duckdb is not None:
             self.conn = duckdb.connect(str(self.path))
+            self.conn.execute("CREATE SEQUENCE IF NOT EXISTS messages_id_seq")
             self.conn.execute(
                 """
                 CREATE TABLE IF NOT EXISTS messages (
-                    id BIGINT PRIMARY KEY GENERATED ALWAYS AS IDENTITY,
+                    id BIGINT PRIMARY KEY DEFAULT nextval('messages_id_seq'),
                     ts DOUBLE,
                     sender TEXT,
                     recipient TEXT,
@@ -132,7 +184,8 @@ class Ledger:
         elif db_type == "postgres":
             if "psycopg2" not in globals():
                 _log.warning("AGI_INSIGHT_DB=postgres but psycopg2 not installed – falling back to sqlite")
-                self.conn = sqlite3.connect(str(self.path))
+                self.db_type = "sqlite"
+                self.conn = sqlite3.connect(str(self.path), check_same_thread=False)
                 self.conn.execute(
                     """
                     CREATE TABLE IF NOT EXISTS messages (
@@ -170,7 +223,8 @@ class Ledger:
         else:
             if db_type == "duckdb" and duckdb is None:
                 _log.warning("AGI_INSIGHT_DB=duckdb but duckdb not installed – falling back to sqlite")
-            self.conn = sqlite3.connect(str(self.path))
+            self.db_type = "sqlite"
+            self.conn = sqlite3.connect(str(self.path), check_same_thread=False)
             self.conn.execute(
                 """
                 CREATE TABLE IF NOT EXISTS messages (
@@ -183,83 +237,222 @@ class Ledger:
                 )
                 """
             )
-        self.conn.commit()
+        self._lock = threading.RLock()
+        self._apply_durability()
+        with self._transaction():
+            self._merkle = MerkleAccumulator(
+                self.conn,
+                "messages",
+                hash_fn=_digest,
+                empty_root=cast(str, blake3(b"\x00").hexdigest()),
+                paramstyle="format" if self.db_type == "postgres" else "qmark",
+            )
         self._task: asyncio.Task[None] | None = None
         self.rpc_url = rpc_url
         self.wallet = wallet
         self.broadcast = broadcast
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        self._queue: queue.Queue[Any] = queue.Queue(maxsize=max(1, queue_size))
+        self._put_lock = threading.Lock()
+        self._done = threading.Condition()
+        self._enqueued = 0
+        self._committed = 0
+        # (first seq, end seq, error) of every batch that failed to commit
+        self._failures: List[tuple[int, int, BaseException]] = []
+        self._flushed = 0
+        self._writer: threading.Thread | None = None
+        if self.group_commit:
+            self._writer = threading.Thread(target=self._write_loop, name="ledger-writer", daemon=True)
+            self._writer.start()
+
+    def _apply_durability(self) -> None:
+        level = _DURABILITY[self.durability]
+        if self.db_type == "sqlite":
+            if self.group_commit:
+                self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute(f"PRAGMA synchronous={level}")
+        elif self.db_type == "postgres" and self.durability != "full":
+            with self.conn, self.conn.cursor() as cur:
+                cur.execute("SET synchronous_commit = off")
+
+    @staticmethod
+    def _row(env: messaging.Envelope) -> tuple[Any, ...]:
+        from alpha_factory_v1.core.utils import a2a_pb2 as pb
+
+        if dataclasses.is_dataclass(env) and not isinstance(env, type):
+            record = dataclasses.asdict(env)
+        elif isinstance(env, pb.Envelope):
+            if hasattr(env, "DESCRIPTOR"):
+                record = json_format.MessageToDict(env, preserving_proto_field_name=True)
+            else:
+                record = dataclasses.asdict(env) if dataclasses.is_dataclass(env) else env.__dict__
+        else:
+            record = env.__dict__
+        data = json.dumps(record, sort_keys=True).encode()
+        digest = blake3(data).hexdigest()
+        payload_json = json.dumps(record.get("payload", {}))
+        return (env.ts, env.sender, env.recipient, payload_json, digest)
 
     def log(self, env: messaging.Envelope) -> None:
-        """Hash ``env`` and append to the ledger."""
+        """Hash ``env`` and append to the ledger.
+
+        In group-commit mode the row is queued; with ``durability="full"``
+        the call still blocks until the batch holding it is committed.
+        """
         from alpha_factory_v1.core.utils.tracing import span
-        from alpha_factory_v1.core.utils import a2a_pb2 as pb
 
         with span("ledger.log"):
             assert self.conn is not None
-            if dataclasses.is_dataclass(env) and not isinstance(env, type):
-                record = dataclasses.asdict(env)
-            elif isinstance(env, pb.Envelope):
-                if hasattr(env, "DESCRIPTOR"):
-                    record = json_format.MessageToDict(env, preserving_proto_field_name=True)
-                else:
-                    record = dataclasses.asdict(env) if dataclasses.is_dataclass(env) else env.__dict__
-            else:
-                record = env.__dict__
-            data = json.dumps(record, sort_keys=True).encode()
-            digest = blake3(data).hexdigest()
-            payload_json = json.dumps(record.get("payload", {}))
-            if self.db_type == "postgres":
-                with self.conn, self.conn.cursor() as cur:
-                    cur.execute(
-                        "INSERT INTO messages (ts, sender, recipient, payload, hash) VALUES (%s, %s, %s, %s, %s)",
-                        (env.ts, env.sender, env.recipient, payload_json, digest),
-                    )
+            row = self._row(env)
+            if self._writer is None:
+                self._write_rows([row])
+                return
+            with self._put_lock:
+                seq = self._enqueued
+                self._queue.put(row)
+                self._enqueued += 1
+            if self.durability == "full":
+                self._wait(seq, seq + 1)
+
+    async def alog(self, env: messaging.Envelope) -> None:
+        """Async :meth:`log` that waits for a group commit off the event loop."""
+
+        if self._writer is not None and self.durability == "full":
+            await asyncio.to_thread(self.log, env)
+        else:
+            self.log(env)
+
+    def flush(self) -> None:
+        """Block until every envelope logged so far is committed.
+
+        Unless ``durability="full"`` already raised the error to the logging
+        caller, raises ``RuntimeError`` when a batch written since the
+        previous flush failed.
+        """
+
+        if self._writer is not None:
+            self._queue.put(_FLUSH)
+            with self._put_lock:
+                start, self._flushed = self._flushed, self._enqueued
+            self._wait(start, self._flushed, report=self.durability != "full")
+
+    def _wait(self, start: int, end: int, *, report: bool = True) -> None:
+        """Wait until envelopes ``[start, end)`` are committed and report failures among them."""
+        with self._done:
+            self._done.wait_for(lambda: self._committed >= end or not self._writer)
+            failed = [f for f in self._failures if report and f[0] < end and f[1] > start]
+        if failed:
+            lost = sum(min(f[1], end) - max(f[0], start) for f in failed)
+            raise RuntimeError(f"ledger batch write failed ({len(failed)} batches, {lost} envelopes)") from failed[0][2]
+
+    def _write_rows(self, rows: List[tuple[Any, ...]]) -> None:
+        with self._transaction():
+            self._executemany(
+                "INSERT INTO messages (ts, sender, recipient, payload, hash) VALUES (?, ?, ?, ?, ?)",
+                rows,
+            )
+            self._sync_merkle()
+
+    def _write_loop(self) -> None:
+        stop = False
+        while not stop:
+            item = self._queue.get()
+            if item is None:
+                break
+            if item is _FLUSH:
+                continue
+            batch = [item]
+            # callers block on "full" commits, so only linger for company
+            # when they have already returned
+            linger = self.durability != "full"
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.batch_size:
+                try:
+                    if linger:
+                        item = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+                    else:
+                        item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is None:
+                    stop = True
+                    break
+                if item is _FLUSH:
+                    break
+                batch.append(item)
+            start = self._committed
+            try:
+                self._write_rows(batch)
+            except Exception as exc:  # noqa: BLE001 - surfaced to waiting callers
+                _log.warning("Ledger batch of %d envelopes failed: %s", len(batch), exc)
+                self._failures.append((start, start + len(batch), exc))
+            with self._done:
+                self._committed += len(batch)
+                self._done.notify_all()
+
+    @contextlib.contextmanager
+    def _transaction(self) -> Iterator[None]:
+        """Run the enclosed statements in one committed transaction."""
+
+        assert self.conn is not None
+        with self._lock:
+            if self.db_type == "duckdb":
+                # DuckDB connections close when used as a context manager.
+                self.conn.execute("BEGIN TRANSACTION")
+                try:
+                    yield
+                except BaseException:
+                    self.conn.execute("ROLLBACK")
+                    raise
+                self.conn.execute("COMMIT")
             else:
                 with self.conn:
-                    self.conn.execute(
-                        "INSERT INTO messages (ts, sender, recipient, payload, hash) VALUES (?, ?, ?, ?, ?)",
-                        (env.ts, env.sender, env.recipient, payload_json, digest),
-                    )
+                    yield
 
-    def compute_merkle_root(self) -> str:
+    def _execute(self, sql: str, params: tuple[Any, ...] = ()) -> List[tuple[Any, ...]]:
+        assert self.conn is not None
+        if self.db_type == "postgres":
+            with self.conn.cursor() as cur:
+                cur.execute(sql.replace("?", "%s"), params)
+                return list(cur.fetchall()) if cur.description else []
+        cur = self.conn.execute(sql, params)
+        return list(cur.fetchall()) if cur.description else []
+
+    def _executemany(self, sql: str, rows: List[tuple[Any, ...]]) -> None:
         assert self.conn is not None
         if self.db_type == "postgres":
             with self.conn.cursor() as cur:
-                cur.execute("SELECT hash FROM messages ORDER BY id")
-                raw_hashes = [row[0] for row in cur.fetchall()]
+                cur.executemany(sql.replace("?", "%s"), rows)
         else:
-            cur = self.conn.execute("SELECT hash FROM messages ORDER BY id")
-            raw_hashes = [row[0] for row in cur.fetchall()]
+            self.conn.executemany(sql, rows)
 
-        hashes: List[str] = []
-        for h in raw_hashes:
-            if not isinstance(h, str) or not h:
-                continue
-            try:
-                bytes.fromhex(h)
-            except Exception:
-                continue
-            hashes.append(h)
+    def _sync_merkle(self) -> str:
+        rows = self._execute("SELECT id, hash FROM messages WHERE id > ? ORDER BY id", (self._merkle.last_id,))
+        return self._merkle.sync(rows)
+
+    def compute_merkle_root(self) -> str:
+        """Return the Merkle root, folding in rows appended by other writers."""
+        assert self.conn is not None
+        self.flush()
+        with self._transaction():
+            return self._sync_merkle()
 
-        return _merkle_root(hashes)
+    def merkle_proof(self, index: int) -> List[tuple[str, bool]]:
+        """Return the inclusion proof for the ``index``-th valid ledger hash."""
+        self.compute_merkle_root()
+        return self._merkle.proof(index)
 
     def tail(self, count: int = 10) -> List[dict[str, object]]:
         """Return the last ``count`` ledger entries."""
 
         assert self.conn is not None
-        if self.db_type == "postgres":
-            with self.conn.cursor() as cur:
-                cur.execute(
-                    "SELECT ts, sender, recipient, payload FROM messages ORDER BY id DESC LIMIT %s",
-                    (count,),
-                )
-                rows = cur.fetchall()
-        else:
-            cur = self.conn.execute(
+        self.flush()
+        with self._lock:
+            rows = self._execute(
                 "SELECT ts, sender, recipient, payload FROM messages ORDER BY id DESC LIMIT ?",
                 (count,),
             )
-            rows = cur.fetchall()
         result: List[dict[str, object]] = []
         for ts, sender, recipient, payload in reversed(rows):
             try:
@@ -327,6 +520,12 @@ class Ledger:
             self._task = None
 
     def close(self) -> None:
+        if self._writer is not None:
+            self._queue.put(None)
+            self._writer.join()
+            with self._done:
+                self._writer = None
+                self._done.notify_all()
         if self.conn:
             self.conn.close()
             self.conn = None
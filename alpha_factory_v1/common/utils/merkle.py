@@ -0,0 +1,249 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Persistent append-only Merkle accumulator.
+
+The accumulator reproduces the classic "duplicate the last node" Merkle tree
+used by the ledger and archives while only touching ``O(log N)`` nodes per
+append. Completed subtree roots are stored in a ``merkle_nodes`` table next to
+the data they commit to and the current root is cached in ``merkle_state`` so
+lookups are ``O(1)``. Inclusion proofs are assembled from the stored nodes.
+
+The owning table is replayed through :meth:`MerkleAccumulator.sync`, which
+only reads rows newer than the last committed id. The first call therefore
+acts as a one-time migration for databases created before the accumulator
+existed, and later calls pick up rows written by other connections.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable, Iterable, List, Sequence, Tuple
+
+__all__ = ["MerkleAccumulator", "verify_proof"]
+
+HashFn = Callable[[bytes], bytes]
+LeafFn = Callable[[str], bytes]
+Proof = List[Tuple[str, bool]]
+
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS merkle_nodes("
+    "tree TEXT NOT NULL, level INTEGER NOT NULL, idx BIGINT NOT NULL, hash TEXT NOT NULL,"
+    " PRIMARY KEY(tree, level, idx))",
+    "CREATE TABLE IF NOT EXISTS merkle_state("
+    "tree TEXT PRIMARY KEY, size BIGINT NOT NULL, last_id BIGINT NOT NULL, root TEXT NOT NULL)",
+)
+
+
+def verify_proof(leaf: bytes, proof: Sequence[Tuple[str, bool]], root: str, *, hash_fn: HashFn) -> bool:
+    """Return ``True`` when ``proof`` links ``leaf`` to ``root``.
+
+    Each proof step is ``(sibling_hex, sibling_is_left)``.
+    """
+
+    node = leaf
+    for sibling_hex, is_left in proof:
+        sibling = bytes.fromhex(sibling_hex)
+        node = hash_fn(sibling + node) if is_left else hash_fn(node + sibling)
+    return node.hex() == root
+
+
+class MerkleAccumulator:
+    """Incremental Merkle frontier persisted in a DB-API connection.
+
+    Args:
+        conn: Open ``sqlite3``, ``duckdb`` or ``psycopg2`` connection.
+        tree: Name distinguishing several trees stored in one database.
+        hash_fn: Function returning the digest of its input bytes.
+        leaf_fn: Converts a stored row hash into leaf bytes. Rows for which it
+            raises are skipped, mirroring the tolerant full recomputation.
+        empty_root: Root reported for an empty tree.
+        paramstyle: ``"qmark"`` for sqlite/duckdb or ``"format"`` for
+            postgres.
+
+    The accumulator never commits; callers wrap appends in their own
+    transaction so the frontier and the data row are written atomically.
+    """
+
+    def __init__(
+        self,
+        conn: Any,
+        tree: str,
+        *,
+        hash_fn: HashFn,
+        leaf_fn: LeafFn = bytes.fromhex,
+        empty_root: str = "",
+        paramstyle: str = "qmark",
+    ) -> None:
+        self.conn = conn
+        self.tree = tree
+        self.hash_fn = hash_fn
+        self.leaf_fn = leaf_fn
+        self.empty_root = empty_root
+        self.paramstyle = paramstyle
+        for stmt in _SCHEMA:
+            self._exec(stmt)
+        self.size = 0
+        self.last_id = 0
+        self.root = empty_root
+        self._peaks: dict[int, bytes] = {}
+        self._load()
+
+    # ------------------------------------------------------------------ sql
+    def _exec(self, sql: str, params: Sequence[Any] = ()) -> List[Tuple[Any, ...]]:
+        if self.paramstyle == "format":
+            with self.conn.cursor() as cur:
+                cur.execute(sql.replace("?", "%s"), tuple(params))
+                return list(cur.fetchall()) if cur.description else []
+        cur = self.conn.execute(sql, tuple(params))
+        return list(cur.fetchall()) if cur.description else []
+
+    def _load(self) -> None:
+        rows = self._exec("SELECT size, last_id, root FROM merkle_state WHERE tree=?", (self.tree,))
+        if not rows:
+            return
+        self.size, self.last_id, self.root = int(rows[0][0]), int(rows[0][1]), str(rows[0][2])
+        self._peaks = {}
+        for level in range(self.size.bit_length()):
+            if (self.size >> level) & 1:
+                self._peaks[level] = bytes.fromhex(self._node(level, (self.size >> level) - 1))
+
+    def _node(self, level: int, idx: int) -> str:
+        rows = self._exec(
+            "SELECT hash FROM merkle_nodes WHERE tree=? AND level=? AND idx=?",
+            (self.tree, level, idx),
+        )
+        if not rows:
+            raise LookupError(f"missing Merkle node {level}/{idx}")
+        return str(rows[0][0])
+
+    def _refresh(self) -> None:
+        """Reload the frontier when another connection advanced the stored state."""
+
+        rows = self._exec("SELECT size, last_id FROM merkle_state WHERE tree=?", (self.tree,))
+        if rows and (int(rows[0][0]), int(rows[0][1])) != (self.size, self.last_id):
+            self._load()
+
+    def _save_state(self) -> None:
+        self._exec(
+            "INSERT INTO merkle_state(tree, size, last_id, root) VALUES(?,?,?,?) "
+            "ON CONFLICT(tree) DO UPDATE SET size=excluded.size, last_id=excluded.last_id, root=excluded.root",
+            (self.tree, self.size, self.last_id, self.root),
+        )
+
+    # ----------------------------------------------------------------- tree
+    def _walk(self) -> tuple[str, dict[int, bytes]]:
+        """Return the root and the partial right-edge node of every level."""
+
+        n = self.size
+        if n == 0:
+            return self.empty_root, {}
+        partial: dict[int, bytes] = {}
+        cur: bytes | None = None
+        level = 0
+        while (n - 1) >> level:
+            if cur is not None:
+                partial[level] = cur
+            if (n >> level) & 1:
+                peak = self._peaks[level]
+                cur = self.hash_fn(peak + (peak if cur is None else cur))
+            elif cur is not None:
+                cur = self.hash_fn(cur + cur)
+            level += 1
+        root = cur if cur is not None else self._peaks[level]
+        return root.hex(), partial
+
+    def _append(self, leaf: bytes) -> None:
+        n = self.size
+        node = leaf
+        level = 0
+        idx = n
+        writes = [(self.tree, 0, idx, node.hex())]
+        while (n >> level) & 1:
+            node = self.hash_fn(self._peaks.pop(level) + node)
+            level += 1
+            idx >>= 1
+            writes.append((self.tree, level, idx, node.hex()))
+        self._peaks[level] = node
+        self.size = n + 1
+        for params in writes:
+            self._exec("INSERT INTO merkle_nodes(tree, level, idx, hash) VALUES(?,?,?,?)", params)
+
+    def append(self, value: str, row_id: int | None = None) -> str:
+        """Append the stored hash ``value`` and return the new root.
+
+        ``row_id`` records the source row so :meth:`sync` resumes after it.
+        Values rejected by ``leaf_fn`` leave the tree unchanged.
+        """
+
+        self._refresh()
+        try:
+            leaf = self.leaf_fn(value)
+        except Exception:
+            leaf = None
+        if leaf is not None:
+            self._append(leaf)
+            self.root = self._walk()[0]
+        if row_id is not None:
+            self.last_id = max(self.last_id, int(row_id))
+        self._save_state()
+        return self.root
+
+    def sync(self, rows: Iterable[Tuple[int, Any]]) -> str:
+        """Append ``(row_id, hash)`` pairs newer than :attr:`last_id`.
+
+        The persisted state is re-read first, so rows another instance already
+        folded in are skipped rather than appended twice. Call this inside the
+        write transaction that owns the rows.
+        """
+
+        self._refresh()
+        changed = False
+        for row_id, value in rows:
+            if int(row_id) <= self.last_id:
+                continue
+            self.last_id = int(row_id)
+            changed = True
+            if not isinstance(value, str) or not value:
+                continue
+            try:
+                leaf = self.leaf_fn(value)
+            except Exception:
+                continue
+            self._append(leaf)
+        if changed:
+            self.root = self._walk()[0]
+            self._save_state()
+        return self.root
+
+    def proof(self, index: int) -> Proof:
+        """Return the inclusion proof for the leaf at position ``index``."""
+
+        n = self.size
+        if not 0 <= index < n:
+            raise IndexError(index)
+        _, partial = self._walk()
+        steps: Proof = []
+        level = 0
+        while (n - 1) >> level:
+            pos = index >> level
+            sib = pos ^ 1
+            full = n >> level
+            if sib < full:
+                sibling = self._node(level, sib)
+            elif sib == full and level in partial:
+                sibling = partial[level].hex()
+            elif pos < full:
+                sibling = self._node(level, pos)
+            else:
+                sibling = partial[level].hex()
+            steps.append((sibling, sib < pos))
+            level += 1
+        return steps
+
+    def leaf(self, index: int) -> str:
+        """Return the stored leaf digest at ``index``."""
+
+        return self._node(0, index)
+
+    def verify(self, value: str, proof: Sequence[Tuple[str, bool]], root: str | None = None) -> bool:
+        """Check that the stored hash ``value`` is committed to by ``root``."""
+
+        return verify_proof(self.leaf_fn(value), proof, root or self.root, hash_fn=self.hash_fn)
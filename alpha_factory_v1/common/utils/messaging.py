@@ -4,19 +4,38 @@
 Envelopes are published to in-memory subscribers and optionally forwarded via
 gRPC or Kafka. Use :class:`A2ABus` to subscribe handlers and to start the
 optional transport servers.
+
+gRPC peers pick a wire codec during the handshake by appending
+``codecs=<name>,<name>`` to the version string; the bus replies with
+``codec=<name>`` and decodes that peer's envelopes accordingly. Peers that
+send the bare handshake keep using JSON. Kafka records use
+``settings.bus_codec`` and carry a ``codec`` header unless it is JSON. See
+:mod:`~alpha_factory_v1.common.utils.envelope_codec`.
+
+Async handlers and Kafka forwarding are fed through one bounded queue per
+subscription, drained by a fixed number of worker tasks. When a queue is full
+the subscription's overflow policy applies: ``drop_new`` discards the
+incoming envelope, ``drop_oldest`` evicts the oldest queued one and ``block``
+makes :meth:`A2ABus.apublish` wait for space (the synchronous
+:meth:`A2ABus.publish` never blocks and drops instead). Queue depth, queueing
+lag and drops are exported as ``bus_queue_depth``, ``bus_queue_lag_seconds``
+and ``bus_dropped_total``.
 """
 
 from __future__ import annotations
 
 import asyncio
-import json
+import inspect
 import logging
+import time
+from contextvars import ContextVar
 from pathlib import Path
 import contextlib
 from types import TracebackType
 from typing import Any, Awaitable, Callable, Dict, List, Optional, Protocol, TypeAlias
 from cachetools import TTLCache
 
+from . import envelope_codec
 from .config import Settings
 from google.protobuf import json_format, struct_pb2
 from typing import TYPE_CHECKING
@@ -57,6 +76,13 @@ except ModuleNotFoundError:  # pragma: no cover - broker optional
 
 logger = logging.getLogger(__name__)
 
+Handler: TypeAlias = Callable[[EnvelopeLike], Awaitable[None] | None]
+
+OVERFLOW_POLICIES = ("block", "drop_new", "drop_oldest")
+
+# set inside bus worker tasks so handlers that publish never wait on each other
+_IN_WORKER: ContextVar[bool] = ContextVar("a2a_bus_worker", default=False)
+
 
 if not hasattr(struct_pb2.Struct, "get"):
 
@@ -67,6 +93,41 @@ if not hasattr(struct_pb2.Struct, "get"):
     struct_pb2.Struct.get = _struct_get  # type: ignore[attr-defined]
 
 
+def _discard(item: Any) -> None:
+    if asyncio.iscoroutine(item):
+        item.close()
+
+
+class _Subscription:
+    """Bounded queue and worker tasks delivering envelopes to one handler."""
+
+    def __init__(self, topic: str, handler: Callable[[Any], Any], *, maxsize: int, workers: int, overflow: str) -> None:
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"unknown overflow policy {overflow!r}")
+        self.topic = topic
+        self.handler = handler
+        self.name = getattr(handler, "__qualname__", type(handler).__name__)
+        call = handler if inspect.isroutine(handler) else getattr(handler, "__call__", None)
+        self.is_async = inspect.iscoroutinefunction(call)
+        self.maxsize = max(1, maxsize)
+        self.workers = max(1, workers)
+        self.overflow = overflow
+        self.loop: asyncio.AbstractEventLoop | None = None
+        self.queue: asyncio.Queue[tuple[float, Any]] | None = None
+        self.space: asyncio.Event | None = None
+        self.tasks: List[asyncio.Task[None]] = []
+
+    def cancel(self) -> List[asyncio.Task[None]]:
+        tasks, self.tasks = self.tasks, []
+        for task in tasks:
+            with contextlib.suppress(RuntimeError):  # loop already closed
+                task.cancel()
+        if self.queue is not None:
+            while not self.queue.empty():
+                _discard(self.queue.get_nowait()[1])
+        return tasks
+
+
 class A2ABus:
     """In-memory pub/sub with best-effort gRPC transport."""
 
@@ -74,14 +135,30 @@ class A2ABus:
 
     HANDSHAKE_TTL = 60
 
+    DRAIN_TIMEOUT = 1.0
+
     def __init__(self, settings: Settings) -> None:
         self.settings = settings
-        self._subs: Dict[str, List[Callable[[EnvelopeLike], Awaitable[None] | None]]] = {}
+        self._subs: Dict[str, List[_Subscription]] = {}
         self._server: "grpc.aio.Server | None" = None
         self._producer: Optional[AIOKafkaProducer] = None
         self._handshake_peers: set[str] = set()
         self._handshake_failures: TTLCache[str, int] = TTLCache(maxsize=1024, ttl=self.HANDSHAKE_TTL)
         self._handshake_nonces: TTLCache[str, None] = TTLCache(maxsize=1024, ttl=self.HANDSHAKE_TTL)
+        self._peer_codecs: Dict[str, envelope_codec.Codec] = {}
+        self._codec = envelope_codec.get(settings.bus_codec)
+        self._allowed_codecs = (
+            [c.strip() for c in settings.bus_codecs.split(",") if c.strip()] if settings.bus_codecs else None
+        )
+        if settings.bus_overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"unknown overflow policy {settings.bus_overflow!r}")
+        self._forwarder = _Subscription(
+            "kafka",
+            self._forward,
+            maxsize=settings.bus_queue_size,
+            workers=settings.bus_workers,
+            overflow=settings.bus_overflow,
+        )
 
     async def __aenter__(self) -> "A2ABus":
         """Start the bus when entering an async context."""
@@ -101,40 +178,66 @@ class A2ABus:
         """Send an alert using :func:`alerts.send_alert`."""
         alerts.send_alert(message, url or self.settings.alert_webhook_url)
 
-    def subscribe(self, topic: str, handler: Callable[[EnvelopeLike], Awaitable[None] | None]) -> None:
-        self._subs.setdefault(topic, []).append(handler)
+    def subscribe(
+        self,
+        topic: str,
+        handler: Handler,
+        *,
+        queue_size: int | None = None,
+        workers: int | None = None,
+        overflow: str | None = None,
+    ) -> None:
+        """Deliver envelopes published on ``topic`` to ``handler``.
+
+        Synchronous handlers run inline in :meth:`publish`. Async handlers
+        get a queue of ``queue_size`` envelopes served by ``workers`` tasks;
+        ``overflow`` picks the policy applied when it is full. Unset options
+        default to the ``bus_queue_size``, ``bus_workers`` and
+        ``bus_overflow`` settings.
+        """
+        sub = _Subscription(
+            topic,
+            handler,
+            maxsize=self.settings.bus_queue_size if queue_size is None else queue_size,
+            workers=self.settings.bus_workers if workers is None else workers,
+            overflow=overflow or self.settings.bus_overflow,
+        )
+        self._subs.setdefault(topic, []).append(sub)
 
-    def unsubscribe(self, topic: str, handler: Callable[[EnvelopeLike], Awaitable[None] | None]) -> None:
+    def unsubscribe(self, topic: str, handler: Handler) -> None:
         """Remove a previously subscribed handler."""
-        handlers = self._subs.get(topic)
-        if not handlers:
+        subs = self._subs.get(topic)
+        if not subs:
             return
-        with contextlib.suppress(ValueError):
-            handlers.remove(handler)
-        if not handlers:
+        for sub in subs:
+            if sub.handler == handler:
+                subs.remove(sub)
+                sub.cancel()
+                break
+        if not subs:
             self._subs.pop(topic, None)
 
     def publish(self, topic: str, env: EnvelopeLike) -> None:
+        """Deliver ``env`` to ``topic`` subscribers without blocking."""
         from alpha_factory_v1.core.utils.tracing import span, bus_messages_total
-        from alpha_factory_v1.core.utils import a2a_pb2 as pb
 
         with span("bus.publish"):
             bus_messages_total.labels(topic).inc()
             if self._producer:
-                if isinstance(env, pb.Envelope):
-                    payload = json_format.MessageToDict(env, preserving_proto_field_name=True)
-                else:  # support SimpleNamespace in tests
-                    payload = env.__dict__
-                data = json.dumps(payload).encode()
-                asyncio.create_task(self._producer.send_and_wait(topic, data))
-            for h in list(self._subs.get(topic, [])):
+                self._offer(self._forwarder, (topic, self._codec.encode(env)))
+            for sub in list(self._subs.get(topic, [])):
                 try:
-                    res = h(env)
-                    if asyncio.iscoroutine(res):
-                        try:
-                            asyncio.get_running_loop().create_task(res)
-                        except RuntimeError:  # pragma: no cover - sync context
-                            asyncio.run(res)
+                    item: Any = env
+                    if not sub.is_async:
+                        item = sub.handler(env)
+                        if not asyncio.iscoroutine(item):
+                            continue
+                    try:
+                        asyncio.get_running_loop()
+                    except RuntimeError:  # pragma: no cover - sync context
+                        asyncio.run(item if asyncio.iscoroutine(item) else sub.handler(env))
+                        continue
+                    self._offer(sub, item)
                 except Exception:  # noqa: BLE001
                     logger.exception(
                         "handler error %s -> %s on %s",
@@ -143,6 +246,90 @@ class A2ABus:
                         topic,
                     )
 
+    async def apublish(self, topic: str, env: EnvelopeLike) -> None:
+        """Publish ``env`` after waiting for space in ``block`` subscriber queues.
+
+        This is how publishers receive backpressure. Calls made from inside a
+        bus handler do not wait, so handlers publishing to each other cannot
+        deadlock; they get the non-blocking :meth:`publish` behaviour.
+        """
+        if not _IN_WORKER.get():
+            subs = [s for s in self._subs.get(topic, []) if s.is_async and s.overflow == "block"]
+            if self._producer and self._forwarder.overflow == "block":
+                subs.append(self._forwarder)
+            while True:
+                full = next((s for s in subs if self._queue(s).full()), None)
+                if full is None:
+                    break
+                assert full.space is not None
+                full.space.clear()
+                await full.space.wait()
+        self.publish(topic, env)
+
+    async def drain(self, timeout: float | None = None) -> None:
+        """Wait until every queued envelope has been handled."""
+        loop = asyncio.get_running_loop()
+        subs = [s for subs in self._subs.values() for s in subs] + [self._forwarder]
+        queues = [s.queue for s in subs if s.loop is loop and s.queue is not None and s.tasks]
+        if queues:
+            await asyncio.wait_for(asyncio.gather(*(q.join() for q in queues)), timeout)
+
+    def _queue(self, sub: _Subscription) -> asyncio.Queue[tuple[float, Any]]:
+        """Return ``sub``'s queue, starting its workers on the running loop."""
+        loop = asyncio.get_running_loop()
+        if sub.loop is not loop or not sub.tasks:
+            sub.cancel()
+            sub.loop = loop
+            sub.queue = asyncio.Queue(sub.maxsize)
+            sub.space = asyncio.Event()
+            sub.tasks = [loop.create_task(self._work(sub, sub.queue, sub.space)) for _ in range(sub.workers)]
+        assert sub.queue is not None
+        return sub.queue
+
+    def _offer(self, sub: _Subscription, item: Any) -> None:
+        from alpha_factory_v1.core.utils.tracing import bus_dropped_total, bus_queue_depth
+
+        queue = self._queue(sub)
+        if queue.full():
+            if sub.overflow == "drop_oldest":
+                _discard(queue.get_nowait()[1])
+                queue.task_done()
+                bus_dropped_total.labels(sub.topic, "oldest").inc()
+            else:
+                _discard(item)
+                bus_dropped_total.labels(sub.topic, "full").inc()
+                return
+        queue.put_nowait((time.monotonic(), item))
+        bus_queue_depth.labels(sub.topic, sub.name).set(queue.qsize())
+
+    async def _work(self, sub: _Subscription, queue: asyncio.Queue[tuple[float, Any]], space: asyncio.Event) -> None:
+        from alpha_factory_v1.core.utils.tracing import bus_queue_depth, bus_queue_lag_seconds
+
+        _IN_WORKER.set(True)
+        while True:
+            queued_at, item = await queue.get()
+            space.set()
+            bus_queue_depth.labels(sub.topic, sub.name).set(queue.qsize())
+            bus_queue_lag_seconds.labels(sub.topic).observe(time.monotonic() - queued_at)
+            try:
+                res = item if asyncio.iscoroutine(item) else sub.handler(item)
+                if asyncio.iscoroutine(res):
+                    await res
+            except Exception:  # noqa: BLE001
+                logger.exception("handler %s failed on %s", sub.name, sub.topic)
+            finally:
+                queue.task_done()
+
+    async def _forward(self, item: tuple[str, bytes]) -> None:
+        topic, data = item
+        producer = self._producer
+        if producer is None:
+            return
+        if self._codec.name == "json":
+            await producer.send_and_wait(topic, data)
+        else:
+            await producer.send_and_wait(topic, data, headers=[("codec", self._codec.name.encode())])
+
     async def _fail_handshake(self, peer: str, context: Any) -> bytes:
         """Record a handshake failure and abort if the limit is exceeded."""
         count = self._handshake_failures.get(peer, 0) + 1
@@ -155,37 +342,49 @@ class A2ABus:
             await context.abort(grpc.StatusCode.FAILED_PRECONDITION, "handshake required")
         return b"handshake required"
 
+    def _forget_peer(self, peer: str) -> None:
+        self._handshake_peers.discard(peer)
+        self._peer_codecs.pop(peer, None)
+
+    async def _handshake(self, request: bytes, peer: str, context: Any) -> bytes:
+        parts = request.decode(errors="replace").strip().split()
+        offered: list[str] = []
+        if len(parts) == 3 and parts[2].startswith("codecs="):
+            offered = parts.pop()[len("codecs=") :].split(",")
+        if len(parts) != 2 or parts[0] != self.PROTO_VERSION:
+            return await self._fail_handshake(peer, context)
+        nonce = parts[1]
+        if nonce in self._handshake_nonces:
+            return await self._fail_handshake(peer, context)
+        self._handshake_nonces[nonce] = None
+        self._handshake_peers.add(peer)
+        codec = envelope_codec.negotiate(offered, self._allowed_codecs)
+        self._peer_codecs[peer] = codec
+        if grpc and hasattr(context, "add_callback"):
+            context.add_callback(lambda: self._forget_peer(peer))
+        if not offered:
+            return self.PROTO_VERSION.encode()
+        return f"{self.PROTO_VERSION} codec={codec.name}".encode()
+
     async def _handle_rpc(self, request: bytes, context: Any) -> bytes:
-        text = request.decode()
         peer = context.peer() if grpc else ""
         if peer not in self._handshake_peers:
-            parts = text.strip().split()
-            if len(parts) != 2 or parts[0] != self.PROTO_VERSION:
-                return await self._fail_handshake(peer, context)
-            nonce = parts[1]
-            if nonce in self._handshake_nonces:
-                return await self._fail_handshake(peer, context)
-            self._handshake_nonces[nonce] = None
-            self._handshake_peers.add(peer)
-            if grpc and hasattr(context, "add_callback"):
-                context.add_callback(lambda: self._handshake_peers.discard(peer))
-            return self.PROTO_VERSION.encode()
-        data = json.loads(text)
-        token = data.pop("token", None)
+            return await self._handshake(request, peer, context)
+        codec = self._peer_codecs.get(peer) or envelope_codec.get("json")
+        try:
+            env, token = codec.decode(request)
+        except Exception:  # noqa: BLE001 - malformed input from the peer
+            logger.warning("undecodable %s envelope from %s", codec.name, peer)
+            if grpc:
+                await context.abort(grpc.StatusCode.INVALID_ARGUMENT, "malformed envelope")
+            return b"invalid"
         if self.settings.bus_token and token != self.settings.bus_token:
             if grpc:
                 await context.abort(grpc.StatusCode.PERMISSION_DENIED, "unauthenticated")
             return b"denied"
-        env = Envelope(
-            sender=data.get("sender", ""),
-            recipient=data.get("recipient", ""),
-            ts=float(data.get("ts", 0.0)),
-        )
-        if isinstance(data.get("payload"), dict):
-            env.payload.update(data["payload"])
-        self.publish(env.recipient, env)
+        await self.apublish(env.recipient, env)
         if grpc and hasattr(context, "add_callback"):
-            context.add_callback(lambda: self._handshake_peers.discard(peer))
+            context.add_callback(lambda: self._forget_peer(peer))
         return b"ok"
 
     async def start(self) -> None:
@@ -197,6 +396,7 @@ class A2ABus:
         self._handshake_peers.clear()
         self._handshake_failures.clear()
         self._handshake_nonces.clear()
+        self._peer_codecs.clear()
         if self.settings.broker_url and AIOKafkaProducer:
             self._producer = AIOKafkaProducer(bootstrap_servers=self.settings.broker_url)
             await self._producer.start()
@@ -229,6 +429,10 @@ class A2ABus:
             self.settings.bus_port,
             self.settings.broker_url or "disabled",
         )
+        with contextlib.suppress(asyncio.TimeoutError):
+            await self.drain(self.DRAIN_TIMEOUT)
+        workers = [t for subs in self._subs.values() for s in subs for t in s.cancel()] + self._forwarder.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
         if self._server:
             await self._server.stop(0)
             self._server = None
@@ -238,3 +442,4 @@ class A2ABus:
         self._handshake_peers.clear()
         self._handshake_failures.clear()
         self._handshake_nonces.clear()
+        self._peer_codecs.clear()
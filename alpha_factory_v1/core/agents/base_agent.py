@@ -127,8 +127,16 @@ class BaseAgent:
         )
         if isinstance(payload, dict):
             env.payload.update(payload)
-        self.ledger.log(env)
-        self.bus.publish(recipient, env)
+        alog = getattr(self.ledger, "alog", None)
+        if alog is not None:
+            await alog(env)
+        else:
+            self.ledger.log(env)
+        apublish = getattr(self.bus, "apublish", None)
+        if apublish is not None:
+            await apublish(recipient, env)
+        else:
+            self.bus.publish(recipient, env)
 
     def close(self) -> None:
         """Unsubscribe the agent from the bus."""
@@ -8,12 +8,13 @@ import random
 import sqlite3
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, List
+from typing import Any, Iterable, Iterator, List
 
 from alpha_factory_v1.core.monitoring import metrics
 
 from .db import ArchiveDB, ArchiveEntry
 from .manager import PatchManager
+from .sqlite_pool import get_pool
 
 
 @dataclass(slots=True)
@@ -26,14 +27,34 @@ class Agent:
 
 
 class Archive:
-    """Persist agent records and provide weighted sampling."""
+    """Persist agent records and provide weighted sampling.
+
+    Connections come from a shared WAL-mode :class:`SQLitePool`. Count, sum
+    and best score live in an ``agents_stats`` row updated with every insert,
+    and each row stores the running total of its default logistic weight so
+    :meth:`sample` resolves draws with indexed range lookups. ``meta["parent"]``
+    is mirrored into an indexed ``parent`` column so :meth:`lineage` and
+    :meth:`subtree` resolve with one recursive query.
+    """
+
+    LAM = 10.0
+    ALPHA0 = 0.5
 
     def __init__(self, path: str | Path) -> None:
         self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.pool = get_pool(self.path)
         self._ensure()
 
+    @classmethod
+    def _weight(cls, score: float, lam: float | None = None, alpha0: float | None = None) -> float:
+        lam = cls.LAM if lam is None else lam
+        alpha0 = cls.ALPHA0 if alpha0 is None else alpha0
+        z = -lam * (score - alpha0)
+        return 0.0 if z > 700 else 1.0 / (1.0 + math.exp(z))
+
     def _ensure(self) -> None:
-        with sqlite3.connect(self.path) as cx:
+        with self.pool.transaction() as cx:
             cx.execute(
                 "CREATE TABLE IF NOT EXISTS agents("
                 "id INTEGER PRIMARY KEY AUTOINCREMENT,"
@@ -41,36 +62,188 @@ class Archive:
                 "score REAL"
                 ")"
             )
-
-    def _update_metrics(self) -> None:
-        records = self.all()
-        if not records:
+            cols = {row[1] for row in cx.execute("PRAGMA table_info(agents)")}
+            if "cum_weight" not in cols:
+                cx.execute("ALTER TABLE agents ADD COLUMN cum_weight REAL")
+            cx.execute("CREATE INDEX IF NOT EXISTS agents_cum_weight ON agents(cum_weight)")
+            if "parent" not in cols:
+                cx.execute("ALTER TABLE agents ADD COLUMN parent INTEGER")
+                rows = cx.execute("SELECT id, meta FROM agents").fetchall()
+                updates = [(p, i) for i, m in rows if (p := self._parent(json.loads(m))) is not None]
+                cx.executemany("UPDATE agents SET parent = ? WHERE id = ?", updates)
+            cx.execute("CREATE INDEX IF NOT EXISTS agents_parent ON agents(parent)")
+            cx.execute(
+                "CREATE TABLE IF NOT EXISTS agents_stats("
+                "id INTEGER PRIMARY KEY CHECK (id = 0),"
+                "count INTEGER NOT NULL,"
+                "total REAL NOT NULL,"
+                "best REAL,"
+                "weight REAL NOT NULL"
+                ")"
+            )
+            if cx.execute("SELECT 1 FROM agents_stats WHERE id = 0").fetchone() is None:
+                self._rebuild_stats(cx)
+
+    @staticmethod
+    def _parent(meta: dict[str, Any]) -> int | None:
+        try:
+            return int(meta["parent"])
+        except (KeyError, TypeError, ValueError):
+            return None
+
+    def _rebuild_stats(self, cx: sqlite3.Connection) -> None:
+        """Backfill aggregates and cumulative weights for existing rows."""
+        count, total, best, weight = 0, 0.0, None, 0.0
+        updates = []
+        for row_id, score in cx.execute("SELECT id, score FROM agents ORDER BY id"):
+            score = float(score)
+            count += 1
+            total += score
+            best = score if best is None else max(best, score)
+            weight += self._weight(score)
+            updates.append((weight, row_id))
+        cx.executemany("UPDATE agents SET cum_weight = ? WHERE id = ?", updates)
+        cx.execute(
+            "INSERT OR REPLACE INTO agents_stats(id, count, total, best, weight) VALUES (0, ?, ?, ?, ?)",
+            (count, total, best, weight),
+        )
+
+    def _stats(self, cx: sqlite3.Connection) -> tuple[int, float, float | None, float]:
+        row = cx.execute("SELECT count, total, best, weight FROM agents_stats WHERE id = 0").fetchone()
+        if row is None:
+            return 0, 0.0, None, 0.0
+        return int(row[0]), float(row[1]), row[2], float(row[3])
+
+    def _update_metrics(self, stats: tuple[int, float, float | None, float] | None = None) -> None:
+        if stats is None:
+            with self.pool.connection() as cx:
+                stats = self._stats(cx)
+        count, total, best, _ = stats
+        if not count:
             return
-        scores = [a.score for a in records]
-        metrics.dgm_best_score.set(max(scores))
-        metrics.dgm_archive_mean.set(sum(scores) / len(scores))
-        metrics.dgm_lineage_depth.set(len(records))
+        metrics.dgm_best_score.set(best)
+        metrics.dgm_archive_mean.set(total / count)
+        metrics.dgm_lineage_depth.set(count)
 
     def add(self, meta: dict[str, Any], score: float) -> None:
         """Insert an agent entry and update archive metrics."""
-        with sqlite3.connect(self.path) as cx:
-            cx.execute("INSERT INTO agents(meta, score) VALUES (?, ?)", (json.dumps(meta), score))
-        self._update_metrics()
+        self.add_many([(meta, score)])
+
+    def add_many(self, items: Iterable[tuple[dict[str, Any], float]]) -> None:
+        """Insert several agent entries in one transaction."""
+        batch = [(json.dumps(meta), float(score), self._parent(meta)) for meta, score in items]
+        if not batch:
+            return
+        with self.pool.transaction() as cx:
+            count, total, best, weight = self._stats(cx)
+            rows = []
+            for meta_json, score, parent in batch:
+                count += 1
+                total += score
+                best = score if best is None else max(best, score)
+                weight += self._weight(score)
+                rows.append((meta_json, score, weight, parent))
+            cx.executemany("INSERT INTO agents(meta, score, cum_weight, parent) VALUES (?, ?, ?, ?)", rows)
+            stats = (count, total, best, weight)
+            cx.execute(
+                "UPDATE agents_stats SET count = ?, total = ?, best = ?, weight = ? WHERE id = 0",
+                stats,
+            )
+        self._update_metrics(stats)
+
+    def __len__(self) -> int:
+        with self.pool.connection() as cx:
+            return self._stats(cx)[0]
 
     def all(self) -> List[Agent]:
         """Return all archived agents sorted by insertion order."""
-        with sqlite3.connect(self.path) as cx:
+        with self.pool.connection() as cx:
             rows = list(cx.execute("SELECT id, meta, score FROM agents ORDER BY id"))
         return [Agent(id=r[0], meta=json.loads(r[1]), score=float(r[2])) for r in rows]
 
-    def sample(self, k: int, *, lam: float = 10.0, alpha0: float = 0.5) -> List[Agent]:
-        """Draw ``k`` agents using a logistic ranking scheme."""
-        agents = self.all()
-        if not agents:
-            return []
-        weights = [1.0 / (1.0 + math.exp(-lam * (a.score - alpha0))) for a in agents]
-        chosen = random.choices(agents, weights=weights, k=min(k, len(agents)))
-        return chosen
+    def iter_all(self, batch_size: int = 512) -> Iterator[Agent]:
+        """Yield archived agents in insertion order without loading them all.
+
+        Rows are paged by id and each page borrows a pooled connection only
+        while it is read, so a slow consumer neither holds a connection nor
+        pins a WAL snapshot between pages.
+        """
+        last = 0
+        while True:
+            with self.pool.connection() as cx:
+                rows = cx.execute(
+                    "SELECT id, meta, score FROM agents WHERE id > ? ORDER BY id LIMIT ?", (last, batch_size)
+                ).fetchall()
+            if not rows:
+                return
+            last = rows[-1][0]
+            for r in rows:
+                yield Agent(id=r[0], meta=json.loads(r[1]), score=float(r[2]))
+
+    def lineage(self, agent_id: int, *, max_depth: int | None = None) -> List[Agent]:
+        """Return the ancestors of ``agent_id`` followed by the agent itself.
+
+        ``max_depth`` limits how many parent links are followed. Returns an
+        empty list when ``agent_id`` is unknown.
+        """
+        return self._walk(agent_id, up=True, max_depth=max_depth)[::-1]
+
+    def subtree(self, agent_id: int, *, max_depth: int | None = None) -> List[Agent]:
+        """Return ``agent_id`` and its descendants, breadth first."""
+        return self._walk(agent_id, up=False, max_depth=max_depth)
+
+    def _walk(self, agent_id: int, *, up: bool, max_depth: int | None) -> List[Agent]:
+        link = "a.id = w.parent" if up else "a.parent = w.id"
+        with self.pool.connection() as cx:
+            if max_depth is None:
+                # a lineage cannot be longer than the archive unless it loops
+                max_depth = self._stats(cx)[0]
+            rows = cx.execute(
+                "WITH RECURSIVE w(id, parent, depth) AS ("
+                " SELECT id, parent, 0 FROM agents WHERE id = ?"
+                f" UNION ALL SELECT a.id, a.parent, w.depth + 1 FROM agents a JOIN w ON {link}"
+                " WHERE w.depth < ?)"
+                " SELECT a.id, a.meta, a.score FROM w JOIN agents a ON a.id = w.id ORDER BY w.depth, a.id",
+                (agent_id, max_depth),
+            ).fetchall()
+        return [Agent(id=r[0], meta=json.loads(r[1]), score=float(r[2])) for r in rows]
+
+    def _by_ids(self, cx: sqlite3.Connection, ids: List[int]) -> List[Agent]:
+        unique = sorted(set(ids))
+        marks = ",".join("?" * len(unique))
+        rows = cx.execute(f"SELECT id, meta, score FROM agents WHERE id IN ({marks})", unique)
+        found = {r[0]: Agent(id=r[0], meta=json.loads(r[1]), score=float(r[2])) for r in rows}
+        return [found[i] for i in ids]
+
+    def sample(self, k: int, *, lam: float = LAM, alpha0: float = ALPHA0) -> List[Agent]:
+        """Draw ``k`` agents using a logistic ranking scheme.
+
+        Draws use the stored cumulative weights for the default ``lam`` and
+        ``alpha0``; other parameters fall back to scanning the score column.
+        When every weight is zero the draw is uniform.
+        """
+        with self.pool.connection() as cx:
+            count, _, _, weight = self._stats(cx)
+            if not count or k <= 0:
+                return []
+            n = min(k, count)
+            if lam == self.LAM and alpha0 == self.ALPHA0 and weight > 0:
+                ids = []
+                for _ in range(n):
+                    u = random.random() * weight
+                    row = cx.execute(
+                        "SELECT id FROM agents WHERE cum_weight > ? ORDER BY cum_weight LIMIT 1", (u,)
+                    ).fetchone()
+                    if row is None:
+                        row = cx.execute("SELECT id FROM agents ORDER BY cum_weight DESC LIMIT 1").fetchone()
+                    ids.append(int(row[0]))
+            else:
+                pairs = list(cx.execute("SELECT id, score FROM agents ORDER BY id"))
+                weights = [self._weight(float(s), lam, alpha0) for _, s in pairs]
+                # every weight underflowed to zero: fall back to a uniform draw
+                chosen = random.choices(pairs, weights=weights if sum(weights) else None, k=n)
+                ids = [int(i) for i, _ in chosen]
+            return self._by_ids(cx, ids)
 
 
 __all__ = ["Agent", "Archive", "ArchiveDB", "ArchiveEntry", "PatchManager"]
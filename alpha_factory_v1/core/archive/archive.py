@@ -1,5 +1,10 @@
 # SPDX-License-Identifier: Apache-2.0
-"""Archive entry insertion with Merkle root tracking."""
+"""Archive entry insertion with Merkle root tracking.
+
+Entry hashes are folded into an append-only
+:class:`~alpha_factory_v1.common.utils.merkle.MerkleAccumulator` in insertion
+order, so inserts and root lookups touch ``O(log N)`` rows.
+"""
 from __future__ import annotations
 
 import hashlib
@@ -8,8 +13,9 @@ import os
 import sqlite3
 import time
 from pathlib import Path
-from typing import Mapping, Iterable
+from typing import List, Mapping
 
+from alpha_factory_v1.common.utils.merkle import MerkleAccumulator
 
 _DEFAULT_DB = Path(os.getenv("ARCHIVE_PATH", "archive.db"))
 
@@ -31,31 +37,35 @@ def _ensure(path: Path) -> None:
         cx.execute("CREATE TABLE IF NOT EXISTS merkle(date TEXT PRIMARY KEY, root TEXT)")
 
 
-def _compute_root(hashes: Iterable[str]) -> str:
-    nodes = [hashlib.sha256(h.encode()).digest() for h in sorted(hashes)]
-    if not nodes:
-        return ""
-    while len(nodes) > 1:
-        if len(nodes) % 2 == 1:
-            nodes.append(nodes[-1])
-        nodes = [hashlib.sha256(nodes[i] + nodes[i + 1]).digest() for i in range(0, len(nodes), 2)]
-    return nodes[0].hex()
+def _sha256(data: bytes) -> bytes:
+    return hashlib.sha256(data).digest()
+
+
+def _leaf(h: str) -> bytes:
+    return _sha256(h.encode())
+
+
+def _accumulator(cx: sqlite3.Connection) -> MerkleAccumulator:
+    acc = MerkleAccumulator(cx, "entries", hash_fn=_sha256, leaf_fn=_leaf)
+    rows = cx.execute("SELECT id, hash FROM entries WHERE id > ? ORDER BY id", (acc.last_id,))
+    acc.sync(rows.fetchall())
+    return acc
 
 
 def merkle_root(*, db_path: str | Path = _DEFAULT_DB) -> str:
+    """Return the Merkle root over all entry hashes in insertion order."""
     path = Path(db_path)
     _ensure(path)
     with sqlite3.connect(path) as cx:
-        hashes = [r[0] for r in cx.execute("SELECT hash FROM entries ORDER BY id")]
-    return _compute_root(hashes)
+        return _accumulator(cx).root
 
 
-def _update_root(path: Path) -> str:
-    root = merkle_root(db_path=path)
-    date = time.strftime("%Y-%m-%d")
+def merkle_proof(index: int, *, db_path: str | Path = _DEFAULT_DB) -> List[tuple[str, bool]]:
+    """Return the inclusion proof for the ``index``-th entry hash."""
+    path = Path(db_path)
+    _ensure(path)
     with sqlite3.connect(path) as cx:
-        cx.execute("INSERT OR REPLACE INTO merkle(date, root) VALUES(?,?)", (date, root))
-    return root
+        return _accumulator(cx).proof(index)
 
 
 def insert(
@@ -79,7 +89,10 @@ def insert(
             "INSERT INTO entries(parent, child, metrics, hash, ts) VALUES(?,?,?,?,?)",
             (parent_hash, child_hash, json.dumps(record["metrics"]), h, time.time()),
         )
-    return _update_root(path)
+        root = _accumulator(cx).root
+        date = time.strftime("%Y-%m-%d")
+        cx.execute("INSERT OR REPLACE INTO merkle(date, root) VALUES(?,?)", (date, root))
+    return root
 
 
-__all__ = ["insert", "merkle_root"]
+__all__ = ["insert", "merkle_root", "merkle_proof"]
@@ -1,5 +1,10 @@
 # SPDX-License-Identifier: Apache-2.0
-"""SQLAlchemy-backed archive database."""
+"""SQLAlchemy-backed archive database.
+
+Lineage walks (:meth:`ArchiveDB.history` and :meth:`ArchiveDB.descendants`)
+run as a single recursive CTE over the indexed ``parent`` column instead of
+one query per generation.
+"""
 
 from __future__ import annotations
 
@@ -10,7 +15,7 @@ import dataclasses
 from pathlib import Path
 from typing import Iterator, Optional
 
-from sqlalchemy import Boolean, Column, Float, String, create_engine
+from sqlalchemy import Boolean, Column, Float, String, create_engine, func, literal, select
 from sqlalchemy.orm import Session, DeclarativeBase
 
 
@@ -34,7 +39,7 @@ class _ArchiveRow(Base):
     __tablename__ = "archive"
 
     hash = Column(String, primary_key=True)
-    parent = Column(String, nullable=True)
+    parent = Column(String, nullable=True, index=True)
     score = Column(Float, default=0.0)
     novelty = Column(Float, default=0.0)
     is_live = Column(Boolean, default=True)
@@ -57,6 +62,8 @@ class ArchiveDB:
         self.path = Path(path)
         self.engine = create_engine(f"sqlite:///{self.path}")
         Base.metadata.create_all(self.engine)
+        for index in _ArchiveRow.__table__.indexes:  # create_all skips indexes on existing tables
+            index.create(self.engine, checkfirst=True)
         with Session(self.engine) as session:
             exists = session.query(_ArchiveRow).first() is not None
         if not exists:
@@ -104,14 +111,32 @@ class ArchiveDB:
                 ts=row.ts,
             )
 
-    def history(self, start_hash: str) -> Iterator[ArchiveEntry]:
-        """Yield ancestral lineage starting from ``start_hash``."""
-        current = self.get(start_hash)
-        while current is not None:
-            yield current
-            if not current.parent:
-                break
-            current = self.get(current.parent)
+    def history(self, start_hash: str, *, max_depth: int | None = None) -> Iterator[ArchiveEntry]:
+        """Yield ancestral lineage starting from ``start_hash``.
+
+        ``max_depth`` limits how many parent links are followed.
+        """
+        yield from self._walk(start_hash, up=True, max_depth=max_depth)
+
+    def descendants(self, root_hash: str, *, max_depth: int | None = None) -> Iterator[ArchiveEntry]:
+        """Yield ``root_hash`` and its subtree, breadth first."""
+        yield from self._walk(root_hash, up=False, max_depth=max_depth)
+
+    def _walk(self, start: str, *, up: bool, max_depth: int | None) -> Iterator[ArchiveEntry]:
+        t = _ArchiveRow.__table__
+        cols = [t.c.hash, t.c.parent, t.c.score, t.c.novelty, t.c.is_live, t.c.ts]
+        with self.engine.connect() as conn:
+            if max_depth is None:
+                # a lineage cannot be longer than the table unless it loops
+                max_depth = int(conn.execute(select(func.count()).select_from(t)).scalar_one())
+            walk = select(*cols, literal(0).label("depth")).where(t.c.hash == start).cte("walk", recursive=True)
+            link = t.c.hash == walk.c.parent if up else t.c.parent == walk.c.hash
+            walk = walk.union_all(
+                select(*cols, (walk.c.depth + 1).label("depth")).join(walk, link).where(walk.c.depth < max_depth)
+            )
+            stmt = select(*(walk.c[c.name] for c in cols)).order_by(walk.c.depth, walk.c.ts)
+            for row in conn.execute(stmt):
+                yield ArchiveEntry(*row)
 
     # state helpers -----------------------------------------------------
 
@@ -11,6 +11,7 @@ import time
 from pathlib import Path
 from typing import Any, Iterable, Mapping, List
 
+from alpha_factory_v1.common.utils.merkle import MerkleAccumulator
 from alpha_factory_v1.core.evaluators.novelty import NoveltyIndex
 
 try:
@@ -46,6 +47,10 @@ def _merkle_root(hashes: Iterable[str]) -> str:
     return nodes[0].hex()
 
 
+def _digest(data: bytes) -> bytes:
+    return blake3(data).digest()
+
+
 class ArchiveService:
     """Simple append-only archive with Merkle root broadcasting."""
 
@@ -72,7 +77,14 @@ class ArchiveService:
             )
             """
         )
-        self.conn.commit()
+        with self.conn:
+            self._merkle = MerkleAccumulator(
+                self.conn,
+                "entries",
+                hash_fn=_digest,
+                empty_root=blake3(b"\x00").hexdigest(),
+            )
+            self._sync_merkle()
         self.rpc_url = rpc_url
         self.wallet = wallet
         self.broadcast = broadcast
@@ -80,9 +92,7 @@ class ArchiveService:
         self.novelty = NoveltyIndex()
         try:
             cur = self.conn.execute("SELECT spec FROM entries")
-            for (spec_text,) in cur.fetchall():
-                if isinstance(spec_text, str):
-                    self.novelty.add(spec_text)
+            self.novelty.add_many(spec for (spec,) in cur.fetchall() if isinstance(spec, str))
         except Exception:  # pragma: no cover - index load errors
             _log.debug("Failed to rebuild novelty index", exc_info=True)
 
@@ -92,18 +102,19 @@ class ArchiveService:
         row = cur.fetchone()
         return row[0] if row else None
 
+    def _sync_merkle(self) -> str:
+        cur = self.conn.execute("SELECT id, hash FROM entries WHERE id > ? ORDER BY id", (self._merkle.last_id,))
+        return self._merkle.sync(cur.fetchall())
+
     def compute_merkle_root(self) -> str:
         """Return the Merkle root over all stored entry hashes."""
-        cur = self.conn.execute("SELECT hash FROM entries ORDER BY id")
-        hashes = [row[0] for row in cur.fetchall() if isinstance(row[0], str)]
-        valid: List[str] = []
-        for h in hashes:
-            try:
-                bytes.fromhex(h)
-            except Exception:
-                continue
-            valid.append(h)
-        return _merkle_root(valid)
+        with self.conn:
+            return self._sync_merkle()
+
+    def merkle_proof(self, index: int) -> List[tuple[str, bool]]:
+        """Return the inclusion proof for the entry hash at position ``index``."""
+        self.compute_merkle_root()
+        return self._merkle.proof(index)
 
     def insert_entry(
         self,
@@ -121,11 +132,12 @@ class ArchiveService:
                 "INSERT INTO entries(parent, spec, scores, hash, ts) VALUES(?,?,?,?,?)",
                 (parent, json.dumps(spec), json.dumps(record["scores"]), digest, time.time()),
             )
+            root = self._sync_merkle()
         try:
             self.novelty.add(json.dumps(spec))
         except Exception:  # pragma: no cover - embed errors
             _log.debug("Failed to add spec to novelty index", exc_info=True)
-        return self.compute_merkle_root()
+        return root
 
     async def broadcast_merkle_root(self) -> None:
         """Publish the current Merkle root via Solana or log it."""
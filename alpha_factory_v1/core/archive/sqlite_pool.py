@@ -0,0 +1,120 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Thread-safe pool of long-lived SQLite connections.
+
+Connections are opened once in WAL mode with ``synchronous=NORMAL`` and a
+large statement cache, so repeated queries reuse their prepared statements.
+Pools are shared per database file through :func:`get_pool`.
+"""
+
+from __future__ import annotations
+
+import atexit
+import queue
+import sqlite3
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator
+
+__all__ = ["SQLitePool", "get_pool", "close_pools"]
+
+
+class SQLitePool:
+    """Bounded pool of WAL-mode connections to one database file."""
+
+    def __init__(self, path: str | Path, *, size: int = 4, timeout: float = 30.0) -> None:
+        self.path = Path(path)
+        self.size = max(1, size)
+        self.timeout = timeout
+        self._idle: queue.LifoQueue[sqlite3.Connection] = queue.LifoQueue()
+        self._opened = 0
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def _open(self) -> sqlite3.Connection:
+        cx = sqlite3.connect(
+            self.path,
+            timeout=self.timeout,
+            check_same_thread=False,
+            cached_statements=256,
+        )
+        cx.execute("PRAGMA journal_mode=WAL")
+        cx.execute("PRAGMA synchronous=NORMAL")
+        cx.execute("PRAGMA foreign_keys=ON")
+        return cx
+
+    def _acquire(self) -> sqlite3.Connection:
+        if self._closed:
+            raise RuntimeError("pool is closed")
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        with self._lock:
+            if self._opened < self.size:
+                self._opened += 1
+                try:
+                    return self._open()
+                except Exception:
+                    self._opened -= 1
+                    raise
+        return self._idle.get(timeout=self.timeout)
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        """Borrow a connection without starting a transaction."""
+        cx = self._acquire()
+        try:
+            yield cx
+        finally:
+            if cx.in_transaction:
+                cx.rollback()
+            if self._closed:
+                cx.close()
+            else:
+                self._idle.put(cx)
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """Borrow a connection and commit on success, roll back on error."""
+        with self.connection() as cx:
+            cx.execute("BEGIN IMMEDIATE")
+            try:
+                yield cx
+            except BaseException:
+                cx.rollback()
+                raise
+            cx.commit()
+
+    def close(self) -> None:
+        """Close idle connections; busy ones close when returned."""
+        self._closed = True
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                break
+
+
+_POOLS: dict[Path, SQLitePool] = {}
+_POOLS_LOCK = threading.Lock()
+
+
+def get_pool(path: str | Path, *, size: int = 4) -> SQLitePool:
+    """Return the shared pool for ``path``, creating it on first use."""
+    key = Path(path).resolve()
+    with _POOLS_LOCK:
+        pool = _POOLS.get(key)
+        if pool is None or pool._closed:
+            pool = SQLitePool(key, size=size)
+            _POOLS[key] = pool
+        return pool
+
+
+@atexit.register
+def close_pools() -> None:
+    """Close every pool created through :func:`get_pool`."""
+    with _POOLS_LOCK:
+        for pool in _POOLS.values():
+            pool.close()
+        _POOLS.clear()
@@ -1,13 +1,29 @@
 # SPDX-License-Identifier: Apache-2.0
-"""Embedding-based novelty scoring utilities."""
+"""Embedding-based novelty scoring utilities.
+
+Embeddings are computed in batches and stored in a content-addressed
+:class:`VectorCache` on disk so archive rebuilds only encode unseen text.
+Concurrent single-text requests are coalesced into micro-batches before
+reaching the encoder.
+"""
 from __future__ import annotations
 
 import logging
 import hashlib
-from typing import Any, TYPE_CHECKING
+import os
+import threading
+from concurrent.futures import Future
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Iterable, Iterator, Sequence, TYPE_CHECKING
 
 import numpy as np
 
+try:  # POSIX only
+    import fcntl
+except ModuleNotFoundError:  # pragma: no cover - windows
+    fcntl = None  # type: ignore[assignment]
+
 try:  # optional heavy deps
     import faiss
 except Exception:  # pragma: no cover - offline
@@ -18,7 +34,10 @@ if TYPE_CHECKING:  # pragma: no cover
 
 _LOG = logging.getLogger(__name__)
 _MODEL: "SentenceTransformer" | None = None
+_MODEL_NAME = "all-MiniLM-L6-v2"
 _DIM = 384
+_BATCH_SIZE = int(os.getenv("NOVELTY_BATCH_SIZE", "64"))
+_BATCH_WAIT = float(os.getenv("NOVELTY_BATCH_WAIT_MS", "5")) / 1000.0
 
 
 def _get_model() -> "SentenceTransformer":
@@ -36,19 +55,238 @@ def _get_model() -> "SentenceTransformer":
         raise ImportError("sentence-transformers missing") from exc
     global _MODEL
     if _MODEL is None:
-        _MODEL = SentenceTransformer("all-MiniLM-L6-v2")
+        _MODEL = SentenceTransformer(_MODEL_NAME)
     return _MODEL
 
 
-def embed(text: str) -> np.ndarray:
-    """Return the MiniLM embedding for ``text``."""
+class VectorCache:
+    """Append-only on-disk embedding store keyed by content hash.
+
+    Vectors live in ``vectors.f32`` as raw ``float32`` rows that are read
+    through a memory map, and ``keys.bin`` holds the matching 16-byte digests.
+    Appends hold an exclusive ``flock`` on ``.lock`` and first index rows other
+    processes added, so processes sharing a directory never interleave rows.
+    A torn write left by a crashed writer is truncated away.
+    """
+
+    _KEY_SIZE = 16
+
+    def __init__(self, path: str | Path, dim: int = _DIM) -> None:
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.dim = dim
+        self._vec_file = self.path / "vectors.f32"
+        self._key_file = self.path / "keys.bin"
+        self._lock_file = self.path / ".lock"
+        self._lock = threading.Lock()
+        self._rows: dict[bytes, int] = {}
+        self._size = 0
+        self._mmap: np.ndarray | None = None
+        with self._locked():
+            self._catch_up()
+
+    @staticmethod
+    def key(text: str, model: str = _MODEL_NAME) -> bytes:
+        return hashlib.blake2b(f"{model}\0{text}".encode(), digest_size=VectorCache._KEY_SIZE).digest()
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        with self._lock, open(self._lock_file, "ab") as fh:
+            if fcntl is not None:
+                fcntl.flock(fh, fcntl.LOCK_EX)
+            yield  # closing the file releases the flock
+
+    def _catch_up(self) -> None:
+        """Index rows appended since the last call; requires :meth:`_locked`."""
+        key_bytes = self._key_file.stat().st_size if self._key_file.exists() else 0
+        vec_bytes = self._vec_file.stat().st_size if self._vec_file.exists() else 0
+        n = min(key_bytes // self._KEY_SIZE, vec_bytes // (4 * self.dim))
+        if n < self._size:  # pragma: no cover - files replaced underneath us
+            self._rows.clear()
+            self._size = 0
+        if n > self._size:
+            with open(self._key_file, "rb") as fh:
+                fh.seek(self._size * self._KEY_SIZE)
+                keys = fh.read((n - self._size) * self._KEY_SIZE)
+            for i in range(n - self._size):
+                self._rows.setdefault(keys[i * self._KEY_SIZE : (i + 1) * self._KEY_SIZE], self._size + i)
+        if key_bytes != n * self._KEY_SIZE or vec_bytes != n * 4 * self.dim:
+            with open(self._key_file, "ab") as fh:
+                fh.truncate(n * self._KEY_SIZE)
+            with open(self._vec_file, "ab") as fh:
+                fh.truncate(n * 4 * self.dim)
+        self._size = n
+
+    def _view(self) -> np.ndarray:
+        if self._mmap is None or len(self._mmap) != self._size:
+            self._mmap = np.memmap(self._vec_file, dtype="float32", mode="r", shape=(self._size, self.dim))
+        return self._mmap
+
+    def __len__(self) -> int:
+        return self._size
+
+    def get_many(self, keys: Sequence[bytes]) -> dict[int, np.ndarray]:
+        """Return cached vectors indexed by their position in ``keys``."""
+        with self._lock:
+            hits = [(i, self._rows[k]) for i, k in enumerate(keys) if k in self._rows]
+            if not hits:
+                return {}
+            view = self._view()
+            return {i: np.array(view[row]) for i, row in hits}
+
+    def put_many(self, keys: Sequence[bytes], vecs: np.ndarray) -> None:
+        """Append ``vecs`` for ``keys`` that are not stored yet."""
+        with self._locked():
+            self._catch_up()
+            new = [(k, v) for k, v in zip(keys, vecs) if k not in self._rows]
+            if not new:
+                return
+            block = np.asarray([v for _, v in new], dtype="float32").reshape(len(new), self.dim)
+            with open(self._vec_file, "ab") as fh:
+                fh.write(block.tobytes())
+            with open(self._key_file, "ab") as fh:
+                fh.write(b"".join(k for k, _ in new))
+            for k, _ in new:
+                self._rows[k] = self._size
+                self._size += 1
+
+
+class _MicroBatcher:
+    """Coalesce concurrent :func:`embed` calls into one encoder batch.
+
+    A call arriving while the encoder is idle runs immediately on the calling
+    thread; calls made while it is busy are queued and encoded together.
+    """
+
+    def __init__(self, max_batch: int = _BATCH_SIZE, max_wait: float = _BATCH_WAIT) -> None:
+        self.max_batch = max(1, max_batch)
+        self.max_wait = max_wait
+        self._pending: list[tuple[str, Future[np.ndarray]]] = []
+        self._cond = threading.Condition()
+        self._thread: threading.Thread | None = None
+        self._active = 0  # encoder calls in flight
+
+    def submit(self, text: str) -> np.ndarray:
+        fut: Future[np.ndarray] = Future()
+        with self._cond:
+            direct = not self._pending and not self._active
+            if direct:
+                self._active += 1
+            else:
+                self._pending.append((text, fut))
+                if self._thread is None or not self._thread.is_alive():
+                    self._thread = threading.Thread(target=self._run, name="novelty-embed", daemon=True)
+                    self._thread.start()
+                self._cond.notify()
+        if not direct:
+            return fut.result()
+        try:
+            return embed_batch([text])
+        finally:
+            with self._cond:
+                self._active -= 1
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                if not self._pending:
+                    self._cond.wait(timeout=1.0)
+                    if not self._pending:
+                        self._thread = None
+                        return
+                self._cond.wait_for(lambda: len(self._pending) >= self.max_batch, timeout=self.max_wait)
+                batch = self._pending[: self.max_batch]
+                del self._pending[: self.max_batch]
+                if not batch:
+                    continue
+                self._active += 1
+            try:
+                vecs = embed_batch([t for t, _ in batch])
+            except Exception as exc:  # pragma: no cover - defensive
+                for _, fut in batch:
+                    fut.set_exception(exc)
+                continue
+            finally:
+                with self._cond:
+                    self._active -= 1
+            for i, (_, fut) in enumerate(batch):
+                fut.set_result(vecs[i : i + 1])
+
+
+_CACHE: VectorCache | None = None
+_CACHE_LOCK = threading.Lock()
+_BATCHER = _MicroBatcher()
+
+
+def _cache() -> VectorCache | None:
+    """Return the process-wide vector cache or ``None`` when disabled.
+
+    ``NOVELTY_CACHE_DIR`` selects the directory; an empty value disables the
+    disk tier. The default lives under ``$ALPHA_DATA_DIR``.
+    """
+    global _CACHE
+    if _CACHE is None:
+        default = Path(os.getenv("ALPHA_DATA_DIR", "/tmp/alphafactory")) / "novelty_cache"
+        path = os.getenv("NOVELTY_CACHE_DIR", str(default))
+        if not path:
+            return None
+        with _CACHE_LOCK:
+            if _CACHE is None:
+                try:
+                    _CACHE = VectorCache(path)
+                except OSError as exc:  # pragma: no cover - read-only fs
+                    _LOG.warning("Novelty cache disabled: %s", exc)
+                    return None
+    return _CACHE
+
+
+def embed_batch(texts: Sequence[str]) -> np.ndarray:
+    """Return MiniLM embeddings for ``texts`` as an ``(n, dim)`` array.
+
+    Cached vectors are served from disk and only unseen texts are encoded,
+    in a single model call.
+    """
+    out = np.zeros((len(texts), _DIM), dtype="float32")
+    if not texts:
+        return out
     try:
         model = _get_model()
-        vec = model.encode([text], normalize_embeddings=True)
-        return np.asarray(vec, dtype="float32")  # type: ignore[no-any-return]
     except Exception as exc:  # pragma: no cover - offline fallback
         _LOG.warning("SentenceTransformer unavailable (%s) → hashing fallback.", exc)
-        return _hash_embedding(text)
+        for i, text in enumerate(texts):
+            out[i] = _hash_embedding(text)[0]
+        return out
+    cache = _cache()
+    keys = [VectorCache.key(t) for t in texts]
+    hits = cache.get_many(keys) if cache is not None else {}
+    for i, vec in hits.items():
+        out[i] = vec
+    missing: dict[bytes, list[int]] = {}
+    for i, k in enumerate(keys):
+        if i not in hits:
+            missing.setdefault(k, []).append(i)
+    if missing:
+        first = [idx[0] for idx in missing.values()]
+        vecs = np.asarray(
+            model.encode([texts[i] for i in first], batch_size=_BATCH_SIZE, normalize_embeddings=True),
+            dtype="float32",
+        ).reshape(len(first), _DIM)
+        for vec, idx in zip(vecs, missing.values()):
+            out[idx] = vec
+        if cache is not None:
+            cache.put_many(list(missing), vecs)
+    return out
+
+
+def embed(text: str) -> np.ndarray:
+    """Return the MiniLM embedding for ``text``.
+
+    Calls from concurrent threads are batched together once the encoder is
+    loaded.
+    """
+    if _MODEL is None:
+        return embed_batch([text])
+    return _BATCHER.submit(text)
 
 
 def _hash_embedding(text: str) -> np.ndarray:
@@ -81,6 +319,18 @@ class NoveltyIndex:
         self.mean = (self.mean * self.count + vec[0]) / (self.count + 1)
         self.count += 1
 
+    def add_many(self, texts: Iterable[str]) -> None:
+        """Index several texts with one batched embedding call."""
+        items = list(texts)
+        if not items:
+            return
+        vecs = embed_batch(items)
+        if self.index is not None:
+            self.index.add(vecs)
+        total = self.mean * self.count + vecs.sum(axis=0)
+        self.count += len(items)
+        self.mean = (total / self.count).astype("float32")
+
     def divergence(self, text: str) -> float:
         """Return the KL divergence between ``text`` and the index mean."""
         vec = embed(text)
@@ -90,3 +340,13 @@ class NoveltyIndex:
         q = _softmax(self.mean)
         kl = float(np.sum(p * np.log((p + 1e-12) / (q + 1e-12))))
         return kl
+
+    def divergence_many(self, texts: Sequence[str]) -> list[float]:
+        """Return :meth:`divergence` for each of ``texts`` using one batch."""
+        if self.count == 0:
+            return [1.0] * len(texts)
+        vecs = embed_batch(texts)
+        p = np.exp(vecs - vecs.max(axis=1, keepdims=True))
+        p /= p.sum(axis=1, keepdims=True) + 1e-12
+        q = _softmax(self.mean)
+        return [float(v) for v in np.sum(p * np.log((p + 1e-12) / (q + 1e-12)), axis=1)]
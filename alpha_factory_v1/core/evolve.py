@@ -9,7 +9,7 @@ import random
 import time
 from dataclasses import dataclass
 from enum import Enum, auto
-from typing import Any, Callable, Sequence, Awaitable, Optional
+from typing import Any, Callable, Iterator, Sequence, Awaitable, Optional, overload
 
 from alpha_factory_v1.core.agents.reviewer_agent import ReviewerAgent
 
@@ -33,27 +33,64 @@ class Phase(Enum):
     TASK_SOLVE = auto()
 
 
+class ArchiveView(Sequence[Candidate]):
+    """Read-only live view over an archive's candidates."""
+
+    __slots__ = ("_items",)
+
+    def __init__(self, items: list[Candidate]) -> None:
+        self._items = items
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    @overload
+    def __getitem__(self, idx: int) -> Candidate: ...
+
+    @overload
+    def __getitem__(self, idx: slice) -> Sequence[Candidate]: ...
+
+    def __getitem__(self, idx: int | slice) -> Candidate | Sequence[Candidate]:
+        return self._items[idx]
+
+    def __iter__(self) -> Iterator[Candidate]:
+        return iter(self._items)
+
+    def __repr__(self) -> str:
+        return f"ArchiveView({self._items!r})"
+
+
 class InMemoryArchive:
     """Trivial in-memory archive used for demos and tests."""
 
     def __init__(self) -> None:
         self._items: list[Candidate] = []
+        self._view = ArchiveView(self._items)
+        self._total = 0.0
+        self._best = float("-inf")
+
+    def __len__(self) -> int:
+        return len(self._items)
 
     def _update_metrics(self) -> None:
         if not self._items:
             return
-        scores = [c.fitness for c in self._items]
-        metrics.dgm_best_score.set(max(scores))
-        metrics.dgm_archive_mean.set(sum(scores) / len(scores))
+        metrics.dgm_best_score.set(self._best)
+        metrics.dgm_archive_mean.set(self._total / len(self._items))
         metrics.dgm_lineage_depth.set(len(self._items))
 
     def all(self) -> Sequence[Candidate]:
-        """Return a copy of all archived candidates."""
-        return list(self._items)
+        """Return a read-only view of all archived candidates.
+
+        The view tracks later additions; copy it to keep a snapshot.
+        """
+        return self._view
 
     async def accept(self, cand: Candidate) -> None:
         """Add ``cand`` to the archive and update metrics."""
         self._items.append(cand)
+        self._total += cand.fitness
+        self._best = max(self._best, cand.fitness)
         self._update_metrics()
 
 
@@ -70,8 +107,13 @@ async def evolve(
     phase_hook: Optional[Callable[[Phase], None]] = None,
     reviewer: ReviewerAgent | None = None,
     cost_threshold: float | None = None,
+    concurrency: int = 1,
 ) -> None:
-    """Run the self-modification phase followed by task solving."""
+    """Run the self-modification phase followed by task solving.
+
+    Up to ``concurrency`` candidate evaluations run at once; with more than
+    one, the cost budget may be overshot by the evaluations still in flight.
+    """
 
     await self_mod_phase(
         operator,
@@ -85,6 +127,7 @@ async def evolve(
         phase_hook=phase_hook,
         reviewer=reviewer,
         cost_threshold=cost_threshold,
+        concurrency=concurrency,
     )
     await task_solve_phase(
         operator,
@@ -98,6 +141,7 @@ async def evolve(
         phase_hook=phase_hook,
         reviewer=reviewer,
         cost_threshold=cost_threshold,
+        concurrency=concurrency,
     )
 
 
@@ -115,6 +159,7 @@ async def _phase_loop(
     phase_hook: Optional[Callable[[Phase], None]] = None,
     reviewer: ReviewerAgent | None = None,
     cost_threshold: float | None = None,
+    concurrency: int = 1,
 ) -> None:
     if not archive.all():
         await archive.accept(Candidate(genome=0.0, fitness=0.0, novelty=1.0, cost=0.0))
@@ -122,27 +167,61 @@ async def _phase_loop(
     spent = 0.0
     start = time.time()
     stopper = BanditEarlyStopper(cost_threshold) if cost_threshold is not None else None
-
-    while True:
-        if max_cost is not None and spent >= max_cost:
-            break
-        if wallclock is not None and time.time() - start >= wallclock:
-            break
-
-        population = archive.all()
-        parent = backtrack_boost(population, population, backtrack_rate, beta=beta, gamma=gamma)
-        genome = operator(parent.genome)
-        if phase_hook:
-            phase_hook(phase)
-        fitness, cost = await evaluate(genome)
-        gain = max(fitness - parent.fitness, 0.0)
-        if stopper and stopper.update(cost, gain):
-            break
-        child = Candidate(genome=genome, fitness=fitness, novelty=random.random(), cost=cost)
-        if reviewer is None or reviewer.critique(str(genome)) >= 0.7:
-            await archive.accept(child)
-            metrics.dgm_children_total.inc()
-        spent += cost
+    slots = asyncio.Semaphore(max(1, concurrency))
+    in_flight: set[asyncio.Task[None]] = set()
+    stopped = False
+    error: BaseException | None = None
+
+    async def _child(parent: Candidate, genome: Any) -> None:
+        nonlocal spent, stopped, error
+        try:
+            fitness, cost = await evaluate(genome)
+            gain = max(fitness - parent.fitness, 0.0)
+            if stopper and stopper.update(cost, gain):
+                stopped = True
+                return
+            child = Candidate(genome=genome, fitness=fitness, novelty=random.random(), cost=cost)
+            if reviewer is None or reviewer.critique(str(genome)) >= 0.7:
+                await archive.accept(child)
+                metrics.dgm_children_total.inc()
+            spent += cost
+        except asyncio.CancelledError:
+            raise
+        except BaseException as exc:
+            stopped = True
+            error = error or exc
+        finally:
+            slots.release()
+
+    try:
+        while True:
+            await slots.acquire()
+            if (
+                stopped
+                or (max_cost is not None and spent >= max_cost)
+                or (wallclock is not None and time.time() - start >= wallclock)
+            ):
+                slots.release()
+                break
+
+            population = archive.all()
+            parent = backtrack_boost(population, population, backtrack_rate, beta=beta, gamma=gamma)
+            genome = operator(parent.genome)
+            if phase_hook:
+                phase_hook(phase)
+            task = asyncio.create_task(_child(parent, genome))
+            in_flight.add(task)
+            task.add_done_callback(in_flight.discard)
+
+        if stopped:
+            for task in in_flight:
+                task.cancel()
+        await asyncio.gather(*in_flight, return_exceptions=True)
+    finally:
+        for task in in_flight:
+            task.cancel()
+    if error is not None:
+        raise error
 
 
 async def self_mod_phase(
@@ -158,6 +237,7 @@ async def self_mod_phase(
     phase_hook: Optional[Callable[[Phase], None]] = None,
     reviewer: ReviewerAgent | None = None,
     cost_threshold: float | None = None,
+    concurrency: int = 1,
 ) -> None:
     await _phase_loop(
         operator,
@@ -172,6 +252,7 @@ async def self_mod_phase(
         phase_hook=phase_hook,
         reviewer=reviewer,
         cost_threshold=cost_threshold,
+        concurrency=concurrency,
     )
 
 
@@ -188,6 +269,7 @@ async def task_solve_phase(
     phase_hook: Optional[Callable[[Phase], None]] = None,
     reviewer: ReviewerAgent | None = None,
     cost_threshold: float | None = None,
+    concurrency: int = 1,
 ) -> None:
     await _phase_loop(
         operator,
@@ -202,6 +284,7 @@ async def task_solve_phase(
         phase_hook=phase_hook,
         reviewer=reviewer,
         cost_threshold=cost_threshold,
+        concurrency=concurrency,
     )
 
 
@@ -248,6 +331,12 @@ def main(argv: Sequence[str] | None = None) -> None:
         default=None,
         help="Stop if GPU seconds per fitness gain exceed this value",
     )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=1,
+        help="Candidate evaluations in flight at once",
+    )
     args = parser.parse_args(argv)
 
     archive = InMemoryArchive()
@@ -262,6 +351,7 @@ def main(argv: Sequence[str] | None = None) -> None:
             beta=args.beta,
             gamma=args.gamma,
             cost_threshold=args.max_cost_per_gain,
+            concurrency=args.concurrency,
         )
     )
 
@@ -14,9 +14,9 @@ import time
 import logging
 import shutil
 import random
-from collections import OrderedDict, deque
+from collections import deque
 from pathlib import Path
-from typing import Any, List, TYPE_CHECKING, cast, Set
+from typing import Any, Iterable, Iterator, List, Sequence, TYPE_CHECKING, cast, Set
 import smtplib
 from email.message import EmailMessage
 
@@ -40,6 +40,8 @@ except ModuleNotFoundError:  # pragma: no cover - optional
 from alpha_factory_v1.core.utils.config import init_config
 from alpha_factory_v1.core.monitoring import metrics
 from alpha_factory_v1.core.capsules import CapsuleFacts, ImpactScorer, load_capsule_facts
+from alpha_factory_v1.core.interface.result_store import ResultStore
+from alpha_factory_v1.core.interface.sim_executor import QueueFull, SimulationExecutor, simulation_job
 from alpha_factory_v1.utils.disclaimer import DISCLAIMER
 
 __all__ = [
@@ -69,7 +71,7 @@ if TYPE_CHECKING:  # pragma: no cover - typing only
     class ForecastTrajectoryPoint(Protocol):
         year: int
         capability: float
-        sectors: List[Any]
+        sectors: Sequence[Any]
 
     ForecastModule = Any
     SectorModule = Any
@@ -96,7 +98,7 @@ try:
     from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
     from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
     from fastapi.middleware.cors import CORSMiddleware
-    from starlette.responses import Response, PlainTextResponse
+    from starlette.responses import Response, PlainTextResponse, StreamingResponse
     from fastapi.staticfiles import StaticFiles
     from contextlib import asynccontextmanager
     from collections.abc import AsyncGenerator
@@ -284,6 +286,9 @@ if app is not None:
         try:
             yield
         finally:
+            for sim_task in list(_sim_tasks.values()):
+                sim_task.cancel()
+            _sim_executor.shutdown()
             task = getattr(app_f.state, "orch_task", None)
             if task:
                 task.cancel()
@@ -295,7 +300,6 @@ if app is not None:
     app_f.router.lifespan_context = lifespan
 
 
-_simulations: OrderedDict[str, ResultsResponse] = OrderedDict()
 _progress_ws: Set[WebSocket] = set()
 _latest_id: str | None = None
 _meme_usage: dict[str, int] = {}
@@ -307,7 +311,9 @@ _results_dir = Path(
 )
 _max_results = int(os.getenv("MAX_RESULTS", "100"))
 _max_sim_tasks = max(1, int(os.getenv("MAX_SIM_TASKS", "4")))
-_sim_semaphore = asyncio.Semaphore(_max_sim_tasks)
+# simulations run on worker processes so the event loop stays responsive
+_sim_executor = SimulationExecutor.from_env(_max_sim_tasks)
+_sim_tasks: dict[str, asyncio.Task[None]] = {}
 _results_dir.mkdir(parents=True, exist_ok=True, mode=0o700)
 
 # Capsule facts for impact scoring
@@ -327,40 +333,34 @@ _pending_votes: TTLCache[str, float] = TTLCache(maxsize=3, ttl=300)
 
 
 def _load_results() -> None:
-    entries: list[tuple[float, ResultsResponse]] = []
-    latest_time = 0.0
-    latest_id: str | None = None
-    for f in _results_dir.glob("*.json"):
-        try:
-            data = json.loads(f.read_text())
-            res = ResultsResponse(**data)
-        except (json.JSONDecodeError, ValueError) as exc:
-            _log.warning("Skipping corrupt results file %s: %s", f, exc)
-            continue
-        mtime = f.stat().st_mtime
-        entries.append((mtime, res))
-        if mtime > latest_time:
-            latest_time = mtime
-            latest_id = res.id
-    _simulations.clear()
-    for _, res in sorted(entries, key=lambda t: t[0]):
-        _simulations[res.id] = res
+    """Import legacy JSON results once, then enforce ``MAX_RESULTS``."""
+
+    if _simulations.get_meta("json_imported") is None:
+        added = _simulations.import_json(
+            _results_dir.glob("*.json"),
+            on_error=lambda f, exc: _log.warning("Skipping corrupt results file %s: %s", f, exc),
+        )
+        _simulations.set_meta("json_imported", str(time.time()))
+        if added:
+            _log.info("Imported %d JSON results into %s", added, _simulations.path)
+    _evict_results()
+    global _latest_id
+    _latest_id = _simulations.latest_id()
+
+
+def _evict_results() -> None:
     while len(_simulations) > _max_results:
         old_id, _ = _simulations.popitem(last=False)
         with contextlib.suppress(FileNotFoundError):
             (_results_dir / f"{old_id}.json").unlink()
-    global _latest_id
-    _latest_id = latest_id
 
 
-def _save_result(result: ResultsResponse) -> None:
+def _save_result(result: ResultsResponse, *, sectors: dict[str, int] | None = None) -> None:
     path = _results_dir / f"{result.id}.json"
     path.write_text(result.model_dump_json())
-    _simulations[result.id] = result
-    while len(_simulations) > _max_results:
-        old_id, _ = _simulations.popitem(last=False)
-        with contextlib.suppress(FileNotFoundError):
-            (_results_dir / f"{old_id}.json").unlink()
+    stats = sectors or {}
+    _simulations.put(result, sectors=stats.get("total"), disrupted=stats.get("disrupted"))
+    _evict_results()
     global _latest_id
     _latest_id = result.id
 
@@ -434,6 +434,7 @@ class SimRequest(BaseModel):
     x0: float | None = None
     seed: int | None = None
     sectors: list[SectorSpec] | None = None
+    priority: int = 0
 
     model_config = ConfigDict(
         json_schema_extra={
@@ -480,10 +481,16 @@ class ResultsResponse(BaseModel):
     population: list[PopulationMember] | None = None
 
 
+# indexed result store; JSON files remain as the published run artefacts
+_results_db = Path(os.getenv("SIM_RESULTS_DB", str(_results_dir.with_name(_results_dir.name + ".sqlite"))))
+_simulations: ResultStore[ResultsResponse] = ResultStore(_results_db, ResultsResponse)
+
+
 class RunsResponse(BaseModel):
     """List of available run identifiers."""
 
     ids: list[str]
+    next: str | None = None
 
 
 class PopulationResponse(BaseModel):
@@ -502,6 +509,21 @@ class LineageNode(BaseModel):
     pass_rate: float
 
 
+def _lineage_json(agents: Iterable[Any]) -> Iterator[bytes]:
+    """Encode archive agents as a JSON array of :class:`LineageNode` chunks."""
+
+    yield b"["
+    for i, a in enumerate(agents):
+        node = LineageNode(
+            id=a.id,
+            parent=a.meta.get("parent"),
+            diff=a.meta.get("diff") or a.meta.get("patch"),
+            pass_rate=a.score,
+        )
+        yield (b"," if i else b"") + node.model_dump_json().encode()
+    yield b"]"
+
+
 class InsightRequest(BaseModel):
     """Payload selecting runs for aggregation."""
 
@@ -566,42 +588,29 @@ async def _background_run(sim_id: str, cfg: SimRequest) -> None:
         None
     """
 
-    if cfg.sectors:
-        secs = [sector.Sector(s.name, s.energy, s.entropy, s.growth) for s in cfg.sectors]
-    else:
-        secs = [sector.Sector(f"s{i:02d}", cfg.energy, cfg.entropy) for i in range(cfg.num_sectors)]
-    traj: list[ForecastTrajectoryPoint] = []
-    for year in range(1, cfg.horizon + 1):
-        t = year / cfg.horizon
-        cap = forecast.capability_growth(t, cfg.curve, k=cfg.k, x0=cfg.x0)
-        for sec in secs:
-            if not sec.disrupted:
-                sec.energy *= 1.0 + sec.growth
-                if forecast.thermodynamic_trigger(sec, cap):
-                    sec.disrupted = True
-                    sec.energy += forecast._innovation_gain(cfg.pop_size, cfg.generations, seed=cfg.seed)
-        snapshot = [sector.Sector(s.name, s.energy, s.entropy, s.growth, s.disrupted) for s in secs]
-        point = forecast.TrajectoryPoint(year, cap, snapshot)
-        traj.append(point)
-        for ws in list(_progress_ws):
-            try:
-                await ws.send_json({"id": sim_id, "year": year, "capability": cap})
-            except (RuntimeError, WebSocketDisconnect) as exc:
-                _log.debug("Dropping progress WebSocket %s: %s", ws, exc)
-                _progress_ws.discard(ws)
-        await asyncio.sleep(0)
-
-    def eval_fn(genome: list[float]) -> tuple[float, float, float]:
-        x, y = genome
-        return x**2, y**2, (x + y) ** 2
-
-    pop = mats.run_evolution(
-        eval_fn,
-        2,
-        population_size=cfg.pop_size,
-        generations=cfg.generations,
-        seed=cfg.seed,
-    )
+    updates: asyncio.Queue[dict[str, Any] | None] = asyncio.Queue()
+
+    async def _forward() -> None:
+        while (update := await updates.get()) is not None:
+            for ws in list(_progress_ws):
+                try:
+                    await ws.send_json({"id": sim_id, **update})
+                except (RuntimeError, WebSocketDisconnect) as exc:
+                    _log.debug("Dropping progress WebSocket %s: %s", ws, exc)
+                    _progress_ws.discard(ws)
+
+    forwarder = asyncio.create_task(_forward())
+    try:
+        out = await _sim_executor.run(
+            simulation_job,
+            cfg.model_dump(exclude={"priority"}),
+            on_progress=updates.put_nowait,
+        )
+    finally:
+        updates.put_nowait(None)
+        await forwarder
+    traj = [ForecastPoint(year=year, capability=cap) for year, cap in out["forecast"]]
+    pop = out["population"]
     metrics.dgm_children_total.inc(len(pop))
 
     # Pick first available capsule facts for impact scoring
@@ -610,21 +619,21 @@ async def _background_run(sim_id: str, cfg: SimRequest) -> None:
 
     pop_data = [
         PopulationMember(
-            effectiveness=ind.fitness[0],
-            risk=ind.fitness[1],
-            complexity=ind.fitness[2],
-            rank=ind.rank,
-            impact=_scorer.score(_facts, ind.fitness[0]),
+            effectiveness=fitness[0],
+            risk=fitness[1],
+            complexity=fitness[2],
+            rank=rank,
+            impact=_scorer.score(_facts, fitness[0]),
         )
-        for ind in pop
+        for fitness, rank in pop
     ]
 
     result = ResultsResponse(
         id=sim_id,
-        forecast=[ForecastPoint(year=p.year, capability=p.capability) for p in traj],
+        forecast=traj,
         population=pop_data,
     )
-    _save_result(result)
+    _save_result(result, sectors=out.get("sectors"))
 
     try:
         from alpha_factory_v1.core.snark import publish_score_proof
@@ -634,14 +643,16 @@ async def _background_run(sim_id: str, cfg: SimRequest) -> None:
         score_a = traj[-1].capability if traj else 0.0
         score_b = pop_data[0].effectiveness if pop_data else 0.0
         db = ArchiveDB(Path(os.getenv("ARCHIVE_DB", "archive.db")))
-        publish_score_proof(_results_dir / f"{sim_id}.json", sim_id, [score_a, score_b], threshold, db)
+        await asyncio.to_thread(
+            publish_score_proof, _results_dir / f"{sim_id}.json", sim_id, [score_a, score_b], threshold, db
+        )
     except Exception as exc:  # pragma: no cover - best effort
         _log.debug("Proof generation failed: %s", exc)
 
 
 async def _bounded_run(sim_id: str, cfg: SimRequest) -> None:
-    """Run a simulation with concurrency limits enforced."""
-    async with _sim_semaphore:
+    """Run a simulation with concurrency limits and priority enforced."""
+    async with _sim_executor.slot(cfg.priority):
         await _background_run(sim_id, cfg)
 
 
@@ -654,8 +665,15 @@ if app is not None:
         start = time.perf_counter()
         status = "200"
         try:
+            try:
+                _sim_executor.check_capacity()
+            except QueueFull as exc:
+                status = "429"
+                raise HTTPException(status_code=429, detail=str(exc)) from exc
             sim_id = secrets.token_hex(8)
-            asyncio.create_task(_bounded_run(sim_id, req))
+            task = asyncio.create_task(_bounded_run(sim_id, req))
+            _sim_tasks[sim_id] = task
+            task.add_done_callback(lambda _t, i=sim_id: _sim_tasks.pop(i, None))
             return SimStartResponse(id=sim_id)
         except HTTPException as exc:
             status = str(exc.status_code)
@@ -664,6 +682,19 @@ if app is not None:
             REQ_COUNT.labels("POST", "/simulate", status).inc()
             REQ_LAT.labels("POST", "/simulate").observe(time.perf_counter() - start)
 
+    @app.delete("/simulate/{sim_id}")
+    async def cancel_simulation(sim_id: str, _: None = Depends(verify_token)) -> Any:
+        """Cancel a queued or running simulation."""
+
+        try:
+            task = _sim_tasks.get(sim_id)
+            if task is None:
+                raise HTTPException(status_code=404)
+            task.cancel()
+            return {"id": sim_id, "status": "cancelled"}
+        except HTTPException as exc:
+            return problem_response(exc)
+
     @app.get("/results/{sim_id}", response_model=ResultsResponse)
     async def get_results(sim_id: str, _: None = Depends(verify_token)) -> Any:
         """Return final forecast data for ``sim_id`` if available."""
@@ -725,9 +756,18 @@ if app is not None:
             REQ_LAT.labels("GET", "/population/{sim_id}").observe(time.perf_counter() - start)
 
     @app.get("/runs", response_model=RunsResponse)
-    async def list_runs(_: None = Depends(verify_token)) -> RunsResponse:
-        """Return identifiers for all stored runs."""
-        return RunsResponse(ids=list(_simulations.keys()))
+    async def list_runs(
+        limit: int | None = None, after: str | None = None, _: None = Depends(verify_token)
+    ) -> RunsResponse:
+        """Return stored run identifiers, oldest first.
+
+        With ``limit`` the response holds one page and ``next`` is the cursor
+        to pass as ``after`` for the following page.
+        """
+        if limit is None and after is None:
+            return RunsResponse(ids=list(_simulations.keys()))
+        ids, nxt = _simulations.page(max(1, min(limit or 100, 1000)), after)
+        return RunsResponse(ids=ids, next=nxt)
 
     @app.get("/memes")
     async def meme_usage(_: None = Depends(verify_token)) -> dict[str, int]:
@@ -735,44 +775,29 @@ if app is not None:
         return _meme_usage
 
     @app.get("/lineage", response_model=list[LineageNode])
-    async def lineage(_: None = Depends(verify_token)) -> list[LineageNode]:
-        """Return archive lineage information."""
-        path = Path(os.getenv("ARCHIVE_PATH", "archive.db"))
-        arch = Archive(path)
-        nodes: list[LineageNode] = []
-        for a in arch.all():
-            nodes.append(
-                LineageNode(
-                    id=a.id,
-                    parent=a.meta.get("parent"),
-                    diff=a.meta.get("diff") or a.meta.get("patch"),
-                    pass_rate=a.score,
-                )
-            )
-        return nodes
+    async def lineage(_: None = Depends(verify_token)) -> Response:
+        """Stream archive lineage information."""
+        arch = Archive(Path(os.getenv("ARCHIVE_PATH", "archive.db")))
+        return StreamingResponse(_lineage_json(arch.iter_all()), media_type="application/json")
 
     @app.get("/lineage/{node_id}", response_model=list[LineageNode])
-    async def lineage_subtree(node_id: int, _: None = Depends(verify_token)) -> list[LineageNode]:
-        """Return lineage up to ``node_id``."""
-        path = Path(os.getenv("ARCHIVE_PATH", "archive.db"))
-        arch = Archive(path)
-        nodes: list[LineageNode] = []
-        found = False
-        for a in arch.all():
-            nodes.append(
-                LineageNode(
-                    id=a.id,
-                    parent=a.meta.get("parent"),
-                    diff=a.meta.get("diff") or a.meta.get("patch"),
-                    pass_rate=a.score,
-                )
-            )
-            if a.id == node_id:
-                found = True
-                break
-        if not found:
+    async def lineage_subtree(
+        node_id: int,
+        depth: int | None = None,
+        subtree: bool = False,
+        _: None = Depends(verify_token),
+    ) -> Response:
+        """Return the ancestry of ``node_id``, root first.
+
+        With ``subtree`` the descendants of ``node_id`` are returned instead.
+        ``depth`` limits how many generations are walked.
+        """
+        arch = Archive(Path(os.getenv("ARCHIVE_PATH", "archive.db")))
+        walk = arch.subtree if subtree else arch.lineage
+        nodes = await asyncio.to_thread(walk, node_id, max_depth=depth)
+        if not nodes:
             raise HTTPException(status_code=404)
-        return nodes
+        return StreamingResponse(_lineage_json(nodes), media_type="application/json")
 
     @app.get("/status", response_model=StatusResponse)
     async def status(_: None = Depends(verify_token)) -> StatusResponse:
@@ -878,17 +903,10 @@ if app is not None:
         """Return aggregated forecast data across runs."""
 
         try:
-            ids = req.ids or list(_simulations.keys())
-            forecasts = [_simulations[i].forecast for i in ids if i in _simulations]
-            if not forecasts:
+            means = _simulations.year_means(req.ids or None)
+            if means is None:
                 raise HTTPException(status_code=404)
-
-            year_map: dict[int, list[float]] = {}
-            for fc in forecasts:
-                for point in fc:
-                    year_map.setdefault(point.year, []).append(point.capability)
-            agg = [InsightPoint(year=year, capability=sum(vals) / len(vals)) for year, vals in sorted(year_map.items())]
-            return InsightResponse(forecast=agg)
+            return InsightResponse(forecast=[InsightPoint(year=year, capability=cap) for year, cap in means])
         except HTTPException as exc:
             return problem_response(exc)
 
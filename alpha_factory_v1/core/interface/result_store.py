@@ -0,0 +1,283 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Indexed SQLite store for API simulation results.
+
+Each run is one row in ``runs`` holding the serialised result plus summary
+columns (timestamps, sector stats and a Pareto-front digest) for cheap
+listing. Forecast points are normalised into ``forecast_points`` so
+``/insight`` can aggregate a subset of runs with one indexed query, and
+``year_totals`` keeps running sums per year so the all-runs aggregate never
+touches individual results.
+
+:class:`ResultStore` behaves like an ordered mapping of run id to result
+model, oldest first, so callers written against the previous in-memory
+``OrderedDict`` keep working.
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import time
+from collections import OrderedDict
+from collections.abc import MutableMapping
+from pathlib import Path
+from typing import Any, Generic, Iterable, Iterator, Sequence, Type, TypeVar
+
+from alpha_factory_v1.core.archive.sqlite_pool import get_pool
+
+__all__ = ["ResultStore"]
+
+M = TypeVar("M")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs(
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    id TEXT UNIQUE NOT NULL,
+    created REAL NOT NULL,
+    horizon INTEGER NOT NULL,
+    final_capability REAL,
+    sectors INTEGER,
+    disrupted INTEGER,
+    pop_size INTEGER NOT NULL,
+    front_size INTEGER NOT NULL,
+    best_effectiveness REAL,
+    min_risk REAL,
+    mean_impact REAL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_runs_created ON runs(created);
+CREATE TABLE IF NOT EXISTS forecast_points(
+    run_id TEXT NOT NULL,
+    year INTEGER NOT NULL,
+    capability REAL NOT NULL,
+    PRIMARY KEY(run_id, year)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS year_totals(
+    year INTEGER PRIMARY KEY,
+    total REAL NOT NULL,
+    n INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS store_meta(key TEXT PRIMARY KEY, value TEXT NOT NULL);
+"""
+
+
+class ResultStore(MutableMapping[str, M], Generic[M]):
+    """Ordered, persistent mapping of run id to a pydantic result model.
+
+    Args:
+        path: SQLite database file.
+        model: Pydantic model class used to (de)serialise results. It must
+            expose ``id``, ``forecast`` (``year``/``capability`` items) and an
+            optional ``population`` of Pareto members.
+        cache_size: Number of parsed results kept in memory.
+    """
+
+    def __init__(self, path: str | Path, model: Type[M], *, cache_size: int = 256) -> None:
+        self.path = Path(path)
+        self.model = model
+        self.cache_size = cache_size
+        self._cache: OrderedDict[str, M] = OrderedDict()
+        self._pool = get_pool(self.path)
+        with self._pool.connection() as cx:
+            cx.executescript(_SCHEMA)
+
+    # ------------------------------------------------------------ writes
+    def put(
+        self,
+        result: M,
+        *,
+        created: float | None = None,
+        sectors: int | None = None,
+        disrupted: int | None = None,
+    ) -> None:
+        """Insert or replace ``result`` and update the running aggregates."""
+
+        res: Any = result
+        points = [(res.id, p.year, p.capability) for p in res.forecast]
+        pop = list(res.population or [])
+        front = [m for m in pop if m.rank == 0] or pop
+        impacts = [m.impact for m in pop if m.impact is not None]
+        row = (
+            res.id,
+            time.time() if created is None else created,
+            len(points),
+            points[-1][2] if points else None,
+            sectors,
+            disrupted,
+            len(pop),
+            len(front),
+            max((m.effectiveness for m in front), default=None),
+            min((m.risk for m in front), default=None),
+            sum(impacts) / len(impacts) if impacts else None,
+            res.model_dump_json(),
+        )
+        with self._pool.transaction() as cx:
+            self._remove(cx, res.id)
+            cx.execute(
+                "INSERT INTO runs(id, created, horizon, final_capability, sectors, disrupted, pop_size, "
+                "front_size, best_effectiveness, min_risk, mean_impact, data) VALUES(?,?,?,?,?,?,?,?,?,?,?,?)",
+                row,
+            )
+            cx.executemany("INSERT INTO forecast_points VALUES(?,?,?)", points)
+            cx.executemany(
+                "INSERT INTO year_totals(year, total, n) VALUES(?,?,1) "
+                "ON CONFLICT(year) DO UPDATE SET total = total + excluded.total, n = n + 1",
+                [(year, cap) for _, year, cap in points],
+            )
+        self._remember(res.id, result)
+
+    @staticmethod
+    def _remove(cx: sqlite3.Connection, run_id: str) -> bool:
+        points = cx.execute("SELECT year, capability FROM forecast_points WHERE run_id=?", (run_id,)).fetchall()
+        cx.executemany("UPDATE year_totals SET total = total - ?, n = n - 1 WHERE year=?", [(c, y) for y, c in points])
+        cx.execute("DELETE FROM year_totals WHERE n <= 0")
+        cx.execute("DELETE FROM forecast_points WHERE run_id=?", (run_id,))
+        return cx.execute("DELETE FROM runs WHERE id=?", (run_id,)).rowcount > 0
+
+    def _remember(self, run_id: str, result: M) -> None:
+        self._cache[run_id] = result
+        self._cache.move_to_end(run_id)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    # --------------------------------------------------- mapping protocol
+    def __getitem__(self, run_id: str) -> M:
+        cached = self._cache.get(run_id)
+        if cached is not None:
+            self._cache.move_to_end(run_id)
+            return cached
+        with self._pool.connection() as cx:
+            row = cx.execute("SELECT data FROM runs WHERE id=?", (run_id,)).fetchone()
+        if row is None:
+            raise KeyError(run_id)
+        result: M = self.model.model_validate_json(row[0])  # type: ignore[attr-defined]
+        self._remember(run_id, result)
+        return result
+
+    def __setitem__(self, run_id: str, result: M) -> None:
+        if getattr(result, "id", run_id) != run_id:
+            raise ValueError("result id does not match key")
+        self.put(result)
+
+    def __delitem__(self, run_id: str) -> None:
+        with self._pool.transaction() as cx:
+            found = self._remove(cx, run_id)
+        self._cache.pop(run_id, None)
+        if not found:
+            raise KeyError(run_id)
+
+    def __contains__(self, run_id: object) -> bool:
+        if run_id in self._cache:
+            return True
+        with self._pool.connection() as cx:
+            return cx.execute("SELECT 1 FROM runs WHERE id=?", (run_id,)).fetchone() is not None
+
+    def __iter__(self) -> Iterator[str]:
+        with self._pool.connection() as cx:
+            ids = [r[0] for r in cx.execute("SELECT id FROM runs ORDER BY seq")]
+        return iter(ids)
+
+    def __len__(self) -> int:
+        with self._pool.connection() as cx:
+            return int(cx.execute("SELECT COUNT(*) FROM runs").fetchone()[0])
+
+    def popitem(self, last: bool = True) -> tuple[str, M]:
+        """Remove and return the newest (or oldest) run, like ``OrderedDict``."""
+
+        order = "DESC" if last else "ASC"
+        with self._pool.connection() as cx:
+            row = cx.execute(f"SELECT id FROM runs ORDER BY seq {order} LIMIT 1").fetchone()
+        if row is None:
+            raise KeyError("store is empty")
+        result = self[row[0]]
+        del self[row[0]]
+        return row[0], result
+
+    def clear(self) -> None:
+        with self._pool.transaction() as cx:
+            cx.execute("DELETE FROM runs")
+            cx.execute("DELETE FROM forecast_points")
+            cx.execute("DELETE FROM year_totals")
+        self._cache.clear()
+
+    # ------------------------------------------------------------ queries
+    def latest_id(self) -> str | None:
+        with self._pool.connection() as cx:
+            row = cx.execute("SELECT id FROM runs ORDER BY created DESC, seq DESC LIMIT 1").fetchone()
+        return row[0] if row else None
+
+    def page(self, limit: int, after: str | None = None) -> tuple[list[str], str | None]:
+        """Return up to ``limit`` run ids following ``after`` and the next cursor."""
+
+        with self._pool.connection() as cx:
+            start = 0
+            if after is not None:
+                row = cx.execute("SELECT seq FROM runs WHERE id=?", (after,)).fetchone()
+                start = row[0] if row else 0
+            ids = [r[0] for r in cx.execute("SELECT id FROM runs WHERE seq > ? ORDER BY seq LIMIT ?", (start, limit))]
+        return ids, ids[-1] if len(ids) == limit else None
+
+    def summaries(self, limit: int = 100, after: str | None = None) -> list[dict[str, Any]]:
+        """Return the summary columns of a page of runs without parsing results."""
+
+        ids, _ = self.page(limit, after)
+        if not ids:
+            return []
+        marks = ",".join("?" * len(ids))
+        with self._pool.connection() as cx:
+            cur = cx.execute(f"SELECT * FROM runs WHERE id IN ({marks}) ORDER BY seq", ids)
+            cols = [d[0] for d in cur.description]
+            return [{k: v for k, v in zip(cols, row) if k != "data"} for row in cur]
+
+    def year_means(self, ids: Sequence[str] | None = None) -> list[tuple[int, float]] | None:
+        """Return mean capability per year over ``ids`` (all runs when ``None``).
+
+        Returns ``None`` when none of ``ids`` exist, or the store is empty.
+        """
+
+        with self._pool.connection() as cx:
+            if ids is None:
+                if cx.execute("SELECT 1 FROM runs LIMIT 1").fetchone() is None:
+                    return None
+                rows = cx.execute("SELECT year, total / n FROM year_totals WHERE n > 0 ORDER BY year").fetchall()
+                return [(int(y), float(v)) for y, v in rows]
+            ids = list(dict.fromkeys(ids))
+            marks = ",".join("?" * len(ids))
+            if cx.execute(f"SELECT 1 FROM runs WHERE id IN ({marks}) LIMIT 1", ids).fetchone() is None:
+                return None
+            rows = cx.execute(
+                f"SELECT year, AVG(capability) FROM forecast_points WHERE run_id IN ({marks}) GROUP BY year ORDER BY year",
+                ids,
+            ).fetchall()
+        return [(int(y), float(v)) for y, v in rows]
+
+    # ---------------------------------------------------------- migration
+    def import_json(self, files: Iterable[Path], *, on_error: Any = None) -> int:
+        """Import legacy per-run JSON files not yet in the store.
+
+        Files are imported in modification-time order so that the oldest run
+        stays first. Returns the number of runs added.
+        """
+
+        added = 0
+        for mtime, f in sorted((f.stat().st_mtime, f) for f in files):
+            try:
+                result = self.model.model_validate_json(f.read_text())  # type: ignore[attr-defined]
+            except (json.JSONDecodeError, ValueError) as exc:
+                if on_error is not None:
+                    on_error(f, exc)
+                continue
+            if result.id in self:
+                continue
+            self.put(result, created=mtime)
+            added += 1
+        return added
+
+    def get_meta(self, key: str) -> str | None:
+        with self._pool.connection() as cx:
+            row = cx.execute("SELECT value FROM store_meta WHERE key=?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def set_meta(self, key: str, value: str) -> None:
+        with self._pool.transaction() as cx:
+            cx.execute("INSERT OR REPLACE INTO store_meta VALUES(?,?)", (key, value))
@@ -0,0 +1,358 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Process-based simulation executor for the API server.
+
+Simulations are CPU bound, so running them on the event loop stalls every
+other request and the progress WebSocket. :class:`SimulationExecutor` keeps a
+small set of long-lived worker processes instead:
+
+* ``slot(priority)`` admits jobs in priority order (lower runs first) with a
+  bounded wait queue; :class:`QueueFull` signals that the queue is saturated.
+* ``run(fn, kwargs)`` executes ``fn`` in an idle worker. ``fn`` receives a
+  ``progress`` callback whose payloads travel back over the worker's own
+  pipe and are delivered to ``on_progress`` on the event loop. Each worker
+  has a private channel so terminating one never leaves a shared lock held.
+* Cancelling the awaiting task terminates the worker running the job, which is
+  replaced on the next run. ``timeout`` does the same after a deadline and
+  ``memory_mb`` caps each worker's address space.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import heapq
+import itertools
+import logging
+import multiprocessing as mp
+import os
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Callable, Dict, List
+
+try:  # POSIX only
+    import resource
+except ImportError:  # pragma: no cover - Windows
+    resource = None  # type: ignore[assignment]
+
+__all__ = ["QueueFull", "SimulationExecutor", "simulation_job"]
+
+_log = logging.getLogger(__name__)
+
+Progress = Callable[[Dict[str, Any]], None]
+
+
+class QueueFull(RuntimeError):
+    """Raised when more jobs are waiting than the executor accepts."""
+
+
+def _worker_main(conn: Any, memory_mb: int | None) -> None:
+    if memory_mb and resource is not None:
+        limit = memory_mb * 1024 * 1024
+        with contextlib.suppress(ValueError, OSError):
+            resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+    while True:
+        try:
+            job = conn.recv()
+        except EOFError:
+            return
+        if job is None:
+            return
+        job_id, fn, kwargs = job
+        try:
+            result = fn(progress=lambda payload, _id=job_id: conn.send(("progress", _id, payload)), **kwargs)
+        except BaseException as exc:  # noqa: BLE001 - reported to the parent
+            conn.send(("error", job_id, f"{type(exc).__name__}: {exc}"))
+        else:
+            conn.send(("done", job_id, result))
+
+
+@dataclass
+class _Worker:
+    proc: Any
+    conn: Any
+    job: int | None = None
+
+
+@dataclass
+class _Job:
+    future: asyncio.Future[Any]
+    on_progress: Progress | None
+    worker: _Worker | None = None
+
+
+@dataclass(order=True)
+class _Waiter:
+    priority: int
+    seq: int
+    future: asyncio.Future[None] = field(compare=False)
+
+
+class SimulationExecutor:
+    """Run simulation jobs on worker processes without blocking the loop.
+
+    Args:
+        workers: Number of worker processes and concurrently running jobs.
+        max_pending: Jobs allowed to wait for a slot before :class:`QueueFull`.
+        timeout: Default wall-clock limit per job in seconds.
+        memory_mb: Address-space limit applied to each worker process.
+    """
+
+    def __init__(
+        self,
+        workers: int = 4,
+        *,
+        max_pending: int = 64,
+        timeout: float | None = None,
+        memory_mb: int | None = None,
+    ) -> None:
+        self.workers = max(1, workers)
+        self.max_pending = max_pending
+        self.timeout = timeout
+        self.memory_mb = memory_mb
+        self.loop: asyncio.AbstractEventLoop | None = None
+        self._ctx = mp.get_context("spawn")
+        self._pool: List[_Worker] = []
+        self._jobs: Dict[int, _Job] = {}
+        self._ids = itertools.count()
+        self._running = 0
+        self._waiters: List[_Waiter] = []
+        self._worker_waiters: List[asyncio.Future[None]] = []
+
+    # ------------------------------------------------------------- admission
+    @property
+    def pending(self) -> int:
+        return sum(1 for w in self._waiters if not w.future.done())
+
+    @property
+    def running(self) -> int:
+        return self._running
+
+    def check_capacity(self) -> None:
+        """Raise :class:`QueueFull` when a new job would exceed the queue bound."""
+
+        if self._running >= self.workers and self.pending >= self.max_pending:
+            raise QueueFull(f"{self.pending} simulations already queued")
+
+    @contextlib.asynccontextmanager
+    async def slot(self, priority: int = 0) -> AsyncIterator[None]:
+        """Hold one of ``workers`` run slots, waiting in priority order."""
+
+        if self._running >= self.workers or self.pending:
+            self.check_capacity()
+            fut: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+            heapq.heappush(self._waiters, _Waiter(priority, next(self._ids), fut))
+            try:
+                await fut
+            except asyncio.CancelledError:
+                if fut.done() and not fut.cancelled():
+                    self._release()  # slot was handed over just before cancel
+                raise
+        else:
+            self._running += 1
+        try:
+            yield
+        finally:
+            self._release()
+
+    def _release(self) -> None:
+        while self._waiters:
+            waiter = heapq.heappop(self._waiters)
+            if not waiter.future.done():
+                waiter.future.set_result(None)  # hand the slot over
+                return
+        self._running -= 1
+
+    # ------------------------------------------------------------- processes
+    def _start(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self.loop is loop:
+            return
+        if self.loop is not None:
+            self.shutdown()
+        self.loop = loop
+
+    def _spawn(self) -> _Worker:
+        assert self.loop is not None
+        parent, child = self._ctx.Pipe()
+        proc = self._ctx.Process(target=_worker_main, args=(child, self.memory_mb), daemon=True)
+        proc.start()
+        child.close()
+        worker = _Worker(proc, parent)
+        self._pool.append(worker)
+        self.loop.add_reader(parent.fileno(), self._read, worker)
+        return worker
+
+    def _kill(self, worker: _Worker) -> None:
+        with contextlib.suppress(ValueError):
+            self._pool.remove(worker)
+        self._unwatch(worker)
+        worker.proc.terminate()
+        worker.proc.join(1)
+        worker.conn.close()
+
+    def _unwatch(self, worker: _Worker) -> None:
+        if self.loop is not None and not worker.conn.closed:
+            with contextlib.suppress(RuntimeError, ValueError, OSError):  # loop already closed
+                self.loop.remove_reader(worker.conn.fileno())
+
+    def _read(self, worker: _Worker) -> None:
+        try:
+            msg = worker.conn.recv()
+        except (EOFError, OSError):
+            # worker died; fail its job now instead of at the next liveness poll
+            self._unwatch(worker)
+            job = self._jobs.get(worker.job) if worker.job is not None else None
+            if job is not None and not job.future.done():
+                job.future.set_exception(RuntimeError("simulation worker exited unexpectedly"))
+            return
+        self._dispatch(msg)
+
+    def _dispatch(self, msg: tuple[str, int, Any]) -> None:
+        kind, job_id, payload = msg
+        job = self._jobs.get(job_id)
+        if job is None:
+            return
+        if kind == "progress":
+            if job.on_progress is not None:
+                try:
+                    job.on_progress(payload)
+                except Exception as exc:  # noqa: BLE001 - never break the job
+                    _log.debug("progress callback failed: %s", exc)
+            return
+        self._finish(job_id)
+        if job.future.done():
+            return
+        if kind == "done":
+            job.future.set_result(payload)
+        else:
+            job.future.set_exception(RuntimeError(payload))
+
+    def _finish(self, job_id: int) -> None:
+        job = self._jobs.pop(job_id, None)
+        if job is not None and job.worker is not None:
+            job.worker.job = None
+        self._wake_one()
+
+    def _wake_one(self) -> None:
+        while self._worker_waiters:
+            fut = self._worker_waiters.pop(0)
+            if not fut.done():
+                fut.set_result(None)
+                return
+
+    async def _acquire_worker(self) -> _Worker:
+        while True:
+            self._pool = [w for w in self._pool if w.proc.is_alive() or w.job is not None]
+            for worker in self._pool:
+                if worker.job is None:
+                    return worker
+            if len(self._pool) < self.workers:
+                return self._spawn()
+            fut: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+            self._worker_waiters.append(fut)
+            await fut
+
+    async def run(
+        self,
+        fn: Callable[..., Any],
+        kwargs: Dict[str, Any] | None = None,
+        *,
+        on_progress: Progress | None = None,
+        timeout: float | None = None,
+    ) -> Any:
+        """Execute ``fn(progress=..., **kwargs)`` in a worker and return its result.
+
+        ``fn`` and its arguments must be picklable; raises ``TimeoutError``
+        when the job exceeds ``timeout`` and ``RuntimeError`` when it fails.
+        """
+
+        self._start()
+        worker = await self._acquire_worker()
+        job_id = next(self._ids)
+        fut: asyncio.Future[Any] = asyncio.get_running_loop().create_future()
+        self._jobs[job_id] = _Job(fut, on_progress, worker)
+        worker.job = job_id
+        worker.conn.send((job_id, fn, kwargs or {}))
+        limit = timeout if timeout is not None else self.timeout
+        try:
+            async with asyncio.timeout(limit):
+                while True:
+                    done, _ = await asyncio.wait({fut}, timeout=1.0)
+                    if done:
+                        return fut.result()
+                    if not worker.proc.is_alive():
+                        raise RuntimeError(f"simulation worker exited with code {worker.proc.exitcode}")
+        except BaseException:
+            if job_id in self._jobs:
+                # cancelled, timed out or crashed: the worker may still be busy
+                self._jobs.pop(job_id)
+                self._kill(worker)
+                self._wake_one()
+            raise
+
+    def shutdown(self) -> None:
+        """Stop all workers and the progress reader."""
+
+        for worker in list(self._pool):
+            with contextlib.suppress(OSError, ValueError):
+                worker.conn.send(None)
+            self._kill(worker)
+        self._pool.clear()
+        for job in self._jobs.values():
+            if not job.future.done() and not job.future.get_loop().is_closed():
+                job.future.cancel()
+        self._jobs.clear()
+        self.loop = None
+
+    @classmethod
+    def from_env(cls, workers: int) -> "SimulationExecutor":
+        """Build an executor configured by the ``SIM_*`` environment variables."""
+
+        timeout = float(os.getenv("SIM_JOB_TIMEOUT", "0")) or None
+        memory = int(os.getenv("SIM_JOB_MEMORY_MB", "0")) or None
+        return cls(workers, max_pending=int(os.getenv("SIM_QUEUE_SIZE", "64")), timeout=timeout, memory_mb=memory)
+
+
+def _eval_genome(genome: List[float]) -> tuple[float, float, float]:
+    x, y = genome
+    return x**2, y**2, (x + y) ** 2
+
+
+def simulation_job(progress: Progress, **params: Any) -> Dict[str, Any]:
+    """Run the forecast and MATS evolution for one ``/simulate`` request.
+
+    ``params`` mirrors :class:`~alpha_factory_v1.core.interface.api_server.SimRequest`.
+    Each forecast year is reported through ``progress`` as it is computed.
+    """
+
+    from alpha_factory_v1.core.simulation import forecast, mats, sector
+
+    if params.get("sectors"):
+        secs = [sector.Sector(s["name"], s["energy"], s["entropy"], s["growth"]) for s in params["sectors"]]
+    else:
+        secs = [sector.Sector(f"s{i:02d}", params["energy"], params["entropy"]) for i in range(params["num_sectors"])]
+    engine = forecast.ForecastEngine(
+        secs,
+        params["horizon"],
+        params["curve"],
+        k=params.get("k"),
+        x0=params.get("x0"),
+        pop_size=params["pop_size"],
+        generations=params["generations"],
+        seed=params.get("seed"),
+    )
+    traj = []
+    for point in engine:
+        traj.append((point.year, point.capability))
+        progress({"year": point.year, "capability": point.capability})
+    pop = mats.run_evolution(
+        _eval_genome,
+        2,
+        population_size=params["pop_size"],
+        generations=params["generations"],
+        seed=params.get("seed"),
+    )
+    return {
+        "forecast": traj,
+        "population": [(tuple(ind.fitness), ind.rank) for ind in pop],
+        "sectors": {"total": len(secs), "disrupted": sum(1 for s in secs if s.disrupted)},
+    }
@@ -135,6 +135,8 @@ class Orchestrator(BaseOrchestrator):
             wallet=self.settings.solana_wallet,
             broadcast=self.settings.broadcast,
             db=self.settings.db_type,
+            group_commit=self.settings.ledger_group_commit,
+            durability=self.settings.ledger_durability,
         )
         archive = ArchiveService(
             os.getenv("ARCHIVE_PATH", "archive.db"),
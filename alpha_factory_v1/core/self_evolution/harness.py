@@ -4,20 +4,26 @@
 from __future__ import annotations
 
 import hashlib
+import logging
 import os
+import shlex
 import shutil
 import subprocess
 import tempfile
 from pathlib import Path
-from typing import Tuple
+from typing import Optional, Sequence, Tuple
 
 from alpha_factory_v1.core.eval.preflight import run_preflight
 from alpha_factory_v1.core.governance.stake_registry import StakeRegistry
+from alpha_factory_v1.core.self_evolution.impact_map import ImpactMap, changed_files
 from alpha_factory_v1.demos.self_healing_repo import patcher_core
 
 IMAGE = os.getenv("SELF_EVOLUTION_IMAGE", "python:3.11-slim")
 
+_LOG = logging.getLogger(__name__)
+
 __all__ = [
+    "ImpactMap",
     "apply_patch",
     "vote_and_merge",
     "patcher_core",
@@ -26,11 +32,12 @@ __all__ = [
 ]
 
 
-def _run_tests(repo: Path) -> int:
+def _run_tests(repo: Path, tests: Optional[Sequence[str]] = None) -> int:
     """Run the repository's test suite in a Docker container.
 
     Args:
         repo: Path to the repository to test.
+        tests: Optional pytest node ids or paths to run instead of the full suite.
 
     Returns:
         The pytest return code.
@@ -45,6 +52,7 @@ def _run_tests(repo: Path) -> int:
     wheelhouse = os.getenv("WHEELHOUSE")
     if wheelhouse:
         cmd.extend(["-e", f"WHEELHOUSE={wheelhouse}", "-v", f"{wheelhouse}:{wheelhouse}"])
+    pytest_cmd = "pytest -q" + "".join(" " + shlex.quote(t) for t in tests or ())
     cmd.extend(
         [
             "-w",
@@ -52,19 +60,31 @@ def _run_tests(repo: Path) -> int:
             IMAGE,
             "bash",
             "-c",
-            'python check_env.py --auto-install${WHEELHOUSE:+ --wheelhouse "$WHEELHOUSE"} && pytest -q',
+            'python check_env.py --auto-install${WHEELHOUSE:+ --wheelhouse "$WHEELHOUSE"} && ' + pytest_cmd,
         ]
     )
     proc = subprocess.run(cmd, capture_output=True, text=True)
     return proc.returncode
 
 
-def apply_patch(repo: str | Path, diff: str) -> Tuple[bool, Path]:
+def apply_patch(
+    repo: str | Path,
+    diff: str,
+    *,
+    impact: ImpactMap | None = None,
+    full: bool = True,
+) -> Tuple[bool, Path]:
     """Apply `diff` to `repo` in isolation and run the tests.
 
+    With an ``impact`` map the tests affected by the patch run first and a
+    failure rejects the candidate without touching the rest of the suite.
+    Screening loops pass ``full=False`` and rerun finalists with the default.
+
     Args:
         repo: Repository path to patch.
         diff: Unified diff to apply.
+        impact: Optional test-impact map built for ``repo``.
+        full: Run the full suite after the affected tests pass.
 
     Returns:
         Tuple containing the test result and sandbox path.
@@ -74,11 +94,24 @@ def apply_patch(repo: str | Path, diff: str) -> Tuple[bool, Path]:
     shutil.copytree(src, tmp, dirs_exist_ok=True)
     patcher_core.apply_patch(diff, repo_path=str(tmp))
     run_preflight(tmp)
+    selected = impact.select(changed_files(diff)) if impact is not None else None
+    if selected is not None:
+        if selected and _run_tests(tmp, selected) != 0:
+            return False, tmp
+        if not full:
+            return True, tmp
     rc = _run_tests(tmp)
     return rc == 0, tmp
 
 
-def vote_and_merge(repo: str | Path, diff: str, registry: StakeRegistry, agent_id: str = "orch") -> bool:
+def vote_and_merge(
+    repo: str | Path,
+    diff: str,
+    registry: StakeRegistry,
+    agent_id: str = "orch",
+    *,
+    impact: ImpactMap | None = None,
+) -> bool:
     """Apply patch and merge into `repo` when tests pass and the metric improves.
 
     Args:
@@ -86,6 +119,7 @@ def vote_and_merge(repo: str | Path, diff: str, registry: StakeRegistry, agent_i
         diff: Unified diff to apply.
         registry: Vote registry used for consensus.
         agent_id: Identifier for the voting agent.
+        impact: Optional test-impact map; refreshed after a merge.
 
     Returns:
         ``True`` if the patch was merged into the repository.
@@ -93,7 +127,7 @@ def vote_and_merge(repo: str | Path, diff: str, registry: StakeRegistry, agent_i
     repo_path = Path(repo).resolve()
     proposal = hashlib.sha1(diff.encode()).hexdigest()
     baseline = float((repo_path / "metric.txt").read_text().strip())
-    ok, patched = apply_patch(repo_path, diff)
+    ok, patched = apply_patch(repo_path, diff, impact=impact)
     if not ok:
         registry.vote(proposal, agent_id, False)
         shutil.rmtree(patched)
@@ -113,5 +147,10 @@ def vote_and_merge(repo: str | Path, diff: str, registry: StakeRegistry, agent_i
                 dest.parent.mkdir(parents=True, exist_ok=True)
                 shutil.copy2(src_file, dest)
         registry.archive_accept(agent_id)
+        if impact is not None:
+            try:
+                impact.refresh(repo_path)
+            except Exception as exc:  # noqa: BLE001 - a stale map only costs precision
+                _LOG.warning("test-impact refresh failed: %s", exc)
     shutil.rmtree(patched)
     return accepted
@@ -0,0 +1,202 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Coverage-derived map from source files to the tests that execute them.
+
+:meth:`ImpactMap.refresh` runs pytest under :mod:`coverage` with one dynamic
+context per test and stores ``file -> tests`` edges in SQLite. Later refreshes
+hash every Python file and rerun only the tests touching files whose digest
+changed, plus any new or edited test modules.
+
+:meth:`ImpactMap.select` answers which tests a patch can affect. It returns
+``None`` whenever the map cannot vouch for a change (non-Python files,
+``conftest.py``, unknown modules or modules no test executes) so callers fall
+back to the full suite.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Set
+
+try:
+    import coverage
+except ModuleNotFoundError:  # pragma: no cover - optional
+    coverage = None
+
+__all__ = ["ImpactMap", "changed_files"]
+
+_OUT_ENV = "AF_IMPACT_OUT"
+_PKG_ROOT = Path(__file__).resolve().parents[3]
+_SKIP_DIRS = {"__pycache__", "node_modules", "site-packages"}
+_TEST_FILE = re.compile(r"(^|/)(test_[^/]*|[^/]*_test)\.py$")
+_DIFF_PATH = re.compile(r"^(?:---|\+\+\+) (?:[ab]/)?(\S+)")
+
+
+def changed_files(diff: str) -> List[str]:
+    """Return the repository paths touched by the unified ``diff``."""
+    paths: Set[str] = set()
+    for line in diff.splitlines():
+        m = _DIFF_PATH.match(line)
+        if m and m.group(1) != "/dev/null":
+            paths.add(m.group(1))
+    return sorted(paths)
+
+
+def _is_test_file(path: str) -> bool:
+    return bool(_TEST_FILE.search(path))
+
+
+def _sources(root: Path) -> Iterator[Path]:
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames if not d.startswith(".") and d not in _SKIP_DIRS]
+        for name in filenames:
+            if name.endswith(".py"):
+                yield Path(dirpath, name)
+
+
+def _digest(path: Path) -> str:
+    return hashlib.blake2b(path.read_bytes(), digest_size=16).hexdigest()
+
+
+class ImpactMap:
+    """Persistent ``source file -> test node ids`` index for one repository."""
+
+    def __init__(self, path: str | Path) -> None:
+        # imported lazily: this module is also loaded as a plugin in every pytest run
+        from alpha_factory_v1.core.archive.sqlite_pool import get_pool as get_db_pool
+
+        self._pool = get_db_pool(path)
+        with self._pool.transaction() as cx:
+            cx.execute("CREATE TABLE IF NOT EXISTS files(path TEXT PRIMARY KEY, digest TEXT NOT NULL) WITHOUT ROWID")
+            cx.execute("CREATE TABLE IF NOT EXISTS tests(nodeid TEXT PRIMARY KEY, file TEXT NOT NULL) WITHOUT ROWID")
+            cx.execute(
+                "CREATE TABLE IF NOT EXISTS edges(src TEXT NOT NULL, nodeid TEXT NOT NULL, "
+                "PRIMARY KEY(src, nodeid)) WITHOUT ROWID"
+            )
+            cx.execute("CREATE INDEX IF NOT EXISTS edges_nodeid ON edges(nodeid)")
+
+    def __len__(self) -> int:
+        with self._pool.connection() as cx:
+            return int(cx.execute("SELECT COUNT(*) FROM tests").fetchone()[0])
+
+    def _tests_for(self, cx, paths: Iterable[str]) -> Set[str]:
+        out: Set[str] = set()
+        for path in paths:
+            out.update(r[0] for r in cx.execute("SELECT nodeid FROM edges WHERE src=?", (path,)))
+        return out
+
+    def select(self, changed: Iterable[str]) -> Optional[List[str]]:
+        """Return the pytest arguments covering ``changed`` or ``None`` for "run everything".
+
+        New test modules are selected by path; an empty list means no test
+        can observe the change.
+        """
+        selected: Set[str] = set()
+        with self._pool.connection() as cx:
+            if cx.execute("SELECT 1 FROM files LIMIT 1").fetchone() is None:
+                return None
+            for path in changed:
+                if not path.endswith(".py") or Path(path).name == "conftest.py":
+                    return None
+                tests = self._tests_for(cx, [path])
+                if tests:
+                    selected |= tests
+                elif _is_test_file(path):
+                    selected.add(path)
+                else:
+                    return None
+        return sorted(selected)
+
+    def refresh(self, repo: str | Path, *, timeout: float | None = None) -> int:
+        """Bring the map up to date with ``repo`` and return the number of tests rerun."""
+        if coverage is None:
+            raise RuntimeError("coverage is required")
+        root = Path(repo).resolve()
+        current = {p.relative_to(root).as_posix(): _digest(p) for p in _sources(root)}
+        with self._pool.connection() as cx:
+            stored: Dict[str, str] = dict(cx.execute("SELECT path, digest FROM files"))
+            stale = {p for p, d in current.items() if stored.get(p) != d} | (stored.keys() - current.keys())
+            if not stale:
+                return 0
+            stale_tests = {p for p in stale if _is_test_file(p)}
+            if stored:
+                rerun = {t for t in self._tests_for(cx, stale) if t.split("::", 1)[0] not in stale_tests}
+                args = sorted(rerun) + sorted(p for p in stale_tests if p in current)
+            else:
+                args = []
+        if stored and not args:
+            results: Dict[str, List[str]] = {}
+        else:
+            results = self._collect(root, args, timeout)
+        with self._pool.transaction() as cx:
+            deleted = stored.keys() - current.keys()
+            gone = [(f,) for f in stale_tests | deleted]
+            cx.executemany("DELETE FROM edges WHERE src=?", [(f,) for f in deleted])
+            cx.executemany("DELETE FROM edges WHERE nodeid IN (SELECT nodeid FROM tests WHERE file=?)", gone)
+            cx.executemany("DELETE FROM tests WHERE file=?", gone)
+            for nodeid, files in results.items():
+                cx.execute("DELETE FROM edges WHERE nodeid=?", (nodeid,))
+                cx.execute("INSERT OR REPLACE INTO tests VALUES(?,?)", (nodeid, nodeid.split("::", 1)[0]))
+                cx.executemany("INSERT OR IGNORE INTO edges VALUES(?,?)", [(f, nodeid) for f in files])
+            cx.execute("DELETE FROM files")
+            cx.executemany("INSERT INTO files VALUES(?,?)", current.items())
+        return len(results)
+
+    def _collect(self, root: Path, args: List[str], timeout: float | None) -> Dict[str, List[str]]:
+        with tempfile.TemporaryDirectory(prefix="af-impact-") as tmp:
+            out = Path(tmp) / "edges.json"
+            env = dict(os.environ)
+            env[_OUT_ENV] = str(out)
+            env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(_PKG_ROOT), env.get("PYTHONPATH")]))
+            cmd = [sys.executable, "-m", "pytest", "-q", f"--rootdir={root}", "-p", __name__, "-p", "no:cacheprovider"]
+            cmd += args
+            proc = subprocess.run(cmd, cwd=root, env=env, capture_output=True, text=True, timeout=timeout)
+            if not out.exists():
+                raise RuntimeError(f"impact run failed ({proc.returncode}): {proc.stderr.strip()[-500:]}")
+            data: Dict[str, List[str]] = json.loads(out.read_text())
+        return data
+
+
+class _Collector:
+    """pytest plugin recording the files each test executes."""
+
+    def __init__(self, out: Path, root: Path) -> None:
+        self.out = out
+        self.root = root
+        self.cov = coverage.Coverage(data_file=None, config_file=False, source=[str(root)])
+
+    def pytest_sessionstart(self, session) -> None:
+        self.cov.start()
+
+    def pytest_runtest_protocol(self, item, nextitem) -> None:
+        self.cov.switch_context(item.nodeid)
+
+    def pytest_sessionfinish(self, session, exitstatus) -> None:
+        self.cov.stop()
+        data = self.cov.get_data()
+        edges: Dict[str, Set[str]] = {}
+        for measured in data.measured_files():
+            try:
+                rel = Path(measured).resolve().relative_to(self.root).as_posix()
+            except ValueError:
+                continue
+            for contexts in data.contexts_by_lineno(measured).values():
+                for ctx in contexts:
+                    if ctx:
+                        edges.setdefault(ctx, set()).add(rel)
+        for item in session.items:
+            edges.setdefault(item.nodeid, set())
+        self.out.write_text(json.dumps({k: sorted(v) for k, v in edges.items()}))
+
+
+def pytest_configure(config) -> None:
+    """Register :class:`_Collector` when loaded via ``pytest -p`` by :meth:`ImpactMap.refresh`."""
+    out = os.environ.get(_OUT_ENV)
+    if out and coverage is not None:
+        config.pluginmanager.register(_Collector(Path(out), Path(str(config.rootpath)).resolve()), "af-impact")
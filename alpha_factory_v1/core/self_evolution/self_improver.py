@@ -1,16 +1,16 @@
 # SPDX-License-Identifier: Apache-2.0
 """Minimal self-improvement workflow using GitPython.
 
-This module clones a repository, applies a unified diff patch, evaluates a
-numeric score and logs the score delta. ``improve_repo`` optionally cleans up
-the temporary clone via the ``cleanup`` flag.
+This module checks out a repository, applies a unified diff patch, evaluates a
+numeric score and logs the score delta. Checkouts come from a shared
+:mod:`~alpha_factory_v1.core.self_evolution.worktree_pool`; ``improve_repo``
+returns its worktree to the pool unless ``cleanup`` is ``False``.
 """
 
 from __future__ import annotations
 
 import json
 import re
-import shutil
 import tempfile
 import time
 from pathlib import Path
@@ -18,6 +18,7 @@ from typing import Tuple
 
 from alpha_factory_v1.core.utils.patch_guard import is_patch_valid
 from alpha_factory_v1.core.eval.preflight import run_preflight
+from alpha_factory_v1.core.self_evolution import worktree_pool
 
 try:
     import git
@@ -76,7 +77,7 @@ def improve_repo(
     log_file: str,
     cleanup: bool = True,
 ) -> Tuple[float, Path]:
-    """Clone ``repo_url``, apply ``patch_file`` and log score delta.
+    """Check out ``repo_url``, apply ``patch_file`` and log score delta.
 
     Parameters
     ----------
@@ -89,18 +90,30 @@ def improve_repo(
     log_file:
         JSON file updated with the score delta.
     cleanup:
-        When ``True`` the temporary clone is removed before returning.
+        When ``True`` the worktree is handed back to the pool before
+        returning; otherwise the caller owns it and may delete it.
 
     Returns
     -------
     tuple[float, Path]
-        Score delta and path to the cloned repository (if ``cleanup`` is
+        Score delta and path to the checkout (only valid if ``cleanup`` is
         ``False``).
     """
     if git is None:
         raise RuntimeError("GitPython is required")
-    repo_dir = Path(tempfile.mkdtemp(prefix="selfimprover-"))
-    repo = git.Repo.clone_from(repo_url, repo_dir)
+    pool = worktree_pool.get_pool(repo_url)
+    repo_dir = pool.acquire()
+    try:
+        delta = _apply_and_score(git.Repo(repo_dir), repo_dir, patch_file, metric_file, log_file)
+    except BaseException:
+        pool.release(repo_dir)
+        raise
+    if cleanup:
+        pool.release(repo_dir)
+    return delta, repo_dir
+
+
+def _apply_and_score(repo: "git.Repo", repo_dir: Path, patch_file: str, metric_file: str, log_file: str) -> float:
     baseline = _evaluate(repo_dir, metric_file)
 
     diff = _ensure_hunk_ranges(Path(patch_file).read_text())
@@ -121,6 +134,4 @@ def improve_repo(
     new_score = _evaluate(repo_dir, metric_file)
     delta = new_score - baseline
     _log_delta(delta, Path(log_file))
-    if cleanup:
-        shutil.rmtree(repo_dir, ignore_errors=True)
-    return delta, repo_dir
+    return delta
@@ -0,0 +1,318 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Pre-warmed git worktrees and a content-addressed cache of check results.
+
+Each source repository is mirrored once into a bare repository under
+``AF_WORKTREE_CACHE``. Candidate patches are applied in detached worktrees of
+that mirror which are reset with ``git checkout --force`` and ``git clean``
+rather than re-cloned, so only files that differ from the last use are
+rewritten.
+
+:func:`run_checks` keys lint results on the git blob hash of every Python file
+and test results on the tree hash plus the test command and environment, so
+validating a one-file patch only lints that file and never reruns tests for a
+tree already seen. Lint tools honour the tree's configured excludes even though
+they receive explicit file lists.
+"""
+
+from __future__ import annotations
+
+import atexit
+import configparser
+import fnmatch
+import hashlib
+import json
+import os
+import queue
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import tomllib
+import uuid
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, Sequence, Set
+
+from alpha_factory_v1.core.archive.sqlite_pool import get_pool as get_db_pool
+
+__all__ = ["CACHE_DIR", "ToolCache", "WorktreePool", "get_pool", "run_checks", "close_pools"]
+
+CACHE_DIR = Path(os.getenv("AF_WORKTREE_CACHE", str(Path(tempfile.gettempdir()) / "af-worktrees")))
+
+_CONFIG_FILES = ("pyproject.toml", "ruff.toml", ".ruff.toml", "setup.cfg", ".bandit")
+_BATCH = 200
+# environment variables that change what a pytest run does
+_TEST_ENV = ("PATH", "PYTHONPATH", "PYTHONHASHSEED", "PYTEST_ADDOPTS", "PYTEST_PLUGINS", "VIRTUAL_ENV")
+
+
+def _git(*args: str, cwd: Path, input: str | None = None) -> str:
+    proc = subprocess.run(["git", *args], cwd=cwd, input=input, capture_output=True, text=True, check=True)
+    return proc.stdout.strip()
+
+
+class WorktreePool:
+    """Reusable detached worktrees of ``source`` at its current ``HEAD``.
+
+    Idle worktrees are parked under ``root``; :meth:`acquire` syncs the mirror,
+    resets one to the fetched commit and moves it to a fresh path, which
+    :meth:`release` moves back. Up to ``size`` idle worktrees are kept. A
+    worktree that is never released belongs to the caller; its metadata is
+    pruned once the caller deletes it.
+    """
+
+    def __init__(self, source: str, root: Path, *, size: int = 4) -> None:
+        self.source = source
+        self.root = Path(root)
+        self.size = max(1, size)
+        self.mirror = self.root / "mirror.git"
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.cache = ToolCache(self.root / "tool_cache.sqlite")
+        self._idle: queue.LifoQueue[Path] = queue.LifoQueue()
+        self._lock = threading.Lock()
+        self._fetch_lock = threading.Lock()
+        self._closed = False
+        if not self.mirror.exists():
+            tmp = self.root / f"mirror-{uuid.uuid4().hex}.tmp"
+            _git("clone", "--bare", "--quiet", source, str(tmp), cwd=self.root)
+            os.replace(tmp, self.mirror)
+        _git("worktree", "prune", cwd=self.mirror)
+        for stale in self.root.glob("idle-*"):
+            if (stale / ".git").exists():
+                self._idle.put(stale)
+
+    def _sync(self) -> str:
+        """Return the source's ``HEAD`` commit, fetching it only when missing."""
+        rev = _git("ls-remote", self.source, "HEAD", cwd=self.mirror).split()[0]
+        have = subprocess.run(["git", "cat-file", "-e", f"{rev}^{{commit}}"], cwd=self.mirror, capture_output=True)
+        if have.returncode:
+            with self._fetch_lock:  # concurrent fetches race on FETCH_HEAD
+                _git("fetch", "--quiet", "--force", self.source, rev, cwd=self.mirror)
+        return rev
+
+    def acquire(self) -> Path:
+        """Return a clean worktree checked out at the source's ``HEAD``."""
+        if self._closed:
+            raise RuntimeError("pool is closed")
+        busy = self.root / f"busy-{uuid.uuid4().hex[:12]}"
+        rev = self._sync()
+        with self._lock:
+            try:
+                idle = self._idle.get_nowait()
+            except queue.Empty:
+                _git("worktree", "prune", cwd=self.mirror)
+                _git("worktree", "add", "--quiet", "--force", "--detach", str(busy), rev, cwd=self.mirror)
+                return busy
+            _git("worktree", "move", str(idle), str(busy), cwd=self.mirror)
+        _git("checkout", "--quiet", "--force", "--detach", rev, cwd=busy)
+        _git("clean", "-qfdx", cwd=busy)
+        return busy
+
+    def release(self, path: Path) -> None:
+        """Park ``path`` for reuse, or remove it when enough are idle."""
+        with self._lock:
+            if self._closed or self._idle.qsize() >= self.size:
+                _git("worktree", "remove", "--force", str(path), cwd=self.mirror)
+                return
+            idle = self.root / f"idle-{uuid.uuid4().hex[:12]}"
+            _git("worktree", "move", "--force", str(path), str(idle), cwd=self.mirror)
+            self._idle.put(idle)
+
+    @contextmanager
+    def checkout(self) -> Iterator[Path]:
+        """Borrow a worktree for the duration of the ``with`` block."""
+        path = self.acquire()
+        try:
+            yield path
+        finally:
+            self.release(path)
+
+    def close(self) -> None:
+        """Remove idle worktrees; borrowed ones are removed on release."""
+        with self._lock:
+            self._closed = True
+            while True:
+                try:
+                    idle = self._idle.get_nowait()
+                except queue.Empty:
+                    break
+                subprocess.run(
+                    ["git", "worktree", "remove", "--force", str(idle)],
+                    cwd=self.mirror,
+                    capture_output=True,
+                )
+
+
+class ToolCache:
+    """Persistent ``(tool, key) -> passed`` map backed by SQLite."""
+
+    def __init__(self, path: Path) -> None:
+        self._pool = get_db_pool(path)
+        with self._pool.connection() as cx:
+            cx.execute(
+                "CREATE TABLE IF NOT EXISTS tool_results("
+                "tool TEXT NOT NULL, key TEXT NOT NULL, ok INTEGER NOT NULL, ts REAL NOT NULL, "
+                "PRIMARY KEY(tool, key)) WITHOUT ROWID"
+            )
+
+    def get(self, tool: str, keys: Iterable[str]) -> Dict[str, bool]:
+        keys = list(keys)
+        found: Dict[str, bool] = {}
+        with self._pool.connection() as cx:
+            for i in range(0, len(keys), 500):
+                chunk = keys[i : i + 500]
+                marks = ",".join("?" * len(chunk))
+                rows = cx.execute(
+                    f"SELECT key, ok FROM tool_results WHERE tool=? AND key IN ({marks})",
+                    [tool, *chunk],
+                )
+                found.update((k, bool(ok)) for k, ok in rows)
+        return found
+
+    def put(self, tool: str, results: Dict[str, bool]) -> None:
+        now = time.time()
+        with self._pool.transaction() as cx:
+            cx.executemany(
+                "INSERT OR REPLACE INTO tool_results VALUES(?,?,?,?)",
+                [(tool, k, int(ok), now) for k, ok in results.items()],
+            )
+
+
+def _ruff_failed(tree: Path, out: str) -> Set[str]:
+    return {os.path.relpath(Path(d["filename"]).resolve(), tree) for d in json.loads(out or "[]")}
+
+
+def _bandit_failed(tree: Path, out: str) -> Set[str]:
+    data = json.loads(out)
+    items = data.get("results", []) + data.get("errors", [])
+    return {os.path.relpath((tree / d["filename"]).resolve(), tree) for d in items}
+
+
+def _bandit_excludes(tree: Path) -> List[str]:
+    """Return the exclude patterns from ``.bandit`` and ``[tool.bandit]``."""
+    patterns: List[str] = []
+    ini = configparser.ConfigParser()
+    try:
+        ini.read(tree / ".bandit")
+    except configparser.Error:
+        pass
+    for option in ("exclude", "exclude_dirs"):
+        patterns += ini.get("bandit", option, fallback="").split(",")
+    pyproject = tree / "pyproject.toml"
+    if pyproject.exists():
+        try:
+            patterns += tomllib.loads(pyproject.read_text()).get("tool", {}).get("bandit", {}).get("exclude_dirs", [])
+        except (tomllib.TOMLDecodeError, UnicodeDecodeError):
+            pass
+    return [p.strip().removeprefix("./") for p in patterns if p.strip()]
+
+
+def _bandit_paths(tree: Path, paths: List[str]) -> List[str]:
+    # bandit only applies its excludes while walking directories, not to files named on the command line
+    excludes = _bandit_excludes(tree)
+    return [p for p in paths if not any(e in p or fnmatch.fnmatch(p, e) for e in excludes)]
+
+
+def _all_paths(tree: Path, paths: List[str]) -> List[str]:
+    return paths
+
+
+# per-file tools: command prefix, a path filter applying the tool's excludes
+# and a parser returning the failing paths
+_FILE_TOOLS: Dict[
+    str, tuple[List[str], Callable[[Path, List[str]], List[str]], Callable[[Path, str], Set[str]]]
+] = {
+    "ruff": (["ruff", "check", "--output-format", "json", "--force-exclude"], _all_paths, _ruff_failed),
+    "bandit": (["bandit", "-q", "-f", "json"], _bandit_paths, _bandit_failed),
+}
+
+
+def _file_check(tool: str, tree: Path, blobs: Dict[str, str], config: str, cache: ToolCache) -> bool:
+    cmd, select, parse = _FILE_TOOLS[tool]
+    keys = {path: f"{blobs[path]}:{config}" for path in select(tree, list(blobs))}
+    known = cache.get(tool, keys.values())
+    if not all(known.values()):
+        return False
+    todo = sorted(p for p, k in keys.items() if k not in known)
+    results: Dict[str, bool] = {}
+    for i in range(0, len(todo), _BATCH):
+        batch = todo[i : i + _BATCH]
+        proc = subprocess.run([*cmd, *batch], cwd=tree, capture_output=True, text=True)
+        try:
+            failed = parse(tree, proc.stdout) if proc.returncode else set()
+        except (ValueError, KeyError, TypeError):
+            return False  # unparseable output: fail without caching
+        if proc.returncode and not failed:
+            return False
+        results.update({keys[p]: p not in failed for p in batch})
+    cache.put(tool, results)
+    return all(results.values())
+
+
+def _run_key(cmd: Sequence[str]) -> str:
+    """Digest of ``cmd``, the resolved executable and the environment it sees."""
+    env = {k: os.environ[k] for k in _TEST_ENV if k in os.environ}
+    state = json.dumps([list(cmd), shutil.which(cmd[0]), sys.executable, env])
+    return hashlib.sha256(state.encode()).hexdigest()[:16]
+
+
+def run_checks(
+    tree: Path,
+    cache: ToolCache,
+    tools: Sequence[str] = ("pytest", "ruff", "bandit"),
+) -> bool:
+    """Run ``tools`` in ``tree`` and return ``True`` when all pass.
+
+    Tools missing from ``PATH`` are skipped. The worktree's index is updated
+    to hash its contents.
+    """
+    tree = Path(tree).resolve()
+    _git("add", "-A", cwd=tree)
+    blobs: Dict[str, str] = {}
+    for line in _git("ls-files", "-s", "--", "*.py", cwd=tree).splitlines():
+        meta, path = line.split("\t", 1)
+        blobs[path] = meta.split()[1]
+    config = hashlib.sha256(_git("ls-files", "-s", "--", *_CONFIG_FILES, cwd=tree).encode()).hexdigest()[:16]
+    for tool in tools:
+        if shutil.which(tool) is None:
+            continue
+        if tool in _FILE_TOOLS:
+            if not _file_check(tool, tree, blobs, config, cache):
+                return False
+            continue
+        cmd = [tool, "-q"]
+        key = f"{_git('write-tree', cwd=tree)}:{_run_key(cmd)}"
+        hit = cache.get(tool, [key]).get(key)
+        if hit is None:
+            proc = subprocess.run(cmd, cwd=tree, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            hit = proc.returncode == 0
+            cache.put(tool, {key: hit})
+        if not hit:
+            return False
+    return True
+
+
+_POOLS: dict[str, WorktreePool] = {}
+_POOLS_LOCK = threading.Lock()
+
+
+def get_pool(source: str | Path, *, size: int = 4) -> WorktreePool:
+    """Return the shared pool for ``source``, creating its mirror on first use."""
+    key = str(Path(source).resolve()) if Path(source).exists() else str(source)
+    with _POOLS_LOCK:
+        pool = _POOLS.get(key)
+        if pool is None or pool._closed:
+            root = CACHE_DIR / hashlib.sha256(key.encode()).hexdigest()[:16]
+            pool = WorktreePool(key, root, size=size)
+            _POOLS[key] = pool
+        return pool
+
+
+@atexit.register
+def close_pools() -> None:
+    """Remove the idle worktrees of every pool created through :func:`get_pool`."""
+    with _POOLS_LOCK:
+        for pool in _POOLS.values():
+            pool.close()
+        _POOLS.clear()
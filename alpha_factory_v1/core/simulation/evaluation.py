@@ -0,0 +1,243 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Pluggable fitness evaluation back-ends for :mod:`mats`.
+
+Evaluators map a scoring callable over a batch of genomes. ``serial`` runs in
+the calling thread, ``thread`` uses a thread pool for I/O bound objectives and
+``process`` keeps a persistent process pool alive across generations, sending
+genomes in chunks to amortise pickling. :class:`FitnessCache` stores scores
+keyed by a hash of the genome so surviving parents and migrated elites are
+never scored twice. Keys also cover the scorer's identity, so one cache can
+be shared between runs with different objectives.
+"""
+
+from __future__ import annotations
+
+import abc
+import atexit
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, Iterable, List, Sequence, Tuple
+
+import numpy as np
+
+__all__ = [
+    "Scorer",
+    "FitnessCache",
+    "EvaluationExecutor",
+    "SerialExecutor",
+    "ThreadExecutor",
+    "ProcessExecutor",
+    "genome_key",
+    "get_executor",
+    "shutdown_executors",
+]
+
+Fitness = Tuple[float, ...]
+
+
+def genome_key(genome: Sequence[float], scope: bytes = b"") -> bytes:
+    """Return a stable digest identifying ``genome`` within ``scope``."""
+
+    data = np.asarray(genome, dtype=np.float64).tobytes()
+    return hashlib.blake2b(data, digest_size=16, key=scope[:64]).digest()
+
+
+@dataclass(frozen=True)
+class Scorer:
+    """Picklable bundle of the objective function and critic callables."""
+
+    fn: Callable[[List[float]], Fitness]
+    critics: Tuple[Callable[[List[float]], float], ...] = ()
+
+    def __call__(self, genome: List[float]) -> Fitness:
+        base = tuple(self.fn(genome))
+        return base + tuple(c(genome) for c in self.critics)
+
+    @property
+    def scope(self) -> bytes:
+        """Digest of the objective and critics, valid while they are alive."""
+
+        h = hashlib.blake2b(digest_size=16)
+        for f in (self.fn, *self.critics):
+            name = f"{getattr(f, '__module__', '')}.{getattr(f, '__qualname__', type(f).__qualname__)}"
+            h.update(f"{name}:{id(f)};".encode())
+        return h.digest()
+
+
+def _score_chunk(scorer: Scorer, genomes: List[List[float]]) -> List[Fitness]:
+    return [scorer(g) for g in genomes]
+
+
+@dataclass
+class FitnessCache:
+    """Bounded LRU mapping scorer-scoped genome digests to fitness tuples."""
+
+    max_size: int = 100_000
+    hits: int = 0
+    misses: int = 0
+    _data: "OrderedDict[bytes, Fitness]" = field(default_factory=OrderedDict, repr=False)
+    _scorers: dict[bytes, Scorer] = field(default_factory=dict, repr=False)
+
+    def key(self, scorer: Scorer, genome: Sequence[float]) -> bytes:
+        """Return the cache key for ``genome`` scored by ``scorer``.
+
+        The scorer is retained so its id-based :attr:`Scorer.scope` cannot be
+        reused by a different function for the lifetime of the cache.
+        """
+
+        scope = scorer.scope
+        self._scorers.setdefault(scope, scorer)
+        return genome_key(genome, scope)
+
+    def get(self, key: bytes) -> Fitness | None:
+        val = self._data.get(key)
+        if val is None:
+            self.misses += 1
+            return None
+        self._data.move_to_end(key)
+        self.hits += 1
+        return val
+
+    def put(self, key: bytes, value: Fitness) -> None:
+        self._data[key] = value
+        self._data.move_to_end(key)
+        while len(self._data) > self.max_size:
+            self._data.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def clear(self) -> None:
+        self._data.clear()
+        self._scorers.clear()
+        self.hits = self.misses = 0
+
+
+class EvaluationExecutor:
+    """Base class mapping a :class:`Scorer` over genomes."""
+
+    name = "serial"
+
+    def map(self, scorer: Scorer, genomes: Sequence[List[float]]) -> List[Fitness]:
+        return [scorer(g) for g in genomes]
+
+    def close(self) -> None:
+        """Release any worker resources."""
+
+    def __enter__(self) -> "EvaluationExecutor":
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        self.close()
+
+
+class SerialExecutor(EvaluationExecutor):
+    """Evaluate genomes one by one in the calling thread."""
+
+
+class _PoolExecutor(EvaluationExecutor, abc.ABC):
+    """Shared logic for lazily created, long-lived ``concurrent.futures`` pools."""
+
+    def __init__(self, max_workers: int | None = None, chunksize: int | None = None) -> None:
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.chunksize = chunksize
+        self._pool: Executor | None = None
+        self._lock = threading.Lock()
+
+    @abc.abstractmethod
+    def _create(self) -> Executor:
+        """Return a new ``concurrent.futures`` pool."""
+
+    @property
+    def pool(self) -> Executor:
+        with self._lock:
+            if self._pool is None:
+                self._pool = self._create()
+            return self._pool
+
+    def _chunks(self, genomes: Sequence[List[float]]) -> Iterable[List[List[float]]]:
+        size = self.chunksize or max(1, -(-len(genomes) // (self.max_workers * 4)))
+        for i in range(0, len(genomes), size):
+            yield [list(g) for g in genomes[i : i + size]]
+
+    def map(self, scorer: Scorer, genomes: Sequence[List[float]]) -> List[Fitness]:
+        if len(genomes) <= 1:
+            return [scorer(g) for g in genomes]
+        futures = [self.pool.submit(_score_chunk, scorer, chunk) for chunk in self._chunks(genomes)]
+        out: List[Fitness] = []
+        for fut in futures:
+            out.extend(fut.result())
+        return out
+
+    def close(self) -> None:
+        with self._lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=True, cancel_futures=True)
+                self._pool = None
+
+
+class ThreadExecutor(_PoolExecutor):
+    """Evaluate genomes on a persistent thread pool."""
+
+    name = "thread"
+
+    def _create(self) -> Executor:
+        return ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="mats-eval")
+
+
+class ProcessExecutor(_PoolExecutor):
+    """Evaluate genomes on a persistent process pool.
+
+    The objective and critics must be picklable, i.e. defined at module level.
+    """
+
+    name = "process"
+
+    def _create(self) -> Executor:
+        return ProcessPoolExecutor(max_workers=self.max_workers)
+
+
+_KINDS: dict[str, type[EvaluationExecutor]] = {
+    "serial": SerialExecutor,
+    "thread": ThreadExecutor,
+    "process": ProcessExecutor,
+}
+_SHARED: dict[tuple[str, int | None], EvaluationExecutor] = {}
+_SHARED_LOCK = threading.Lock()
+
+
+def get_executor(kind: str | EvaluationExecutor | None = None, max_workers: int | None = None) -> EvaluationExecutor:
+    """Return an evaluator for ``kind``.
+
+    Pools created by name are shared process-wide so repeated
+    ``run_evolution`` calls reuse warm workers. ``kind`` defaults to the
+    ``MATS_EXECUTOR`` environment variable or ``serial``.
+    """
+
+    if isinstance(kind, EvaluationExecutor):
+        return kind
+    name = (kind or os.getenv("MATS_EXECUTOR", "serial")).lower()
+    if name not in _KINDS:
+        raise ValueError(f"unknown executor: {name}")
+    if name == "serial":
+        return SerialExecutor()
+    with _SHARED_LOCK:
+        exe = _SHARED.get((name, max_workers))
+        if exe is None:
+            exe = _KINDS[name](max_workers)  # type: ignore[call-arg]
+            _SHARED[(name, max_workers)] = exe
+        return exe
+
+
+@atexit.register
+def shutdown_executors() -> None:
+    """Close all shared pools created by :func:`get_executor`."""
+
+    with _SHARED_LOCK:
+        for exe in _SHARED.values():
+            exe.close()
+        _SHARED.clear()
@@ -5,13 +5,22 @@ This module implements a very small toy model using a logistic capability
 curve and a thermodynamic trigger based on free energy. The helpers
 ``forecast_disruptions`` and ``simulate_years`` drive the demo's forecast
 visualisations.
+
+:class:`ForecastEngine` keeps sector state in NumPy columns and tests every
+sector against the trigger at once each year. A trajectory stores only the
+initial columns plus the year and post-gain energy of each disruption; the
+per-year ``Sector`` snapshots are rebuilt on first access.
 """
 
 from __future__ import annotations
 
 import math
+from collections.abc import Sequence
 from dataclasses import dataclass
-from typing import Iterable, List
+from functools import lru_cache
+from typing import Iterable, Iterator, List, overload
+
+import numpy as np
 
 from .sector import Sector
 from . import mats
@@ -31,7 +40,7 @@ class TrajectoryPoint:
 
     year: int
     capability: float
-    sectors: List[Sector]
+    sectors: Sequence[Sector]
 
 
 def logistic_curve(t: float, k: float = 1.0, x0: float = 0.0) -> float:
@@ -94,6 +103,37 @@ def thermodynamic_trigger(sector: Sector, capability: float) -> bool:
     return free_energy(sector, capability) < 0
 
 
+def _gain_objective(genome: list[float]) -> tuple[float, float, float, float]:
+    x, y = genome
+    effectiveness = x**2
+    negative_evar = y**2
+    complexity = (x + y) ** 2
+    history = [1.0, 1.0, 1.0]
+    base = lead_time._arima_baseline(history, 3)
+    forecast_series = [b + x + y for b in base]
+    lead_impr = lead_time.lead_signal_improvement(history, forecast_series, months=3, threshold=1.1)
+    lead_penalty = 1.0 - lead_impr
+    return effectiveness, negative_evar, complexity, lead_penalty
+
+
+def _evolve_gain(pop_size: int, generations: int, seed: int | None, mut_rate: float, xover_rate: float) -> float:
+    pop = mats.run_evolution(
+        _gain_objective,
+        2,
+        population_size=pop_size,
+        mutation_rate=mut_rate,
+        crossover_rate=xover_rate,
+        generations=generations,
+        seed=seed,
+    )
+    m = len(pop[0].fitness or ())
+    best = min(pop, key=lambda ind: sum(ind.fitness or (0.0,) * m))
+    return 0.1 / (1.0 + sum(best.fitness or (0.0,) * m))
+
+
+_cached_gain = lru_cache(maxsize=1024)(_evolve_gain)
+
+
 def _innovation_gain(
     pop_size: int = 6,
     generations: int = 1,
@@ -104,6 +144,10 @@ def _innovation_gain(
 ) -> float:
     """Return a small gain from a short MATS run.
 
+    Seeded runs are deterministic and the MATS objective does not depend on
+    the sector, so their result is memoised on the evolution parameters.
+    Unseeded calls draw a fresh evolution each time.
+
     Args:
         pop_size: Number of individuals in the MATS population.
         generations: Number of evolution steps.
@@ -112,30 +156,156 @@ def _innovation_gain(
         xover_rate: Probability of performing crossover.
     """
 
-    def fn(genome: list[float]) -> tuple[float, float, float, float]:
-        x, y = genome
-        effectiveness = x**2
-        negative_evar = y**2
-        complexity = (x + y) ** 2
-        history = [1.0, 1.0, 1.0]
-        base = lead_time._arima_baseline(history, 3)
-        forecast_series = [b + x + y for b in base]
-        lead_impr = lead_time.lead_signal_improvement(history, forecast_series, months=3, threshold=1.1)
-        lead_penalty = 1.0 - lead_impr
-        return effectiveness, negative_evar, complexity, lead_penalty
+    if seed is None:
+        return _evolve_gain(pop_size, generations, None, mut_rate, xover_rate)
+    return _cached_gain(pop_size, generations, seed, mut_rate, xover_rate)
 
-    pop = mats.run_evolution(
-        fn,
-        2,
-        population_size=pop_size,
-        mutation_rate=mut_rate,
-        crossover_rate=xover_rate,
-        generations=generations,
-        seed=seed,
-    )
-    m = len(pop[0].fitness or ())
-    best = min(pop, key=lambda ind: sum(ind.fitness or (0.0,) * m))
-    return 0.1 / (1.0 + sum(best.fitness or (0.0,) * m))
+
+class _SectorColumns:
+    """Initial sector state plus disruption events for one forecast."""
+
+    __slots__ = ("names", "energy0", "entropy", "growth", "year", "frozen", "_grown", "_grown_year")
+
+    NEVER = np.iinfo(np.int64).max
+
+    def __init__(self, sectors: List[Sector]) -> None:
+        self.names = [s.name for s in sectors]
+        self.energy0 = np.array([s.energy for s in sectors], dtype=float)
+        self.entropy = np.array([s.entropy for s in sectors], dtype=float)
+        self.growth = np.array([s.growth for s in sectors], dtype=float)
+        disrupted = np.array([s.disrupted for s in sectors], dtype=bool)
+        # year in which each sector was disrupted (0 = before the forecast)
+        self.year = np.where(disrupted, 0, self.NEVER).astype(np.int64)
+        self.frozen = self.energy0.copy()
+        self._grown = self.energy0.copy()
+        self._grown_year = 0
+
+    def _energy_if_undisrupted(self, year: int) -> np.ndarray:
+        # Replays the same per-year multiplications as the live loop so the
+        # rebuilt energies match it bit for bit.
+        if year < self._grown_year:
+            self._grown = self.energy0.copy()
+            self._grown_year = 0
+        while self._grown_year < year:
+            self._grown *= 1.0 + self.growth
+            self._grown_year += 1
+        return self._grown
+
+    def sectors_at(self, year: int) -> List[Sector]:
+        disrupted = self.year <= year
+        energy = np.where(disrupted, self.frozen, self._energy_if_undisrupted(year))
+        return [
+            Sector(name, e, h, g, d)
+            for name, e, h, g, d in zip(
+                self.names,
+                energy.tolist(),
+                self.entropy.tolist(),
+                self.growth.tolist(),
+                disrupted.tolist(),
+            )
+        ]
+
+
+class SectorSnapshot(Sequence[Sector]):
+    """Read-only view of every sector at the end of one forecast year."""
+
+    __slots__ = ("_cols", "_year", "_items")
+
+    def __init__(self, cols: _SectorColumns, year: int) -> None:
+        self._cols = cols
+        self._year = year
+        self._items: List[Sector] | None = None
+
+    def _materialise(self) -> List[Sector]:
+        if self._items is None:
+            self._items = self._cols.sectors_at(self._year)
+        return self._items
+
+    @overload
+    def __getitem__(self, idx: int) -> Sector: ...
+
+    @overload
+    def __getitem__(self, idx: slice) -> List[Sector]: ...
+
+    def __getitem__(self, idx: int | slice) -> Sector | List[Sector]:
+        return self._materialise()[idx]
+
+    def __len__(self) -> int:
+        return len(self._cols.names)
+
+    def __iter__(self) -> Iterator[Sector]:
+        return iter(self._materialise())
+
+    def __repr__(self) -> str:
+        return repr(self._materialise())
+
+
+class ForecastEngine:
+    """Year-by-year disruption forecast over column-oriented sector state.
+
+    Iterating the engine yields one :class:`TrajectoryPoint` per year. When
+    the run completes the final energy and ``disrupted`` flag are written
+    back to the input sectors, as :func:`forecast_disruptions` always did.
+    """
+
+    def __init__(
+        self,
+        sectors: Iterable[Sector],
+        horizon: int,
+        curve: str = "logistic",
+        *,
+        k: float | None = None,
+        x0: float | None = None,
+        pop_size: int = 6,
+        generations: int = 1,
+        seed: int | None = None,
+        mut_rate: float = 0.1,
+        xover_rate: float = 0.5,
+    ) -> None:
+        self.sectors = list(sectors)
+        self.horizon = horizon
+        self.curve = curve
+        self.k = k
+        self.x0 = x0
+        self.gain_args = dict(
+            pop_size=pop_size, generations=generations, seed=seed, mut_rate=mut_rate, xover_rate=xover_rate
+        )
+        self.columns = _SectorColumns(self.sectors)
+
+    def capabilities(self) -> np.ndarray:
+        """Return the capability level for every forecast year."""
+
+        return np.array(
+            [capability_growth(y / self.horizon, self.curve, k=self.k, x0=self.x0) for y in range(1, self.horizon + 1)],
+            dtype=float,
+        )
+
+    def __iter__(self) -> Iterator[TrajectoryPoint]:
+        cols = self.columns
+        energy = cols.energy0.copy()
+        active = cols.year == cols.NEVER
+        step = 1.0 + cols.growth
+        for year, cap in enumerate(self.capabilities().tolist(), start=1):
+            np.multiply(energy, step, out=energy, where=active)
+            hit = np.flatnonzero(active & (energy - cap * cols.entropy < 0))
+            for i in hit.tolist():
+                energy[i] += _innovation_gain(
+                    self.gain_args["pop_size"],
+                    self.gain_args["generations"],
+                    seed=self.gain_args["seed"],
+                    mut_rate=self.gain_args["mut_rate"],
+                    xover_rate=self.gain_args["xover_rate"],
+                )
+            active[hit] = False
+            cols.year[hit] = year
+            cols.frozen[hit] = energy[hit]
+            yield TrajectoryPoint(year, cap, SectorSnapshot(cols, year))
+        for sec, e, y in zip(self.sectors, energy.tolist(), cols.year.tolist()):
+            sec.energy = e
+            sec.disrupted = y != cols.NEVER
+
+    def run(self) -> List[TrajectoryPoint]:
+        return list(self)
 
 
 def forecast_disruptions(
@@ -169,28 +339,18 @@ def forecast_disruptions(
         List of trajectory points for each simulated year.
     """
 
-    secs = list(sectors)
-    results: List[TrajectoryPoint] = []
-    for year in range(1, horizon + 1):
-        t = year / horizon
-        cap = capability_growth(t, curve, k=k, x0=x0)
-        affected: List[Sector] = []
-        for sec in secs:
-            if not sec.disrupted:
-                sec.energy *= 1.0 + sec.growth
-                if thermodynamic_trigger(sec, cap):
-                    sec.disrupted = True
-                    sec.energy += _innovation_gain(
-                        pop_size,
-                        generations,
-                        seed=seed,
-                        mut_rate=mut_rate,
-                        xover_rate=xover_rate,
-                    )
-                    affected.append(sec)
-        snapshot = [Sector(s.name, s.energy, s.entropy, s.growth, s.disrupted) for s in secs]
-        results.append(TrajectoryPoint(year, cap, snapshot))
-    return results
+    return ForecastEngine(
+        sectors,
+        horizon,
+        curve,
+        k=k,
+        x0=x0,
+        pop_size=pop_size,
+        generations=generations,
+        seed=seed,
+        mut_rate=mut_rate,
+        xover_rate=xover_rate,
+    ).run()
 
 
 def simulate_years(sectors: Iterable[Sector], horizon: int) -> List[ForecastPoint]:
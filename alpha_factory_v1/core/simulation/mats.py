@@ -15,7 +15,7 @@ from typing import Callable, Iterable, List, Tuple
 import numpy as np
 
 from alpha_factory_v1.core.evaluators.novelty import NoveltyIndex
-from alpha_factory_v1.core.simulation import surrogate_fitness
+from alpha_factory_v1.core.simulation import evaluation, pareto, surrogate_fitness
 
 __all__ = [
     "Individual",
@@ -47,18 +47,47 @@ def evaluate(
     fn: Callable[[List[float]], Tuple[float, ...]],
     novelty: NoveltyIndex | None = None,
     critics: Iterable[Callable[[List[float]], float]] | None = None,
+    *,
+    executor: evaluation.EvaluationExecutor | str | None = None,
+    cache: evaluation.FitnessCache | None = None,
 ) -> None:
-    """Assign fitness scores using ``fn`` plus ``critics`` and optional novelty."""
+    """Assign fitness scores using ``fn`` plus ``critics`` and optional novelty.
 
-    for ind in pop:
-        base = fn(ind.genome)
-        extra = tuple(c(ind.genome) for c in (critics or []))
-        if novelty is not None:
-            spec = ",".join(f"{g:.3f}" for g in ind.genome)
-            div = novelty.divergence(spec)
-            ind.fitness = base + extra + (div,)
+    Objective and critic scores are computed through ``executor`` and stored
+    in ``cache`` so genomes seen before are not scored again. Novelty depends
+    on the live index and is always recomputed.
+    """
+
+    scorer = evaluation.Scorer(fn, tuple(critics or ()))
+    if cache is not None:
+        keys = [cache.key(scorer, ind.genome) for ind in pop]
+    else:
+        keys = [evaluation.genome_key(ind.genome) for ind in pop]
+    known: dict[bytes, Tuple[float, ...]] = {}
+    todo: dict[bytes, List[float]] = {}
+    for key, ind in zip(keys, pop):
+        if key in known or key in todo:
+            continue
+        hit = cache.get(key) if cache is not None else None
+        if hit is None:
+            todo[key] = ind.genome
         else:
-            ind.fitness = base + extra
+            known[key] = hit
+    if todo:
+        results = evaluation.get_executor(executor).map(scorer, list(todo.values()))
+        for key, res in zip(todo, results):
+            known[key] = res
+            if cache is not None:
+                cache.put(key, res)
+
+    if novelty is not None:
+        specs = [",".join(f"{g:.3f}" for g in ind.genome) for ind in pop]
+        divs = novelty.divergence_many(specs)
+        for key, ind, div in zip(keys, pop, divs):
+            ind.fitness = known[key] + (div,)
+    else:
+        for key, ind in zip(keys, pop):
+            ind.fitness = known[key]
 
     fits = [ind.fitness or () for ind in pop]
     scores = surrogate_fitness.aggregate(fits)
@@ -66,70 +95,39 @@ def evaluate(
         ind.score = sc
 
 
+def _fitness_matrix(pop: Population) -> np.ndarray:
+    for ind in pop:
+        assert ind.fitness is not None
+    return pareto.as_matrix([ind.fitness for ind in pop])
+
+
 def _crowding(pop: Population) -> None:
     """Compute the crowding distance for a Pareto front."""
 
     if not pop or pop[0].fitness is None:
         return
-    m = len(pop[0].fitness)
-    for ind in pop:
-        ind.crowd = 0.0
-    for i in range(m):
-        pop.sort(key=lambda x: (x.fitness or (0.0,) * m)[i])
-        first_fit = pop[0].fitness
-        last_fit = pop[-1].fitness
-        assert first_fit is not None and last_fit is not None
-        pop[0].crowd = pop[-1].crowd = float("inf")
-        fmin = first_fit[i]
-        fmax = last_fit[i]
-        span = fmax - fmin or 1.0
-        for j in range(1, len(pop) - 1):
-            prev_fit = pop[j - 1].fitness
-            next_fit = pop[j + 1].fitness
-            assert prev_fit is not None and next_fit is not None
-            prev_f = prev_fit[i]
-            next_f = next_fit[i]
-            pop[j].crowd += (next_f - prev_f) / span
+    crowd = pareto.crowding_distance(_fitness_matrix(pop))
+    for ind, c in zip(pop, crowd.tolist()):
+        ind.crowd = c
 
 
 def _non_dominated_sort(pop: Population) -> List[Population]:
     """Group ``pop`` into Pareto fronts."""
 
-    fronts: List[Population] = []
-    S: dict[int, list[Individual]] = {id(ind): [] for ind in pop}
-    n: dict[int, int] = {id(ind): 0 for ind in pop}
-    for ind in pop:
-        assert ind.fitness is not None
-    for p in pop:
-        for q in pop:
-            if p is q:
-                continue
-            assert q.fitness is not None
-            assert p.fitness is not None
-            if all(pf <= qf for pf, qf in zip(p.fitness, q.fitness)):
-                if any(pf < qf for pf, qf in zip(p.fitness, q.fitness)):
-                    S[id(p)].append(q)
-            elif all(qf <= pf for pf, qf in zip(p.fitness, q.fitness)):
-                if any(qf < pf for pf, qf in zip(p.fitness, q.fitness)):
-                    n[id(p)] += 1
-        if n[id(p)] == 0:
-            p.rank = 0
-            if not fronts:
-                fronts.append([])
-            fronts[0].append(p)
-    i = 0
-    while i < len(fronts):
-        nxt: Population = []
-        for p in fronts[i]:
-            for q in S[id(p)]:
-                n[id(q)] -= 1
-                if n[id(q)] == 0:
-                    q.rank = i + 1
-                    nxt.append(q)
-        if nxt:
-            fronts.append(nxt)
-        i += 1
-    return fronts
+    ranks = pareto.non_dominated_sort(_fitness_matrix(pop))
+    for ind, r in zip(pop, ranks.tolist()):
+        ind.rank = r
+    return [[pop[i] for i in front.tolist()] for front in pareto.fronts_from_ranks(ranks)]
+
+
+def _select(pop: Population, mu: int) -> Population:
+    """Return the ``mu`` best members of ``pop`` by rank then crowding."""
+
+    ranks, crowd, order = pareto.survivor_order(_fitness_matrix(pop))
+    for ind, r, c in zip(pop, ranks.tolist(), crowd.tolist()):
+        ind.rank = r
+        ind.crowd = c
+    return [pop[i] for i in order[:mu].tolist()]
 
 
 def _evolve_step(
@@ -141,10 +139,12 @@ def _evolve_step(
     crossover_rate: float,
     novelty: NoveltyIndex | None = None,
     critics: Iterable[Callable[[List[float]], float]] | None = None,
+    executor: evaluation.EvaluationExecutor | str | None = None,
+    cache: evaluation.FitnessCache | None = None,
 ) -> Population:
     """Return the next generation from ``pop`` using NSGA‑II."""
 
-    evaluate(pop, fn, novelty, critics)
+    evaluate(pop, fn, novelty, critics, executor=executor, cache=cache)
     mu = len(pop)
     genome_length = len(pop[0].genome)
     offspring: Population = []
@@ -162,17 +162,8 @@ def _evolve_step(
             idx = rng.randrange(genome_length)
             child_genome[idx] += rng.uniform(-1, 1)
         offspring.append(Individual(child_genome))
-    evaluate(offspring, fn, novelty, critics)
-    union = pop + offspring
-    fronts = _non_dominated_sort(union)
-    new_pop: Population = []
-    for front in fronts:
-        _crowding(front)
-        front.sort(key=lambda x: (-x.rank, -x.crowd))
-        for ind in front:
-            if len(new_pop) < mu:
-                new_pop.append(ind)
-    return new_pop
+    evaluate(offspring, fn, novelty, critics, executor=executor, cache=cache)
+    return _select(pop + offspring, mu)
 
 
 def run_evolution(
@@ -189,6 +180,8 @@ def run_evolution(
     exchange_interval: int = 5,
     novelty_index: NoveltyIndex | None = None,
     critics: Iterable[Callable[[List[float]], float]] | None = None,
+    executor: evaluation.EvaluationExecutor | str | None = None,
+    cache: evaluation.FitnessCache | None = None,
 ) -> Population:
     """Run an NSGA-II optimisation.
 
@@ -203,6 +196,12 @@ def run_evolution(
         scenario_hash: Key identifying the island population.
         populations: Mapping of existing island populations.
         exchange_interval: Exchange elites every ``exchange_interval`` generations.
+        novelty_index: Optional index adding a novelty objective.
+        critics: Extra scoring callables appended to the objectives.
+        executor: Evaluation back-end or its name (``serial``, ``thread`` or
+            ``process``). Defaults to ``$MATS_EXECUTOR`` or ``serial``.
+        cache: Fitness cache shared across generations. A fresh cache is
+            created when omitted.
 
     Returns:
         The final population after ``generations`` steps.
@@ -212,6 +211,9 @@ def run_evolution(
     islands = populations if populations is not None else ISLANDS
     key = scenario_hash or "default"
     novelty = novelty_index
+    critics = tuple(critics or ())
+    exe = evaluation.get_executor(executor)
+    fit_cache = cache if cache is not None else evaluation.FitnessCache()
 
     pop = None if populations is None else islands.get(key)
     ISLAND_SEEDS[key] = seed
@@ -228,6 +230,8 @@ def run_evolution(
             crossover_rate=crossover_rate,
             novelty=novelty,
             critics=critics,
+            executor=exe,
+            cache=fit_cache,
         )
         islands[key] = pop
         if exchange_interval and (gen + 1) % exchange_interval == 0 and len(islands) > 1:
@@ -237,7 +241,7 @@ def run_evolution(
                 for ind in others:
                     repl = rng.randrange(len(island_pop))
                     island_pop[repl] = Individual(list(ind.genome))
-                evaluate(island_pop, fn, novelty, critics)
+                evaluate(island_pop, fn, novelty, critics, executor=exe, cache=fit_cache)
 
     return islands[key]
 
@@ -248,12 +252,6 @@ def pareto_front(pop: Population) -> Population:
     if not pop:
         return []
 
-    fits = np.asarray([ind.fitness for ind in pop], dtype=float)
-    dominated = np.zeros(len(pop), dtype=bool)
-    for i, fi in enumerate(fits):
-        dom = np.all(fi <= fits, axis=1) & np.any(fi < fits, axis=1)
-        dominated |= dom
-        dominated[i] = False
-    front = [ind for ind, d in zip(pop, dominated) if not d]
+    front = [ind for ind, keep in zip(pop, pareto.pareto_mask(_fitness_matrix(pop))) if keep]
     _crowding(front)
     return sorted(front, key=lambda x: -x.crowd)
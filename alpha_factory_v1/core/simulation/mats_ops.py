@@ -118,56 +118,29 @@ class SelfRewriteOperator:
         return text
 
     def _validate_patch(self, patch: str) -> bool:
-        """Apply ``patch`` in a temporary clone and run quality checks."""
+        """Apply ``patch`` in a pooled worktree and run quality checks."""
 
         from pathlib import Path
-        import shutil
         import subprocess
-        import tempfile
+
+        from alpha_factory_v1.core.self_evolution import worktree_pool
 
         try:
             root = Path(subprocess.check_output(["git", "rev-parse", "--show-toplevel"], text=True).strip())
-        except subprocess.CalledProcessError:
-            return False
-
-        with tempfile.TemporaryDirectory() as tmp:
-            try:
-                subprocess.run(
-                    ["git", "clone", "--local", str(root), tmp],
-                    check=True,
-                    stdout=subprocess.DEVNULL,
-                    stderr=subprocess.DEVNULL,
-                )
+            pool = worktree_pool.get_pool(root)
+            with pool.checkout() as tree:
                 apply = subprocess.run(
                     ["git", "apply", "-"],
                     input=patch.encode(),
-                    cwd=tmp,
+                    cwd=tree,
                     stdout=subprocess.DEVNULL,
                     stderr=subprocess.DEVNULL,
                 )
                 if apply.returncode != 0:
                     return False
-
-                checks = [
-                    ["pytest", "-q"],
-                    ["ruff", "."],
-                    ["bandit", "-q", "-r", "."],
-                ]
-                for cmd in checks:
-                    if shutil.which(cmd[0]) is None:
-                        continue
-                    proc = subprocess.run(
-                        cmd,
-                        cwd=tmp,
-                        stdout=subprocess.DEVNULL,
-                        stderr=subprocess.DEVNULL,
-                    )
-                    if proc.returncode != 0:
-                        return False
-            except Exception:
-                return False
-
-        return True
+                return worktree_pool.run_checks(tree, pool.cache)
+        except Exception:
+            return False
 
 
 def backtrack_boost(
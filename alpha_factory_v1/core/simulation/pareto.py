@@ -0,0 +1,260 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Vectorised Pareto ranking utilities.
+
+The helpers operate on a fitness matrix of shape ``(n, m)`` where every
+objective is minimised. Ranking uses the efficient non-dominated sort
+(ENS-BS) of Zhang et al.: points are visited in lexicographic order and
+binary-searched into the first front that does not dominate them. Two
+objective problems use an ``O(n log n)`` specialisation that only compares
+against the last member of each front, three objective problems keep a
+two dimensional staircase per front, and wider fitness vectors fall back to
+vectorised comparisons against each candidate front. Crowding distances are
+computed for all fronts at once with NumPy.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from typing import Sequence
+
+import numpy as np
+
+__all__ = [
+    "as_matrix",
+    "non_dominated_sort",
+    "fronts_from_ranks",
+    "crowding_distance",
+    "rank_and_crowd",
+    "survivor_order",
+    "pareto_mask",
+]
+
+
+def as_matrix(values: Sequence[Sequence[float]] | np.ndarray) -> np.ndarray:
+    """Return ``values`` as a two dimensional ``float64`` array."""
+
+    arr = np.asarray(values, dtype=float)
+    if arr.ndim == 1:
+        arr = arr.reshape(len(arr), -1) if arr.size else arr.reshape(0, 0)
+    if arr.ndim != 2:
+        raise ValueError("fitness matrix must be two dimensional")
+    return arr
+
+
+def _sort_2d(vals: np.ndarray, order: np.ndarray, ranks: np.ndarray) -> None:
+    # Within a front built in lexicographic order the second objective never
+    # increases, so only the last member of each front can dominate a newcomer.
+    keys: list[tuple[float, float]] = []
+    f0 = vals[:, 0].tolist()
+    f1 = vals[:, 1].tolist()
+    for idx in order.tolist():
+        key = (f1[idx], f0[idx])
+        k = bisect_left(keys, key)
+        if k == len(keys):
+            keys.append(key)
+        else:
+            keys[k] = key
+        ranks[idx] = k
+
+
+class _Staircase:
+    """Members of one front projected onto the last two objectives.
+
+    Only points that are not weakly dominated in the projection are kept,
+    ordered by increasing ``f1`` and therefore strictly decreasing ``f2``.
+    Because points arrive in lexicographic order every stored member already
+    has ``f0`` no larger than the newcomer.
+    """
+
+    __slots__ = ("f1", "f2", "f0")
+
+    def __init__(self) -> None:
+        self.f1: list[float] = []
+        self.f2: list[float] = []
+        self.f0: list[float] = []
+
+    def dominates(self, a: float, b: float, c: float) -> bool:
+        k = bisect_right(self.f1, b) - 1
+        if k < 0 or self.f2[k] > c:
+            return False
+        return not (self.f1[k] == b and self.f2[k] == c and self.f0[k] == a)
+
+    def append(self, a: float, b: float, c: float) -> None:
+        k = bisect_left(self.f1, b)
+        end = k
+        while end < len(self.f1) and self.f2[end] >= c:
+            end += 1
+        self.f1[k:end] = [b]
+        self.f2[k:end] = [c]
+        self.f0[k:end] = [a]
+
+
+def _sort_3d(vals: np.ndarray, order: np.ndarray, ranks: np.ndarray) -> None:
+    fronts: list[_Staircase] = []
+    cols = vals.T.tolist()
+    for idx in order.tolist():
+        a, b, c = cols[0][idx], cols[1][idx], cols[2][idx]
+        lo, hi = 0, len(fronts)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if fronts[mid].dominates(a, b, c):
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo == len(fronts):
+            fronts.append(_Staircase())
+        fronts[lo].append(a, b, c)
+        ranks[idx] = lo
+
+
+class _Front:
+    """Growable row buffer holding the members of one front."""
+
+    __slots__ = ("rows", "size")
+
+    def __init__(self, width: int) -> None:
+        self.rows = np.empty((8, width), dtype=float)
+        self.size = 0
+
+    def append(self, row: np.ndarray) -> None:
+        if self.size == len(self.rows):
+            grown = np.empty((2 * len(self.rows), self.rows.shape[1]), dtype=float)
+            grown[: self.size] = self.rows
+            self.rows = grown
+        self.rows[self.size] = row
+        self.size += 1
+
+    def dominates(self, row: np.ndarray) -> bool:
+        members = self.rows[: self.size]
+        le = np.all(members <= row, axis=1)
+        if not le.any():
+            return False
+        return bool(np.any(np.any(members[le] < row, axis=1)))
+
+
+def _sort_nd(vals: np.ndarray, order: np.ndarray, ranks: np.ndarray) -> None:
+    fronts: list[_Front] = []
+    width = vals.shape[1]
+    for idx in order.tolist():
+        row = vals[idx]
+        lo, hi = 0, len(fronts)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if fronts[mid].dominates(row):
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo == len(fronts):
+            fronts.append(_Front(width))
+        fronts[lo].append(row)
+        ranks[idx] = lo
+
+
+def non_dominated_sort(values: Sequence[Sequence[float]] | np.ndarray) -> np.ndarray:
+    """Return the Pareto rank of every row in ``values``.
+
+    Rank ``0`` denotes the non-dominated set. The result is an ``int64`` array
+    aligned with the rows of ``values``.
+    """
+
+    vals = as_matrix(values)
+    n = len(vals)
+    ranks = np.zeros(n, dtype=np.int64)
+    if n == 0 or vals.shape[1] == 0:
+        return ranks
+    if vals.shape[1] == 1:
+        _, inv = np.unique(vals[:, 0], return_inverse=True)
+        return inv.astype(np.int64)
+    order = np.lexsort(vals.T[::-1])
+    if vals.shape[1] == 2:
+        _sort_2d(vals, order, ranks)
+    elif vals.shape[1] == 3:
+        _sort_3d(vals, order, ranks)
+    else:
+        _sort_nd(vals, order, ranks)
+    return ranks
+
+
+def fronts_from_ranks(ranks: np.ndarray) -> list[np.ndarray]:
+    """Group row indices by rank, best front first."""
+
+    if not len(ranks):
+        return []
+    order = np.argsort(ranks, kind="stable")
+    bounds = np.flatnonzero(np.diff(ranks[order])) + 1
+    return list(np.split(order, bounds))
+
+
+def _crowding(vals: np.ndarray, rk: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Return crowding distances and the row order left by the last objective sort."""
+
+    n = len(vals)
+    crowd = np.zeros(n, dtype=float)
+    if n == 0:
+        return crowd, np.arange(0)
+    boundary = np.zeros(n, dtype=bool)
+    order = np.arange(n)
+    for i in range(vals.shape[1]):
+        # Chain the stable sorts so ties keep the order left by the previous
+        # objective, matching an in-place ``list.sort`` per objective.
+        col = vals[:, i]
+        order = order[np.lexsort((col[order], rk[order]))]
+        srt = col[order]
+        srk = rk[order]
+        starts = np.flatnonzero(np.r_[True, srk[1:] != srk[:-1]])
+        ends = np.r_[starts[1:], n] - 1
+        span = srt[ends] - srt[starts]
+        span[span == 0] = 1.0
+        seg = np.repeat(np.arange(len(starts)), np.diff(np.r_[starts, n]))
+        gap = np.zeros(n, dtype=float)
+        if n > 2:
+            gap[1:-1] = (srt[2:] - srt[:-2]) / span[seg[1:-1]]
+        gap[starts] = 0.0
+        gap[ends] = 0.0
+        crowd[order] += gap
+        boundary[order[starts]] = True
+        boundary[order[ends]] = True
+    crowd[boundary] = np.inf
+    return crowd, order
+
+
+def crowding_distance(values: Sequence[Sequence[float]] | np.ndarray, ranks: np.ndarray | None = None) -> np.ndarray:
+    """Return NSGA-II crowding distances computed within each front.
+
+    When ``ranks`` is omitted all rows are treated as a single front. Boundary
+    points of every front receive ``inf``.
+    """
+
+    vals = as_matrix(values)
+    rk = np.zeros(len(vals), dtype=np.int64) if ranks is None else np.asarray(ranks, dtype=np.int64)
+    return _crowding(vals, rk)[0]
+
+
+def rank_and_crowd(values: Sequence[Sequence[float]] | np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Return ``(ranks, crowding)`` arrays for ``values``."""
+
+    vals = as_matrix(values)
+    ranks = non_dominated_sort(vals)
+    return ranks, crowding_distance(vals, ranks)
+
+
+def survivor_order(values: Sequence[Sequence[float]] | np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Return ``(ranks, crowding, order)`` with ``order`` listing rows best first.
+
+    Rows sort by rank, then by descending crowding distance. Equal crowding
+    keeps the order left by the per-objective sorts, as the list-based
+    NSGA-II did, so seeded runs select the same survivors.
+    """
+
+    vals = as_matrix(values)
+    ranks = non_dominated_sort(vals)
+    crowd, chain = _crowding(vals, ranks.astype(np.int64))
+    pos = np.empty(len(vals), dtype=np.int64)
+    pos[chain] = np.arange(len(vals))
+    return ranks, crowd, np.lexsort((pos, -crowd, ranks))
+
+
+def pareto_mask(values: Sequence[Sequence[float]] | np.ndarray) -> np.ndarray:
+    """Return a boolean mask selecting the non-dominated rows of ``values``."""
+
+    return non_dominated_sort(values) == 0
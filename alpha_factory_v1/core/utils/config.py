@@ -107,6 +107,8 @@ class Settings(SettingsBase):
     offline: bool = Field(default=False, alias="AGI_INSIGHT_OFFLINE")
     bus_port: int = Field(default=6006, alias="AGI_INSIGHT_BUS_PORT")
     ledger_path: str = Field(default="./ledger/audit.db", alias="AGI_INSIGHT_LEDGER_PATH")
+    ledger_group_commit: bool = Field(default=False, alias="AGI_INSIGHT_LEDGER_GROUP_COMMIT")
+    ledger_durability: str = Field(default="full", alias="AGI_INSIGHT_LEDGER_DURABILITY")
     seed: Optional[int] = Field(default=None, alias="SEED")
     memory_path: Optional[str] = Field(default=None, alias="AGI_INSIGHT_MEMORY_PATH")
     broker_url: Optional[str] = Field(default=None, alias="AGI_INSIGHT_BROKER_URL")
@@ -114,6 +116,11 @@ class Settings(SettingsBase):
     bus_cert: Optional[str] = Field(default=None, alias="AGI_INSIGHT_BUS_CERT")
     bus_key: Optional[str] = Field(default=None, alias="AGI_INSIGHT_BUS_KEY")
     bus_fail_limit: int = Field(default=3, alias="AGI_INSIGHT_BUS_FAIL_LIMIT")
+    bus_codec: str = Field(default="json", alias="AGI_INSIGHT_BUS_CODEC")
+    bus_codecs: Optional[str] = Field(default=None, alias="AGI_INSIGHT_BUS_CODECS")
+    bus_queue_size: int = Field(default=1024, alias="AGI_INSIGHT_BUS_QUEUE_SIZE")
+    bus_workers: int = Field(default=4, alias="AGI_INSIGHT_BUS_WORKERS")
+    bus_overflow: str = Field(default="block", alias="AGI_INSIGHT_BUS_OVERFLOW")
     alert_webhook_url: Optional[str] = Field(default=None, alias="ALERT_WEBHOOK_URL")
     allow_insecure: bool = Field(default=False, alias="AGI_INSIGHT_ALLOW_INSECURE")
     broadcast: bool = Field(default=True, alias="AGI_INSIGHT_BROADCAST")
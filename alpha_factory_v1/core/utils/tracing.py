@@ -37,6 +37,9 @@ __all__ = [
     "span",
     "configure",
     "bus_messages_total",
+    "bus_queue_depth",
+    "bus_queue_lag_seconds",
+    "bus_dropped_total",
     "agent_cycle_seconds",
     "api_request_seconds",
 ]
@@ -48,10 +51,10 @@ try:
     import prometheus_client as pc
 
     prometheus_client = pc
-    from prometheus_client import Counter, Histogram
+    from prometheus_client import Counter, Gauge, Histogram
 except ModuleNotFoundError:  # pragma: no cover - optional
     prometheus_client = None
-    Counter = Histogram = None
+    Counter = Gauge = Histogram = None
 
 
 def _noop(*_a: Any, **_kw: Any) -> Any:
@@ -65,6 +68,9 @@ def _noop(*_a: Any, **_kw: Any) -> Any:
         def inc(self, *_a: Any) -> None:
             ...
 
+        def set(self, *_a: Any) -> None:
+            ...
+
     return _N()
 
 
@@ -80,6 +86,24 @@ if prometheus_client is not None:
         "Messages published on the internal bus",
         ["topic"],
     )
+    bus_queue_depth = _get_metric(
+        Gauge,
+        "bus_queue_depth",
+        "Envelopes waiting in a bus subscriber queue",
+        ["topic", "subscriber"],
+    )
+    bus_queue_lag_seconds = _get_metric(
+        Histogram,
+        "bus_queue_lag_seconds",
+        "Time envelopes spend queued before a handler picks them up",
+        ["topic"],
+    )
+    bus_dropped_total = _get_metric(
+        Counter,
+        "bus_dropped_total",
+        "Envelopes dropped because a subscriber queue was full",
+        ["topic", "reason"],
+    )
     agent_cycle_seconds = _get_metric(
         Histogram,
         "agent_cycle_seconds",
@@ -94,6 +118,9 @@ if prometheus_client is not None:
     )
 else:  # pragma: no cover - prometheus not installed
     bus_messages_total = _noop()
+    bus_queue_depth = _noop()
+    bus_queue_lag_seconds = _noop()
+    bus_dropped_total = _noop()
     agent_cycle_seconds = _noop()
     api_request_seconds = _noop()
 
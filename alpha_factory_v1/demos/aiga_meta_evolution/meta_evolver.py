@@ -12,7 +12,10 @@ MetaEvolver v3.0 (2025‑04‑23)
   from a laptop to a Kubernetes Ray cluster with zero code changes.
 ✦ **Pillar coverage**  Architecture, plasticity rule, and environment co‑evolve.
 ✦ **Observability**  Prometheus gauges, structured logs, population SHA.
-✦ **Fail‑safe parallelism**  Ray ➜ multiprocessing ➜ ThreadPool cascade.
+✦ **Fail‑safe parallelism**  Ray ➜ multiprocessing ➜ ThreadPool cascade. The
+  multiprocessing tier is a long‑lived pool whose workers keep the environment
+  and recently used networks warm; genomes travel as rows of a shared‑memory
+  array and novelty is scored in the parent by k‑NN over an incremental archive.
 ✦ **Audit hooks**  JSON checkpoints (atomic), population hash, deterministic RNG.
 ✦ **Extensibility**  Plug‑in novelty metrics, LLM commentary, A2A broadcast.
 """
@@ -26,12 +29,16 @@ import logging
 import math
 import os
 import pathlib
+import pickle
 import random
 import contextlib
+import weakref
+from collections import OrderedDict
 from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime, timezone
-from functools import cached_property
-from typing import Callable, List, Tuple
+from multiprocessing import shared_memory
+from typing import Any, Callable, List, Sequence, Tuple
 
 try:
     import numpy as np
@@ -182,7 +189,7 @@ class Genome:
     def from_json(js: str | dict) -> "Genome":
         return Genome(**(json.loads(js) if isinstance(js, str) else js))
 
-    @cached_property
+    @property
     def sha(self) -> str:
         return hashlib.sha256(self.to_json().encode()).hexdigest()[:12]
 
@@ -221,6 +228,178 @@ class EvoNet(nn.Module):
         return h
 
 
+def _rollout(env, net) -> Tuple[float, np.ndarray]:
+    """Run one episode of ``net`` in ``env`` and return reward and mean observation."""
+    obs, _ = env.reset()
+    total, bc = 0.0, []
+    for _ in range(env.genome.max_steps):
+        with torch.no_grad():
+            a = net(torch.tensor(obs, dtype=torch.float32, device=Device)).argmax().item()
+        obs, rew, done, truncated, _ = env.step(a)
+        total += rew
+        bc.append(obs)
+        if done or truncated:
+            break
+    return total, np.mean(bc, axis=0)
+
+
+# ───────────────────────── novelty archive ────────────────────────────────
+class NoveltyIndex:
+    """Growable archive of behaviour vectors scored by k‑nearest‑neighbour distance.
+
+    Vectors live in one preallocated matrix together with their squared norms,
+    so adding a generation is an amortised copy and scoring a whole population
+    is a single matrix product.
+    """
+
+    def __init__(self, k: int = 15) -> None:
+        self.k = k
+        self._data: np.ndarray | None = None
+        self._sq: np.ndarray | None = None
+        self._n = 0
+
+    def __len__(self) -> int:
+        return self._n
+
+    def add(self, vecs: Sequence[np.ndarray] | np.ndarray) -> None:
+        arr = np.atleast_2d(np.asarray(vecs, dtype=np.float64))
+        if not arr.size:
+            return
+        if self._data is None:
+            self._data = np.empty((max(64, len(arr)), arr.shape[1]))
+            self._sq = np.empty(len(self._data))
+        need = self._n + len(arr)
+        if need > len(self._data):
+            cap = max(need, 2 * len(self._data))
+            self._data = np.resize(self._data, (cap, arr.shape[1]))
+            self._sq = np.resize(self._sq, cap)
+        self._data[self._n : need] = arr
+        self._sq[self._n : need] = np.einsum("ij,ij->i", arr, arr)
+        self._n = need
+
+    def novelty(self, vecs: Sequence[np.ndarray] | np.ndarray) -> np.ndarray:
+        """Return the mean distance of each vector to its ``k`` nearest archived ones."""
+        arr = np.atleast_2d(np.asarray(vecs, dtype=np.float64))
+        if not self._n:
+            return np.zeros(len(arr))
+        data, sq = self._data[: self._n], self._sq[: self._n]
+        d2 = np.einsum("ij,ij->i", arr, arr)[:, None] + sq[None, :] - 2.0 * arr @ data.T
+        dist = np.sqrt(np.maximum(d2, 0.0))
+        k = min(self.k, self._n)
+        if k < self._n:
+            dist = np.partition(dist, k - 1, axis=1)[:, :k]
+        return dist.mean(axis=1)
+
+    def tail(self, n: int) -> np.ndarray:
+        """Return the ``n`` most recently added vectors."""
+        if self._data is None:
+            return np.empty((0, 0))
+        return self._data[max(0, self._n - n) : self._n].copy()
+
+    def clear(self) -> None:
+        self._data = self._sq = None
+        self._n = 0
+
+
+# ──────────────────────── persistent eval pool ────────────────────────────
+_NET_CACHE = 64  # warm networks kept per worker
+
+# per-process worker state, populated by ``_pool_init``
+_WORKER: dict[str, Any] = {}
+
+
+def _encode_genomes(pop: Sequence[Genome], out: np.ndarray) -> None:
+    names = list(_ACT)
+    for row, g in zip(out, pop):
+        row[:4] = (names.index(g.activation), g.hebbian, g.novelty_weight, len(g.layers))
+        row[4 : 4 + len(g.layers)] = g.layers
+
+
+def _decode_genome(row: np.ndarray) -> Genome:
+    n = int(row[3])
+    return Genome(
+        layers=tuple(int(x) for x in row[4 : 4 + n]),
+        activation=list(_ACT)[int(row[0])],
+        hebbian=bool(row[1]),
+        novelty_weight=float(row[2]),
+    )
+
+
+def _pool_init(env_cls: Callable) -> None:
+    _WORKER.update(env_cls=env_cls, env=None, base=None, nets=OrderedDict(), shm={})
+
+
+def _pool_eval(name: str, shape: Tuple[int, int], idx: int) -> Tuple[float, np.ndarray]:
+    blocks = _WORKER["shm"]
+    shm = blocks.get(name)
+    if shm is None:  # new generation block; drop the previous one
+        for old in blocks.values():
+            old.close()
+        blocks.clear()
+        shm = blocks[name] = shared_memory.SharedMemory(name=name)
+    g = _decode_genome(np.ndarray(shape, dtype=np.float64, buffer=shm.buf)[idx].copy())
+
+    env = _WORKER["env"]
+    if env is None:
+        env = _WORKER["env"] = _WORKER["env_cls"]()
+        _WORKER["base"] = getattr(env, "genome", None)
+    elif _WORKER["base"] is not None:
+        env.genome = _WORKER["base"]  # undo curriculum progress from earlier episodes
+
+    nets = _WORKER["nets"]
+    key = g.to_json()
+    cached = nets.pop(key, None)
+    if cached is None:
+        net = EvoNet(env.observation_space.shape[0], env.action_space.n, g).to(Device)
+        cached = (net, copy.deepcopy(net.state_dict()))
+    else:
+        net, state = cached
+        net.load_state_dict(state)
+        if g.hebbian:
+            net.hFast = torch.zeros_like(next(net.model.parameters()))
+    nets[key] = cached
+    while len(nets) > _NET_CACHE:
+        nets.popitem(last=False)
+    return _rollout(env, net)
+
+
+class _EvalPool:
+    """Process pool reused across generations, fed through one shared-memory block."""
+
+    def __init__(self, env_cls: Callable) -> None:
+        self.pool = ProcessPoolExecutor(initializer=_pool_init, initargs=(env_cls,))
+        self._shm: List[shared_memory.SharedMemory | None] = [None]
+        self._finalizer = weakref.finalize(self, _EvalPool._release, self.pool, self._shm)
+
+    @staticmethod
+    def _release(pool: ProcessPoolExecutor, shm: List[shared_memory.SharedMemory | None]) -> None:
+        pool.shutdown(wait=True, cancel_futures=True)
+        _EvalPool._unlink(shm)
+
+    @staticmethod
+    def _unlink(shm: List[shared_memory.SharedMemory | None]) -> None:
+        if shm[0] is not None:
+            shm[0].close()
+            shm[0].unlink()
+            shm[0] = None
+
+    def map(self, pop: Sequence[Genome]) -> List[Tuple[float, np.ndarray]]:
+        """Evaluate ``pop`` and return ``(reward, behaviour)`` per genome."""
+        shape = (len(pop), 4 + max(len(g.layers) for g in pop))
+        nbytes = shape[0] * shape[1] * 8
+        block = self._shm[0]
+        if block is None or block.size < nbytes:
+            self._unlink(self._shm)
+            block = self._shm[0] = shared_memory.SharedMemory(create=True, size=nbytes)
+        _encode_genomes(pop, np.ndarray(shape, dtype=np.float64, buffer=block.buf))
+        n = len(pop)
+        chunk = max(1, n // (4 * self.pool._max_workers))  # type: ignore[attr-defined]
+        return list(self.pool.map(_pool_eval, [block.name] * n, [shape] * n, range(n), chunksize=chunk))
+
+    def close(self) -> None:
+        self._finalizer()
+
+
 # ────────────────────────── MetaEvolver core ──────────────────────────────
 class MetaEvolver:
     def __init__(
@@ -256,7 +435,8 @@ class MetaEvolver:
         self.rng = random.Random(seed)
         self.gen = 0
         self.history: List[Tuple[int, float]] = []
-        self._archive: List[np.ndarray] = []
+        self._archive = NoveltyIndex()
+        self._pool: _EvalPool | None = None
         self._best_fitness = -math.inf
         self.best_genome: Genome | None = None
         self._last_scores: List[float] = []
@@ -285,46 +465,15 @@ class MetaEvolver:
 
     # evaluation util ------------------------------------------------------
     def _simulate(self, g: Genome) -> Tuple[float, np.ndarray]:
-        env = self.env_cls()
-        obs_dim, act_dim = env.observation_space.shape[0], env.action_space.n
-        net = EvoNet(obs_dim, act_dim, g).to(Device)
-        obs, _ = env.reset()
-        total, bc = 0.0, []
-        for _ in range(env.genome.max_steps):
-            with torch.no_grad():
-                a = net(torch.tensor(obs, dtype=torch.float32, device=Device)).argmax().item()
-            obs, rew, done, truncated, _ = env.step(a)
-            total += rew
-            bc.append(obs)
-            if done or truncated:
-                break
-        bc_vec = np.mean(bc, axis=0)
-        if g.novelty_weight and self._archive:
-            novelty = float(np.mean([np.linalg.norm(bc_vec - a) for a in self._archive]))
-            total += g.novelty_weight * novelty
-        return total, bc_vec
+        return self._simulate_worker(self.env_cls, g.to_json())
 
     @staticmethod
-    def _simulate_worker(env_cls, archive, js: str):
+    def _simulate_worker(env_cls, js: str):
         g = Genome.from_json(js)
         env = env_cls()
         obs_dim, act_dim = env.observation_space.shape[0], env.action_space.n
         net = EvoNet(obs_dim, act_dim, g).to(Device)
-        obs, _ = env.reset()
-        total, bc = 0.0, []
-        for _ in range(env.genome.max_steps):
-            with torch.no_grad():
-                a = net(torch.tensor(obs, dtype=torch.float32, device=Device)).argmax().item()
-            obs, rew, done, truncated, _ = env.step(a)
-            total += rew
-            bc.append(obs)
-            if done or truncated:
-                break
-        bc_vec = np.mean(bc, axis=0)
-        if g.novelty_weight and archive:
-            novelty = float(np.mean([np.linalg.norm(bc_vec - a) for a in archive]))
-            total += g.novelty_weight * novelty
-        return total, bc_vec
+        return _rollout(env, net)
 
     # -------- parallel dispatch ------------------------------------------
     def _evaluate_population(self) -> List[float]:
@@ -334,19 +483,29 @@ class MetaEvolver:
 
     def _ray_eval(self):
         env_cls = self.env_cls
-        archive = self._archive.copy()
 
         @ray.remote
         def _worker(js: str):
-            return MetaEvolver._simulate_worker(env_cls, archive, js)
+            return MetaEvolver._simulate_worker(env_cls, js)
 
         futures = [_worker.remote(g.to_json()) for g in self.population]
         results = ray.get(futures)
         return self._post_eval(results)
 
     def _mp_eval(self):
-        with ProcessPoolExecutor() as pool:
-            results = list(pool.map(self._simulate, self.population))
+        if self._pool is None:
+            try:
+                pickle.dumps(self.env_cls)
+            except Exception:
+                LOG.warning("env_cls is not picklable; evaluating in threads")
+                return self._thread_eval()
+            self._pool = _EvalPool(self.env_cls)
+        try:
+            results = self._pool.map(self.population)
+        except BrokenProcessPool:
+            LOG.warning("evaluation pool died; retrying generation in threads", exc_info=True)
+            self.close()
+            return self._thread_eval()
         return self._post_eval(results)
 
     def _thread_eval(self):
@@ -356,8 +515,18 @@ class MetaEvolver:
 
     def _post_eval(self, results):
         scores, bcs = zip(*results)
-        self._archive.extend(bcs[-64:])
-        return list(scores)
+        bcs = np.stack(bcs)
+        if len(self._archive):
+            weights = np.array([g.novelty_weight for g in self.population])
+            scores = np.asarray(scores, dtype=np.float64) + weights * self._archive.novelty(bcs)
+        self._archive.add(bcs[-64:])
+        return [float(s) for s in scores]
+
+    def close(self) -> None:
+        """Shut down the evaluation worker pool, if one was started."""
+        if self._pool is not None:
+            self._pool.close()
+            self._pool = None
 
     # tournament -----------------------------------------------------------
     def _select(self, scores, k=3):
@@ -395,7 +564,7 @@ class MetaEvolver:
             "gen": self.gen,
             "pop": [g.to_json() for g in self.population],
             "hist": self.history,
-            "arc": [a.tolist() for a in self._archive[-256:]],
+            "arc": self._archive.tail(256).tolist(),
             "seed": self.rng.random(),
             "sha": self.population_sha(),
             "best_fitness": self._best_fitness,
@@ -432,7 +601,9 @@ class MetaEvolver:
         self.gen = js["gen"]
         self.population = [Genome.from_json(j) for j in js["pop"]]
         self.history = js.get("hist", [])
-        self._archive = [np.array(a) for a in js.get("arc", [])]
+        self._archive.clear()
+        if js.get("arc"):
+            self._archive.add(np.array(js["arc"]))
         self.rng.seed(js.get("seed", 0))
         self._best_fitness = js.get("best_fitness", -math.inf)
         bg = js.get("best_genome")
@@ -90,7 +90,7 @@ LLM = OpenAIAgent(
 # ─────────────────────────── Globals ────────────────────────────────
 PORTFOLIO_USD: float = float(os.getenv("DEFAULT_PORTFOLIO_USD", "2000000"))
 LIVE_FEED: bool = bool(int(os.getenv("LIVE_FEED", "0")))
-simulator: MonteCarloSimulator = MonteCarloSimulator()
+simulator: MonteCarloSimulator = MonteCarloSimulator(workers=int(os.getenv("MC_WORKERS", "0")))
 event_iter: AsyncIterator[dict[str, Any]] = stream_macro_events(live=LIVE_FEED)
 
 
@@ -116,9 +116,9 @@ async def mc_risk(event: dict[str, Any], portfolio: float = PORTFOLIO_USD) -> di
     Returns:
         Dictionary with hedging information and return scenarios.
     """
-    factors = simulator.simulate(event)
-    hedge = simulator.hedge(factors, portfolio)
-    scen = simulator.scenario_table(factors).to_dict(orient="records")
+    stats = simulator.simulate_stats(event)
+    hedge = simulator.hedge(stats, portfolio)
+    scen = simulator.scenario_table(stats).to_dict(orient="records")
     return {"hedge": hedge, "scenarios": scen}
 
 
@@ -15,11 +15,16 @@ New in this revision
 ▪ `scenario_table()` helper returns P50 / P95 / P99 distributions for UI
 ▪ 100 % self-contained; no external data fetch at import-time
 ▪ Optional seed parameter enables deterministic results
+▪ Paths are generated in fixed-size blocks; `simulate_stats()` folds each block
+  into a streaming `RiskStats` (moments + t-digest) and can fan blocks out
+  across processes, so memory stays flat however many paths are requested
 """
 
 from __future__ import annotations
 
+import math
 import random
+from concurrent.futures import ProcessPoolExecutor
 
 try:  # optional deps
     import numpy as np
@@ -27,7 +32,7 @@ try:  # optional deps
 except ModuleNotFoundError:  # pragma: no cover - simplified fallback
     np = None
     pd = None
-from typing import Dict, Sequence, Any
+from typing import Dict, Sequence, Any, List, Tuple
 
 # ─────────────────────────  calibration constants  ──────────────────────────
 
@@ -58,19 +63,142 @@ def _choose_dv01(years: int = 10) -> float:
     return DV01_TABLE.get(years, DV01_TABLE[10])
 
 
+# ─────────────────────────  streaming statistics  ───────────────────────────
+class RiskStats:
+    """Constant-memory summary of a stream of ES factors.
+
+    Moments are combined with the pairwise update of Chan/Pébay, so blocks can
+    be folded in any grouping. Quantiles come from a merging t-digest whose
+    centroids shrink towards the tails, where VaR and CVaR are read off.
+    """
+
+    def __init__(self, compression: int = 500) -> None:
+        self.compression = compression
+        self.n = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self._m3 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+        self._means = np.empty(0)
+        self._weights = np.empty(0)
+
+    def __len__(self) -> int:
+        return self.n
+
+    def update(self, values: Any) -> "RiskStats":
+        """Fold a block of observations into the summary."""
+        x = np.asarray(values, dtype=np.float64).ravel()
+        if not x.size:
+            return self
+        mean = float(x.mean())
+        d = x - mean
+        self._combine(x.size, mean, float(d @ d), float((d * d) @ d), float(x.min()), float(x.max()))
+        self._digest(np.concatenate([self._means, x]), np.concatenate([self._weights, np.ones(x.size)]))
+        return self
+
+    def merge(self, other: "RiskStats") -> "RiskStats":
+        """Fold another summary into this one."""
+        if other.n:
+            self._combine(other.n, other.mean, other._m2, other._m3, other.min, other.max)
+            self._digest(
+                np.concatenate([self._means, other._means]),
+                np.concatenate([self._weights, other._weights]),
+            )
+        return self
+
+    def _combine(self, nb: int, mb: float, m2b: float, m3b: float, lo: float, hi: float) -> None:
+        na, n = self.n, self.n + nb
+        delta = mb - self.mean
+        self._m3 += m3b + delta**3 * na * nb * (na - nb) / n**2 + 3 * delta * (na * m2b - nb * self._m2) / n
+        self._m2 += m2b + delta**2 * na * nb / n
+        self.mean += delta * nb / n
+        self.n = n
+        self.min, self.max = min(self.min, lo), max(self.max, hi)
+
+    def _digest(self, means: Any, weights: Any) -> None:
+        order = np.argsort(means, kind="stable")
+        means, weights = means[order], weights[order]
+        cum = np.cumsum(weights)
+        q = (cum - weights / 2) / cum[-1]
+        # k1 scale: centroids cover at most one unit of k, so they are tiny near q=0 and q=1
+        k = np.floor(self.compression * (np.arcsin(2 * q - 1) / np.pi + 0.5))
+        starts = np.flatnonzero(np.r_[True, k[1:] != k[:-1]])
+        self._weights = np.add.reduceat(weights, starts)
+        self._means = np.add.reduceat(means * weights, starts) / self._weights
+
+    def quantile(self, q: float) -> float:
+        """Return the estimated ``q`` quantile."""
+        if not self.n:
+            return math.nan
+        centres = np.cumsum(self._weights) - self._weights / 2
+        xs = np.r_[0.0, centres, float(self.n)]
+        ys = np.r_[self.min, self._means, self.max]
+        return float(np.interp(q * self.n, xs, ys))
+
+    def tail_mean(self, q: float) -> float:
+        """Return the mean of the lowest ``q`` fraction of observations."""
+        if not self.n:
+            return math.nan
+        cut = max(q * self.n, 1.0)
+        before = np.cumsum(self._weights) - self._weights
+        take = np.clip(cut - before, 0.0, self._weights)
+        return float(take @ self._means / take.sum())
+
+    @property
+    def std(self) -> float:
+        return math.sqrt(self._m2 / self.n) if self.n else 0.0
+
+    @property
+    def skew(self) -> float:
+        return math.sqrt(self.n) * self._m3 / self._m2**1.5 if self._m2 else 0.0
+
+
+def _block_log_es(rng: Any, high: Any, horizon: int, drift: float, rows: Tuple[Any, Any]) -> Any:
+    """Return terminal ES log-returns for the block of paths flagged by ``high``.
+
+    Only the ES leg of each correlated shock is needed, so each path applies
+    its regime's Cholesky row to the noise instead of the full matrix.
+    """
+    chol_es = np.where(high[:, None], rows[1], rows[0])
+    noise = rng.standard_normal((len(high), horizon, 3))
+    return horizon * drift + np.einsum("phk,pk->p", noise, chol_es)
+
+
+def _simulate_block(
+    seed: Any, size: int, horizon: int, drift: float, rows: Tuple[Any, Any], compression: int
+) -> RiskStats:
+    """Simulate ``size`` paths from ``seed`` and summarise their ES factors."""
+    rng = np.random.default_rng(seed)
+    high = rng.random(size) < P_SWITCH  # regime flag per path
+    return RiskStats(compression).update(np.exp(_block_log_es(rng, high, horizon, drift, rows)))
+
+
 # ─────────────────────────  simulator class  ────────────────────────────────
 class MonteCarloSimulator:
     """Simple Monte-Carlo engine for ES factor shocks."""
 
-    def __init__(self, n_paths: int = 20_000, horizon: int = 30, seed: int | None = None):
+    def __init__(
+        self,
+        n_paths: int = 20_000,
+        horizon: int = 30,
+        seed: int | None = None,
+        *,
+        block_size: int = 8192,
+        workers: int = 0,
+    ):
         """Create a simulator.
 
         Args:
             n_paths: Number of Monte-Carlo scenarios.
             horizon: Days to simulate.
             seed: Optional RNG seed for deterministic results.
+            block_size: Paths generated per block; bounds working memory.
+            workers: Processes used by :meth:`simulate_stats` (``0`` runs in-process).
         """
         self.n, self.h = n_paths, horizon
+        self.block_size = max(1, block_size)
+        self.workers = workers
         self.dt = 1.0
         self.beta_slope = -8.1e-3  # from 2019-24 OLS
         self.beta_flow = 9.7e-5
@@ -97,6 +225,10 @@ class MonteCarloSimulator:
         Σ = np.diag([VOL_SLOPE, VOL_FLOW, SIGMA_HIGH])
         return np.linalg.cholesky(Σ @ RHO @ Σ)
 
+    def _blocks(self) -> List[int]:
+        full, rest = divmod(self.n, self.block_size)
+        return [self.block_size] * full + ([rest] if rest else [])
+
     # ─────────── public API ───────────
     def simulate(self, obs: Dict[str, float]) -> Any:
         """Simulate ES price factors given current observations."""
@@ -108,55 +240,87 @@ class MonteCarloSimulator:
                     val *= 1.0 + self.rng.gauss(0, 0.01)
                 vals.append(val)
             return vals
-        mu = self._drift_vec(obs)
-        high = self.rng.random(self.n) < P_SWITCH  # regime flag per path
-        chol = np.where(high[:, None, None], self._chol(True), CHOL_LOW)
+        drift = float(self._drift_vec(obs)[2]) * self.dt
+        rows = (CHOL_LOW[2], self._chol(True)[2])
+        # all regime flags come first so the normals follow the same stream
+        # as an unblocked draw and seeded results do not depend on block_size
+        high = self.rng.random(self.n) < P_SWITCH
+        out = np.empty(self.n)
+        start = 0
+        for size in self._blocks():
+            out[start : start + size] = _block_log_es(self.rng, high[start : start + size], self.h, drift, rows)
+            start += size
+        return pd.Series(np.exp(out, out=out), name="es_factor")
+
+    def simulate_stats(self, obs: Dict[str, float], *, compression: int = 500) -> Any:
+        """Simulate ES factors and return a streaming :class:`RiskStats` summary.
 
-        noise = self.rng.standard_normal((self.n, self.h, 3))
-        shocks = (chol[:, None] @ noise[..., None]).squeeze(-1)
-        steps = mu * self.dt + shocks
-        log_es = steps[..., 2].sum(axis=1)
-        return pd.Series(np.exp(log_es), name="es_factor")
+        Memory is bounded by one block per worker regardless of ``n_paths``.
+        Each block draws from its own child seed, so results do not depend on
+        the number of workers. Without numpy the raw scenario list is returned.
+        """
+        if np is None or pd is None:  # pragma: no cover - simplified fallback
+            return self.simulate(obs)
+        drift = float(self._drift_vec(obs)[2]) * self.dt
+        rows = (CHOL_LOW[2], self._chol(True)[2])
+        sizes = self._blocks()
+        seeds = np.random.SeedSequence(int(self.rng.integers(2**63))).spawn(len(sizes))
+        args = [(seed, size, self.h, drift, rows, compression) for seed, size in zip(seeds, sizes)]
+        stats = RiskStats(compression)
+        if self.workers > 0 and len(args) > 1:
+            with ProcessPoolExecutor(self.workers) as pool:
+                for part in pool.map(_simulate_block, *zip(*args)):
+                    stats.merge(part)
+        else:
+            for a in args:
+                stats.merge(_simulate_block(*a))
+        return stats
 
     @staticmethod
-    def var(s: Sequence[float], a: float = 0.05) -> Any:
+    def var(s: Sequence[float] | RiskStats, a: float = 0.05) -> Any:
         """Return the ``a`` percentile minus one."""
-        data = list(s)
+        if isinstance(s, RiskStats):
+            return s.quantile(a) - 1
         if np is not None:
-            return float(np.percentile(data, a * 100)) - 1
+            return float(np.percentile(np.asarray(s, dtype=np.float64), a * 100)) - 1
+        data = list(s)
         data.sort()
         idx = max(0, int(len(data) * a) - 1)
         return data[idx] - 1
 
     @staticmethod
-    def cvar(s: Sequence[float], a: float = 0.05) -> Any:
+    def cvar(s: Sequence[float] | RiskStats, a: float = 0.05) -> Any:
         """Return expected value below the ``a`` percentile minus one."""
-        data = list(s)
+        if isinstance(s, RiskStats):
+            return s.tail_mean(a) - 1
         if np is not None:
-            thr = np.percentile(data, a * 100)
-            return float(np.mean([x for x in data if x <= thr])) - 1
+            arr = np.asarray(s, dtype=np.float64)
+            return float(arr[arr <= np.percentile(arr, a * 100)].mean()) - 1
+        data = list(s)
         data.sort()
         cut = int(len(data) * a)
         subset = data[:cut] if cut else data[:1]
         return sum(subset) / len(subset) - 1
 
     @staticmethod
-    def skew(s: Sequence[float]) -> Any:
+    def skew(s: Sequence[float] | RiskStats) -> Any:
         """Compute sample skewness of ``s``."""
-        data = list(s)
+        if isinstance(s, RiskStats):
+            return s.skew
         if np is not None:
-            arr = np.array(data)
+            arr = np.asarray(s, dtype=np.float64)
             return float(((arr - arr.mean()) ** 3).mean() / arr.std() ** 3)
+        data = list(s)
         m = sum(data) / len(data)
         var = sum((x - m) ** 2 for x in data) / len(data)
         std = var**0.5
         return sum((x - m) ** 3 for x in data) / len(data) / (std**3 if std else 1)
 
-    def hedge(self, s: Sequence[float], port_usd: float, swap_tenor: int = 10) -> Dict[str, Any]:
+    def hedge(self, s: Sequence[float] | RiskStats, port_usd: float, swap_tenor: int = 10) -> Dict[str, Any]:
         """Return hedge notionals and risk metrics.
 
         Args:
-            s: Scenario results as ES factors.
+            s: Scenario results as ES factors, or their :class:`RiskStats`.
             port_usd: Portfolio value in USD.
             swap_tenor: Swap maturity in years.
 
@@ -176,17 +340,20 @@ class MonteCarloSimulator:
         }
 
     # convenience for UI
-    def scenario_table(self, s: Sequence[float]) -> Any:
+    def scenario_table(self, s: Sequence[float] | RiskStats) -> Any:
         """Return median, VaR 5 % and stress 1 % rows for UI tables."""
-        data = list(s)
         if np is not None and pd is not None:
-            quant = np.percentile(data, [50, 95, 99])
+            if isinstance(s, RiskStats):
+                quant = np.array([s.quantile(p / 100) for p in (50, 95, 99)])
+            else:
+                quant = np.percentile(np.asarray(s, dtype=np.float64), [50, 95, 99])
             return pd.DataFrame(
                 {
                     "Scenario": ["Median", "VaR 5 %", "Stress 1 %"],
                     "ES factor": quant.round(3),
                 }
             )
+        data = list(s)
         data.sort()
         n = len(data)
 
@@ -0,0 +1,151 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Leaf-parallel MuZero tree search over array-backed node storage.
+
+Edge statistics (visit counts, value sums, priors) live in contiguous
+``(nodes, actions)`` NumPy arrays and latent states in a ``(nodes, hidden)``
+matrix, so a search of ``n`` simulations allocates once up front. Each round
+walks ``batch_size`` simulations down the tree, applying a virtual loss to
+every edge taken so that concurrent walks spread over different leaves, then
+evaluates all pending leaves with a single ``recurrent_inference`` call.
+
+Any model exposing ``recurrent_inference(states, actions)`` that returns
+``(next_states, rewards, values, policy_logits)`` arrays can be searched;
+:class:`LinearMuNet` is a NumPy stand-in used when torch is unavailable.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import Protocol, Tuple
+
+import numpy as np
+
+__all__ = ["BatchedMCTS", "LinearMuNet", "RecurrentModel"]
+
+
+class RecurrentModel(Protocol):
+    def recurrent_inference(
+        self, states: np.ndarray, actions: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]: ...
+
+
+def _softmax(logits: np.ndarray) -> np.ndarray:
+    z = np.exp(logits - logits.max(axis=-1, keepdims=True))
+    return z / z.sum(axis=-1, keepdims=True)
+
+
+class LinearMuNet:
+    """Random linear world model with the MiniMuNet interface, in NumPy."""
+
+    def __init__(self, obs_dim: int, action_dim: int, hidden_dim: int = 32, seed: int = 0) -> None:
+        rng = np.random.default_rng(seed)
+        scale = 1 / math.sqrt(hidden_dim)
+        self.action_dim = action_dim
+        self.w_repr = rng.normal(0, 1 / math.sqrt(obs_dim), (obs_dim, hidden_dim)).astype(np.float32)
+        self.w_dyn = rng.normal(0, scale, (hidden_dim + action_dim, hidden_dim + 1)).astype(np.float32)
+        self.w_pol = rng.normal(0, scale, (hidden_dim, action_dim)).astype(np.float32)
+        self.w_val = rng.normal(0, scale, (hidden_dim, 1)).astype(np.float32)
+
+    def initial_inference(self, obs) -> Tuple[np.ndarray, float, np.ndarray]:
+        state = np.tanh(np.asarray(obs, dtype=np.float32) @ self.w_repr)
+        return state, float(state @ self.w_val[:, 0]), state @ self.w_pol
+
+    def recurrent_inference(
+        self, states: np.ndarray, actions: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        onehot = np.eye(self.action_dim, dtype=np.float32)[actions]
+        out = np.concatenate([states, onehot], axis=1) @ self.w_dyn
+        nxt = np.tanh(out[:, 1:])
+        return nxt, out[:, 0], (nxt @ self.w_val)[:, 0], nxt @ self.w_pol
+
+
+class BatchedMCTS:
+    """MuZero search that evaluates up to ``batch_size`` leaves per model call.
+
+    With ``batch_size=1`` this is the classic sequential search; larger
+    batches trade a little search quality (leaves are chosen before earlier
+    ones in the batch are backed up) for far fewer inference calls.
+    """
+
+    def __init__(
+        self,
+        action_dim: int,
+        *,
+        num_simulations: int = 64,
+        batch_size: int = 8,
+        c_puct: float = 1.5,
+        discount: float = 0.997,
+        virtual_loss: float = 1.0,
+    ) -> None:
+        self.action_dim = action_dim
+        self.num_simulations = num_simulations
+        self.batch_size = max(1, batch_size)
+        self.c_puct = c_puct
+        self.discount = discount
+        self.virtual_loss = virtual_loss
+        self.inference_calls = 0
+
+    def _reset(self, hidden_dim: int, dtype: np.dtype) -> None:
+        cap = self.num_simulations + 1
+        self.children = np.full((cap, self.action_dim), -1, dtype=np.int32)
+        self.visits = np.zeros((cap, self.action_dim), dtype=np.float64)
+        self.value_sum = np.zeros((cap, self.action_dim), dtype=np.float64)
+        self.prior = np.zeros((cap, self.action_dim), dtype=np.float64)
+        self.reward = np.zeros(cap, dtype=np.float64)
+        self.states = np.zeros((cap, hidden_dim), dtype=dtype)
+        self.size = 1
+
+    def _select(self, node: int) -> int:
+        n = self.visits[node]
+        q = np.divide(self.value_sum[node], n, out=np.zeros_like(n), where=n > 0)
+        ucb = q + self.c_puct * self.prior[node] * math.sqrt(n.sum() + 1) / (1 + n)
+        return int(np.argmax(ucb))
+
+    def _descend(self) -> Tuple[list[tuple[int, int]], int, int]:
+        """Walk to an unexpanded edge, applying virtual loss along the way."""
+
+        path: list[tuple[int, int]] = []
+        node = 0
+        while True:
+            action = self._select(node)
+            self.visits[node, action] += 1
+            self.value_sum[node, action] -= self.virtual_loss
+            path.append((node, action))
+            child = int(self.children[node, action])
+            if child < 0:
+                return path, node, action
+            node = child
+
+    def run(self, model: RecurrentModel, root_state: np.ndarray, root_logits: np.ndarray) -> np.ndarray:
+        """Search from ``root_state`` and return root visit counts per action."""
+
+        root_state = np.asarray(root_state)
+        self._reset(root_state.shape[-1], root_state.dtype)
+        self.states[0] = root_state
+        self.prior[0] = _softmax(np.asarray(root_logits, dtype=np.float64))
+        self.inference_calls = 0
+        done = 0
+        while done < self.num_simulations:
+            paths = []
+            leaves: dict[tuple[int, int], int] = {}
+            for _ in range(min(self.batch_size, self.num_simulations - done)):
+                path, parent, action = self._descend()
+                paths.append(path)
+                leaves.setdefault((parent, action), len(leaves))
+            edges = np.array(list(leaves), dtype=np.int64)
+            nxt, rewards, values, logits = model.recurrent_inference(self.states[edges[:, 0]], edges[:, 1])
+            self.inference_calls += 1
+            ids = np.arange(self.size, self.size + len(edges))
+            self.size += len(edges)
+            self.children[edges[:, 0], edges[:, 1]] = ids
+            self.states[ids] = nxt
+            self.reward[ids] = np.asarray(rewards, dtype=np.float64).reshape(-1)
+            self.prior[ids] = _softmax(np.asarray(logits, dtype=np.float64))
+            values = np.asarray(values, dtype=np.float64).reshape(-1)
+            for path in paths:
+                g = values[leaves[path[-1]]]
+                for node, action in reversed(path):
+                    g = self.reward[self.children[node, action]] + self.discount * g
+                    self.value_sum[node, action] += g + self.virtual_loss
+            done += len(paths)
+        return self.visits[0].copy()
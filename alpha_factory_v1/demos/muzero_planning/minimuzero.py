@@ -43,8 +43,7 @@ try:
     _TORCH = True
 except ModuleNotFoundError:  # pragma: no cover - optional dependency
     _TORCH = False
-from dataclasses import dataclass
-from typing import Dict, List, Sequence, Tuple
+from typing import List, Sequence, Tuple
 
 
 if _TORCH:
@@ -81,6 +80,22 @@ if _TORCH:
                 value = self.value_head(next_state)
             return next_state.detach(), reward, value, policy
 
+        def initial_inference(self, obs) -> Tuple[np.ndarray, float, np.ndarray]:
+            state, value, policy = self.initial(obs)
+            return state.numpy(), float(value), policy.numpy()
+
+        def recurrent_inference(
+            self, states: np.ndarray, actions: np.ndarray
+        ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+            """Batched :meth:`recurrent` over ``(B, hidden)`` states and ``(B,)`` actions."""
+            with torch.no_grad():
+                a = F.one_hot(torch.as_tensor(actions, dtype=torch.long), num_classes=self.action_dim).float()
+                out = self.dyn(torch.cat([torch.as_tensor(states), a], dim=-1))
+                next_state = torch.tanh(out[:, 1:])
+                value = self.value_head(next_state)[:, 0]
+                policy = self.policy_head(next_state)
+            return next_state.numpy(), out[:, 0].numpy(), value.numpy(), policy.numpy()
+
 else:  # pragma: no cover - torch missing
 
     class MiniMuNet:  # type: ignore[misc]
@@ -94,38 +109,12 @@ else:  # pragma: no cover - torch missing
             return None, 0.0, 0.0, None
 
 
-@dataclass
-class Node:
-    prior: float
-    state: torch.Tensor | None = None
-    reward: float = 0.0
-    visit_count: int = 0
-    value_sum: float = 0.0
-    children: Dict[int, "Node"] | None = None
-
-    def expanded(self) -> bool:
-        return self.children is not None
+def mcts_policy(net: MiniMuNet, env: gym.Env, obs, num_simulations: int = 64, batch_size: int = 8):
+    """Return policy via MuZero-style MCTS (random if torch unavailable).
 
-    def value(self) -> float:
-        return self.value_sum / self.visit_count if self.visit_count else 0.0
-
-
-def _select_child(node: Node) -> Tuple[int, Node]:
-    """Pick child with highest UCB score."""
-    best_score = -float("inf")
-    best_action = 0
-    best_child = None
-    for action, child in node.children.items():
-        ucb = child.value() + 1.5 * child.prior * math.sqrt(node.visit_count + 1) / (1 + child.visit_count)
-        if ucb > best_score:
-            best_score = ucb
-            best_action = action
-            best_child = child
-    return best_action, best_child
-
-
-def mcts_policy(net: MiniMuNet, env: gym.Env, obs, num_simulations: int = 64):
-    """Return policy via MuZero-style MCTS (random if torch unavailable)."""
+    Leaves are expanded ``batch_size`` at a time through one batched
+    ``recurrent_inference`` call; see :class:`batched_mcts.BatchedMCTS`.
+    """
     if not _TORCH:
         n = env.action_space.n
         if np is not None:
@@ -139,38 +128,12 @@ def mcts_policy(net: MiniMuNet, env: gym.Env, obs, num_simulations: int = 64):
 
         return _P([1 / n] * n)
 
-    with torch.no_grad():
-        state, value, policy_logits = net.initial(obs)
-        root = Node(prior=1.0, state=state)
-        root.children = {a: Node(prior=float(p)) for a, p in enumerate(torch.softmax(policy_logits, dim=-1))}
-        root.visit_count = 1
-        discount = 0.997
-
-        for _ in range(num_simulations):
-            node = root
-            search_path = [node]
-            actions_taken: List[int] = []
-
-            while node.expanded():
-                action, node = _select_child(node)
-                actions_taken.append(action)
-                search_path.append(node)
-
-            parent = search_path[-2]
-            state, reward, value, policy_logits = net.recurrent(parent.state, actions_taken[-1])
-            node.state = state
-            node.reward = float(reward)
-            node.children = {a: Node(prior=float(p)) for a, p in enumerate(torch.softmax(policy_logits, dim=-1))}
-            leaf_value = float(value)
-
-            for n in reversed(search_path):
-                n.visit_count += 1
-                n.value_sum += leaf_value
-                leaf_value = n.reward + discount * leaf_value
-
-        visits = torch.tensor([c.visit_count for c in root.children.values()], dtype=torch.float32)
-        policy = visits / visits.sum()
-    return policy
+    from .batched_mcts import BatchedMCTS
+
+    state, _value, policy_logits = net.initial_inference(obs)
+    search = BatchedMCTS(net.action_dim, num_simulations=num_simulations, batch_size=batch_size)
+    visits = torch.as_tensor(search.run(net, state, policy_logits), dtype=torch.float32)
+    return visits / visits.sum()
 
 
 class MiniMu:
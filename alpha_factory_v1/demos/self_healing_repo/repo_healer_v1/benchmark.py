@@ -9,11 +9,13 @@ import shutil
 import subprocess
 import sys
 import tempfile
+import time
 from dataclasses import dataclass
 
 from .candidate_generation import generate_candidates
 from .engine import EngineOptions, RepoHealerEngine
-from .models import FailureBundle, SupportMode, ValidatorClass
+from .models import FailureBundle, PatchCandidate, SupportMode, ValidatorClass
+from .safety import touched_files_from_diff
 
 PYTHON = sys.executable
 
@@ -43,6 +45,19 @@ def _replace_once(text: str, old: str, new: str) -> str:
     return text.replace(old, new, 1)
 
 
+def _snapshot(repo: pathlib.Path, candidates: list[PatchCandidate]) -> dict[pathlib.Path, bytes | None]:
+    paths = {repo / rel for c in candidates for rel in touched_files_from_diff(c.diff)}
+    return {p: p.read_bytes() if p.exists() else None for p in paths}
+
+
+def _restore(snapshot: dict[pathlib.Path, bytes | None]) -> None:
+    for path, data in snapshot.items():
+        if data is None:
+            path.unlink(missing_ok=True)
+        else:
+            path.write_bytes(data)
+
+
 def _build_cases() -> list[SeedCase]:
     return [
         SeedCase(
@@ -179,9 +194,16 @@ def _build_cases() -> list[SeedCase]:
     ]
 
 
-def run_seeded_benchmark(repo_root: pathlib.Path) -> dict[str, object]:
-    """Run seeded cases in isolated workspace and return machine-readable result."""
+def run_seeded_benchmark(repo_root: pathlib.Path, *, compare_serial: bool = True) -> dict[str, object]:
+    """Run seeded cases in isolated workspace and return machine-readable result.
+
+    With ``compare_serial`` every case is first healed on the serial path
+    (one worker, full workspace copies) and then rolled back, so the parallel
+    engine's wall-clock time can be reported as a speedup.
+    """
     results: list[dict[str, object]] = []
+    serial_total = 0.0
+    parallel_total = 0.0
 
     with tempfile.TemporaryDirectory(prefix="repo-healer-bench-") as tmp:
         work_repo = pathlib.Path(tmp) / "repo"
@@ -197,12 +219,35 @@ def run_seeded_benchmark(repo_root: pathlib.Path) -> dict[str, object]:
             baseline_rc = _run(case.baseline_cmd, cwd=work_repo)
             reproducible = baseline_rc not in {127}
 
+            candidates = generate_candidates(work_repo, case.bundle)
+            serial_seconds: float | None = None
+            if compare_serial:
+                snapshot = _snapshot(work_repo, candidates)
+                serial = RepoHealerEngine(
+                    work_repo,
+                    EngineOptions(
+                        dry_run=False,
+                        max_attempts=1,
+                        run_broader_validation=False,
+                        workers=1,
+                        link_workspaces=False,
+                    ),
+                )
+                start = time.perf_counter()
+                serial.run(case.bundle, candidates)
+                serial_seconds = time.perf_counter() - start
+                _restore(snapshot)
+
             engine = RepoHealerEngine(
                 work_repo,
                 EngineOptions(dry_run=False, max_attempts=1, run_broader_validation=False),
             )
-            candidates = generate_candidates(work_repo, case.bundle)
+            start = time.perf_counter()
             report = engine.run(case.bundle, candidates)
+            parallel_seconds = time.perf_counter() - start
+            if serial_seconds is not None:
+                serial_total += serial_seconds
+                parallel_total += parallel_seconds
 
             healed_rc = _run(case.baseline_cmd, cwd=work_repo)
             if not reproducible:
@@ -223,11 +268,19 @@ def run_seeded_benchmark(repo_root: pathlib.Path) -> dict[str, object]:
                     "classification": report.classification.value,
                     "support_mode": report.support_mode.value,
                     "reason": report.reason,
+                    "time_to_first_fix": report.time_to_first_fix,
+                    "serial_seconds": None if serial_seconds is None else round(serial_seconds, 3),
+                    "parallel_seconds": round(parallel_seconds, 3),
                 }
             )
 
     healed = sum(1 for row in results if row["healed"])
-    return {"total": len(results), "healed": healed, "results": results}
+    payload: dict[str, object] = {"total": len(results), "healed": healed, "results": results}
+    if compare_serial:
+        payload["serial_seconds"] = round(serial_total, 3)
+        payload["parallel_seconds"] = round(parallel_total, 3)
+        payload["speedup"] = round(serial_total / parallel_total, 2) if parallel_total else None
+    return payload
 
 
 def main() -> int:
@@ -237,8 +290,9 @@ def main() -> int:
     parser = argparse.ArgumentParser(description="Run Repo-Healer v1 seeded benchmark")
     parser.add_argument("--repo", default=".")
     parser.add_argument("--out", default="repo_healer_benchmark.json")
+    parser.add_argument("--skip-serial", action="store_true", help="do not time the serial path")
     args = parser.parse_args()
-    payload = run_seeded_benchmark(pathlib.Path(args.repo).resolve())
+    payload = run_seeded_benchmark(pathlib.Path(args.repo).resolve(), compare_serial=not args.skip_serial)
     pathlib.Path(args.out).write_text(json.dumps(payload, indent=2), encoding="utf-8")
     print(json.dumps(payload, indent=2))
     return 0
@@ -4,10 +4,14 @@
 from __future__ import annotations
 
 import json
+import os
 import pathlib
 import shutil
 import sys
 import tempfile
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass
 
 from alpha_factory_v1.demos.self_healing_repo import patcher_core
@@ -15,7 +19,9 @@ from alpha_factory_v1.demos.self_healing_repo import patcher_core
 from .models import FailureBundle, PatchCandidate, RepairReport, SupportMode, ValidatorClass
 from .safety import is_patch_safe, touched_files_from_diff
 from .triage import triage_bundle
-from .validators import get_plan, run_validator
+from .validators import ValidatorPlan, get_plan, run_validator
+
+_IGNORE = shutil.ignore_patterns(".git", ".pytest_cache", ".mypy_cache", "__pycache__")
 
 
 @dataclass(slots=True)
@@ -26,16 +32,23 @@ class EngineOptions:
     report_only: bool = False
     max_attempts: int = 2
     run_broader_validation: bool = True
+    workers: int = 0  # concurrent candidate validations; 0 = one per CPU
+    link_workspaces: bool = True  # hardlink trees instead of full copies
 
 
 class RepoHealerEngine:
-    """Run triage, patch attempt, and validation in an isolated bounded loop."""
+    """Run triage, patch attempt, and validation in an isolated bounded loop.
+
+    Candidates are validated speculatively in parallel, each in its own
+    workspace; the first one to pass is promoted and the rest are cancelled.
+    """
 
     def __init__(self, repo_root: pathlib.Path, options: EngineOptions | None = None):
         self.repo_root = repo_root
         self.options = options or EngineOptions()
 
     def run(self, bundle: FailureBundle, candidates: list[PatchCandidate]) -> RepairReport:
+        started = time.perf_counter()
         triage = triage_bundle(bundle)
         if triage.support_mode != SupportMode.AUTOPATCH_SAFE or self.options.report_only:
             return RepairReport(False, triage.classification, triage.support_mode, triage.reason, [], 0)
@@ -43,10 +56,10 @@ class RepoHealerEngine:
         plan = get_plan(triage.validator_class)
         targeted = self._resolve_targeted_command(bundle, triage.validator_class, plan.targeted)
         commands = [targeted] + ([plan.broader] if self.options.run_broader_validation else [])
-        attempts = 0
+        ranked = sorted(candidates, key=lambda c: c.score, reverse=True)[: self.options.max_attempts]
 
-        for candidate in sorted(candidates, key=lambda c: c.score, reverse=True)[: self.options.max_attempts]:
-            attempts += 1
+        safe_candidates: list[PatchCandidate] = []
+        for candidate in ranked:
             safe, reason = is_patch_safe(candidate.diff, self.repo_root)
             if not safe:
                 continue
@@ -57,55 +70,104 @@ class RepoHealerEngine:
                     triage.support_mode,
                     f"dry-run safe candidate ({reason})",
                     commands,
-                    attempts,
-                    candidate.summary,
-                )
-
-            with tempfile.TemporaryDirectory(prefix="repo-healer-attempt-") as tmpdir:
-                isolated_repo = pathlib.Path(tmpdir) / "repo"
-                self._copy_repo(self.repo_root, isolated_repo)
-                try:
-                    patcher_core.apply_patch(candidate.diff, repo_path=str(isolated_repo))
-                except Exception:
-                    continue
-
-                try:
-                    rc_target, _ = run_validator(targeted, cwd=str(isolated_repo))
-                except Exception:
-                    continue
-                if rc_target != 0:
-                    continue
-                if self.options.run_broader_validation:
-                    try:
-                        rc_broader, _ = run_validator(plan.broader, cwd=str(isolated_repo))
-                    except Exception:
-                        continue
-                    if rc_broader != 0:
-                        continue
-                    success_reason = "targeted and broader validators passed"
-                else:
-                    success_reason = "targeted validator passed (broader validation skipped by option)"
-
-                self._promote_patch(candidate.diff, isolated_repo)
-                return RepairReport(
-                    True,
-                    triage.classification,
-                    triage.support_mode,
-                    success_reason,
-                    commands,
-                    attempts,
+                    ranked.index(candidate) + 1,
                     candidate.summary,
                 )
-
+            safe_candidates.append(candidate)
+
+        workers = self.options.workers or os.cpu_count() or 1
+        cancel = threading.Event()
+        started_count = 0
+        count_lock = threading.Lock()
+
+        def attempt(candidate: PatchCandidate) -> tuple[str, pathlib.Path] | None:
+            nonlocal started_count
+            if cancel.is_set():
+                return None
+            with count_lock:
+                started_count += 1
+            return self._attempt(candidate, targeted, plan, cancel)
+
+        winner: tuple[PatchCandidate, str, pathlib.Path] | None = None
+        pool = ThreadPoolExecutor(max_workers=max(1, min(workers, len(safe_candidates) or 1)))
+        futures: dict[Future[tuple[str, pathlib.Path] | None], PatchCandidate] = {
+            pool.submit(attempt, c): c for c in safe_candidates
+        }
+        try:
+            pending = set(futures)
+            while pending and winner is None:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in sorted(done, key=lambda f: safe_candidates.index(futures[f])):
+                    result = future.result()
+                    if result is not None and winner is None:
+                        winner = (futures[future], *result)
+        finally:
+            cancel.set()
+            pool.shutdown(wait=True, cancel_futures=True)
+            for future in futures:
+                if future.done() and not future.cancelled():
+                    result = future.result()
+                    if result is not None and (winner is None or result[1] != winner[2]):
+                        shutil.rmtree(result[1].parent, ignore_errors=True)
+
+        attempts = len(ranked) - len(safe_candidates) + started_count
+        if winner is None:
+            return RepairReport(
+                False,
+                triage.classification,
+                triage.support_mode,
+                "no candidate passed validators",
+                commands,
+                attempts,
+            )
+        candidate, success_reason, isolated_repo = winner
+        try:
+            self._promote_patch(candidate.diff, isolated_repo)
+        finally:
+            shutil.rmtree(isolated_repo.parent, ignore_errors=True)
         return RepairReport(
-            False,
+            True,
             triage.classification,
             triage.support_mode,
-            "no candidate passed validators",
+            success_reason,
             commands,
             attempts,
+            candidate.summary,
+            time_to_first_fix=round(time.perf_counter() - started, 3),
         )
 
+    def _attempt(
+        self,
+        candidate: PatchCandidate,
+        targeted: list[str],
+        plan: ValidatorPlan,
+        cancel: threading.Event,
+    ) -> tuple[str, pathlib.Path] | None:
+        """Validate ``candidate`` in a fresh workspace.
+
+        Returns the success reason and the workspace (owned by the caller) or
+        ``None`` after removing the workspace.
+        """
+        isolated_repo = pathlib.Path(tempfile.mkdtemp(prefix="repo-healer-attempt-")) / "repo"
+        try:
+            if self.options.link_workspaces:
+                self._link_repo(self.repo_root, isolated_repo, touched_files_from_diff(candidate.diff))
+            else:
+                self._copy_repo(self.repo_root, isolated_repo)
+            patcher_core.apply_patch(candidate.diff, repo_path=str(isolated_repo))
+            rc_target, _ = run_validator(targeted, cwd=str(isolated_repo), cancel=cancel)
+            if rc_target != 0 or cancel.is_set():
+                raise _Rejected
+            if self.options.run_broader_validation:
+                rc_broader, _ = run_validator(plan.broader, cwd=str(isolated_repo), cancel=cancel)
+                if rc_broader != 0 or cancel.is_set():
+                    raise _Rejected
+                return "targeted and broader validators passed", isolated_repo
+            return "targeted validator passed (broader validation skipped by option)", isolated_repo
+        except Exception:
+            shutil.rmtree(isolated_repo.parent, ignore_errors=True)
+            return None
+
     @staticmethod
     def _resolve_targeted_command(
         bundle: FailureBundle, validator_class: ValidatorClass, default: list[str]
@@ -125,8 +187,22 @@ class RepoHealerEngine:
     @staticmethod
     def _copy_repo(src: pathlib.Path, dst: pathlib.Path) -> None:
         """Copy repository into isolated scratch directory."""
-        ignore = shutil.ignore_patterns(".git", ".pytest_cache", ".mypy_cache", "__pycache__")
-        shutil.copytree(src, dst, ignore=ignore)
+        shutil.copytree(src, dst, ignore=_IGNORE)
+
+    @staticmethod
+    def _link_repo(src: pathlib.Path, dst: pathlib.Path, touched: list[str]) -> None:
+        """Build a copy-on-write view of ``src``: hardlinks, with real copies of ``touched``.
+
+        ``patch`` replaces files by rename, so only the files a candidate edits
+        need private copies; validators must not rewrite other files in place.
+        """
+        shutil.copytree(src, dst, ignore=_IGNORE, copy_function=_link_or_copy)
+        for rel in touched:
+            path = dst / rel
+            if path.is_file():
+                private = path.with_name(path.name + ".cow")
+                shutil.copy2(path, private)
+                os.replace(private, path)
 
     def _promote_patch(self, diff: str, isolated_repo: pathlib.Path) -> None:
         """Copy touched files from validated isolated repo back to working tree."""
@@ -138,6 +214,17 @@ class RepoHealerEngine:
                 shutil.copy2(source, destination)
 
 
+class _Rejected(Exception):
+    """Candidate failed a validator."""
+
+
+def _link_or_copy(src: str, dst: str) -> None:
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+
 def write_report(report: RepairReport, out_path: pathlib.Path) -> None:
-    """Write machine-readable report JSON."""
+    """Write machine-readable report JSON, including ``time_to_first_fix`` seconds."""
     out_path.write_text(json.dumps(report.to_dict(), indent=2), encoding="utf-8")
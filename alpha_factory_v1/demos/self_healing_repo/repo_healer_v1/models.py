@@ -124,6 +124,7 @@ class RepairReport:
     attempts: int
     selected_patch_summary: str | None = None
     branch_name: str | None = None
+    time_to_first_fix: float | None = None
 
     def to_dict(self) -> dict[str, Any]:
         payload = asdict(self)
@@ -8,9 +8,12 @@ The command plans mirror the current CI gates:
 
 from __future__ import annotations
 
+import os
 import shlex
+import signal
 import subprocess
 import sys
+import threading
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -76,10 +79,39 @@ REGISTRY: dict[ValidatorClass, ValidatorPlan] = {
 }
 
 
-def run_validator(cmd: list[str], cwd: str) -> tuple[int, str]:
-    """Run one validator command and return (exit_code, combined_output)."""
-    proc = subprocess.run(cmd, cwd=cwd, text=True, capture_output=True)
-    return proc.returncode, proc.stdout + proc.stderr
+def run_validator(cmd: list[str], cwd: str, cancel: threading.Event | None = None) -> tuple[int, str]:
+    """Run one validator command and return (exit_code, combined_output).
+
+    When ``cancel`` is set while the command runs, its process group is
+    killed and the negative signal number is returned.
+    """
+    if cancel is None:
+        proc = subprocess.run(cmd, cwd=cwd, text=True, capture_output=True)
+        return proc.returncode, proc.stdout + proc.stderr
+    with subprocess.Popen(
+        cmd,
+        cwd=cwd,
+        text=True,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        start_new_session=hasattr(os, "killpg"),
+    ) as proc:
+        while True:
+            try:
+                out, err = proc.communicate(timeout=0.05)
+                break
+            except subprocess.TimeoutExpired:
+                if cancel.is_set():
+                    try:
+                        if hasattr(os, "killpg"):
+                            os.killpg(proc.pid, signal.SIGKILL)
+                        else:  # pragma: no cover - non-POSIX
+                            proc.kill()
+                    except ProcessLookupError:
+                        pass
+                    out, err = proc.communicate()
+                    break
+    return proc.returncode, out + err
 
 
 def get_plan(kind: ValidatorClass) -> ValidatorPlan:
@@ -0,0 +1,79 @@
+# SPDX-License-Identifier: Apache-2.0
+import random
+import unittest
+
+import numpy as np
+
+from alpha_factory_v1.backend import alpha_model as am
+from alpha_factory_v1.backend import indicators as ind
+
+
+def _walk(n: int, seed: int = 0) -> list[float]:
+    rng = random.Random(seed)
+    prices = [100.0]
+    for _ in range(n - 1):
+        prices.append(max(1.0, prices[-1] * (1 + rng.gauss(0, 0.02))))
+    return prices
+
+
+class StreamingIndicatorTest(unittest.TestCase):
+    def test_ring_buffer_evicts_oldest(self):
+        buf = ind.RingBuffer(3)
+        self.assertIsNone(buf.append(1.0))
+        buf.append(2.0)
+        buf.append(3.0)
+        self.assertEqual(buf.append(4.0), 1.0)
+        self.assertEqual(list(buf), [2.0, 3.0, 4.0])
+        self.assertEqual(buf[-1], 4.0)
+        with self.assertRaises(IndexError):
+            buf[3]
+
+    def test_rolling_stats_match_window(self):
+        prices = _walk(500)
+        stats = ind.RollingStats(37)
+        for i, p in enumerate(prices, 1):
+            stats.push(p)
+            window = prices[max(0, i - 37) : i]
+            self.assertAlmostEqual(stats.mean, float(np.mean(window)), places=9)
+            self.assertAlmostEqual(stats.std(), float(np.std(window)), places=7)
+
+    def test_streaming_matches_batch_functions(self):
+        prices = _walk(300, seed=1)
+        live = ind.IndicatorSet(lookback=10, fast=5, slow=12, span=9, period=7, window=15, num_std=1.5)
+        for i, p in enumerate(prices, 1):
+            got = live.update(p)
+            hist = prices[:i]
+            self.assertAlmostEqual(got["momentum"], am.momentum(hist, 10), places=9)
+            self.assertEqual(got["sma_crossover"], am.sma_crossover(hist, 5, 12))
+            self.assertAlmostEqual(got["ema"], am.ema(hist, 9), places=6)
+            self.assertAlmostEqual(got["rsi"], am.rsi(hist, 7), places=6)
+            lo, hi = am.bollinger_bands(hist, 15, 1.5)
+            self.assertAlmostEqual(got["bollinger_bands"][0], lo, places=6)
+            self.assertAlmostEqual(got["bollinger_bands"][1], hi, places=6)
+
+    def test_backfill_matches_replay(self):
+        prices = _walk(2000, seed=2)
+        replay = ind.IndicatorSet()
+        for p in prices:
+            replay.update(p)
+        seeded = ind.IndicatorSet()
+        seeded.backfill(prices)
+        for a, b in zip(seeded.snapshot().values(), replay.snapshot().values()):
+            np.testing.assert_allclose(a, b, rtol=1e-9)
+        for p in _walk(50, seed=3):
+            np.testing.assert_allclose(
+                list(seeded.update(p)["bollinger_bands"]), list(replay.update(p)["bollinger_bands"]), rtol=1e-9
+            )
+
+    def test_series_helpers(self):
+        prices = _walk(400, seed=4)
+        ema = ind.EMA(20)
+        np.testing.assert_allclose(ind.ema_series(prices, 20), [ema.update(p) for p in prices], rtol=1e-10)
+        rsi = ind.RSI(14)
+        np.testing.assert_allclose(ind.rsi_series(prices, 14), [rsi.update(p) for p in prices], rtol=1e-9)
+        np.testing.assert_allclose(ind.rolling_mean(prices, 20)[-1], np.mean(prices[-20:]))
+        np.testing.assert_allclose(ind.rolling_std(prices, 20)[-1], np.std(prices[-20:], ddof=1))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,23 +1,58 @@
 #!/usr/bin/env python
 # SPDX-License-Identifier: Apache-2.0
-"""Run benchmark tasks and emit JSON results."""
+"""Run benchmark tasks and emit JSON results.
+
+Every task runs in a fresh worker process (``maxtasksperchild=1``), so the
+reported peak RSS belongs to that task alone. Each task is imported once and
+its ``run()`` repeated ``--repeat`` times; the report carries the median, p95
+and standard deviation of those runs. ``time_ms`` remains the integer median
+so existing consumers keep working. Tasks run one at a time by default so
+timings stay comparable with a serial baseline; ``--workers N`` overlaps them
+for throughput at the cost of timing noise.
+
+``--profile DIR`` writes one cProfile (or pyinstrument) report per task and
+``--baseline FILE`` compares medians against a stored run, exiting with status
+1 when a task slowed down by more than ``--threshold``. ``--save-baseline``
+records the current run for later comparisons.
+"""
 
 from __future__ import annotations
 
+import argparse
 import importlib
 import json
+import math
+import multiprocessing as mp
+import signal
+import statistics
 import sys
 from pathlib import Path
 from time import perf_counter_ns
+from typing import Any, Iterable
+
+try:  # POSIX only
+    import resource
+except ImportError:  # pragma: no cover - Windows
+    resource = None  # type: ignore[assignment]
 
 ROOT = Path(__file__).parent
+DATASETS = (
+    "swebench_verified_mini",
+    "polyglot_lite",
+    "swe_mini",
+    "poly_mini",
+)
+
+
+class TaskTimeout(Exception):
+    """Raised inside a worker when a task exceeds its time budget."""
 
 
 def _discover_tasks(dataset: str) -> list[tuple[str, str]]:
     """Return list of (task_id, module_name)."""
     tasks = []
     base = ROOT.parent
-    for path in (ROOT / dataset).glob("task_*.py"):
+    for path in sorted((ROOT / dataset).glob("task_*.py")):
         rel = path.with_suffix("").relative_to(base)
         module_name = ".".join(rel.parts)
         task_id = f"{dataset}/{path.stem}"
@@ -25,33 +60,245 @@ def _discover_tasks(dataset: str) -> list[tuple[str, str]]:
     return tasks
 
 
-def run_task(task_id: str, module_name: str) -> dict[str, object]:
-    t0 = perf_counter_ns()
+def _peak_rss_kb() -> int | None:
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return int(peak // 1024 if sys.platform == "darwin" else peak)
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    ordered = sorted(values)
+    idx = max(0, math.ceil(pct / 100 * len(ordered)) - 1)
+    return ordered[idx]
+
+
+def _on_alarm(_signum: int, _frame: Any) -> None:
+    raise TaskTimeout
+
+
+class _Profiler:
+    """Wrap cProfile or pyinstrument behind one start/stop/save interface."""
+
+    def __init__(self, kind: str) -> None:
+        self.kind = kind
+        if kind == "pyinstrument":
+            from pyinstrument import Profiler  # type: ignore
+
+            self._prof: Any = Profiler()
+        else:
+            import cProfile
+
+            self._prof = cProfile.Profile()
+
+    def start(self) -> None:
+        (self._prof.start if self.kind == "pyinstrument" else self._prof.enable)()
+
+    def stop(self) -> None:
+        (self._prof.stop if self.kind == "pyinstrument" else self._prof.disable)()
+
+    def save(self, path: Path) -> Path:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if self.kind == "pyinstrument":
+            out = path.with_suffix(".html")
+            out.write_text(self._prof.output_html(), encoding="utf-8")
+        else:
+            out = path.with_suffix(".prof")
+            self._prof.dump_stats(out)
+        return out
+
+
+def run_task(
+    task_id: str,
+    module_name: str,
+    *,
+    repeat: int = 1,
+    timeout: float | None = None,
+    profile_dir: str | None = None,
+    profiler: str = "cprofile",
+) -> dict[str, object]:
+    """Import ``module_name`` and time ``repeat`` calls of its ``run()``."""
+
+    use_alarm = bool(timeout) and hasattr(signal, "setitimer")
+    if use_alarm:
+        prev = signal.signal(signal.SIGALRM, _on_alarm)
+        signal.setitimer(signal.ITIMER_REAL, float(timeout))  # type: ignore[arg-type]
+    prof = _Profiler(profiler) if profile_dir else None
+    samples: list[float] = []
     passed = True
+    error: str | None = None
     try:
+        if prof:
+            prof.start()
+        t0 = perf_counter_ns()
         mod = importlib.import_module(module_name)
-        if hasattr(mod, "run"):
-            mod.run()
-    except Exception:
+        import_ns = perf_counter_ns() - t0
+        fn = getattr(mod, "run", None)
+        if fn is None:
+            samples.append(import_ns / 1e6)
+        for i in range(repeat if fn is not None else 0):
+            t0 = perf_counter_ns()
+            fn()
+            elapsed = perf_counter_ns() - t0
+            # the first sample includes the import, as the serial runner did
+            samples.append((elapsed + (import_ns if i == 0 else 0)) / 1e6)
+    except TaskTimeout:
+        passed = False
+        error = "timeout"
+    except Exception as exc:
         passed = False
-    elapsed_ms = int((perf_counter_ns() - t0) / 1_000_000)
-    return {"task_id": task_id, "pass": passed, "time_ms": elapsed_ms}
+        error = f"{type(exc).__name__}: {exc}"
+    finally:
+        if prof:
+            prof.stop()
+        if use_alarm:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(signal.SIGALRM, prev)
+    if not samples:
+        samples = [0.0]
+    median = statistics.median(samples)
+    result: dict[str, object] = {
+        "task_id": task_id,
+        "pass": passed,
+        "time_ms": int(median),
+        "runs": len(samples),
+        "median_ms": round(median, 3),
+        "p95_ms": round(_percentile(samples, 95), 3),
+        "stdev_ms": round(statistics.pstdev(samples), 3),
+        "peak_rss_kb": _peak_rss_kb(),
+    }
+    if error:
+        result["error"] = error
+    if prof and profile_dir:
+        result["profile"] = str(prof.save(Path(profile_dir) / task_id.replace("/", "__")))
+    return result
+
+
+def _init_worker(root: str) -> None:
+    if root not in sys.path:
+        sys.path.insert(0, root)
+
+
+def run_all(
+    tasks: Iterable[tuple[str, str]],
+    *,
+    workers: int = 1,
+    repeat: int = 1,
+    timeout: float | None = None,
+    profile_dir: str | None = None,
+    profiler: str = "cprofile",
+) -> list[dict[str, object]]:
+    """Run ``tasks`` on ``workers`` processes and return results in task order."""
+
+    tasks = list(tasks)
+    opts = {"repeat": repeat, "timeout": timeout, "profile_dir": profile_dir, "profiler": profiler}
+    _init_worker(str(ROOT.parent))
+    # Workers enforce ``timeout`` themselves; the outer wait only guards
+    # against tasks that block signals.
+    grace = None if timeout is None else timeout + 5.0
+    # one task per process: ru_maxrss is a per-process high-water mark
+    pool = mp.get_context().Pool(
+        max(1, workers), initializer=_init_worker, initargs=(str(ROOT.parent),), maxtasksperchild=1
+    )
+    try:
+        pending = [(tid, pool.apply_async(run_task, (tid, mod), opts)) for tid, mod in tasks]
+        results = []
+        for tid, res in pending:
+            try:
+                results.append(res.get(grace))
+            except mp.TimeoutError:
+                ms = int((timeout or 0) * 1000)
+                results.append({"task_id": tid, "pass": False, "time_ms": ms, "error": "timeout"})
+        return results
+    finally:
+        pool.terminate()
+        pool.join()
+
+
+def compare(
+    results: list[dict[str, object]],
+    baseline: list[dict[str, object]],
+    *,
+    threshold: float = 0.2,
+    min_delta_ms: float = 1.0,
+) -> list[dict[str, object]]:
+    """Annotate ``results`` with baseline deltas and return the regressions.
+
+    A task regresses when it stopped passing, or when its median grew by more
+    than ``threshold`` (relative) and ``min_delta_ms`` (absolute).
+    """
+
+    base = {str(b["task_id"]): b for b in baseline}
+    regressions = []
+    for entry in results:
+        ref = base.get(str(entry["task_id"]))
+        if ref is None:
+            continue
+        now = float(entry.get("median_ms", entry["time_ms"]))  # type: ignore[arg-type]
+        before = float(ref.get("median_ms", ref["time_ms"]))  # type: ignore[arg-type]
+        entry["baseline_ms"] = before
+        entry["delta_pct"] = round((now - before) / before * 100, 1) if before else None
+        slower = now - before > min_delta_ms and now > before * (1 + threshold)
+        broke = bool(ref.get("pass")) and not entry["pass"]
+        entry["regression"] = slower or broke
+        if entry["regression"]:
+            regressions.append(entry)
+    return regressions
+
+
+def _parse_args(argv: list[str] | None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Run benchmark tasks and emit JSON results.")
+    parser.add_argument("--datasets", nargs="+", default=list(DATASETS), choices=DATASETS)
+    parser.add_argument(
+        "--workers", type=int, default=1, help="tasks timed concurrently; >1 skews timings against a serial baseline"
+    )
+    parser.add_argument("--repeat", type=int, default=1, help="timed run() calls per task")
+    parser.add_argument("--timeout", type=float, default=300.0, help="per-task time limit in seconds")
+    parser.add_argument("--profile", metavar="DIR", help="write a profile per task to DIR")
+    parser.add_argument("--profiler", choices=("cprofile", "pyinstrument"), default="cprofile")
+    parser.add_argument("--baseline", type=Path, help="baseline JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=0.2, help="relative slowdown flagged as regression")
+    parser.add_argument("--min-delta-ms", type=float, default=1.0, help="ignore slowdowns below this many ms")
+    parser.add_argument("--save-baseline", type=Path, help="write the results to this file")
+    args = parser.parse_args(argv)
+    if args.repeat < 1:
+        parser.error("--repeat must be at least 1")
+    if args.profiler == "pyinstrument" and args.profile:
+        try:
+            importlib.import_module("pyinstrument")
+        except ImportError:
+            parser.error("pyinstrument is not installed")
+    return args
 
 
-def main() -> None:
+def main(argv: list[str] | None = None) -> None:
+    args = _parse_args(argv)
     # Ensure the repository root is on sys.path so benchmark modules import
     sys.path.insert(0, str(ROOT.parent))
-    datasets = [
-        "swebench_verified_mini",
-        "polyglot_lite",
-        "swe_mini",
-        "poly_mini",
-    ]
-    results = []
-    for ds in datasets:
-        for task_id, module in _discover_tasks(ds):
-            results.append(run_task(task_id, module))
+    tasks = [t for ds in args.datasets for t in _discover_tasks(ds)]
+    results = run_all(
+        tasks,
+        workers=min(args.workers, len(tasks)) or 1,
+        repeat=args.repeat,
+        timeout=args.timeout or None,
+        profile_dir=args.profile,
+        profiler=args.profiler,
+    )
+    regressions = []
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+        regressions = compare(results, baseline, threshold=args.threshold, min_delta_ms=args.min_delta_ms)
+    if args.save_baseline:
+        args.save_baseline.write_text(json.dumps(results, indent=2) + "\n", encoding="utf-8")
     json.dump(results, sys.stdout)
+    for entry in regressions:
+        print(
+            f"REGRESSION {entry['task_id']}: {entry.get('median_ms')} ms vs {entry['baseline_ms']} ms"
+            + ("" if entry["pass"] else " (now failing)"),
+            file=sys.stderr,
+        )
+    if regressions:
+        raise SystemExit(1)
 
 
 if __name__ == "__main__":  # pragma: no cover
@@ -0,0 +1,69 @@
+#!/usr/bin/env python
+# SPDX-License-Identifier: Apache-2.0
+"""Benchmark A2ABus dispatch under a burst of envelopes for a slow async handler.
+
+Reports wall time, peak in-flight handler count and drops for each overflow
+policy. Before bounded dispatch every envelope spawned its own task, so the
+in-flight count grew with the burst size.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import sys
+import types
+from time import perf_counter
+from typing import Any
+
+from alpha_factory_v1.common.utils import config, messaging
+
+
+async def _run(policy: str, messages: int, queue_size: int, workers: int, delay: float) -> dict[str, Any]:
+    bus = messaging.A2ABus(
+        config.Settings(bus_port=0, bus_queue_size=queue_size, bus_workers=workers, bus_overflow=policy)
+    )
+    handled = 0
+    active = 0
+    peak = 0
+
+    async def handler(_env: Any) -> None:
+        nonlocal handled, active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(delay)
+        active -= 1
+        handled += 1
+
+    bus.subscribe("bench", handler)
+    t0 = perf_counter()
+    for i in range(messages):
+        await bus.apublish("bench", types.SimpleNamespace(sender="a", recipient="bench", ts=0.0, payload={"i": i}))
+    await bus.drain()
+    return {
+        "policy": policy,
+        "messages": messages,
+        "handled": handled,
+        "dropped": messages - handled,
+        "peak_in_flight": peak,
+        "seconds": round(perf_counter() - t0, 3),
+    }
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--messages", type=int, default=20000)
+    parser.add_argument("--queue-size", type=int, default=1024)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--delay", type=float, default=0.0)
+    parser.add_argument("--policies", nargs="+", default=list(messaging.OVERFLOW_POLICIES))
+    args = parser.parse_args(argv)
+    results = [
+        asyncio.run(_run(p, args.messages, args.queue_size, args.workers, args.delay)) for p in args.policies
+    ]
+    json.dump(results, sys.stdout, indent=2)
+    sys.stdout.write("\n")
+
+
+if __name__ == "__main__":
+    main()
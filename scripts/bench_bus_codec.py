@@ -0,0 +1,66 @@
+#!/usr/bin/env python
+# SPDX-License-Identifier: Apache-2.0
+"""Benchmark A2ABus envelope codecs: encode/decode throughput and bytes on the wire.
+
+Envelopes mimic typical agent traffic: a small control message, a planner
+message with a few KiB of text and a research result carrying a numeric
+series. Every registered codec is measured unless ``--codecs`` is given.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from time import perf_counter
+from typing import Any, Dict
+
+from alpha_factory_v1.common.utils import envelope_codec, messaging
+
+
+def _envelopes() -> Dict[str, Any]:
+    def env(payload: dict[str, Any]) -> Any:
+        e = messaging.Envelope(sender="planning", recipient="research", ts=1_700_000_000.0)
+        e.payload.update(payload)
+        return e
+
+    text = " ".join(f"step {i}: evaluate sector {i % 7} under scenario {i % 3}" for i in range(80))
+    return {
+        "control": env({"cmd": "heartbeat", "ok": True}),
+        "plan": env({"task": "forecast", "prompt": text, "params": {"horizon": 10, "pop": 32}}),
+        "series": env({"sector": "energy", "capability": [i * 0.001 for i in range(5000)]}),
+    }
+
+
+def bench(codec_name: str, kind: str, env: Any, rounds: int) -> dict[str, float | int | str]:
+    codec = envelope_codec.get(codec_name)
+    data = codec.encode(env, token="tok")
+    t0 = perf_counter()
+    for _ in range(rounds):
+        codec.encode(env, token="tok")
+    enc = perf_counter() - t0
+    t0 = perf_counter()
+    for _ in range(rounds):
+        codec.decode(data)
+    dec = perf_counter() - t0
+    return {
+        "codec": codec_name,
+        "envelope": kind,
+        "bytes": len(data),
+        "encode_per_s": round(rounds / enc, 1),
+        "decode_per_s": round(rounds / dec, 1),
+    }
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--codecs", nargs="+", default=envelope_codec.available())
+    parser.add_argument("--rounds", type=int, default=200)
+    args = parser.parse_args(argv)
+    envs = _envelopes()
+    results = [bench(c, kind, env, args.rounds) for c in args.codecs for kind, env in envs.items()]
+    json.dump(results, sys.stdout, indent=2)
+    sys.stdout.write("\n")
+
+
+if __name__ == "__main__":
+    main()
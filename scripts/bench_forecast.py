@@ -0,0 +1,49 @@
+#!/usr/bin/env python
+# SPDX-License-Identifier: Apache-2.0
+"""Benchmark the disruption forecast engine on large sector sets."""
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+from time import perf_counter
+
+from alpha_factory_v1.core.simulation import forecast, sector
+
+
+def bench(num_sectors: int, horizon: int, seed: int | None) -> dict[str, float | int | None]:
+    rng = random.Random(0)
+    secs = [
+        sector.Sector(f"s{i:04d}", rng.uniform(0.5, 2.0), rng.uniform(0.5, 3.0), rng.uniform(0.0, 0.1))
+        for i in range(num_sectors)
+    ]
+    forecast._cached_gain.cache_clear()
+    t0 = perf_counter()
+    traj = forecast.forecast_disruptions(secs, horizon, pop_size=6, generations=1, seed=seed)
+    t1 = perf_counter()
+    disrupted = sum(s.disrupted for s in traj[-1].sectors)
+    t2 = perf_counter()
+    return {
+        "sectors": num_sectors,
+        "horizon": horizon,
+        "seed": seed,
+        "disrupted": disrupted,
+        "forecast_ms": round((t1 - t0) * 1000, 3),
+        "snapshot_ms": round((t2 - t1) * 1000, 3),
+    }
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sectors", type=int, nargs="+", default=[100, 1_000, 10_000])
+    parser.add_argument("--horizon", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args(argv)
+    results = [bench(n, args.horizon, args.seed) for n in args.sectors]
+    json.dump(results, sys.stdout, indent=2)
+    sys.stdout.write("\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+#!/usr/bin/env python
+# SPDX-License-Identifier: Apache-2.0
+"""Benchmark GraphMemory relation ingest on the in-memory backend.
+
+Compares one ``add`` call per relation with a single ``add_many`` call.
+Neo4j is exercised the same way when ``NEO4J_URI``/``NEO4J_USER``/
+``NEO4J_PASSWORD`` are set.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+from time import perf_counter
+
+from alpha_factory_v1.backend.memory_graph import GraphMemory
+
+
+def _relations(n: int, nodes: int, seed: int) -> list[tuple[str, str, str, dict[str, int]]]:
+    rng = random.Random(seed)
+    rels = ("CAUSES", "LINKS", "PRECEDES")
+    return [(f"n{rng.randrange(nodes)}", rng.choice(rels), f"n{rng.randrange(nodes)}", {"i": i}) for i in range(n)]
+
+
+def bench(mode: str, rows: list[tuple[str, str, str, dict[str, int]]]) -> dict[str, float | int | str]:
+    g = GraphMemory()
+    g.clear()
+    t0 = perf_counter()
+    if mode == "add":
+        for r in rows:
+            g.add(*r)
+    else:
+        g.add_many(rows)
+    g.flush()
+    elapsed = perf_counter() - t0
+    out = {"backend": g.backend, "mode": mode, "relations": len(rows), "edges": len(g), "seconds": round(elapsed, 3)}
+    g.clear()
+    g.close()
+    return out
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--relations", type=int, default=100_000)
+    parser.add_argument("--nodes", type=int, default=20_000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+    rows = _relations(args.relations, args.nodes, args.seed)
+    json.dump([bench(mode, rows) for mode in ("add", "add_many")], sys.stdout, indent=2)
+    sys.stdout.write("\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+#!/usr/bin/env python
+# SPDX-License-Identifier: Apache-2.0
+"""Benchmark ledger write throughput (envelopes/s) with and without group commit.
+
+``sync`` commits every envelope, ``group-full`` shares commits between
+``--threads`` concurrent producers that still wait for durability and
+``group-normal`` returns as soon as envelopes are queued.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import tempfile
+import threading
+from pathlib import Path
+from time import perf_counter
+
+from alpha_factory_v1.common.utils import messaging
+from alpha_factory_v1.common.utils.logging import Ledger
+
+COUNTS = (1_000, 10_000, 100_000)
+MODES = {
+    "sync": {"group_commit": False, "durability": "full"},
+    "group-full": {"group_commit": True, "durability": "full"},
+    "group-normal": {"group_commit": True, "durability": "normal"},
+}
+
+
+def bench(db: str, mode: str, count: int, threads: int) -> dict[str, float | int | str]:
+    envs = [messaging.Envelope(sender="a", recipient="b", payload={"v": i}, ts=float(i)) for i in range(count)]
+    chunks = [envs[i::threads] for i in range(threads)]
+    with tempfile.TemporaryDirectory() as tmp:
+        led = Ledger(str(Path(tmp) / f"bench.{db}"), broadcast=False, db=db, **MODES[mode])
+        workers = [threading.Thread(target=lambda c=c: [led.log(e) for e in c]) for c in chunks]
+        t0 = perf_counter()
+        for w in workers:
+            w.start()
+        for w in workers:
+            w.join()
+        led.flush()
+        elapsed = perf_counter() - t0
+        led.close()
+    return {"db": db, "mode": mode, "count": count, "env_per_s": round(count / elapsed, 1)}
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--counts", type=int, nargs="+", default=list(COUNTS))
+    parser.add_argument("--modes", nargs="+", default=list(MODES), choices=list(MODES))
+    parser.add_argument("--dbs", nargs="+", default=["sqlite"], choices=["sqlite", "duckdb", "postgres"])
+    parser.add_argument("--threads", type=int, default=8, help="concurrent producers")
+    args = parser.parse_args(argv)
+    results = [bench(db, m, n, args.threads) for db in args.dbs for m in args.modes for n in args.counts]
+    json.dump(results, sys.stdout, indent=2)
+    sys.stdout.write("\n")
+
+
+if __name__ == "__main__":
+    main()
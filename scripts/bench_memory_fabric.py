@@ -0,0 +1,83 @@
+#!/usr/bin/env python
+# SPDX-License-Identifier: Apache-2.0
+"""Benchmark memory-fabric add and search latency as the vector store grows.
+
+Each store is filled to the requested size and then measured at its
+per-agent quota, so every timed add also evicts the oldest memory.
+"""
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import tempfile
+from pathlib import Path
+from time import perf_counter
+from unittest import mock
+
+import numpy as np
+
+from alpha_factory_v1.backend import memory_fabric as memf
+
+SIZES = (10_000, 100_000, 1_000_000)
+DIM = 64
+
+
+def _embed(text: str) -> np.ndarray:
+    seed = int.from_bytes(hashlib.blake2b(text.encode(), digest_size=8).digest(), "little")
+    vec = np.random.default_rng(seed).standard_normal(DIM).astype("float32")
+    return vec / np.linalg.norm(vec)
+
+
+def bench(mode: str, size: int, ops: int, k: int) -> dict[str, float | int | str]:
+    with tempfile.TemporaryDirectory() as tmp:
+        env = {
+            "VECTOR_STORE_USE_SQLITE": "true" if mode == "sqlite" else "false",
+            "VECTOR_SQLITE_PATH": str(Path(tmp) / "bench.db"),
+        }
+        with (
+            mock.patch.dict(os.environ, env),
+            mock.patch.object(memf, "_EMBED", _embed),
+            mock.patch.object(memf.CFG, "VECTOR_DIM", DIM),
+            mock.patch.object(memf.CFG, "MEM_MAX_PER_AGENT", size),
+        ):
+            store = memf._VectorStore()
+            if store._mode != mode:
+                raise SystemExit(f"{mode} tier unavailable")
+            t0 = perf_counter()
+            for start in range(0, size, 10_000):
+                store.add_many("bench", [f"fill-{i}" for i in range(start, min(size, start + 10_000))])
+            t1 = perf_counter()
+            for i in range(ops):
+                store.add("bench", f"op-{i}")
+            t2 = perf_counter()
+            for i in range(ops):
+                store.search(f"query-{i}", k)
+            t3 = perf_counter()
+            store.close()
+    return {
+        "mode": mode,
+        "size": size,
+        "fill_s": round(t1 - t0, 3),
+        "add_us": round((t2 - t1) / ops * 1e6, 1),
+        "search_ms": round((t3 - t2) / ops * 1e3, 3),
+    }
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(SIZES))
+    parser.add_argument("--modes", nargs="+", default=["faiss", "sqlite"], choices=["faiss", "sqlite"])
+    parser.add_argument("--ops", type=int, default=200)
+    parser.add_argument("-k", type=int, default=5)
+    args = parser.parse_args(argv)
+    modes = [m for m in args.modes if m != "faiss" or "faiss" in vars(memf)]
+    results = [bench(m, n, args.ops, args.k) for m in modes for n in args.sizes]
+    json.dump(results, sys.stdout, indent=2)
+    sys.stdout.write("\n")
+
+
+if __name__ == "__main__":
+    main()
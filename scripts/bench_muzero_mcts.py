@@ -0,0 +1,61 @@
+#!/usr/bin/env python
+# SPDX-License-Identifier: Apache-2.0
+"""Benchmark MuZero search throughput (simulations/s) across leaf batch sizes.
+
+Uses the torch ``MiniMuNet`` when available and the NumPy ``LinearMuNet``
+otherwise; all runs are on CPU.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from time import perf_counter
+
+import numpy as np
+
+from alpha_factory_v1.demos.muzero_planning import minimuzero
+from alpha_factory_v1.demos.muzero_planning.batched_mcts import BatchedMCTS, LinearMuNet
+
+BATCHES = (1, 2, 4, 8, 16, 32, 64, 128, 256)
+
+
+def bench(net, obs: np.ndarray, action_dim: int, sims: int, batch: int, repeat: int) -> dict[str, float | int]:
+    state, _, logits = net.initial_inference(obs)
+    search = BatchedMCTS(action_dim, num_simulations=sims, batch_size=batch)
+    t0 = perf_counter()
+    for _ in range(repeat):
+        search.run(net, state, logits)
+    elapsed = perf_counter() - t0
+    return {
+        "batch": batch,
+        "sims_per_s": round(sims * repeat / elapsed, 1),
+        "inference_calls": search.inference_calls,
+    }
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--batches", type=int, nargs="+", default=list(BATCHES))
+    parser.add_argument("--sims", type=int, default=512, help="simulations per search")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--actions", type=int, default=8)
+    parser.add_argument("--obs-dim", type=int, default=16)
+    parser.add_argument("--hidden", type=int, default=64)
+    args = parser.parse_args(argv)
+    if minimuzero._TORCH:
+        net = minimuzero.MiniMuNet(args.obs_dim, args.actions, args.hidden)
+        backend = "torch"
+    else:
+        net = LinearMuNet(args.obs_dim, args.actions, args.hidden)
+        backend = "numpy"
+    obs = np.random.default_rng(0).standard_normal(args.obs_dim).astype("float32")
+    results = [
+        {"backend": backend, **bench(net, obs, args.actions, args.sims, b, args.repeat)} for b in args.batches
+    ]
+    json.dump(results, sys.stdout, indent=2)
+    sys.stdout.write("\n")
+
+
+if __name__ == "__main__":
+    main()
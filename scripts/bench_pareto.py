@@ -0,0 +1,46 @@
+#!/usr/bin/env python
+# SPDX-License-Identifier: Apache-2.0
+"""Benchmark the vectorised Pareto ranking engine."""
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from time import perf_counter
+
+import numpy as np
+
+from alpha_factory_v1.core.simulation import pareto
+
+SIZES = (100, 1_000, 10_000, 100_000)
+
+
+def bench(size: int, objectives: int, seed: int = 0) -> dict[str, float | int]:
+    rng = np.random.default_rng(seed)
+    values = rng.random((size, objectives))
+    t0 = perf_counter()
+    ranks = pareto.non_dominated_sort(values)
+    t1 = perf_counter()
+    pareto.crowding_distance(values, ranks)
+    t2 = perf_counter()
+    return {
+        "size": size,
+        "objectives": objectives,
+        "fronts": int(ranks.max()) + 1,
+        "sort_ms": round((t1 - t0) * 1000, 3),
+        "crowding_ms": round((t2 - t1) * 1000, 3),
+    }
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(SIZES))
+    parser.add_argument("--objectives", type=int, nargs="+", default=[2, 3])
+    args = parser.parse_args(argv)
+    results = [bench(n, m) for m in args.objectives for n in args.sizes]
+    json.dump(results, sys.stdout, indent=2)
+    sys.stdout.write("\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -10,6 +10,7 @@ from alpha_factory_v1.demos.self_healing_repo.repo_healer_v1.benchmark import ru
 def test_seeded_benchmark_machine_readable() -> None:
     payload = run_seeded_benchmark(pathlib.Path("."))
     assert payload["total"] == 6
+    assert payload["speedup"] is None or payload["speedup"] > 0
     assert isinstance(payload["results"], list)
     rows = payload["results"]
     assert {row["case"] for row in rows} == {
@@ -209,3 +209,41 @@ def test_mypy_validator_plan_matches_ci_scope() -> None:
 
     plan = get_plan(ValidatorClass.MYPY)
     assert plan.targeted == ["mypy", "--config-file", "mypy.ini", "."]
+
+
+def test_engine_parallel_first_fix_cancels_slow_candidates(tmp_path: pathlib.Path) -> None:
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    readme = repo / "README.md"
+    readme.write_text("hello\n", encoding="utf-8")
+    (repo / "other.txt").write_text("shared\n", encoding="utf-8")
+    bundle = FailureBundle("wf", "job", "step", "1", "abc", logs="pytest assert")
+    candidates = [
+        PatchCandidate(
+            diff=f"--- a/README.md\n+++ b/README.md\n@@ -1,1 +1,1 @@\n-hello\n+{text}\n",
+            summary=text,
+            score=score,
+        )
+        for text, score in (("slow", 1.0), ("good", 0.5))
+    ]
+    check = (
+        "import pathlib, sys, time\n"
+        "text = pathlib.Path('README.md').read_text()\n"
+        "assert pathlib.Path('other.txt').stat().st_nlink >= 2\n"
+        "time.sleep(60) if text == 'slow\\n' else sys.exit(text != 'good\\n')\n"
+    )
+
+    with mock.patch("alpha_factory_v1.demos.self_healing_repo.repo_healer_v1.engine.get_plan") as get_plan:
+        get_plan.return_value = mock.Mock(targeted=[sys.executable, "-c", check], broader=["broad"])
+        engine = RepoHealerEngine(
+            repo,
+            EngineOptions(max_attempts=2, run_broader_validation=False, workers=2),
+        )
+        report = engine.run(bundle, candidates)
+
+    assert report.success is True
+    assert report.selected_patch_summary == "good"
+    assert report.attempts == 2
+    assert report.time_to_first_fix is not None and report.time_to_first_fix < 30
+    assert readme.read_text(encoding="utf-8") == "good\n"
+    assert (repo / "other.txt").stat().st_nlink == 1
@@ -0,0 +1,63 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Tests for the MetaEvolver novelty archive and shared-memory genome rows."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from alpha_factory_v1.demos.aiga_meta_evolution import meta_evolver as me
+
+
+def _brute(archive: np.ndarray, vecs: np.ndarray, k: int) -> np.ndarray:
+    d = np.linalg.norm(vecs[:, None, :] - archive[None, :, :], axis=2)
+    return np.sort(d, axis=1)[:, :k].mean(axis=1)
+
+
+def test_knn_novelty_matches_brute_force() -> None:
+    rng = np.random.default_rng(0)
+    idx = me.NoveltyIndex(k=5)
+    assert list(idx.novelty(rng.random((2, 9)))) == [0.0, 0.0]
+    chunks = [rng.random((n, 9)) for n in (3, 70, 64)]
+    for c in chunks:
+        idx.add(c)
+    archive = np.concatenate(chunks)
+    vecs = rng.random((8, 9))
+    assert len(idx) == len(archive)
+    assert np.allclose(idx.novelty(vecs), _brute(archive, vecs, 5))
+    assert np.allclose(idx.tail(4), archive[-4:])
+
+    small = me.NoveltyIndex(k=15)
+    small.add(chunks[0])
+    assert np.allclose(small.novelty(vecs), _brute(chunks[0], vecs, 3))
+
+
+def test_genome_rows_round_trip() -> None:
+    pop = [
+        me.Genome(layers=(16, 32, 8), activation="tanh", hebbian=True, novelty_weight=0.35),
+        me.Genome(layers=(4,), activation="gelu"),
+    ]
+    rows = np.zeros((2, 7))
+    me._encode_genomes(pop, rows)
+    assert [me._decode_genome(r) for r in rows] == pop
+    assert pop[0].sha != pop[1].sha
+
+
+def test_post_eval_adds_weighted_novelty_and_checkpoints(tmp_path: Path) -> None:
+    ev = me.MetaEvolver(lambda: None, pop_size=2, parallel=False, checkpoint_dir=tmp_path)
+    ev.population = [me.Genome(novelty_weight=0.0), me.Genome(novelty_weight=1.0)]
+    first = ev._post_eval([(1.0, np.zeros(3)), (2.0, np.zeros(3))])
+    assert first == [1.0, 2.0]
+
+    scores = ev._post_eval([(1.0, np.full(3, 2.0)), (2.0, np.full(3, 2.0))])
+    assert scores[0] == 1.0
+    assert scores[1] == pytest.approx(2.0 + np.sqrt(12.0))
+
+    ev.save()
+    other = me.MetaEvolver(lambda: None, pop_size=2, parallel=False, checkpoint_dir=tmp_path)
+    other.load()
+    assert len(other._archive) == 4
+    assert np.allclose(other._archive.tail(4), ev._archive.tail(4))
@@ -122,3 +122,20 @@ def test_root_serves_spa() -> None:
         r = client.get("/")
         assert r.status_code == 200
         assert '<div id="root">' in r.text
+
+
+def test_cancel_and_queue_limits(monkeypatch: pytest.MonkeyPatch) -> None:
+    with make_client() as client:
+        from alpha_factory_v1.core.interface import api_server
+
+        headers = {"Authorization": "Bearer test-token"}
+        assert client.delete("/simulate/missing", headers=headers).status_code == 404
+
+        ex = api_server._sim_executor
+
+        def _full() -> None:
+            raise api_server.QueueFull("busy")
+
+        monkeypatch.setattr(ex, "check_capacity", _full)
+        resp = client.post("/simulate", json={"horizon": 1}, headers=headers)
+        assert resp.status_code == 429
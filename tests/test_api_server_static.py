@@ -76,3 +76,27 @@ def test_lineage_detail(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None
         data = resp.json()
         assert len(data) == 2
         assert data[-1]["id"] == 2
+
+
+def test_lineage_subtree_and_depth(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Walk descendants and limit the depth of lineage queries."""
+    monkeypatch.setenv("API_RATE_LIMIT", "1000")
+    monkeypatch.setenv("ARCHIVE_PATH", str(tmp_path / "a.db"))
+    from alpha_factory_v1.core.archive import Archive
+
+    arch = Archive(tmp_path / "a.db")
+    arch.add({"diff": "root"}, 0.1)
+    arch.add_many([({"parent": 1}, 0.2), ({"parent": 2}, 0.3), ({"parent": 1}, 0.4)])
+
+    from alpha_factory_v1.core.interface import api_server as mod
+
+    api_mod = importlib.reload(mod)
+
+    with TestClient(cast(Any, api_mod.app)) as client:
+        headers = {"Authorization": "Bearer test-token"}
+        assert [n["id"] for n in client.get("/lineage", headers=headers).json()] == [1, 2, 3, 4]
+        resp = client.get("/lineage/3", params={"depth": 1}, headers=headers)
+        assert [n["id"] for n in resp.json()] == [2, 3]
+        resp = client.get("/lineage/1", params={"subtree": True}, headers=headers)
+        assert [n["id"] for n in resp.json()] == [1, 2, 4, 3]
+        assert client.get("/lineage/99", headers=headers).status_code == 404
@@ -33,6 +33,26 @@ def test_archive_crud(tmp_path) -> None:
     assert [e.hash for e in history] == ["h2", "h1"]
 
 
+def test_archive_lineage_queries(tmp_path) -> None:
+    db = ArchiveDB(tmp_path / "arch.db")
+    db.add(ArchiveEntry("h0", None, 0.0, 0.0, True, 0.0))
+    for i in range(1, 2000):
+        db.add(ArchiveEntry(f"h{i}", f"h{i - 1}", float(i), 0.0, True, float(i)))
+    db.add(ArchiveEntry("side", "h1", 0.5, 0.0, True, 1.5))
+
+    history = list(db.history("h1999"))
+    assert len(history) == 2000 and history[-1].hash == "h0"
+    assert history[0] == db.get("h1999")
+    assert [e.hash for e in db.history("h1999", max_depth=2)] == ["h1999", "h1998", "h1997"]
+    assert [e.hash for e in db.descendants("h1", max_depth=1)] == ["h1", "side", "h2"]
+    assert len(list(db.descendants("h0"))) == 2001
+    assert list(db.history("missing")) == []
+
+    # a corrupt parent cycle must not loop forever
+    db.add(ArchiveEntry("h0", "h1999", 0.0, 0.0, True, 0.0))
+    assert len(list(db.history("h5"))) <= 2002
+
+
 def test_archive_migration(TestArchiveMigration) -> None:
     entries = [
         {"hash": "a", "parent": None, "score": 0.3, "novelty": 0.1, "is_live": True, "ts": 1.0},
@@ -11,7 +11,7 @@ from alpha_factory_v1.core.archive.hash_archive import HashArchive
 
 
 def _manual_root(hashes: list[str]) -> str:
-    nodes = [hashlib.sha256(h.encode()).digest() for h in sorted(hashes)]
+    nodes = [hashlib.sha256(h.encode()).digest() for h in hashes]
     if not nodes:
         return ""
     while len(nodes) > 1:
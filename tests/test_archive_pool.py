@@ -0,0 +1,112 @@
+# SPDX-License-Identifier: Apache-2.0
+from __future__ import annotations
+
+import random
+import sqlite3
+import threading
+from collections import Counter
+from pathlib import Path
+
+from alpha_factory_v1.core.archive import Archive
+from alpha_factory_v1.core.monitoring import metrics
+
+
+def _gauge(g) -> float:
+    return float(g.collect()[0].samples[0].value)
+
+
+def test_add_maintains_aggregates_and_metrics(tmp_path: Path) -> None:
+    arch = Archive(tmp_path / "a.db")
+    arch.add({"n": 0}, 0.2)
+    arch.add_many([({"n": 1}, 0.8), ({"n": 2}, 0.5)])
+    assert len(arch) == 3
+    assert [a.meta["n"] for a in arch.all()] == [0, 1, 2]
+    if hasattr(metrics.dgm_best_score, "collect"):
+        assert _gauge(metrics.dgm_best_score) == 0.8
+        assert _gauge(metrics.dgm_lineage_depth) == 3
+
+
+def test_sample_follows_logistic_weights(tmp_path: Path) -> None:
+    arch = Archive(tmp_path / "a.db")
+    arch.add_many([({"n": "low"}, 0.0), ({"n": "high"}, 1.0)])
+    random.seed(0)
+    counts = Counter(a.meta["n"] for _ in range(400) for a in arch.sample(1))
+    assert counts["high"] > 0.95 * sum(counts.values())
+    assert len(arch.sample(5)) == 2
+    custom = arch.sample(2, lam=0.0)
+    assert len(custom) == 2 and all(a.meta["n"] in {"low", "high"} for a in custom)
+
+
+def test_sample_is_uniform_when_all_weights_vanish(tmp_path: Path) -> None:
+    arch = Archive(tmp_path / "a.db")
+    arch.add_many([({"n": i}, -100.0) for i in range(3)])
+    assert len(arch.sample(2)) == 2
+    assert len(arch.sample(3, alpha0=100.0)) == 3
+
+
+def test_legacy_database_is_migrated(tmp_path: Path) -> None:
+    db = tmp_path / "legacy.db"
+    with sqlite3.connect(db) as cx:
+        cx.execute("CREATE TABLE agents(id INTEGER PRIMARY KEY AUTOINCREMENT, meta TEXT, score REAL)")
+        cx.executemany("INSERT INTO agents(meta, score) VALUES (?, ?)", [("{}", 0.1), ("{}", 0.9)])
+    arch = Archive(db)
+    arch.add({}, 0.4)
+    assert len(arch) == 3
+    with sqlite3.connect(db) as cx:
+        weights = [r[0] for r in cx.execute("SELECT cum_weight FROM agents ORDER BY id")]
+        mode = cx.execute("PRAGMA journal_mode").fetchone()[0]
+    assert weights == sorted(weights) and None not in weights
+    assert mode == "wal"
+
+
+def test_concurrent_writers(tmp_path: Path) -> None:
+    arch = Archive(tmp_path / "a.db")
+
+    def worker(i: int) -> None:
+        for j in range(20):
+            arch.add({"w": i, "j": j}, j / 20)
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert len(arch) == 80 == len(arch.all())
+
+
+def test_lineage_and_subtree_queries(tmp_path: Path) -> None:
+    db = tmp_path / "legacy.db"
+    with sqlite3.connect(db) as cx:
+        cx.execute("CREATE TABLE agents(id INTEGER PRIMARY KEY AUTOINCREMENT, meta TEXT, score REAL)")
+        cx.executemany(
+            "INSERT INTO agents(meta, score) VALUES (?, ?)",
+            [("{}", 0.1), ('{"parent": 1}', 0.2), ('{"parent": 1}', 0.3)],
+        )
+    arch = Archive(db)  # backfills the parent column
+    arch.add_many([({"parent": 2}, 0.4), ({"parent": 4}, 0.5)])
+
+    assert [a.id for a in arch.lineage(5)] == [1, 2, 4, 5]
+    assert [a.id for a in arch.lineage(5, max_depth=1)] == [4, 5]
+    assert [a.id for a in arch.subtree(1)] == [1, 2, 3, 4, 5]
+    assert [a.id for a in arch.subtree(2, max_depth=1)] == [2, 4]
+    assert arch.lineage(99) == []
+    assert [a.id for a in arch.iter_all(batch_size=2)] == [1, 2, 3, 4, 5]
+
+
+def test_paused_iterators_do_not_hold_connections(tmp_path: Path) -> None:
+    arch = Archive(tmp_path / "a.db")
+    arch.add_many([({"n": i}, 0.1) for i in range(5)])
+    streams = [arch.iter_all(batch_size=2) for _ in range(arch.pool.size + 2)]
+    assert [next(s).id for s in streams] == [1] * len(streams)
+    arch.add({"n": 5}, 0.2)  # every stream is paused mid-page
+    assert len(arch) == 6
+    assert [a.id for a in streams[0]] == [2, 3, 4, 5, 6]
+
+
+def test_deep_lineage_is_single_query(tmp_path: Path) -> None:
+    arch = Archive(tmp_path / "a.db")
+    arch.add({}, 0.0)
+    arch.add_many([({"parent": i}, 0.0) for i in range(1, 10_000)])
+    chain = arch.lineage(10_000)
+    assert len(chain) == 10_000 and chain[0].id == 1
+    assert len(arch.subtree(9_990)) == 11
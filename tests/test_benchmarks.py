@@ -24,3 +24,79 @@ def test_run_benchmarks(tmp_path: Path) -> None:
     for entry in data:
         assert "time_ms" in entry and isinstance(entry["time_ms"], int)
         assert "pass" in entry
+
+
+def test_run_all_times_out_and_repeats(tmp_path: Path, monkeypatch) -> None:
+    from benchmarks import run_benchmarks as rb
+
+    pkg = tmp_path / "bench_tmp_pkg"
+    pkg.mkdir()
+    (pkg / "__init__.py").write_text("")
+    (pkg / "task_slow.py").write_text("import time\n\ndef run():\n    time.sleep(30)\n")
+    (pkg / "task_fast.py").write_text("def run():\n    return sum(range(100))\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    tasks = [("tmp/task_slow", "bench_tmp_pkg.task_slow"), ("tmp/task_fast", "bench_tmp_pkg.task_fast")]
+    results = rb.run_all(tasks, workers=2, repeat=3, timeout=0.5)
+    slow, fast = results
+    assert slow["pass"] is False and slow["error"] == "timeout"
+    assert fast["pass"] is True and fast["runs"] == 3
+    assert fast["p95_ms"] >= fast["median_ms"]
+
+
+def test_peak_rss_is_reported_per_task(tmp_path: Path, monkeypatch) -> None:
+    from benchmarks import run_benchmarks as rb
+
+    pkg = tmp_path / "bench_rss_pkg"
+    pkg.mkdir()
+    (pkg / "__init__.py").write_text("")
+    # touch one byte per page so the allocation is resident
+    (pkg / "task_big.py").write_text("def run():\n    b = bytearray(200 << 20)\n    b[::4096] = b'x' * (50 << 8)\n")
+    (pkg / "task_small.py").write_text("def run():\n    return 1\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    tasks = [("tmp/task_big", "bench_rss_pkg.task_big"), ("tmp/task_small", "bench_rss_pkg.task_small")]
+    big, small = rb.run_all(tasks, workers=1)
+    if big["peak_rss_kb"] is None:
+        return
+    assert big["peak_rss_kb"] - small["peak_rss_kb"] > 150 * 1024
+
+
+def test_compare_flags_regressions() -> None:
+    from benchmarks import run_benchmarks as rb
+
+    baseline = [
+        {"task_id": "a", "pass": True, "time_ms": 10, "median_ms": 10.0},
+        {"task_id": "b", "pass": True, "time_ms": 10, "median_ms": 10.0},
+        {"task_id": "c", "pass": True, "time_ms": 10, "median_ms": 10.0},
+    ]
+    results = [
+        {"task_id": "a", "pass": True, "time_ms": 11, "median_ms": 11.0},
+        {"task_id": "b", "pass": True, "time_ms": 20, "median_ms": 20.0},
+        {"task_id": "c", "pass": False, "time_ms": 5, "median_ms": 5.0},
+        {"task_id": "d", "pass": True, "time_ms": 50, "median_ms": 50.0},
+    ]
+    flagged = rb.compare(results, baseline, threshold=0.2)
+    assert [r["task_id"] for r in flagged] == ["b", "c"]
+    assert results[1]["delta_pct"] == 100.0
+    assert "regression" not in results[3]
+
+
+def test_baseline_gate_exit_code(tmp_path: Path) -> None:
+    base = tmp_path / "base.json"
+    cmd = [sys.executable, str(Path("benchmarks") / "run_benchmarks.py"), "--datasets", "swe_mini"]
+    subprocess.run(cmd + ["--save-baseline", str(base)], capture_output=True, check=True)
+    data = json.loads(base.read_text())
+    for entry in data:
+        entry["median_ms"] = 0.0
+        entry["pass"] = True
+    data[0]["median_ms"] = 1e9
+    base.write_text(json.dumps(data))
+    proc = subprocess.run(cmd + ["--baseline", str(base), "--min-delta-ms", "1e6"], capture_output=True, text=True)
+    assert proc.returncode == 0, proc.stderr
+    data[0]["median_ms"] = 0.0
+    data[0]["pass"] = True
+    base.write_text(json.dumps(data))
+    proc = subprocess.run(
+        cmd + ["--baseline", str(base), "--threshold", "-1", "--min-delta-ms", "-1"], capture_output=True, text=True
+    )
+    assert proc.returncode == 1
+    assert "REGRESSION" in proc.stderr
@@ -0,0 +1,166 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Tests for bounded A2ABus dispatch and publisher backpressure."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import types
+
+from alpha_factory_v1.common.utils import config, messaging
+
+
+def _env(n: int) -> object:
+    return types.SimpleNamespace(sender="a", recipient="b", ts=0.0, payload={"n": n})
+
+
+def _bus(**kw: object) -> messaging.A2ABus:
+    return messaging.A2ABus(config.Settings(bus_port=0, **kw))
+
+
+def test_queue_is_bounded_and_drops_new() -> None:
+    bus = _bus(bus_queue_size=2, bus_workers=1, bus_overflow="drop_new")
+    seen: list[int] = []
+
+    async def handler(env: object) -> None:
+        seen.append(env.payload["n"])
+
+    bus.subscribe("b", handler)
+
+    async def run() -> None:
+        for i in range(5):
+            bus.publish("b", _env(i))
+        await bus.drain(1)
+
+    asyncio.run(run())
+    assert seen == [0, 1]
+
+
+def test_drop_oldest_keeps_latest() -> None:
+    bus = _bus(bus_workers=1)
+    seen: list[int] = []
+
+    async def handler(env: object) -> None:
+        seen.append(env.payload["n"])
+
+    bus.subscribe("b", handler, queue_size=2, overflow="drop_oldest")
+
+    async def run() -> None:
+        for i in range(5):
+            bus.publish("b", _env(i))
+        await bus.drain(1)
+
+    asyncio.run(run())
+    assert seen == [3, 4]
+
+
+def test_apublish_waits_for_space() -> None:
+    bus = _bus(bus_queue_size=1, bus_workers=1)
+    seen: list[int] = []
+    active = 0
+    peak = 0
+
+    async def run() -> None:
+        nonlocal active, peak
+        release = asyncio.Event()
+
+        async def handler(env: object) -> None:
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await release.wait()
+            seen.append(env.payload["n"])
+            active -= 1
+
+        bus.subscribe("b", handler)
+        publisher = asyncio.ensure_future(asyncio.gather(*(bus.apublish("b", _env(i)) for i in range(4))))
+        await asyncio.sleep(0.05)
+        assert not publisher.done()
+        release.set()
+        await asyncio.wait_for(publisher, 1)
+        await bus.drain(1)
+
+    asyncio.run(run())
+    assert sorted(seen) == [0, 1, 2, 3]
+    assert peak == 1
+
+
+def test_rpc_publish_waits_for_space() -> None:
+    bus = _bus(bus_queue_size=1, bus_workers=1)
+    seen: list[int] = []
+
+    class Ctx:
+        def peer(self) -> str:
+            return "ipv4:127.0.0.1:1"
+
+        def add_callback(self, _cb: object) -> None:
+            pass
+
+        async def abort(self, *_a: object) -> None:
+            raise RuntimeError("aborted")
+
+    def frame(n: int) -> bytes:
+        return json.dumps({"sender": "a", "recipient": "b", "payload": {"n": n}, "ts": 0.0}).encode()
+
+    async def run() -> None:
+        release = asyncio.Event()
+
+        async def handler(env: object) -> None:
+            await release.wait()
+            seen.append(env.payload["n"])
+
+        bus.subscribe("b", handler)
+        ctx = Ctx()
+        assert await bus._handle_rpc(f"{bus.PROTO_VERSION} n1".encode(), ctx) == bus.PROTO_VERSION.encode()
+        calls = asyncio.ensure_future(asyncio.gather(*(bus._handle_rpc(frame(i), ctx) for i in range(4))))
+        await asyncio.sleep(0.05)
+        assert not calls.done()
+        release.set()
+        assert await asyncio.wait_for(calls, 1) == [b"ok"] * 4
+        await bus.drain(1)
+
+    asyncio.run(run())
+    assert sorted(seen) == [0, 1, 2, 3]
+
+
+def test_handler_publishing_to_full_queue_does_not_deadlock() -> None:
+    bus = _bus(bus_queue_size=1, bus_workers=1)
+    seen: list[int] = []
+
+    async def relay(env: object) -> None:
+        n = env.payload["n"]
+        seen.append(n)
+        if n < 3:
+            await bus.apublish("b", _env(n + 1))
+
+    bus.subscribe("b", relay)
+
+    async def run() -> None:
+        await bus.apublish("b", _env(0))
+        await bus.drain(1)
+
+    asyncio.run(run())
+    assert seen == [0, 1, 2, 3]
+
+
+def test_sync_handlers_run_inline_and_stop_drains() -> None:
+    bus = _bus()
+    inline: list[int] = []
+    queued: list[int] = []
+
+    async def handler(env: object) -> None:
+        await asyncio.sleep(0.01)
+        queued.append(env.payload["n"])
+
+    bus.subscribe("b", lambda env: inline.append(env.payload["n"]))
+    bus.subscribe("b", handler)
+
+    async def run() -> None:
+        await bus.start()
+        for i in range(3):
+            bus.publish("b", _env(i))
+        assert inline == [0, 1, 2]
+        await bus.stop()
+
+    asyncio.run(run())
+    assert sorted(queued) == [0, 1, 2]
@@ -0,0 +1,119 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Tests for the pluggable A2ABus envelope codecs."""
+
+from __future__ import annotations
+
+import asyncio
+import socket
+import types
+
+import pytest
+
+from alpha_factory_v1.common.utils import config, envelope_codec, messaging
+
+pb = pytest.importorskip("alpha_factory_v1.core.utils.a2a_pb2")
+
+
+def _env(n: int = 3) -> object:
+    env = pb.Envelope(sender="planner", recipient="research", ts=12.5)
+    env.payload.update({"task": "evaluate", "scores": [0.25] * n, "meta": {"round": 3}})
+    return env
+
+
+@pytest.mark.parametrize("name", envelope_codec.available())
+def test_round_trip(name: str) -> None:
+    codec = envelope_codec.get(name)
+    for env in (_env(), _env(2000)):
+        data = codec.encode(env, token="tok")
+        out, token = codec.decode(memoryview(data))
+        assert token == "tok"
+        assert out == env
+    out, token = codec.decode(codec.encode(_env()))
+    assert token is None
+
+
+def test_plain_objects_and_compression() -> None:
+    ns = types.SimpleNamespace(sender="a", recipient="b", ts=1.0, payload={"x": "y" * 5000})
+    proto = envelope_codec.get("proto")
+    zipped = envelope_codec.get("proto+zlib")
+    assert proto.decode(proto.encode(ns))[0].payload["x"] == "y" * 5000
+    assert len(zipped.encode(ns)) < len(proto.encode(ns)) // 10
+    small = types.SimpleNamespace(sender="a", recipient="b", ts=1.0, payload={})
+    assert zipped.encode(small)[:1] == b"\x00"
+
+
+def test_codec_requires_encode_and_decode() -> None:
+    class Half(envelope_codec.Codec):
+        def encode(self, env: object, token: str | None = None) -> bytes:
+            return b""
+
+    with pytest.raises(TypeError):
+        Half()  # type: ignore[abstract]
+
+
+def test_negotiate_prefers_offer_order() -> None:
+    assert envelope_codec.negotiate(["nope", "proto", "json"]).name == "proto"
+    assert envelope_codec.negotiate(["proto+zlib", "json"], allowed=["json"]).name == "json"
+    assert envelope_codec.negotiate([]).name == "json"
+    with pytest.raises(ValueError):
+        envelope_codec.get("nope")
+
+
+def _free_port() -> int:
+    s = socket.socket()
+    s.bind(("localhost", 0))
+    port = int(s.getsockname()[1])
+    s.close()
+    return port
+
+
+def test_grpc_handshake_negotiates_codec() -> None:
+    grpc = pytest.importorskip("grpc")
+    port = _free_port()
+    bus = messaging.A2ABus(config.Settings(bus_port=port, allow_insecure=True, bus_token="tok"))
+    received: list[object] = []
+    bus.subscribe("research", received.append)
+    codec = envelope_codec.get("proto+zlib")
+
+    async def run() -> None:
+        async with bus:
+            async with grpc.aio.insecure_channel(f"localhost:{port}") as ch:
+                stub = ch.unary_unary("/bus.Bus/Send")
+                reply = await stub(f"{messaging.A2ABus.PROTO_VERSION} n1 codecs=nope,proto+zlib,json".encode())
+                assert reply == f"{messaging.A2ABus.PROTO_VERSION} codec=proto+zlib".encode()
+                assert await stub(codec.encode(_env(500), token="tok")) == b"ok"
+                with pytest.raises(grpc.aio.AioRpcError):
+                    await stub(codec.encode(_env(), token="bad"))
+
+    asyncio.run(run())
+    assert received == [_env(500)]
+
+
+def test_kafka_records_carry_codec_header(monkeypatch: pytest.MonkeyPatch) -> None:
+    sent: list[tuple[str, bytes, object]] = []
+
+    class Prod:
+        def __init__(self, bootstrap_servers: str) -> None:
+            pass
+
+        async def start(self) -> None:
+            return None
+
+        async def send_and_wait(self, topic: str, data: bytes, headers: object = None) -> None:
+            sent.append((topic, data, headers))
+
+        async def stop(self) -> None:
+            return None
+
+    monkeypatch.setattr(messaging, "AIOKafkaProducer", Prod)
+    cfg = config.Settings(bus_port=0, broker_url="k:1", bus_codec="proto")
+
+    async def run() -> None:
+        async with messaging.A2ABus(cfg) as bus:
+            bus.publish("research", _env())
+            await asyncio.sleep(0)
+
+    asyncio.run(run())
+    topic, data, headers = sent[0]
+    assert headers == [("codec", b"proto")]
+    assert envelope_codec.get("proto").decode(data)[0] == _env()
@@ -52,3 +52,47 @@ def test_bandit_early_stop_reduces_cost() -> None:
     naive_ratio = naive_cost / naive_gain
     early_ratio = early_cost / early_gain
     assert early_ratio <= 0.75 * naive_ratio
+
+
+def test_concurrent_evaluations_overlap() -> None:
+    active = 0
+    peak = 0
+
+    async def slow_eval(_g: float) -> tuple[float, float]:
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        return 0.5, 0.1
+
+    arch = InMemoryArchive()
+    asyncio.run(evolve(lambda g: g + 1, slow_eval, arch, max_cost=0.8, concurrency=4))
+    assert peak == 4
+    assert active == 0
+    assert len(arch) >= 1 + 2 * 8
+
+
+def test_archive_view_is_read_only_with_running_stats() -> None:
+    from alpha_factory_v1.core.monitoring import metrics
+
+    arch = InMemoryArchive()
+    view = arch.all()
+    for fit in (1.0, 3.0, 2.0):
+        asyncio.run(arch.accept(Candidate(0.0, fitness=fit)))
+    assert arch.all() is view
+    assert [c.fitness for c in view[1:]] == [3.0, 2.0]
+    assert not hasattr(view, "append")
+    if hasattr(metrics.dgm_best_score, "_value"):
+        assert metrics.dgm_best_score._value.get() == 3.0
+        assert metrics.dgm_archive_mean._value.get() == 2.0
+
+
+def test_evaluation_error_propagates() -> None:
+    import pytest
+
+    async def bad_eval(_g: float) -> tuple[float, float]:
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError, match="boom"):
+        asyncio.run(evolve(lambda g: g, bad_eval, InMemoryArchive(), max_cost=1.0, concurrency=3))
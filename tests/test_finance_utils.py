@@ -1,6 +1,7 @@
 # SPDX-License-Identifier: Apache-2.0
 import unittest
 from unittest.mock import patch
+import math
 import statistics
 
 from alpha_factory_v1.backend.agents import finance_agent
@@ -43,6 +44,27 @@ class TestFinanceUtils(unittest.TestCase):
         self.assertEqual(p.qty("BTC"), 0.0)
         self.assertEqual(p.book(), {})
 
+    def test_factor_ticks_match_full_recompute(self):
+        def reference(hist):
+            pct = finance_agent._pct
+            mom = pct(hist[-30], hist[-1])
+            vol = statistics.pstdev([pct(a, b) for a, b in zip(hist, hist[1:])]) or 1e-6
+            carry = pct(hist[-31], hist[-1]) if len(hist) >= 31 else 0.0
+            rev = -statistics.mean([pct(a, b) for a, b in zip(hist[-11:-1], hist[-10:])])
+            return (mom + carry + rev) / vol
+
+        prices = [100 + 10 * math.sin(i / 7) + (i % 5) for i in range(160)]
+        engine = finance_agent._FactorEngine(history=100)
+        for i, px in enumerate(prices, 1):
+            engine.update_tick({"BTC": px})
+            hist = prices[max(0, i - 100) : i]
+            if i < 30:
+                self.assertEqual(engine.scores["BTC"], 0.0)
+            else:
+                self.assertAlmostEqual(engine.scores["BTC"], reference(hist), places=6)
+        engine.update({"BTC": prices})
+        self.assertAlmostEqual(engine.scores["BTC"], reference(prices[-100:]), places=6)
+
 
 if __name__ == "__main__":  # pragma: no cover - manual execution
     unittest.main()
@@ -126,3 +126,56 @@ def test_forecast_disruptions_seed_deterministic() -> None:
     result1 = [(p.year, p.sectors[0].energy, p.sectors[0].disrupted) for p in traj1]
     result2 = [(p.year, p.sectors[0].energy, p.sectors[0].disrupted) for p in traj2]
     assert result1 == result2
+
+
+def _reference_forecast(secs, horizon, curve, seed):
+    out = []
+    for year in range(1, horizon + 1):
+        cap = forecast.capability_growth(year / horizon, curve)
+        for sec in secs:
+            if not sec.disrupted:
+                sec.energy *= 1.0 + sec.growth
+                if forecast.thermodynamic_trigger(sec, cap):
+                    sec.disrupted = True
+                    sec.energy += forecast._innovation_gain(2, 1, seed=seed)
+        out.append([(s.name, s.energy, s.disrupted) for s in secs])
+    return out
+
+
+def test_engine_matches_scalar_loop() -> None:
+    import random
+
+    rng = random.Random(7)
+
+    def make():
+        return [
+            sector.Sector(f"s{i}", rng.uniform(0.1, 2.0), rng.uniform(0.1, 3.0), rng.uniform(0.0, 0.2), i % 17 == 0)
+            for i in range(60)
+        ]
+
+    state = rng.getstate()
+    expected_secs = make()
+    rng.setstate(state)
+    secs = make()
+    expected = _reference_forecast(expected_secs, 12, "logistic", seed=5)
+    traj = forecast.forecast_disruptions(secs, 12, pop_size=2, generations=1, seed=5)
+    assert [[(s.name, s.energy, s.disrupted) for s in p.sectors] for p in traj] == expected
+    assert [(s.energy, s.disrupted) for s in secs] == [(s.energy, s.disrupted) for s in expected_secs]
+    # snapshots rebuild the same state when read out of order
+    assert [(s.energy, s.disrupted) for s in traj[3].sectors] == [e[1:] for e in expected[3]]
+
+
+def test_seeded_innovation_gain_is_memoised(monkeypatch) -> None:
+    calls = []
+    real = forecast.mats.run_evolution
+
+    def counting(*args, **kwargs):
+        calls.append(kwargs.get("seed"))
+        return real(*args, **kwargs)
+
+    monkeypatch.setattr(forecast.mats, "run_evolution", counting)
+    forecast._cached_gain.cache_clear()
+    secs = [sector.Sector(f"s{i}", 1.0, 2.0, 0.1) for i in range(50)]
+    forecast.forecast_disruptions(secs, 3, curve="linear", pop_size=2, generations=1, seed=99)
+    assert all(s.disrupted for s in secs)
+    assert calls == [99]
@@ -0,0 +1,54 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Tests for the coverage-based test-impact map."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("coverage")
+
+from alpha_factory_v1.core.self_evolution.impact_map import ImpactMap, changed_files
+
+
+def _make_repo(root: Path) -> Path:
+    (root / "pkg").mkdir(parents=True)
+    (root / "pkg" / "__init__.py").write_text("")
+    (root / "pkg" / "a.py").write_text("def f():\n    return 1\n")
+    (root / "pkg" / "b.py").write_text("def g():\n    return 2\n")
+    (root / "pkg" / "consts.py").write_text("X = 1\n")
+    (root / "tests").mkdir()
+    (root / "tests" / "test_a.py").write_text("from pkg.a import f\n\ndef test_f():\n    assert f() == 1\n")
+    (root / "tests" / "test_b.py").write_text(
+        "from pkg.b import g\n\ndef test_g():\n    assert g() == 2\n\ndef test_g_again():\n    assert g()\n"
+    )
+    (root / "conftest.py").write_text("import sys, pathlib\nsys.path.insert(0, str(pathlib.Path(__file__).parent))\n")
+    return root
+
+
+def test_select_and_incremental_refresh(tmp_path: Path) -> None:
+    repo = _make_repo(tmp_path / "repo")
+    impact = ImpactMap(tmp_path / "impact.sqlite")
+    assert impact.select(["pkg/a.py"]) is None
+
+    assert impact.refresh(repo) == 3
+    assert impact.select(["pkg/a.py"]) == ["tests/test_a.py::test_f"]
+    assert impact.select(["pkg/b.py"]) == ["tests/test_b.py::test_g", "tests/test_b.py::test_g_again"]
+    assert impact.select(["tests/test_new.py"]) == ["tests/test_new.py"]
+    for unsafe in (["pkg/consts.py"], ["pkg/unknown.py"], ["conftest.py"], ["metric.txt"]):
+        assert impact.select(unsafe) is None
+
+    assert impact.refresh(repo) == 0
+    (repo / "pkg" / "a.py").write_text("def f():\n    return 1  # edited\n")
+    assert impact.refresh(repo) == 1
+
+    (repo / "tests" / "test_b.py").write_text("from pkg.b import g\n\ndef test_renamed():\n    assert g() == 2\n")
+    assert impact.refresh(repo) == 1
+    assert impact.select(["pkg/b.py"]) == ["tests/test_b.py::test_renamed"]
+    assert len(impact) == 2
+
+
+def test_changed_files_parses_diff_headers() -> None:
+    diff = "--- a/pkg/a.py\n+++ b/pkg/a.py\n@@\n-x\n+y\n--- /dev/null\n+++ b/tests/test_c.py\n@@\n+z\n"
+    assert changed_files(diff) == ["pkg/a.py", "tests/test_c.py"]
@@ -0,0 +1,155 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Group-commit mode of the ledger: batching, durability and backpressure."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+from unittest import mock
+
+import pytest
+from google.protobuf import json_format
+
+from alpha_factory_v1.common.utils import logging as insight_logging
+from alpha_factory_v1.common.utils import messaging
+from alpha_factory_v1.common.utils.logging import Ledger
+
+
+def _envs(n: int) -> list[messaging.Envelope]:
+    return [messaging.Envelope(sender="a", recipient="b", payload={"v": i}, ts=float(i)) for i in range(n)]
+
+
+def _expected_root(envs: list[messaging.Envelope]) -> str:
+    hashes = []
+    for env in envs:
+        data = json.dumps(json_format.MessageToDict(env, preserving_proto_field_name=True), sort_keys=True)
+        hashes.append(insight_logging.blake3(data.encode()).hexdigest())  # type: ignore[attr-defined]
+    return insight_logging._merkle_root(hashes)
+
+
+@pytest.mark.parametrize("db", ["sqlite", "duckdb"])
+@pytest.mark.parametrize("durability", ["full", "normal"])
+def test_concurrent_group_commit_matches_sequential_root(tmp_path, db: str, durability: str) -> None:
+    if db == "duckdb":
+        pytest.importorskip("duckdb")
+    envs = _envs(200)
+    ledger = Ledger(
+        str(tmp_path / f"log.{db}"), broadcast=False, db=db, group_commit=True, durability=durability, batch_size=64
+    )
+    batches: list[int] = []
+    write = ledger._write_rows
+
+    def _count(rows):
+        batches.append(len(rows))
+        write(rows)
+
+    with mock.patch.object(ledger, "_write_rows", _count):
+        threads = [threading.Thread(target=lambda c=c: [ledger.log(e) for e in c]) for c in (envs[:100], envs[100:])]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        ledger.flush()
+    assert sum(batches) == 200 and max(batches) <= 64
+    rows = ledger._execute("SELECT hash FROM messages ORDER BY id")
+    assert len(rows) == 200
+    assert ledger.compute_merkle_root() == insight_logging._merkle_root(r[0] for r in rows)
+    assert sorted(e["payload"]["v"] for e in ledger.tail(200)) == list(range(200))
+    ledger.close()
+
+
+def test_normal_durability_batches_within_window(tmp_path) -> None:
+    envs = _envs(50)
+    path = str(tmp_path / "l.db")
+    with Ledger(path, broadcast=False, group_commit=True, durability="normal", flush_interval=5) as led:
+        for env in envs:
+            led.log(env)
+        assert led._committed == 0
+        assert led.compute_merkle_root() == _expected_root(envs)
+        assert led._committed == 50
+
+
+def test_log_blocks_when_queue_full(tmp_path) -> None:
+    gate = threading.Event()
+    led = Ledger(
+        str(tmp_path / "l.db"), broadcast=False, group_commit=True, durability="normal", queue_size=1, batch_size=1
+    )
+    write = led._write_rows
+    with mock.patch.object(led, "_write_rows", lambda rows: (gate.wait(5), write(rows))):
+        led.log(_envs(1)[0])  # picked up by the blocked writer
+        led.log(_envs(2)[1])  # fills the queue
+        producer = threading.Thread(target=led.log, args=(_envs(3)[2],))
+        producer.start()
+        producer.join(0.2)
+        assert producer.is_alive()
+        gate.set()
+        producer.join(5)
+        assert not producer.is_alive()
+        led.flush()
+    assert len(led.tail(10)) == 3
+    led.close()
+
+
+def test_failed_batch_surfaces_to_full_durability_callers(tmp_path) -> None:
+    led = Ledger(str(tmp_path / "l.db"), broadcast=False, group_commit=True)
+    with mock.patch.object(led, "_write_rows", side_effect=RuntimeError("disk full")):
+        with pytest.raises(RuntimeError, match="batch write failed"):
+            led.log(_envs(1)[0])
+    led.log(_envs(2)[1])
+    assert [e["payload"]["v"] for e in led.tail()] == [1]
+    led.close()
+
+
+def test_flush_reports_every_failed_batch(tmp_path) -> None:
+    led = Ledger(str(tmp_path / "l.db"), broadcast=False, group_commit=True, durability="normal", batch_size=1)
+    envs = _envs(3)
+    write = led._write_rows
+    failures = iter([RuntimeError("first"), None, RuntimeError("second")])
+
+    def _flaky(rows):
+        exc = next(failures)
+        if exc:
+            raise exc
+        write(rows)
+
+    with mock.patch.object(led, "_write_rows", _flaky):
+        for env in envs:
+            led.log(env)
+        with pytest.raises(RuntimeError, match=r"2 batches, 2 envelopes") as info:
+            led.flush()
+    assert str(info.value.__cause__) == "first"
+    led.flush()  # already reported
+    assert [e["payload"]["v"] for e in led.tail()] == [1]
+    led.close()
+
+
+def test_alog_keeps_event_loop_responsive(tmp_path) -> None:
+    led = Ledger(str(tmp_path / "l.db"), broadcast=False, group_commit=True, flush_interval=0)
+    gate = threading.Event()
+    write = led._write_rows
+
+    async def run() -> None:
+        ticks = 0
+
+        async def ticker() -> None:
+            nonlocal ticks
+            while not gate.is_set():
+                ticks += 1
+                await asyncio.sleep(0.01)
+
+        tick = asyncio.create_task(ticker())
+        with mock.patch.object(led, "_write_rows", lambda rows: (gate.wait(0.3), write(rows))):
+            await led.alog(_envs(1)[0])
+        gate.set()
+        await tick
+        assert ticks >= 5
+
+    asyncio.run(run())
+    assert len(led.tail()) == 1
+    led.close()
+
+
+def test_invalid_durability_rejected(tmp_path) -> None:
+    with pytest.raises(ValueError):
+        Ledger(str(tmp_path / "l.db"), broadcast=False, durability="sometimes")
@@ -0,0 +1,91 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Near-duplicate lookups, namespacing and eviction of the semantic LLM cache."""
+
+import os
+import sqlite3
+from unittest import mock
+
+import pytest
+
+pytest.importorskip("prometheus_client")
+
+from prometheus_client import CollectorRegistry
+import prometheus_client
+import importlib
+
+prometheus_client.REGISTRY = CollectorRegistry()
+prometheus_client.REGISTRY._names_to_collectors.clear()
+getattr(prometheus_client.REGISTRY, "_collector_to_names", {}).clear()
+os.environ.setdefault("OPENAI_API_KEY", "stub")
+import alpha_factory_v1.backend.utils.llm_provider as llm  # noqa: E402
+
+prometheus_client.REGISTRY._names_to_collectors.clear()
+getattr(prometheus_client.REGISTRY, "_collector_to_names", {}).clear()
+llm = importlib.reload(llm)
+
+from alpha_factory_v1.backend.utils.semantic_cache import SemanticCache, hashed_ngram_embedder  # noqa: E402
+
+PROMPT = "Summarise the quarterly revenue drivers for the energy sector."
+REWORDED = "Summarise the quarterly revenue drivers of the energy sector"
+
+
+@pytest.fixture()
+def cache() -> SemanticCache:
+    return SemanticCache(sqlite3.connect(":memory:"), hashed_ngram_embedder(), threshold=0.8, max_entries=8)
+
+
+def test_near_duplicate_hits_and_unrelated_misses(cache: SemanticCache) -> None:
+    cache.store("openai:gpt", PROMPT, "answer", latency=1.5)
+    hit = cache.lookup(["openai:gpt"], REWORDED)
+    assert hit is not None and hit[0] == "answer" and hit[2] == 1.5
+    assert cache.lookup(["openai:gpt"], "Write a haiku about autumn leaves.") is None
+    assert cache.stats() == {"hits": 1, "misses": 1, "latency_saved": 1.5, "entries": 1}
+
+
+def test_namespaces_are_isolated(cache: SemanticCache) -> None:
+    cache.store("openai:gpt", PROMPT, "gpt")
+    assert cache.lookup(["anthropic:claude"], PROMPT) is None
+    assert cache.lookup(["anthropic:claude", "openai:gpt"], PROMPT)[0] == "gpt"
+
+
+def test_ttl_and_size_eviction(cache: SemanticCache) -> None:
+    for i in range(20):
+        cache.store("ns", f"prompt number {i} about topic {i}", str(i))
+    rows = cache.conn.execute("SELECT COUNT(*) FROM semantic_cache").fetchone()[0]
+    assert len(cache) <= 9 and rows == len(cache)
+    assert cache.lookup(["ns"], "prompt number 0 about topic 0") is None
+    with mock.patch("time.time", return_value=cache._spaces["ns"].ts[-1] + cache.ttl + 1):
+        assert cache.lookup(["ns"], "prompt number 19 about topic 19") is None
+
+
+def test_reload_from_sqlite(cache: SemanticCache) -> None:
+    cache.store("ns", PROMPT, "persisted")
+    fresh = SemanticCache(cache.conn, hashed_ngram_embedder(), threshold=0.8)
+    assert fresh.lookup(["ns"], REWORDED)[0] == "persisted"
+
+
+def test_chat_uses_semantic_tier() -> None:
+    calls = []
+
+    class _Echo(llm._Provider):
+        name = "echo"
+
+        def _invoke(self, msgs, temperature, max_tokens, stream, stop):
+            calls.append(msgs[-1]["content"])
+            return f"reply {len(calls)}"
+
+    sem = SemanticCache(None, hashed_ngram_embedder(), threshold=0.8)
+    with (
+        mock.patch.object(llm, "_PROVIDERS", {"echo": _Echo()}),
+        mock.patch.object(llm, "_SEMANTIC", True),
+        mock.patch.object(llm, "_sem_cache", sem),
+        mock.patch.object(llm, "_cache_mem", llm.OrderedDict()),
+        mock.patch.object(llm, "_DB", None),
+        mock.patch.object(llm, "_count_tokens", lambda text: len(text.split())),
+    ):
+        provider = llm.LLMProvider()
+        assert provider.chat(PROMPT) == "reply 1"
+        assert provider.chat(REWORDED) == "reply 1"
+        assert provider.chat(REWORDED, cache=False) == "reply 2"
+    assert calls == [PROMPT, REWORDED]
+    assert sem.hits == 1
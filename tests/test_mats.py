@@ -60,9 +60,10 @@ def test_run_evolution_three_objectives() -> None:
 
 
 def test_pareto_front_after_five_generations() -> None:
+    # Conflicting objectives so the population keeps a genuine trade-off front.
     def fn(genome: list[float]) -> tuple[float, float]:
         x, y = genome
-        return x**2, y**2
+        return x**2 + y**2, (x - 1) ** 2 + y**2
 
     pop = mats.run_evolution(
         fn,
@@ -75,6 +76,10 @@ def test_pareto_front_after_five_generations() -> None:
     )
     front = mats.pareto_front(pop)
     assert len(front) >= 10
+    fits = [ind.fitness for ind in front]
+    assert not any(
+        all(a <= b for a, b in zip(p, q)) and any(a < b for a, b in zip(p, q)) for p in fits for q in fits
+    )
 
 
 def test_novelty_divergence_for_elites() -> None:
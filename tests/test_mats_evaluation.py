@@ -0,0 +1,88 @@
+# SPDX-License-Identifier: Apache-2.0
+import pytest
+
+from alpha_factory_v1.core.simulation import evaluation, mats
+
+
+@pytest.fixture(autouse=True)
+def _reset_islands() -> None:
+    mats.ISLANDS.clear()
+    mats.ISLAND_SEEDS.clear()
+
+
+def _sphere(genome: list[float]) -> tuple[float, float]:
+    x, y = genome
+    return x**2, y**2
+
+
+def test_cache_skips_surviving_parents() -> None:
+    calls: list[tuple[float, ...]] = []
+
+    def fn(genome: list[float]) -> tuple[float, float]:
+        calls.append(tuple(genome))
+        return _sphere(genome)
+
+    cache = evaluation.FitnessCache()
+    mats.run_evolution(fn, 2, population_size=8, generations=4, seed=3, novelty_index=None, cache=cache)
+
+    assert len(calls) == len(set(calls)) == len(cache)
+    assert cache.hits > 0
+
+
+def test_cache_is_reused_for_migrated_elites() -> None:
+    calls: list[tuple[float, ...]] = []
+
+    def fn(genome: list[float]) -> tuple[float, float]:
+        calls.append(tuple(genome))
+        return _sphere(genome)
+
+    islands: dict[str, mats.Population] = {}
+    cache = evaluation.FitnessCache()
+    for key in ("a", "b"):
+        mats.run_evolution(
+            fn,
+            2,
+            population_size=6,
+            generations=2,
+            seed=1,
+            scenario_hash=key,
+            populations=islands,
+            exchange_interval=1,
+            cache=cache,
+        )
+    assert len(calls) == len(set(calls))
+
+
+def test_cache_is_scoped_to_the_fitness_function() -> None:
+    def doubled(genome: list[float]) -> tuple[float, float]:
+        return tuple(2 * v for v in _sphere(genome))
+
+    cache = evaluation.FitnessCache()
+    mats.run_evolution(_sphere, 2, population_size=6, generations=2, seed=5, novelty_index=None, cache=cache)
+    mats.ISLANDS.clear()
+    scaled = mats.run_evolution(doubled, 2, population_size=6, generations=2, seed=5, novelty_index=None, cache=cache)
+    for ind in scaled:
+        assert ind.fitness == tuple(2 * v for v in _sphere(ind.genome))
+
+
+def test_pool_executor_requires_create() -> None:
+    with pytest.raises(TypeError):
+        evaluation._PoolExecutor()  # type: ignore[abstract]
+
+
+@pytest.mark.parametrize("kind", ["thread", "process"])
+def test_pool_executors_match_serial(kind: str) -> None:
+    serial = mats.run_evolution(_sphere, 2, population_size=6, generations=3, seed=7, novelty_index=None)
+    mats.ISLANDS.clear()
+    private = {"thread": evaluation.ThreadExecutor, "process": evaluation.ProcessExecutor}[kind]
+    with private(max_workers=2) as exe:  # not the shared pool, which must outlive this test
+        pooled = mats.run_evolution(
+            _sphere, 2, population_size=6, generations=3, seed=7, novelty_index=None, executor=exe
+        )
+    assert [ind.genome for ind in pooled] == [ind.genome for ind in serial]
+    assert [ind.fitness for ind in pooled] == [ind.fitness for ind in serial]
+
+
+def test_get_executor_rejects_unknown_kind() -> None:
+    with pytest.raises(ValueError):
+        evaluation.get_executor("gpu")
@@ -0,0 +1,141 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Eviction, dedup and search behaviour of the FAISS and SQLite vector tiers."""
+
+import os
+import sqlite3
+import threading
+from types import SimpleNamespace
+from unittest import mock
+
+import numpy as np
+import pytest
+
+import alpha_factory_v1.backend.memory_fabric as memf
+
+DIM = 8
+
+
+def _embed(text: str) -> list[float]:
+    rng = np.random.default_rng(abs(hash(text)) % 2**32)
+    vec = rng.standard_normal(DIM).astype("float32")
+    return (vec / np.linalg.norm(vec)).tolist()
+
+
+class _IDMap:
+    """Exact inner-product index with the ``IndexIDMap`` calls used by the store."""
+
+    def __init__(self, _inner: object) -> None:
+        self.ids = np.empty(0, dtype="int64")
+        self.vecs = np.empty((0, DIM), dtype="float32")
+
+    @property
+    def ntotal(self) -> int:
+        return len(self.ids)
+
+    def add_with_ids(self, x: np.ndarray, ids: np.ndarray) -> None:
+        self.vecs = np.vstack([self.vecs, x])
+        self.ids = np.concatenate([self.ids, ids])
+
+    def remove_ids(self, ids: np.ndarray) -> int:
+        keep = ~np.isin(self.ids, ids)
+        removed = int((~keep).sum())
+        self.ids, self.vecs = self.ids[keep], self.vecs[keep]
+        return removed
+
+    def search(self, q: np.ndarray, k: int) -> tuple[np.ndarray, np.ndarray]:
+        scores = self.vecs @ q[0]
+        order = np.argsort(-scores)[:k]
+        return scores[order][None, :], self.ids[order][None, :]
+
+
+_FAISS = SimpleNamespace(IndexIDMap=_IDMap, IndexFlatIP=lambda dim: None)
+
+
+@pytest.fixture(autouse=True)
+def _small_vectors():
+    with mock.patch.object(memf, "_EMBED", _embed), mock.patch.object(memf.CFG, "VECTOR_DIM", DIM):
+        yield
+
+
+@pytest.fixture()
+def faiss_store():
+    with mock.patch.dict(os.environ, {"VECTOR_STORE_USE_SQLITE": "false"}):
+        with mock.patch.object(memf, "faiss", _FAISS, create=True):
+            store = memf._VectorStore()
+    assert store._mode == "faiss"
+    yield store
+    store.close()
+
+
+@pytest.fixture()
+def sqlite_store(tmp_path):
+    env = {"VECTOR_STORE_USE_SQLITE": "true", "VECTOR_SQLITE_PATH": str(tmp_path / "vec.db")}
+    with mock.patch.dict(os.environ, env):
+        store = memf._VectorStore()
+    assert store._mode == "sqlite"
+    yield store
+    store.close()
+
+
+def test_faiss_dedup_by_hash(faiss_store) -> None:
+    faiss_store.add("a", "same")
+    faiss_store.add("a", "same")
+    faiss_store.add_many("a", ["same", "other"])
+    assert faiss_store._faiss.ntotal == 2
+    assert faiss_store.recent("a") == ["other", "same"]
+
+
+def test_faiss_eviction_tombstones_then_compacts(faiss_store) -> None:
+    with (
+        mock.patch.object(memf.CFG, "MEM_MAX_PER_AGENT", 3),
+        mock.patch.object(memf.CFG, "MEM_FAISS_COMPACT_AT", 4),
+    ):
+        faiss_store.add_many("a", [f"m{i}" for i in range(6)])
+        assert faiss_store.recent("a") == ["m5", "m4", "m3"]
+        assert len(faiss_store._tombstones) == 3
+        assert faiss_store._faiss.ntotal == 6
+
+        hits = faiss_store.search("m0", k=6)
+        assert sorted(h["content"] for h in hits) == ["m3", "m4", "m5"]
+
+        faiss_store.add("a", "m6")
+        for t in threading.enumerate():
+            if t.name == "faiss-compact":
+                t.join(timeout=5)
+    assert faiss_store._tombstones == set()
+    assert faiss_store._faiss.ntotal == 3
+    assert faiss_store.recent("a") == ["m6", "m5", "m4"]
+    faiss_store.add("a", "m0")
+    assert "m0" in faiss_store.recent("a")
+
+
+def test_faiss_search_returns_nearest(faiss_store) -> None:
+    faiss_store.add_many("a", [f"doc{i}" for i in range(20)])
+    hits = faiss_store.search("doc7", k=3)
+    assert hits[0]["content"] == "doc7"
+    assert hits[0]["score"] == pytest.approx(1.0, abs=1e-5)
+
+
+def test_sqlite_blocked_search_matches_bruteforce(sqlite_store) -> None:
+    docs = [f"doc{i}" for i in range(50)]
+    with mock.patch.object(memf, "_SQLITE_BLOCK", 7):
+        sqlite_store.add_many("a", docs)
+        hits = sqlite_store.search("query", k=5)
+    q = np.asarray(_embed("query"))
+    expected = sorted(docs, key=lambda d: -float(np.dot(_embed(d), q)))[:5]
+    assert [h["content"] for h in hits] == expected
+    assert [h["agent"] for h in hits] == ["a"] * 5
+
+
+def test_sqlite_eviction_keeps_quota(sqlite_store, tmp_path) -> None:
+    with mock.patch.object(memf.CFG, "MEM_MAX_PER_AGENT", 4):
+        for i in range(10):
+            sqlite_store.add("a", f"m{i}")
+        sqlite_store.add("a", "m9")
+        sqlite_store.add("b", "other")
+    conn = sqlite3.connect(tmp_path / "vec.db")
+    count = conn.execute("SELECT COUNT(*) FROM memories WHERE agent='a'").fetchone()[0]
+    conn.close()
+    assert count == 4
+    assert sqlite_store._sql_counts["a"] == 4
+    assert sqlite_store.recent("b") == ["other"]
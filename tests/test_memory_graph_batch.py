@@ -0,0 +1,148 @@
+# SPDX-License-Identifier: Apache-2.0
+import time
+import unittest
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import alpha_factory_v1.backend.memory_graph as mg
+from alpha_factory_v1.backend.memory_graph import GraphMemory
+
+
+class _FakeNeo:
+    """Records Cypher and emulates MERGE counters for ``UNWIND`` batches."""
+
+    def __init__(self) -> None:
+        self.nodes: set[str] = set()
+        self.edges: set[tuple[str, str, str]] = set()
+        self.statements: list[str] = []
+        self.transactions = 0
+
+    # driver / session / transaction protocol
+    def session(self, database=None):
+        return self
+
+    def begin_transaction(self):
+        self.transactions += 1
+        return self
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def commit(self) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+    def run(self, cypher: str, **params):
+        self.statements.append(cypher)
+        created_nodes = created_rels = 0
+        values: list = []
+        if "$names" in cypher:
+            new = set(params["names"]) - self.nodes
+            self.nodes |= new
+            created_nodes = len(new)
+        elif "$rows" in cypher:
+            rel = cypher.split("[r:")[1].split("]")[0]
+            for row in params["rows"]:
+                key = (row["src"], rel, row["dst"])
+                if key not in self.edges:
+                    self.edges.add(key)
+                    created_rels += 1
+        elif "count(n)" in cypher:
+            values = [SimpleNamespace(values=lambda: (len(self.nodes),))]
+        elif "count(r)" in cypher:
+            values = [SimpleNamespace(values=lambda: (len(self.edges),))]
+        counters = SimpleNamespace(nodes_created=created_nodes, relationships_created=created_rels)
+        return _Result(values, counters)
+
+
+class _Result(list):
+    def __init__(self, values, counters) -> None:
+        super().__init__(values)
+        self._counters = counters
+
+    def consume(self):
+        return SimpleNamespace(counters=self._counters)
+
+
+class TestGraphMemoryBatching(unittest.TestCase):
+    def _graph(self, fake: _FakeNeo, **kw) -> GraphMemory:
+        db = SimpleNamespace(driver=lambda *a, **k: fake)
+        with (
+            patch.object(mg, "_HAS_NEO", True),
+            patch.object(mg, "GraphDatabase", db, create=True),
+            patch.object(mg, "basic_auth", lambda u, p: (u, p), create=True),
+        ):
+            return GraphMemory("bolt://fake", "neo4j", "pw", **kw)
+
+    def test_size_triggered_flush_uses_one_unwind_transaction(self) -> None:
+        fake = _FakeNeo()
+        g = self._graph(fake, batch_size=4, flush_interval=0)
+        self.assertEqual(g.backend, "neo4j")
+        g.add("A", "CAUSES", "B", {"w": 1})
+        g.add_many([("B", "CAUSES", "C"), ("A", "LINKS", "C", {"w": 2})])
+        self.assertEqual(fake.transactions, 0)
+        g.add("A", "CAUSES", "B")  # duplicate relation fills the batch
+        self.assertEqual(fake.transactions, 1)
+        unwinds = [c for c in fake.statements if c.startswith("UNWIND")]
+        self.assertEqual(len(unwinds), 3)  # nodes + one per relation type
+        self.assertEqual(len(g), 3)
+        self.assertEqual((g._n_nodes, g._n_edges), (3, 3))
+        g.close()
+
+    def test_reads_and_timer_flush_pending_writes(self) -> None:
+        fake = _FakeNeo()
+        g = self._graph(fake, batch_size=1000, flush_interval=0.05)
+        g.add("A", "CAUSES", "B")
+        deadline = time.time() + 5
+        while fake.transactions == 0 and time.time() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(fake.transactions, 1)
+
+        g._wake.set()  # stop the timer; the read below must flush on its own
+        g._flusher.join()
+        g.add("B", "CAUSES", "C")
+        g.query("MATCH (n) RETURN count(n)")
+        self.assertEqual(fake.transactions, 2)
+        self.assertEqual(fake.edges, {("A", "CAUSES", "B"), ("B", "CAUSES", "C")})
+        g.close()
+
+    def test_len_counts_relationships_in_the_database(self) -> None:
+        fake = _FakeNeo()
+        g = self._graph(fake, batch_size=1000, flush_interval=0)
+        g.add("A", "CAUSES", "B")
+        fake.edges.add(("X", "CAUSES", "Y"))  # written by another client
+        self.assertEqual(len(g), 2)
+        self.assertEqual(fake.transactions, 1)
+        g.close()
+
+    def test_node_upserts_count_unique_names_on_every_backend(self) -> None:
+        rels = [("A", "R", "B"), ("A", "R", "C"), ("B", "S", "C")]
+        for make in (lambda: self._graph(_FakeNeo(), flush_interval=0), GraphMemory):
+            counted: list[int] = []
+            with patch.object(mg, "_MET_NODE_UPS", SimpleNamespace(inc=counted.append)):
+                g = make()
+                g.add_many(rels)
+                g.flush()
+                g.close()
+            self.assertEqual(sum(counted), 3)
+
+    def test_networkx_add_many_matches_add(self) -> None:
+        one, bulk = GraphMemory(), GraphMemory()
+        rels = [("A", "R", "B", {"w": 1}), ("A", "R", "B"), ("B", "S", "C")]
+        for r in rels:
+            one.add(*r)
+        bulk.add_many(rels)
+        self.assertEqual(len(one), len(bulk))
+        self.assertEqual(bulk.neighbours("A", rel="R"), one.neighbours("A", rel="R"))
+        self.assertEqual(len(bulk), bulk._g.number_of_edges())
+        one.close()
+        bulk.close()
+
+
+if __name__ == "__main__":  # pragma: no cover
+    unittest.main()
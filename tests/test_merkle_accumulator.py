@@ -0,0 +1,114 @@
+# SPDX-License-Identifier: Apache-2.0
+from __future__ import annotations
+
+import hashlib
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from alpha_factory_v1.common.utils import logging as insight_logging
+from alpha_factory_v1.common.utils import messaging
+from alpha_factory_v1.common.utils.logging import Ledger
+from alpha_factory_v1.common.utils.merkle import MerkleAccumulator, verify_proof
+from alpha_factory_v1.core.archive.archive import insert, merkle_proof, merkle_root
+from alpha_factory_v1.core.archive.service import ArchiveService, _merkle_root
+
+
+def _sha(data: bytes) -> bytes:
+    return hashlib.sha256(data).digest()
+
+
+def _blake3(data: bytes) -> bytes:
+    return insight_logging.blake3(data).digest()
+
+
+def _hashes(n: int) -> list[str]:
+    return [hashlib.sha256(str(i).encode()).hexdigest() for i in range(n)]
+
+
+@pytest.mark.parametrize("n", [0, 1, 2, 3, 5, 8, 13, 33])
+def test_incremental_root_matches_full_rebuild(n: int) -> None:
+    cx = sqlite3.connect(":memory:")
+    acc = MerkleAccumulator(cx, "t", hash_fn=lambda b: insight_logging.blake3(b).digest(), empty_root="e")
+    hashes = _hashes(n)
+    for h in hashes:
+        acc.append(h)
+    expected = insight_logging._merkle_root(hashes) if hashes else "e"
+    assert acc.root == expected
+    for i, h in enumerate(hashes):
+        assert acc.verify(h, acc.proof(i))
+        assert acc.leaf(i) == h
+    if hashes:
+        assert not acc.verify(_hashes(n + 1)[-1], acc.proof(0))
+
+
+def test_frontier_persists_and_migrates_existing_rows(tmp_path: Path) -> None:
+    db = tmp_path / "t.db"
+    cx = sqlite3.connect(db)
+    cx.execute("CREATE TABLE rows(id INTEGER PRIMARY KEY AUTOINCREMENT, hash TEXT)")
+    cx.executemany("INSERT INTO rows(hash) VALUES(?)", [(h,) for h in _hashes(7)])
+    cx.commit()
+
+    acc = MerkleAccumulator(cx, "rows", hash_fn=_sha)
+    acc.sync(cx.execute("SELECT id, hash FROM rows WHERE id > ? ORDER BY id", (acc.last_id,)))
+    cx.commit()
+    root = acc.root
+    cx.close()
+
+    cx = sqlite3.connect(db)
+    reopened = MerkleAccumulator(cx, "rows", hash_fn=_sha)
+    assert (reopened.size, reopened.last_id, reopened.root) == (7, 7, root)
+    reopened.append(_hashes(8)[-1], row_id=8)
+    leaves = [bytes.fromhex(h) for h in _hashes(8)]
+    while len(leaves) > 1:
+        if len(leaves) % 2:
+            leaves.append(leaves[-1])
+        leaves = [_sha(leaves[i] + leaves[i + 1]) for i in range(0, len(leaves), 2)]
+    assert reopened.root == leaves[0].hex()
+
+
+def test_archive_service_root_and_proofs(tmp_path: Path) -> None:
+    with ArchiveService(tmp_path / "arch.db", broadcast=False) as svc:
+        roots = [svc.insert_entry({"i": i}, {"s": float(i)}) for i in range(6)]
+        hashes = [r[0] for r in svc.conn.execute("SELECT hash FROM entries ORDER BY id")]
+        assert roots[-1] == svc.compute_merkle_root() == _merkle_root(hashes)
+        proof = svc.merkle_proof(4)
+        assert verify_proof(bytes.fromhex(hashes[4]), proof, roots[-1], hash_fn=_blake3)
+
+
+def test_archive_services_share_one_database(tmp_path: Path) -> None:
+    db = tmp_path / "arch.db"
+    with ArchiveService(db, broadcast=False) as first, ArchiveService(db, broadcast=False) as second:
+        for i in range(5):
+            first.insert_entry({"a": i}, {"s": float(i)})
+            root = second.insert_entry({"b": i}, {"s": float(i)})
+        hashes = [r[0] for r in first.conn.execute("SELECT hash FROM entries ORDER BY id")]
+        assert len(hashes) == 10
+        assert root == first.compute_merkle_root() == second.compute_merkle_root() == _merkle_root(hashes)
+        assert first.merkle_proof(7) == second.merkle_proof(7)
+
+
+def test_archive_module_proofs(tmp_path: Path) -> None:
+    db = tmp_path / "arch.db"
+    for i in range(5):
+        root = insert(f"p{i}", f"c{i}", {"s": i}, db_path=db)
+    assert merkle_root(db_path=db) == root
+    with sqlite3.connect(db) as cx:
+        h = cx.execute("SELECT hash FROM entries WHERE id=3").fetchone()[0]
+    assert verify_proof(_sha(h.encode()), merkle_proof(2, db_path=db), root, hash_fn=_sha)
+
+
+def test_ledger_picks_up_rows_written_elsewhere(tmp_path: Path) -> None:
+    path = tmp_path / "ledger.db"
+    ledger = Ledger(str(path), broadcast=False)
+    ledger.log(messaging.Envelope(sender="a", recipient="b", payload={"v": 1}, ts=0.0))
+    with sqlite3.connect(path) as cx:
+        cx.execute(
+            "INSERT INTO messages (ts, sender, recipient, payload, hash) VALUES (?, ?, ?, ?, ?)",
+            (1.0, "x", "y", "{}", "ab" * 32),
+        )
+    hashes = [r[0] for r in ledger.conn.execute("SELECT hash FROM messages ORDER BY id")]
+    assert ledger.compute_merkle_root() == insight_logging._merkle_root(hashes)
+    assert len(ledger.merkle_proof(1)) == 1
+    ledger.close()
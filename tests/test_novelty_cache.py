@@ -0,0 +1,108 @@
+# SPDX-License-Identifier: Apache-2.0
+from __future__ import annotations
+
+import threading
+import time
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from alpha_factory_v1.core.evaluators import novelty
+
+
+class _FakeModel:
+    def __init__(self) -> None:
+        self.calls: list[list[str]] = []
+        self.delay = 0.0
+
+    def encode(self, texts: list[str], **_kw: object) -> np.ndarray:
+        self.calls.append(list(texts))
+        time.sleep(self.delay)
+        out = np.zeros((len(texts), novelty._DIM), dtype="float32")
+        for i, t in enumerate(texts):
+            out[i, len(t) % novelty._DIM] = 1.0
+        return out
+
+
+@pytest.fixture()
+def fake_model(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> _FakeModel:
+    model = _FakeModel()
+    monkeypatch.setattr(novelty, "_MODEL", model)
+    monkeypatch.setattr(novelty, "_get_model", lambda: model)
+    monkeypatch.setattr(novelty, "_CACHE", None)
+    monkeypatch.setenv("NOVELTY_CACHE_DIR", str(tmp_path / "cache"))
+    return model
+
+
+def test_embed_batch_encodes_only_unseen_text(fake_model: _FakeModel) -> None:
+    first = novelty.embed_batch(["a", "bb", "a"])
+    assert fake_model.calls == [["a", "bb"]]
+    assert np.array_equal(first[0], first[2])
+    novelty.embed_batch(["bb", "ccc"])
+    assert fake_model.calls[-1] == ["ccc"]
+
+
+def test_vector_cache_survives_restart(fake_model: _FakeModel, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    vecs = novelty.embed_batch(["x", "yy"])
+    monkeypatch.setattr(novelty, "_CACHE", None)
+    fake_model.calls.clear()
+    again = novelty.embed_batch(["yy", "x"])
+    assert fake_model.calls == []
+    assert np.array_equal(again, vecs[::-1])
+    # a torn append is discarded on load
+    with open(tmp_path / "cache" / "vectors.f32", "ab") as fh:
+        fh.write(b"\x00\x01")
+    assert len(novelty.VectorCache(tmp_path / "cache")) == 2
+
+
+def test_writers_sharing_a_directory_keep_rows_aligned(tmp_path: Path) -> None:
+    dim = 4
+    first = novelty.VectorCache(tmp_path / "shared", dim=dim)
+    second = novelty.VectorCache(tmp_path / "shared", dim=dim)  # stands in for another process
+    rows = {bytes([i]) * 16: np.full(dim, float(i), dtype="float32") for i in range(1, 5)}
+    items = list(rows.items())
+    first.put_many([k for k, _ in items[:2]], np.stack([v for _, v in items[:2]]))
+    second.put_many([k for k, _ in items[1:]], np.stack([v for _, v in items[1:]]))
+    assert len(second) == 4
+    for cache in (second, novelty.VectorCache(tmp_path / "shared", dim=dim)):
+        got = cache.get_many(list(rows))
+        assert all(np.array_equal(got[i], v) for i, v in enumerate(rows.values()))
+
+
+def test_concurrent_embed_calls_are_coalesced(fake_model: _FakeModel, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(novelty, "_BATCHER", novelty._MicroBatcher(max_batch=8, max_wait=0.2))
+    fake_model.delay = 0.05  # later callers queue while the first one encodes
+    results: dict[str, np.ndarray] = {}
+
+    def run(text: str) -> None:
+        results[text] = novelty.embed(text)
+
+    threads = [threading.Thread(target=run, args=("t" * (i + 1),)) for i in range(8)]
+    for th in threads:
+        th.start()
+    for th in threads:
+        th.join()
+    assert len(fake_model.calls) < 8
+    assert all(results["t" * (i + 1)][0, i + 1] == 1.0 for i in range(8))
+
+
+def test_lone_embed_skips_the_batch_wait(fake_model: _FakeModel, monkeypatch: pytest.MonkeyPatch) -> None:
+    batcher = novelty._MicroBatcher(max_batch=8, max_wait=5.0)
+    monkeypatch.setattr(novelty, "_BATCHER", batcher)
+    start = time.perf_counter()
+    vec = novelty.embed("solo")
+    assert time.perf_counter() - start < 1.0
+    assert vec[0, 4] == 1.0 and batcher._thread is None
+
+
+def test_add_many_matches_incremental_add(fake_model: _FakeModel) -> None:
+    a = novelty.NoveltyIndex()
+    b = novelty.NoveltyIndex()
+    texts = ["one", "three", "seven!"]
+    for t in texts:
+        a.add(t)
+    b.add_many(texts)
+    assert a.count == b.count == 3
+    assert np.allclose(a.mean, b.mean)
+    assert b.divergence_many(["one", "zz"]) == pytest.approx([b.divergence("one"), b.divergence("zz")])
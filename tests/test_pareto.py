@@ -0,0 +1,87 @@
+# SPDX-License-Identifier: Apache-2.0
+import random
+
+import numpy as np
+import pytest
+
+from alpha_factory_v1.core.simulation import pareto
+
+
+def _naive_ranks(values: list[tuple[float, ...]]) -> list[int]:
+    n = len(values)
+    ranks = [-1] * n
+    remaining = set(range(n))
+    level = 0
+    while remaining:
+        front = {
+            i
+            for i in remaining
+            if not any(
+                all(a <= b for a, b in zip(values[j], values[i])) and any(a < b for a, b in zip(values[j], values[i]))
+                for j in remaining
+                if j != i
+            )
+        }
+        for i in front:
+            ranks[i] = level
+        remaining -= front
+        level += 1
+    return ranks
+
+
+@pytest.mark.parametrize("m", [1, 2, 3, 4])
+def test_non_dominated_sort_matches_naive(m: int) -> None:
+    rng = random.Random(m)
+    values = [tuple(float(rng.randint(0, 6)) for _ in range(m)) for _ in range(120)]
+    assert pareto.non_dominated_sort(values).tolist() == _naive_ranks(values)
+
+
+def test_crowding_distance_per_front() -> None:
+    values = [(0.0, 3.0), (1.0, 2.0), (2.0, 1.0), (3.0, 0.0), (3.0, 3.0)]
+    ranks, crowd = pareto.rank_and_crowd(values)
+    assert ranks.tolist() == [0, 0, 0, 0, 1]
+    assert np.isinf(crowd[[0, 3, 4]]).all()
+    assert crowd[1] == pytest.approx(2 * 2 / 3)
+    assert crowd[2] == pytest.approx(2 * 2 / 3)
+
+
+def _list_survivors(values: list[tuple[float, ...]], mu: int) -> list[tuple[float, ...]]:
+    """The list-based NSGA-II selection ``mats`` used before vectorisation."""
+    ranks = _naive_ranks(values)
+    out: list[tuple[float, ...]] = []
+    for level in range(max(ranks) + 1):
+        front = [[v, 0.0] for v, r in zip(values, ranks) if r == level]
+        for i in range(len(values[0])):
+            front.sort(key=lambda x: x[0][i])
+            front[0][1] = front[-1][1] = float("inf")
+            span = front[-1][0][i] - front[0][0][i] or 1.0
+            for j in range(1, len(front) - 1):
+                front[j][1] += (front[j + 1][0][i] - front[j - 1][0][i]) / span
+        front.sort(key=lambda x: -x[1])
+        out += [v for v, _ in front]
+    return out[:mu]
+
+
+@pytest.mark.parametrize("m", [2, 3])
+def test_survivor_order_matches_list_selection(m: int) -> None:
+    rng = random.Random(10 + m)
+    for _ in range(50):
+        values = [tuple(float(rng.randint(0, 3)) for _ in range(m)) for _ in range(rng.randint(2, 12))]
+        _, _, order = pareto.survivor_order(values)
+        mu = len(values) // 2
+        assert [values[i] for i in order[:mu].tolist()] == _list_survivors(values, mu)
+
+
+def test_pareto_mask_and_empty_input() -> None:
+    assert pareto.pareto_mask([(1.0, 1.0), (0.0, 2.0), (2.0, 2.0)]).tolist() == [True, True, False]
+    assert pareto.non_dominated_sort([]).tolist() == []
+    assert pareto.fronts_from_ranks(np.array([], dtype=np.int64)) == []
+
+
+def test_mats_pareto_front_excludes_dominated_earlier_rows() -> None:
+    from alpha_factory_v1.core.simulation import mats
+
+    pop = [mats.Individual([0.0]) for _ in range(3)]
+    for ind, fit in zip(pop, [(1.0, 1.0), (0.0, 0.0), (2.0, 0.5)]):
+        ind.fitness = fit
+    assert [ind.fitness for ind in mats.pareto_front(pop)] == [(0.0, 0.0)]
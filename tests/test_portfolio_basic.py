@@ -28,3 +28,38 @@ def test_portfolio_record_and_history():
         assert rec["symbol"] == "BTC"
         p.clear()
         assert p.book() == {}
+
+
+def test_portfolio_restores_from_snapshot(monkeypatch):
+    monkeypatch.setattr(portfolio.Portfolio, "SNAPSHOT_EVERY", 4)
+    monkeypatch.setattr(portfolio.Portfolio, "_broadcast", lambda *a, **k: None)
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = portfolio.Path(tmpdir) / "book.jsonl"
+        p = portfolio.Portfolio(path)
+        for _ in range(5):
+            p.record_fill("ETH", 1.0, 10.0, "BUY")
+        p.record_fill("BTC", 2.0, 10.0, "SELL")
+        snap = json.loads(path.with_name("book.jsonl.snap").read_text())
+        assert snap["positions"] == {"ETH": 4.0}
+
+        replayed = []
+        orig = portfolio.Portfolio._apply
+
+        def spy(self, fill, *, persist=True):
+            replayed.append(fill)
+            orig(self, fill, persist=persist)
+
+        monkeypatch.setattr(portfolio.Portfolio, "_apply", spy)
+        again = portfolio.Portfolio(path)
+        assert again.book() == {"ETH": 5.0, "BTC": -2.0}
+        assert len(replayed) == 2
+
+        other = portfolio.Portfolio(path)
+        other.record_fill("ETH", 1.0, 10.0, "SELL")
+        again.record_fill("ETH", 1.0, 10.0, "SELL")
+        assert again._offset is None
+        assert portfolio.Portfolio(path).book() == {"ETH": 3.0, "BTC": -2.0}
+
+        again.clear()
+        assert not path.with_name("book.jsonl.snap").exists()
+        assert portfolio.Portfolio(path).book() == {}
@@ -0,0 +1,107 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Tests for the indexed SQLite result store."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from pydantic import BaseModel
+
+from alpha_factory_v1.core.interface.result_store import ResultStore
+
+
+class Point(BaseModel):
+    year: int
+    capability: float
+
+
+class Member(BaseModel):
+    effectiveness: float
+    risk: float
+    complexity: float
+    rank: int
+    impact: float | None = None
+
+
+class Result(BaseModel):
+    id: str
+    forecast: list[Point]
+    population: list[Member] | None = None
+
+
+def _result(run_id: str, caps: list[float]) -> Result:
+    pop = [
+        Member(effectiveness=0.9, risk=0.2, complexity=0.1, rank=0, impact=1.0),
+        Member(effectiveness=0.5, risk=0.1, complexity=0.3, rank=1, impact=3.0),
+    ]
+    return Result(id=run_id, forecast=[Point(year=i + 1, capability=c) for i, c in enumerate(caps)], population=pop)
+
+
+def test_mapping_order_and_persistence(tmp_path: Path) -> None:
+    store = ResultStore(tmp_path / "r.sqlite", Result)
+    for i in range(3):
+        store.put(_result(f"r{i}", [0.1 * i]))
+    assert list(store) == ["r0", "r1", "r2"]
+    assert store.latest_id() == "r2"
+    old_id, old = store.popitem(last=False)
+    assert old_id == "r0" and old.forecast[0].capability == 0.0
+
+    reopened = ResultStore(tmp_path / "r.sqlite", Result)
+    assert list(reopened) == ["r1", "r2"]
+    assert reopened["r2"] == _result("r2", [0.2])
+    with pytest.raises(KeyError):
+        reopened["r0"]
+
+
+def test_year_means_track_replacements_and_deletes(tmp_path: Path) -> None:
+    store = ResultStore(tmp_path / "r.sqlite", Result)
+    assert store.year_means() is None
+    store.put(_result("a", [1.0, 2.0]))
+    store.put(_result("b", [3.0]))
+    assert store.year_means() == [(1, 2.0), (2, 2.0)]
+    assert store.year_means(["b", "missing"]) == [(1, 3.0)]
+    assert store.year_means(["missing"]) is None
+
+    store.put(_result("b", [5.0, 6.0]))
+    assert store.year_means() == [(1, 3.0), (2, 4.0)]
+    del store["a"]
+    assert store.year_means() == [(1, 5.0), (2, 6.0)]
+
+
+def test_summaries_and_paging(tmp_path: Path) -> None:
+    store = ResultStore(tmp_path / "r.sqlite", Result)
+    for i in range(5):
+        store.put(_result(f"r{i}", [0.5, 0.75]), sectors=4, disrupted=i % 2)
+
+    ids, nxt = store.page(2)
+    assert ids == ["r0", "r1"] and nxt == "r1"
+    ids, nxt = store.page(2, nxt)
+    assert ids == ["r2", "r3"]
+    ids, nxt = store.page(2, nxt)
+    assert ids == ["r4"] and nxt is None
+
+    summary = store.summaries(limit=1, after="r2")[0]
+    assert summary["id"] == "r3"
+    assert summary["horizon"] == 2 and summary["final_capability"] == 0.75
+    assert summary["sectors"] == 4 and summary["disrupted"] == 1
+    assert summary["front_size"] == 1 and summary["best_effectiveness"] == 0.9
+    assert summary["mean_impact"] == 2.0
+    assert "data" not in summary
+
+
+def test_import_json_skips_corrupt_and_known(tmp_path: Path) -> None:
+    src = tmp_path / "json"
+    src.mkdir()
+    (src / "a.json").write_text(_result("a", [1.0]).model_dump_json())
+    (src / "b.json").write_text(_result("b", [2.0]).model_dump_json())
+    (src / "bad.json").write_text("{")
+    store = ResultStore(tmp_path / "r.sqlite", Result)
+    store.put(_result("a", [9.0]))
+
+    errors: list[Path] = []
+    added = store.import_json(src.glob("*.json"), on_error=lambda f, exc: errors.append(f))
+    assert added == 1
+    assert errors == [src / "bad.json"]
+    assert store["a"].forecast[0].capability == 9.0
+    assert "b" in store
@@ -1,18 +1,63 @@
 # SPDX-License-Identifier: Apache-2.0
+import json
+import tempfile
 import unittest
+from pathlib import Path
 from unittest.mock import patch
 
 import alpha_factory_v1.backend.risk_management as rm
+from alpha_factory_v1.backend.timeseries_store import SeriesStore
 
 
 class TestRiskManagementCache(unittest.TestCase):
-    def test_save_equity_cache_logs_error(self) -> None:
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.tmp = Path(self._tmp.name)
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def test_save_equity_snapshot_logs_error(self) -> None:
+        store = SeriesStore(self.tmp / "eq.f64")
         with patch("pathlib.Path.write_text", side_effect=IOError("boom")) as mock_write:
             with patch.object(rm._LOG, "debug") as mock_log:
-                rm._save_equity_cache([1.0, 2.0])
+                rm._save_equity_snapshot(store, 2.0)
                 mock_log.assert_called()
             mock_write.assert_called()
 
+    def test_restart_uses_snapshot_and_tail(self) -> None:
+        path = self.tmp / "eq.f64"
+        curve = [100.0 + 0.1 * i for i in range(300)] + [350.0, 280.0]
+        risk = rm.RiskManager(store_path=path, lookback_days=50)
+        for v in curve:
+            risk.update_equity_curve(v)
+        self.assertEqual(json.loads(path.with_name("eq.f64.snap").read_text())["count"], 256)
+
+        again = rm.RiskManager(store_path=path, lookback_days=50)
+        self.assertEqual(again._peak_equity, 350.0)
+        self.assertAlmostEqual(again.drawdown_pct(), 0.2)
+        self.assertEqual(again.var_pct(), risk.var_pct())
+        self.assertEqual(list(again._store.tail(3)), curve[-3:])
+
+    def test_torn_record_truncated(self) -> None:
+        path = self.tmp / "eq.f64"
+        store = SeriesStore(path)
+        store.append(1.5)
+        store.close()
+        with path.open("ab") as fh:
+            fh.write(b"\x00\x01\x02")
+        store = SeriesStore(path)
+        self.assertEqual(len(store), 1)
+        self.assertEqual(store.last(), 1.5)
+
+    def test_legacy_json_imported(self) -> None:
+        legacy = self.tmp / "equity_curve.json"
+        legacy.write_text(json.dumps([10.0, 12.0, 9.0]))
+        with patch.object(rm, "_EQ_CACHE", legacy), patch.object(rm, "_EQ_STORE", self.tmp / "eq.f64"):
+            risk = rm.RiskManager()
+        self.assertEqual(len(risk._store), 3)
+        self.assertAlmostEqual(risk.drawdown_pct(), 0.25)
+
 
 if __name__ == "__main__":  # pragma: no cover
     unittest.main()
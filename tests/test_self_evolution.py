@@ -56,3 +56,36 @@ def test_vote_and_merge_reverts_on_failure(tmp_path: Path) -> None:
         accepted = harness.vote_and_merge(repo, diff, reg)
     assert not accepted
     assert (repo / "metric.txt").read_text().strip() == "1"
+
+
+class _Impact:
+    def __init__(self, selected: list[str] | None) -> None:
+        self.selected = selected
+
+    def select(self, changed: list[str]) -> list[str] | None:
+        assert changed == ["pkg/mod.py"]
+        return self.selected
+
+
+def test_apply_patch_runs_affected_tests_first(tmp_path: Path) -> None:
+    repo = _make_repo(tmp_path)
+    diff = "--- a/pkg/mod.py\n+++ b/pkg/mod.py\n@@\n-1\n+0\n"
+    calls: list[object] = []
+
+    def fake_tests(path: Path, tests: list[str] | None = None) -> int:
+        calls.append(tests)
+        return 1 if tests == ["tests/test_bad.py::test_x"] else 0
+
+    with (
+        patch.object(harness, "_run_tests", side_effect=fake_tests),
+        patch.object(harness, "run_preflight"),
+        patch.object(harness.patcher_core, "apply_patch", lambda d, repo_path: None),
+    ):
+        ok, _ = harness.apply_patch(repo, diff, impact=_Impact(["tests/test_bad.py::test_x"]))
+        assert not ok and calls == [["tests/test_bad.py::test_x"]]
+        calls.clear()
+        ok, _ = harness.apply_patch(repo, diff, impact=_Impact(["tests/test_ok.py::test_y"]), full=False)
+        assert ok and calls == [["tests/test_ok.py::test_y"]]
+        calls.clear()
+        ok, _ = harness.apply_patch(repo, diff, impact=_Impact(None), full=False)
+        assert ok and calls == [None]
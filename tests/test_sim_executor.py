@@ -0,0 +1,103 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Process-backed simulation executor used by the API server."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any
+
+import pytest
+
+from alpha_factory_v1.core.interface.sim_executor import QueueFull, SimulationExecutor, simulation_job
+
+PARAMS = {
+    "horizon": 3,
+    "num_sectors": 2,
+    "energy": 1.0,
+    "entropy": 1.0,
+    "pop_size": 4,
+    "generations": 1,
+    "curve": "logistic",
+    "k": 5.0,
+    "x0": 0.0,
+    "seed": 1,
+    "sectors": None,
+}
+
+
+def _sleep(progress: Any, seconds: float) -> str:
+    progress({"started": True})
+    time.sleep(seconds)
+    return "slept"
+
+
+def test_simulation_job_streams_progress() -> None:
+    async def _main() -> tuple[dict[str, Any], list[dict[str, Any]]]:
+        ex = SimulationExecutor(1)
+        seen: list[dict[str, Any]] = []
+        try:
+            out = await ex.run(simulation_job, PARAMS, on_progress=seen.append)
+        finally:
+            ex.shutdown()
+        return out, seen
+
+    out, seen = asyncio.run(_main())
+    assert [y for y, _ in out["forecast"]] == [1, 2, 3]
+    assert [p["year"] for p in seen] == [1, 2, 3]
+    assert len(out["population"]) == 4
+
+
+def test_loop_stays_responsive_and_cancel_kills_worker() -> None:
+    async def _main() -> None:
+        ex = SimulationExecutor(1)
+        started = asyncio.Event()
+        task = asyncio.create_task(ex.run(_sleep, {"seconds": 30}, on_progress=lambda _p: started.set()))
+        await asyncio.wait_for(started.wait(), 30)
+        t0 = time.perf_counter()
+        await asyncio.sleep(0.01)
+        assert time.perf_counter() - t0 < 0.5
+        worker = ex._pool[0]
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert not worker.proc.is_alive()
+        assert await ex.run(_sleep, {"seconds": 0}) == "slept"
+        ex.shutdown()
+
+    asyncio.run(_main())
+
+
+def test_timeout_terminates_job() -> None:
+    async def _main() -> None:
+        ex = SimulationExecutor(1, timeout=0.5)
+        with pytest.raises(TimeoutError):
+            await ex.run(_sleep, {"seconds": 30})
+        ex.shutdown()
+
+    asyncio.run(_main())
+
+
+def test_slots_admit_by_priority_and_bound_queue() -> None:
+    async def _main() -> list[int]:
+        ex = SimulationExecutor(1, max_pending=2)
+        order: list[int] = []
+        gate = asyncio.Event()
+
+        async def job(prio: int) -> None:
+            async with ex.slot(prio):
+                order.append(prio)
+                await gate.wait()
+
+        first = asyncio.create_task(job(0))
+        await asyncio.sleep(0)
+        waiting = [asyncio.create_task(job(p)) for p in (5, 1)]
+        await asyncio.sleep(0)
+        with pytest.raises(QueueFull):
+            ex.check_capacity()
+        gate.set()
+        await asyncio.gather(first, *waiting)
+        assert ex.running == 0
+        return order
+
+    assert asyncio.run(_main()) == [0, 1, 5]
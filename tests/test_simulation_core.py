@@ -26,6 +26,65 @@ class TestSimulationCore(unittest.TestCase):
         self.assertAlmostEqual(sim.var(factors), -0.009602935809998603)
         self.assertAlmostEqual(sim.cvar(factors), -0.010516713095912844)
 
+    def test_blocked_simulate_matches_unblocked_stream(self) -> None:
+        try:
+            import numpy as np
+        except ModuleNotFoundError:
+            self.skipTest("numpy not available")
+
+        obs = {"yield_10y": 4.0, "yield_3m": 4.5, "stable_flow": 10.0}
+        blocked = simulation_core.MonteCarloSimulator(n_paths=1000, horizon=4, seed=11, block_size=96)
+        whole = simulation_core.MonteCarloSimulator(n_paths=1000, horizon=4, seed=11, block_size=1000)
+        got = blocked.simulate(obs).to_numpy()
+        np.testing.assert_array_equal(got, whole.simulate(obs).to_numpy())
+
+        # the full per-path Cholesky product draws regimes then all normals
+        rng = np.random.default_rng(11)
+        high = rng.random(1000) < simulation_core.P_SWITCH
+        chol = np.where(high[:, None, None], blocked._chol(True), simulation_core.CHOL_LOW)
+        noise = rng.standard_normal((1000, 4, 3))
+        shocks = (chol[:, None] @ noise[..., None]).squeeze(-1)
+        steps = blocked._drift_vec(obs) * blocked.dt + shocks
+        np.testing.assert_allclose(got, np.exp(steps[..., 2].sum(axis=1)), rtol=1e-12)
+
+    def test_risk_stats_match_exact_metrics(self) -> None:
+        try:
+            import numpy as np
+        except ModuleNotFoundError:
+            self.skipTest("numpy not available")
+
+        sim = simulation_core.MonteCarloSimulator(n_paths=50_000, horizon=10, seed=7, block_size=4096)
+        obs = {"yield_10y": 4.0, "yield_3m": 4.5, "stable_flow": 10.0}
+        factors = sim.simulate(obs).to_numpy()
+        stats = simulation_core.RiskStats()
+        for chunk in np.array_split(factors, 7):
+            stats.merge(simulation_core.RiskStats().update(chunk))
+        self.assertEqual(stats.n, len(factors))
+        self.assertAlmostEqual(stats.mean, factors.mean(), places=12)
+        self.assertAlmostEqual(sim.skew(stats), sim.skew(factors), places=9)
+        # sketch quantiles are accurate to a small fraction of the spread
+        tol = 5e-3 * factors.std()
+        self.assertAlmostEqual(sim.var(stats), sim.var(factors), delta=tol)
+        self.assertAlmostEqual(sim.cvar(stats), sim.cvar(factors), delta=tol)
+        self.assertLessEqual(len(stats._means), stats.compression + 1)
+
+    def test_simulate_stats_independent_of_workers(self) -> None:
+        try:
+            import numpy as np  # noqa: F401
+            import pandas as pd  # noqa: F401
+        except ModuleNotFoundError:
+            self.skipTest("numpy/pandas not available")
+
+        obs = {"yield_10y": 4.0, "yield_3m": 4.5, "stable_flow": 10.0}
+        runs = [
+            simulation_core.MonteCarloSimulator(n_paths=3000, horizon=5, seed=3, block_size=1000, workers=w)
+            for w in (0, 2)
+        ]
+        a, b = (sim.simulate_stats(obs) for sim in runs)
+        self.assertEqual(a.n, 3000)
+        self.assertEqual(runs[0].hedge(a, 1_000_000), runs[1].hedge(b, 1_000_000))
+        self.assertEqual(len(runs[0].scenario_table(a)), 3)
+
 
 if __name__ == "__main__":  # pragma: no cover
     unittest.main()
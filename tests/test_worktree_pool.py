@@ -0,0 +1,119 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Tests for pooled patch-validation worktrees and the tool-result cache."""
+
+from __future__ import annotations
+
+import os
+import stat
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from alpha_factory_v1.core.self_evolution import worktree_pool as wp
+
+
+def _git(cwd: Path, *args: str) -> None:
+    subprocess.run(["git", *args], cwd=cwd, check=True, capture_output=True)
+
+
+@pytest.fixture()
+def source(tmp_path: Path) -> Path:
+    repo = tmp_path / "src"
+    repo.mkdir()
+    _git(repo, "init", "-q")
+    _git(repo, "config", "user.email", "a@example.com")
+    _git(repo, "config", "user.name", "a")
+    (repo / "a.py").write_text("x = 1\n")
+    (repo / "b.py").write_text("y = 2\n")
+    _git(repo, "add", "-A")
+    _git(repo, "commit", "-qm", "init")
+    return repo
+
+
+def test_worktrees_are_reused_and_reset(source: Path, tmp_path: Path) -> None:
+    pool = wp.WorktreePool(str(source), tmp_path / "cache", size=1)
+    with pool.checkout() as tree:
+        (tree / "a.py").write_text("x = 99\n")
+        (tree / "junk.txt").write_text("junk")
+    assert not tree.exists()
+
+    (source / "b.py").write_text("y = 3\n")
+    _git(source, "commit", "-qam", "bump")
+    with pool.checkout() as again:
+        assert (again / "a.py").read_text() == "x = 1\n"
+        assert (again / "b.py").read_text() == "y = 3\n"
+        assert not (again / "junk.txt").exists()
+        assert len(list((tmp_path / "cache").glob("busy-*"))) == 1
+
+    kept = pool.acquire()  # never released: the caller owns it
+    pool.close()
+    assert kept.exists()
+    assert not list((tmp_path / "cache").glob("idle-*"))
+
+
+def _fake_tool(bin_dir: Path, name: str, body: str) -> None:
+    bin_dir.mkdir(exist_ok=True)
+    fake = bin_dir / name
+    fake.write_text("#!/bin/sh\n" + body)
+    fake.chmod(fake.stat().st_mode | stat.S_IEXEC)
+
+
+def test_run_checks_only_lints_changed_files(source: Path, tmp_path: Path, monkeypatch) -> None:
+    bin_dir = tmp_path / "bin"
+    log = tmp_path / "calls.log"
+    _fake_tool(
+        bin_dir,
+        "ruff",
+        f'echo "$@" >> {log}; shift 4\n'
+        'bad=""; for f in "$@"; do grep -q BAD "$f" && bad="$bad{\\"filename\\": \\"$PWD/$f\\"},"; done\n'
+        '[ -z "$bad" ] && exit 0\n'
+        'echo "[${bad%,}]"; exit 1\n',
+    )
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+
+    pool = wp.WorktreePool(str(source), tmp_path / "cache")
+    with pool.checkout() as tree:
+        assert wp.run_checks(tree, pool.cache, tools=("ruff",))
+    with pool.checkout() as tree:
+        (tree / "c.py").write_text("z = 3\n")
+        assert wp.run_checks(tree, pool.cache, tools=("ruff",))
+    with pool.checkout() as tree:
+        (tree / "a.py").write_text("BAD\n")
+        assert not wp.run_checks(tree, pool.cache, tools=("ruff",))
+        assert not wp.run_checks(tree, pool.cache, tools=("ruff",))
+    pool.close()
+
+    prefix = "check --output-format json --force-exclude "
+    assert log.read_text().splitlines() == [prefix + "a.py b.py", prefix + "c.py", prefix + "a.py"]
+
+
+def test_bandit_skips_configured_excludes(source: Path, tmp_path: Path, monkeypatch) -> None:
+    (source / "legacy").mkdir()
+    (source / "legacy" / "old.py").write_text("x = 1\n")
+    (source / "pyproject.toml").write_text('[tool.bandit]\nexclude_dirs = ["legacy"]\n')
+    _git(source, "add", "-A")
+    _git(source, "commit", "-qm", "legacy")
+    log = tmp_path / "calls.log"
+    _fake_tool(tmp_path / "bin", "bandit", f'shift 3; echo "$@" >> {log}\necho "{{}}"\n')
+    monkeypatch.setenv("PATH", f"{tmp_path / 'bin'}{os.pathsep}{os.environ['PATH']}")
+
+    pool = wp.WorktreePool(str(source), tmp_path / "cache")
+    with pool.checkout() as tree:
+        assert wp.run_checks(tree, pool.cache, tools=("bandit",))
+    pool.close()
+    assert log.read_text().splitlines() == ["a.py b.py"]
+
+
+def test_test_results_are_keyed_on_environment(source: Path, tmp_path: Path, monkeypatch) -> None:
+    log = tmp_path / "calls.log"
+    _fake_tool(tmp_path / "bin", "pytest", f"echo run >> {log}\n")
+    monkeypatch.setenv("PATH", f"{tmp_path / 'bin'}{os.pathsep}{os.environ['PATH']}")
+
+    pool = wp.WorktreePool(str(source), tmp_path / "cache")
+    for addopts in ("", "", "-x"):
+        monkeypatch.setenv("PYTEST_ADDOPTS", addopts)
+        with pool.checkout() as tree:
+            assert wp.run_checks(tree, pool.cache, tools=("pytest",))
+    pool.close()
+    assert len(log.read_text().splitlines()) == 2